@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+성능 벤치마크 (pytest-benchmark)
+
+실행: python tools/run_benchmarks.py  (또는 python -m pytest benchmarks)
+"""
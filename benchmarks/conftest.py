@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 공통 설정 (pytest-benchmark)
+
+- 스텁 LLM 서버를 세션 시작 시 띄우고, src 모듈 임포트 전에 LLM 환경 변수를 스텁으로 지정
+  (`LLM_CONFIG`는 settings 임포트 시점에 환경 변수를 읽음)
+- `--bench-scale`로 지정한 규모(1k/10k/100k)마다 각 벤치마크를 매개변수화
+- 합성 데이터는 규모별로 세션 동안 한 번만 생성
+
+옵션:
+    --bench-scale 1k,10k        실행할 규모 (기본값: 1k)
+    --llm-latency-ms 50         스텁 LLM 응답 지연 (ms)
+    --llm-rate-limit-every 0    N번째 요청마다 429 반환 (0=사용 안 함)
+    --bench-rounds 3            상태가 있는 벤치마크(DB/파이프라인)의 반복 횟수
+"""
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+for _path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from benchmarks.stub_llm_server import StubLLMConfig, StubLLMServer, llm_env  # noqa: E402
+from benchmarks.synthetic import SCALES, generate_messages, generate_todos, user_profile  # noqa: E402
+
+_stub_server = None
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("smart-assistant-bench")
+    group.addoption("--bench-scale", default="1k", help="실행할 규모 (쉼표 구분: 1k,10k,100k)")
+    group.addoption("--llm-latency-ms", type=float, default=50.0, help="스텁 LLM 응답 지연 (ms)")
+    group.addoption("--llm-rate-limit-every", type=int, default=0, help="N번째 요청마다 429 반환 (0=사용 안 함)")
+    group.addoption("--bench-rounds", type=int, default=3, help="DB/파이프라인 벤치마크 반복 횟수")
+
+
+def pytest_configure(config):
+    global _stub_server
+    _stub_server = StubLLMServer(StubLLMConfig(
+        latency_ms=config.getoption("--llm-latency-ms"),
+        rate_limit_every=config.getoption("--llm-rate-limit-every"),
+    )).start()
+    os.environ.update(llm_env(_stub_server))
+    # 대량 반복 실행 시 INFO 로그 출력 비용이 측정값을 왜곡하지 않도록 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def pytest_unconfigure(config):
+    if _stub_server is not None:
+        _stub_server.stop()
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        selected = [s.strip() for s in metafunc.config.getoption("--bench-scale").split(",") if s.strip()]
+        unknown = [s for s in selected if s not in SCALES]
+        if unknown:
+            raise pytest.UsageError(f"알 수 없는 규모: {unknown} (사용 가능: {list(SCALES)})")
+        metafunc.parametrize("scale", selected)
+
+
+@pytest.fixture(scope="session")
+def stub_llm() -> StubLLMServer:
+    """세션 공용 스텁 LLM 서버"""
+    return _stub_server
+
+
+@pytest.fixture(scope="session")
+def bench_rounds(pytestconfig) -> int:
+    return max(1, pytestconfig.getoption("--bench-rounds"))
+
+
+_message_cache = {}
+_todo_cache = {}
+
+
+@pytest.fixture
+def messages(scale):
+    """규모별 합성 메시지 (세션 동안 재사용, 변경 금지)"""
+    if scale not in _message_cache:
+        _message_cache[scale] = generate_messages(SCALES[scale])
+    return _message_cache[scale]
+
+
+@pytest.fixture
+def todos(scale):
+    """규모별 합성 TODO (메시지 수의 1/10)"""
+    if scale not in _todo_cache:
+        _todo_cache[scale] = generate_todos(max(10, SCALES[scale] // 10))
+    return _todo_cache[scale]
+
+
+@pytest.fixture
+def profile():
+    return user_profile()
+
+
+@pytest.fixture
+def run_async():
+    """코루틴 함수를 전용 이벤트 루프에서 동기 실행하는 헬퍼 (pytest-benchmark는 async 미지원)"""
+    loop = asyncio.new_event_loop()
+
+    def _run(coro_factory, *args, **kwargs):
+        return loop.run_until_complete(coro_factory(*args, **kwargs))
+
+    yield _run
+    loop.close()
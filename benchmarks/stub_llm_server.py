@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 스텁 LLM 서버 (OpenAI/Azure 호환 chat/completions)
+
+실제 LLM 없이 요약/Top3/대화 요약 경로의 네트워크 왕복을 재현합니다.
+경로가 `/chat/completions`로 끝나는 모든 POST 요청에 응답하므로
+`AZURE_OPENAI_ENDPOINT=http://127.0.0.1:<port>`만 지정하면 Azure 배포 URL 형식 그대로 사용할 수 있습니다.
+
+- 응답 지연: `latency_ms` (+ `jitter_ms` 범위의 결정적 난수)
+- 429 재현: `rate_limit_every`번째 요청마다 429 + Retry-After 반환
+- 응답 본문: 프롬프트 종류에 맞는 JSON (Top3 → selected_ids, 그 외 → 요약 JSON)
+
+단독 실행 (GUI 수동 테스트용):
+    python -m benchmarks.stub_llm_server --port 8765 --latency-ms 300 --rate-limit-every 10
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+_TODO_ID_PATTERN = re.compile(r"ID:(\S+)")
+
+
+@dataclass
+class StubLLMConfig:
+    """스텁 서버 동작 설정"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_every: int = 0  # 0이면 429 없음
+    retry_after_sec: int = 1
+    seed: int = 0
+
+
+@dataclass
+class StubLLMStats:
+    """요청 통계"""
+    requests: int = 0
+    rate_limited: int = 0
+    prompt_chars: int = 0
+    by_kind: Dict[str, int] = field(default_factory=dict)
+
+
+def _prompt_text(payload: Dict[str, Any]) -> str:
+    return "\n".join(str(m.get("content") or "") for m in payload.get("messages") or [])
+
+
+def build_reply(payload: Dict[str, Any]) -> tuple:
+    """요청 프롬프트에 맞는 (종류, 응답 content 문자열) 생성"""
+    prompt = _prompt_text(payload)
+    if "selected_ids" in prompt:
+        ids = _TODO_ID_PATTERN.findall(prompt)[:3]
+        return "top3", json.dumps({"reasoning": "스텁 응답: 목록 앞쪽 3개 선정", "selected_ids": ids}, ensure_ascii=False)
+    if "decisions" in prompt and "unresolved" in prompt:
+        return "conversation", json.dumps({
+            "summary": "스텁 대화 요약입니다.",
+            "key_points": ["일정 확인", "리뷰 요청"],
+            "decisions": [],
+            "unresolved": [],
+            "risks": [],
+            "action_items": [],
+        }, ensure_ascii=False)
+    return "message", json.dumps({
+        "summary": "스텁 요약: 검토 요청 메시지입니다.",
+        "key_points": ["검토 요청", "마감 확인"],
+        "sentiment": "neutral",
+        "urgency_level": "medium",
+        "action_required": True,
+        "validated_deadlines": [],
+        "suggested_response": None,
+    }, ensure_ascii=False)
+
+
+class StubLLMServer:
+    """백그라운드 스레드에서 동작하는 스텁 LLM HTTP 서버
+
+    with 문으로 사용하면 종료 시 자동으로 서버를 내립니다.
+    """
+
+    def __init__(self, config: Optional[StubLLMConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubLLMConfig()
+        self.stats = StubLLMStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="StubLLMServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = StubLLMStats()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    def _next_delay(self) -> float:
+        with self._lock:
+            jitter = self._rng.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0.0
+        return (self.config.latency_ms + jitter) / 1000.0
+
+    def _should_rate_limit(self) -> bool:
+        every = self.config.rate_limit_every
+        with self._lock:
+            self.stats.requests += 1
+            if every and self.stats.requests % every == 0:
+                self.stats.rate_limited += 1
+                return True
+        return False
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002 - 기본 시그니처 유지
+                pass
+
+            def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b"{}"
+                if not self.path.split("?", 1)[0].endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"unknown path: {self.path}"}})
+                    return
+                try:
+                    payload = json.loads(raw.decode("utf-8"))
+                except ValueError:
+                    self._send_json(400, {"error": {"message": "invalid json"}})
+                    return
+
+                time.sleep(server._next_delay())
+                if server._should_rate_limit():
+                    self._send_json(
+                        429,
+                        {"error": {"code": "429", "message": "Rate limit exceeded (stub)"}},
+                        {"Retry-After": str(server.config.retry_after_sec)},
+                    )
+                    return
+
+                kind, content = build_reply(payload)
+                prompt_chars = len(_prompt_text(payload))
+                with server._lock:
+                    server.stats.prompt_chars += prompt_chars
+                    server.stats.by_kind[kind] = server.stats.by_kind.get(kind, 0) + 1
+                self._send_json(200, {
+                    "id": f"stub-{server.stats.requests}",
+                    "object": "chat.completion",
+                    "model": payload.get("model") or "stub",
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_chars // 4,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": (prompt_chars + len(content)) // 4,
+                    },
+                })
+
+        return Handler
+
+
+def llm_env(server: StubLLMServer) -> Dict[str, str]:
+    """스텁 서버를 가리키는 Azure 공급자 환경 변수"""
+    return {
+        "LLM_PROVIDER": "azure",
+        "AZURE_OPENAI_ENDPOINT": server.url,
+        "AZURE_OPENAI_KEY": "stub-key",
+        "AZURE_OPENAI_API_KEY": "stub-key",
+        "AZURE_OPENAI_DEPLOYMENT": "stub-deployment",
+        "AZURE_OPENAI_API_VERSION": "2024-02-15-preview",
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 스텁 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="추가 지연 최대값 (ms)")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 반환 (0=사용 안 함)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    args = parser.parse_args(argv)
+
+    config = StubLLMConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_every=args.rate_limit_every,
+        retry_after_sec=args.retry_after,
+    )
+    server = StubLLMServer(config, host=args.host, port=args.port)
+    print(f"스텁 LLM 서버 실행: {server.url}")
+    for name, value in llm_env(server).items():
+        print(f"  {name}={value}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
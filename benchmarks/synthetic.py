@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 데이터 생성기
+
+같은 시드면 항상 같은 결과를 만드는 결정적(deterministic) 생성기입니다.
+수집 단계(`SmartAssistant._build_chat_messages` / `_build_email_messages`)를 거친
+정규화 메시지와 같은 형태의 한국어/영어 이메일·채팅, 그리고 TodoRepository 행 형태의 TODO를 만듭니다.
+
+필터/병합 단계가 실제와 비슷하게 동작하도록 다음을 일정 비율로 섞습니다.
+- 짧은 인사/단순 업데이트 메시지 (짧은 메시지 필터 대상)
+- 같은 본문의 재전송 (본문 중복 필터 대상)
+- 같은 이메일의 TO/CC 동시 수신 (수신 유형 필터 대상)
+- 같은 발신자의 90초 이내 연속 채팅 (coalesce_messages 병합 대상)
+
+사용 예:
+    from benchmarks.synthetic import generate_messages, generate_todos
+    messages = generate_messages(10_000)
+    todos = generate_todos(1_000)
+"""
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+DEFAULT_SEED = 20240101
+
+# 벤치마크 규모 이름 → 메시지 수
+SCALES = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+}
+
+_START = datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc)
+
+_PEOPLE = [
+    {"name": "김민수", "email_address": "pm.1@quickchat.dev", "chat_handle": "pm_minsu", "role": "PM"},
+    {"name": "이서연", "email_address": "dev.1@quickchat.dev", "chat_handle": "dev_seoyeon", "role": "Backend"},
+    {"name": "박지훈", "email_address": "dev.2@quickchat.dev", "chat_handle": "dev_jihoon", "role": "Frontend"},
+    {"name": "최유진", "email_address": "design.1@quickchat.dev", "chat_handle": "design_yujin", "role": "Designer"},
+    {"name": "정하늘", "email_address": "qa.1@quickchat.dev", "chat_handle": "qa_haneul", "role": "QA"},
+    {"name": "Emily Carter", "email_address": "emily.carter@partner.io", "chat_handle": "emily", "role": "Client"},
+    {"name": "David Kim", "email_address": "david.kim@partner.io", "chat_handle": "david", "role": "Client PM"},
+    {"name": "한도윤", "email_address": "ops.1@quickchat.dev", "chat_handle": "ops_doyun", "role": "DevOps"},
+]
+
+_PROJECTS = ["CareConnect", "HealthCore", "WellLink", "MediSync", "PayFlow"]
+_ROOMS = ["general", "careconnect-dev", "healthcore-design", "release-war-room", "client-sync"]
+
+_KO_ITEMS = ["API 명세서", "로그인 화면 시안", "배포 스크립트", "QA 리포트", "주간 보고서", "DB 마이그레이션", "결제 모듈", "온보딩 플로우"]
+_EN_ITEMS = ["API spec", "login mockups", "release checklist", "QA report", "weekly status deck", "DB migration plan", "billing module", "onboarding flow"]
+_KO_DEADLINES = ["오늘 오후 5시까지", "내일 오전까지", "금요일까지", "이번 주 안에", "다음 주 월요일까지", "3월 15일까지"]
+_EN_DEADLINES = ["by 5pm today", "by tomorrow morning", "by Friday", "by end of this week", "by next Monday", "before March 15"]
+
+_KO_REQUESTS = [
+    "{project} {item} 검토 부탁드립니다. {deadline} 피드백 주시면 감사하겠습니다.",
+    "긴급: {project} {item} 관련 이슈가 발생했습니다. {deadline} 확인 후 회신 부탁드립니다.",
+    "{deadline} {project} {item} 제출해주세요. 고객사 미팅 전에 꼭 필요합니다.",
+    "{project} {item} 업데이트 공유드립니다. 변경 사항 확인 부탁드려요.",
+    "내일 오전 10시 {project} 회의에서 {item} 논의하려고 합니다. 참석 가능하신가요?",
+    "{project} {item} 작업 요청드립니다. 우선순위 높게 처리 부탁드립니다.",
+]
+_EN_REQUESTS = [
+    "Could you review the {project} {item}? Please send feedback {deadline}.",
+    "URGENT: we found a blocker in the {project} {item}. Please check and reply {deadline}.",
+    "Please submit the {project} {item} {deadline}; we need it before the client meeting.",
+    "Sharing the latest {project} {item} update. Let me know if anything looks off.",
+    "Can we discuss the {project} {item} at the 10am meeting tomorrow?",
+    "Requesting help on the {project} {item} task, high priority please.",
+]
+_KO_SHORT = ["넵", "확인했습니다", "감사합니다!", "안녕하세요", "ㅇㅋ", "좋아요"]
+_EN_SHORT = ["ok", "thanks!", "got it", "hi", "sounds good", "lgtm"]
+_KO_UPDATE = ["{item} 작업 진행 중입니다.", "{item} 배포 완료했습니다.", "{item} 50% 진행했습니다."]
+_EN_UPDATE = ["Working on the {item} now.", "Deployed the {item}.", "The {item} is about halfway done."]
+
+_TODO_TYPES = ["review", "task", "deadline", "meeting", "response"]
+_PRIORITIES = ["high", "medium", "low"]
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat()
+
+
+def _compose_text(rng: random.Random, korean: bool) -> str:
+    """요청/공유 본문 또는 짧은 인사·단순 업데이트 생성"""
+    roll = rng.random()
+    if korean:
+        items, deadlines, requests, shorts, updates = _KO_ITEMS, _KO_DEADLINES, _KO_REQUESTS, _KO_SHORT, _KO_UPDATE
+    else:
+        items, deadlines, requests, shorts, updates = _EN_ITEMS, _EN_DEADLINES, _EN_REQUESTS, _EN_SHORT, _EN_UPDATE
+    item = rng.choice(items)
+    if roll < 0.12:
+        return rng.choice(shorts)
+    if roll < 0.22:
+        return rng.choice(updates).format(item=item)
+    text = rng.choice(requests).format(
+        project=rng.choice(_PROJECTS),
+        item=item,
+        deadline=rng.choice(deadlines),
+    )
+    # 본문 길이 분포를 넓히기 위해 일부는 배경 설명을 덧붙임
+    if rng.random() < 0.3:
+        text += " " + " ".join(rng.choice(requests).format(
+            project=rng.choice(_PROJECTS), item=rng.choice(items), deadline=rng.choice(deadlines),
+        ) for _ in range(rng.randint(1, 4)))
+    return text
+
+
+def _chat_message(rng: random.Random, idx: int, when: datetime, korean: bool, sender: Dict[str, str], room: str) -> Dict[str, Any]:
+    body = _compose_text(rng, korean)
+    return {
+        "msg_id": f"chat_{room}_{idx}",
+        "sender": sender["name"],
+        "sender_handle": sender["chat_handle"],
+        "sender_email": sender["email_address"],
+        "subject": "",
+        "body": body,
+        "content": body,
+        "date": _iso(when),
+        "type": "messenger",
+        "platform": room,
+        "room_slug": room,
+        "is_read": True,
+        "metadata": {"chat_id": idx, "raw_sender": sender["chat_handle"], "room_slug": room},
+    }
+
+
+def _email_message(
+    rng: random.Random,
+    idx: int,
+    when: datetime,
+    korean: bool,
+    sender: Dict[str, str],
+    mailbox: str,
+    recipient_type: str = "to",
+    email_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    body = _compose_text(rng, korean)
+    project = rng.choice(_PROJECTS)
+    subject = (
+        f"[{project}] {rng.choice(_KO_ITEMS)} 관련 요청" if korean
+        else f"[{project}] Request: {rng.choice(_EN_ITEMS)}"
+    )
+    email_id = email_id or f"mail-{idx}"
+    return {
+        "msg_id": f"email_{idx}_{sender['email_address']}",
+        "email_id": email_id,
+        "sender": sender["name"],
+        "sender_email": sender["email_address"],
+        "sender_handle": sender["chat_handle"],
+        "subject": subject,
+        "body": body,
+        "content": body,
+        "date": _iso(when),
+        "type": "email",
+        "platform": "email",
+        "mailbox": mailbox,
+        "recipients": [mailbox] if recipient_type == "to" else [],
+        "cc": [mailbox] if recipient_type == "cc" else [],
+        "bcc": [],
+        "recipient_type": recipient_type,
+        "thread_id": f"thread-{idx // 4}",
+        "is_read": True,
+        "metadata": {"mailbox": mailbox, "email_id": email_id},
+    }
+
+
+def generate_messages(
+    count: int,
+    seed: int = DEFAULT_SEED,
+    email_ratio: float = 0.4,
+    korean_ratio: float = 0.7,
+    user: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """정규화된 이메일/채팅 메시지 목록 생성 (날짜 오름차순)
+
+    Args:
+        count: 생성할 메시지 수
+        seed: 난수 시드 (같으면 결과 동일)
+        email_ratio: 이메일 비율 (나머지는 채팅)
+        korean_ratio: 한국어 메시지 비율 (나머지는 영어)
+        user: 수신자 페르소나 (기본값: 첫 번째 PM)
+
+    Returns:
+        메시지 dict 리스트
+    """
+    rng = random.Random(seed)
+    user = user or _PEOPLE[0]
+    senders = [p for p in _PEOPLE if p["email_address"] != user["email_address"]]
+    messages: List[Dict[str, Any]] = []
+    when = _START
+    idx = 0
+    while len(messages) < count:
+        # 업무 시간 위주로 진행 (평균 약 4분 간격)
+        when += timedelta(seconds=rng.randint(5, 480))
+        if when.hour >= 19:
+            when = (when + timedelta(days=1)).replace(hour=9, minute=0, second=0)
+        korean = rng.random() < korean_ratio
+        sender = rng.choice(senders)
+        idx += 1
+
+        if rng.random() < email_ratio:
+            message = _email_message(rng, idx, when, korean, sender, user["email_address"])
+            messages.append(message)
+            # 같은 메일을 CC로도 받은 경우
+            if rng.random() < 0.05 and len(messages) < count:
+                cc_copy = dict(message, msg_id=message["msg_id"] + "_cc", recipient_type="cc",
+                               recipients=[], cc=[user["email_address"]])
+                messages.append(cc_copy)
+            continue
+
+        room = rng.choice(_ROOMS)
+        message = _chat_message(rng, idx, when, korean, sender, room)
+        messages.append(message)
+        roll = rng.random()
+        if roll < 0.15:
+            # 같은 발신자의 연속 채팅 (병합 대상)
+            for _ in range(rng.randint(1, 3)):
+                if len(messages) >= count:
+                    break
+                idx += 1
+                burst_when = when + timedelta(seconds=rng.randint(5, 60))
+                messages.append(_chat_message(rng, idx, burst_when, korean, sender, room))
+        elif roll < 0.2 and len(messages) < count:
+            # 다른 방에 같은 본문 재전송 (본문 중복)
+            idx += 1
+            dup = dict(message, msg_id=f"chat_{rng.choice(_ROOMS)}_{idx}",
+                       date=_iso(when + timedelta(seconds=rng.randint(1, 30))))
+            messages.append(dup)
+
+    messages = messages[:count]
+    messages.sort(key=lambda m: m["date"])
+    return messages
+
+
+def generate_todos(count: int, seed: int = DEFAULT_SEED, persona_name: str = "김민수") -> List[Dict[str, Any]]:
+    """TodoRepository/Top3Service 입력 형태의 TODO 목록 생성
+
+    Args:
+        count: 생성할 TODO 수
+        seed: 난수 시드 (같으면 결과 동일)
+        persona_name: TODO 소유 페르소나 이름
+
+    Returns:
+        TODO dict 리스트
+    """
+    rng = random.Random(seed)
+    senders = _PEOPLE[1:]
+    todos: List[Dict[str, Any]] = []
+    for idx in range(count):
+        korean = rng.random() < 0.7
+        sender = rng.choice(senders)
+        created = _START + timedelta(minutes=7 * idx + rng.randint(0, 6))
+        deadline = created + timedelta(hours=rng.randint(2, 240)) if rng.random() < 0.7 else None
+        item = rng.choice(_KO_ITEMS if korean else _EN_ITEMS)
+        project = rng.choice(_PROJECTS)
+        source_type = "메일" if rng.random() < 0.4 else "메시지"
+        todos.append({
+            "id": f"todo_{idx:06d}",
+            "title": f"{project} {item} 검토" if korean else f"Review {project} {item}",
+            "description": _compose_text(rng, korean),
+            "priority": rng.choice(_PRIORITIES),
+            "deadline": _iso(deadline) if deadline else None,
+            "deadline_ts": _iso(deadline) if deadline else None,
+            "requester": sender["email_address"],
+            "type": rng.choice(_TODO_TYPES),
+            "status": "done" if rng.random() < 0.1 else "pending",
+            "source_message": {"msg_id": f"chat_general_{idx}", "sender": sender["name"]},
+            "created_at": _iso(created),
+            "updated_at": _iso(created),
+            "evidence": json.dumps([f"근거 {n}" for n in range(rng.randint(0, 4))], ensure_ascii=False),
+            "recipient_type": "cc" if rng.random() < 0.1 else "to",
+            "source_type": source_type,
+            "project": project,
+            "persona_name": persona_name,
+        })
+    return todos
+
+
+def user_profile() -> Dict[str, str]:
+    """생성 메시지의 수신자 페르소나 (기본 PM)"""
+    return dict(_PEOPLE[0])
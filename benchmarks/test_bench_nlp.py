@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""규칙 기반 NLP 단계 벤치마크: 우선순위 분류, 액션 추출"""
+from nlp.action_extractor import ActionExtractor
+from nlp.priority_ranker import PriorityRanker
+
+
+def test_priority_ranker_rank_messages(benchmark, messages, run_async):
+    benchmark.group = "nlp"
+    ranker = PriorityRanker()
+    ranked = benchmark(run_async, ranker.rank_messages, messages)
+    assert len(ranked) == len(messages)
+
+
+def test_action_extractor_batch_extract_actions(benchmark, messages, profile, run_async):
+    benchmark.group = "nlp"
+    extractor = ActionExtractor()
+    actions = benchmark(run_async, extractor.batch_extract_actions, messages, profile["email_address"])
+    assert actions
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""전체 분석 파이프라인 벤치마크 (수집 → 필터 → 우선순위 → 요약(스텁 LLM) → 액션 → TODO → 대화 요약)"""
+from typing import Any, Dict, List, Optional
+
+from data_sources.manager import DataSource, DataSourceManager
+from nlp.action_extractor import ActionExtractor
+from nlp.priority_ranker import PriorityRanker
+from nlp.summarize import MessageSummarizer
+from services.analysis_pipeline_service import AnalysisPipelineService
+
+
+class InMemoryDataSource(DataSource):
+    """합성 메시지를 그대로 돌려주는 데이터 소스 (수집 시 얕은 복사)"""
+
+    def __init__(self, messages: List[Dict[str, Any]], personas: List[Dict[str, Any]]):
+        self._messages = messages
+        self._personas = personas
+
+    async def collect_messages(self, options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return [dict(message) for message in self._messages]
+
+    def get_personas(self) -> List[Dict[str, Any]]:
+        return list(self._personas)
+
+    def get_source_type(self) -> str:
+        return "benchmark"
+
+
+def test_analysis_pipeline_analyze_messages(benchmark, messages, profile, run_async, bench_rounds, stub_llm):
+    benchmark.group = "pipeline"
+
+    def setup():
+        manager = DataSourceManager()
+        manager.set_source(InMemoryDataSource(messages, [profile]), "benchmark")
+        service = AnalysisPipelineService(
+            data_source_manager=manager,
+            priority_ranker=PriorityRanker(),
+            summarizer=MessageSummarizer(),
+            action_extractor=ActionExtractor(),
+            user_profile=profile,
+        )
+        return (service,), {}
+
+    def analyze(service):
+        return run_async(service.analyze_messages, persona_id=profile["email_address"], force_reload=True)
+
+    stub_llm.reset_stats()
+    result = benchmark.pedantic(analyze, setup=setup, rounds=bench_rounds, iterations=1)
+    assert result["summary"]["total_messages"] > 0
+    assert stub_llm.stats.requests > 0
+    benchmark.extra_info["llm_requests_per_round"] = stub_llm.stats.requests // bench_rounds
+    benchmark.extra_info["llm_rate_limited"] = stub_llm.stats.rate_limited
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""수집 직후 전처리 단계 벤치마크: 메시지 필터링, 연속 메시지 병합"""
+from main import coalesce_messages
+from utils.message_filters import apply_all_filters
+
+
+def test_apply_all_filters(benchmark, messages):
+    benchmark.group = "preprocess"
+    filtered, stats = benchmark(apply_all_filters, messages)
+    assert stats["original_count"] == len(messages)
+    assert 0 < len(filtered) <= len(messages)
+
+
+def test_coalesce_messages(benchmark, messages):
+    benchmark.group = "preprocess"
+    merged = benchmark(coalesce_messages, messages)
+    assert 0 < len(merged) < len(messages)
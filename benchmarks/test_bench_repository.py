@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""TODO 저장소 벤치마크: 빈 DB 일괄 추가, 기존 DB 증분 업데이트"""
+from src.ui.todo.repository import TodoRepository
+
+
+def test_todo_repository_upsert_new(benchmark, todos, tmp_path, bench_rounds):
+    benchmark.group = "repository"
+    counter = iter(range(1_000_000))
+
+    def setup():
+        repo = TodoRepository(str(tmp_path / f"todos_{next(counter)}.db"))
+        return (repo, todos), {}
+
+    def upsert(repo, rows):
+        try:
+            return repo.upsert_todos(rows)
+        finally:
+            repo.close()
+
+    stats = benchmark.pedantic(upsert, setup=setup, rounds=bench_rounds, iterations=1)
+    assert stats["added"] == len(todos)
+
+
+def test_todo_repository_upsert_existing(benchmark, todos, tmp_path, bench_rounds):
+    benchmark.group = "repository"
+    repo = TodoRepository(str(tmp_path / "todos.db"))
+    repo.upsert_todos(todos)
+    # 10%만 변경된 재분석 결과
+    changed = [
+        dict(row, updated_at=f"2099-01-01T00:00:{idx % 60:02d}+00:00") if idx % 10 == 0 else row
+        for idx, row in enumerate(todos)
+    ]
+    try:
+        stats = benchmark.pedantic(repo.upsert_todos, args=(changed,), rounds=bench_rounds, iterations=1)
+    finally:
+        repo.close()
+    assert stats["added"] == 0
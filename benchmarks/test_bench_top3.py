@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Top3 선정 벤치마크: 점수 기반 선정, 자연어 규칙 기반 LLM 선정 (스텁 LLM)"""
+import pytest
+
+from services.top3_service import Top3Service
+from benchmarks.synthetic import user_profile
+
+
+def _make_service(tmp_path, requester_rule: bool = False) -> Top3Service:
+    service = Top3Service(
+        config_path=str(tmp_path / "top3_config.json"),
+        people_data=[user_profile()],
+    )
+    if requester_rule:
+        service.update_entity_rules({"requester": {"dev.1@quickchat.dev": 8.0}})
+    return service
+
+
+def test_top3_pick_score_based(benchmark, todos, tmp_path, bench_rounds):
+    benchmark.group = "top3"
+
+    def setup():
+        return (_make_service(tmp_path), todos), {"use_llm": False}
+
+    def pick(service, items, use_llm):
+        return service.pick_top3(items, use_llm=use_llm)
+
+    selected = benchmark.pedantic(pick, setup=setup, rounds=bench_rounds, iterations=1)
+    assert len(selected) == 3
+
+
+def test_top3_pick_llm(benchmark, todos, tmp_path, bench_rounds, stub_llm):
+    # LLMClient의 Azure 경로는 openai SDK로 호출
+    pytest.importorskip("openai")
+    benchmark.group = "top3"
+
+    def setup():
+        return (_make_service(tmp_path, requester_rule=True), todos), {}
+
+    def pick(service, items):
+        return service.pick_top3(items, use_llm=True)
+
+    stub_llm.reset_stats()
+    selected = benchmark.pedantic(pick, setup=setup, rounds=bench_rounds, iterations=1)
+    assert selected
+    assert stub_llm.stats.by_kind.get("top3", 0) >= 1
@@ -23,11 +23,15 @@ from utils.datetime_utils import parse_iso_datetime, is_in_time_range, ensure_ut
 from data_sources.manager import DataSourceManager
 from data_sources.json_source import JSONDataSource
 from data_sources.virtualoffice_source import VirtualOfficeDataSource
-from services.analysis_pipeline_service import AnalysisPipelineService
+from src.utils.async_logging import setup_logging
+from src.utils.tracing import current_span, get_tracer, traced
 # 로컬 JSON 파일은 더 이상 사용하지 않음 (VDOS DB 사용)
 # DEFAULT_DATASET_ROOT = project_root / "data" / "multi_project_8week_ko"
 DEFAULT_DATASET_ROOT = None  # VirtualOffice 전용
 
+# 중복 TODO 유형 우선순위: meeting > deadline > review > task > response
+_DEDUP_TYPE_PRIORITY = {"meeting": 5, "deadline": 4, "review": 3, "task": 2, "response": 1}
+
 # # Windows 한글 출력 설정
 # import sys
 # if hasattr(sys.stdout, "reconfigure"):  # Python 3.7+
@@ -35,10 +39,8 @@ DEFAULT_DATASET_ROOT = None  # VirtualOffice 전용
 #     sys.stderr.reconfigure(encoding="utf-8")
 # # 아니면 아예 아무 것도 안 해도 됨
 
-
-from nlp.summarize import MessageSummarizer
-from nlp.priority_ranker import PriorityRanker
-from nlp.action_extractor import ActionExtractor
+# NLP 스택(요약/우선순위/액션 추출)과 AnalysisPipelineService는 무거운 LLM 의존성을
+# 끌고 오므로 SmartAssistant에서 처음 사용할 때 임포트합니다.
 
 def _ensure_todo_table(conn: sqlite3.Connection) -> None:
     """todos_cache.db에 todos 테이블이 없으면 생성한다."""
@@ -108,11 +110,8 @@ def _sort_key(msg: dict) -> datetime:
         except Exception:
             return datetime.min.replace(tzinfo=timezone.utc)
 
-# 로깅 설정 (간단하게)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (비동기 큐 핸들러 + 반복 로그 억제, LOG_PROFILE/LOG_LEVEL 환경 변수로 조정)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 def coalesce_messages(msgs, window_seconds=90, max_chars=1200):
@@ -255,9 +254,10 @@ class SmartAssistant:
         # 로컬 JSON 파일은 더 이상 사용하지 않음 (VDOS 전용)
         self.dataset_root = None  # VirtualOffice 전용
 
-        self.summarizer = MessageSummarizer()
-        self.priority_ranker = PriorityRanker()
-        self.action_extractor = ActionExtractor()
+        # NLP 구성요소는 처음 사용할 때 생성 (lazy initialization)
+        self._summarizer = None
+        self._priority_ranker = None
+        self._action_extractor = None
         
         self.collected_messages: List[Dict[str, Any]] = []
         self.summaries = []
@@ -266,6 +266,11 @@ class SmartAssistant:
 
         self.analysis_report_text = ""     # 분석 결과 탭에 뿌릴 통합 리포트 문자열
         self.conversation_summary = None   # 대화 단위 요약(딕셔너리)
+        # 분석 배치별 TODO를 TODO DB에 바로 저장할지 (백그라운드 선분석은 False)
+        self.persist_batch_todos = True
+        # 수집 메시지/TODO를 의미 인덱스에 추가할지 (SEMANTIC_INDEX=1, CLI 워커는 False)
+        from src.config.settings import SEMANTIC_INDEX_CONFIG
+        self.semantic_indexing = SEMANTIC_INDEX_CONFIG["enabled"]
 
         self.personas: List[Dict[str, Any]] = []
         self.persona_by_email: Dict[str, Dict[str, Any]] = {}
@@ -345,9 +350,46 @@ class SmartAssistant:
             logger.error(f"❌ Top3Service 초기화 실패: {e}")
             self.top3_service = None
     
+    @property
+    def summarizer(self):
+        """MessageSummarizer (처음 접근 시 생성)"""
+        if self._summarizer is None:
+            from nlp.summarize import MessageSummarizer
+            self._summarizer = MessageSummarizer()
+        return self._summarizer
+
+    @summarizer.setter
+    def summarizer(self, value):
+        self._summarizer = value
+
+    @property
+    def priority_ranker(self):
+        """PriorityRanker (처음 접근 시 생성)"""
+        if self._priority_ranker is None:
+            from nlp.priority_ranker import PriorityRanker
+            self._priority_ranker = PriorityRanker()
+        return self._priority_ranker
+
+    @priority_ranker.setter
+    def priority_ranker(self, value):
+        self._priority_ranker = value
+
+    @property
+    def action_extractor(self):
+        """ActionExtractor (처음 접근 시 생성)"""
+        if self._action_extractor is None:
+            from nlp.action_extractor import ActionExtractor
+            self._action_extractor = ActionExtractor()
+        return self._action_extractor
+
+    @action_extractor.setter
+    def action_extractor(self, value):
+        self._action_extractor = value
+
     def _ensure_pipeline_service(self):
         """AnalysisPipelineService lazy initialization (순환 참조 방지)"""
         if self._pipeline_service is None:
+            from services.analysis_pipeline_service import AnalysisPipelineService
             self._pipeline_service = AnalysisPipelineService(
                 data_source_manager=self.data_source_manager,
                 priority_ranker=self.priority_ranker,
@@ -395,6 +437,12 @@ class SmartAssistant:
         
         logger.info(f"✅ VirtualOffice 데이터 소스로 전환 완료 (페르소나: {persona_dict.get('name', 'Unknown')})")
 
+    def set_user_profile(self, persona: Dict[str, Any]) -> None:
+        """분석 기준 사용자(페르소나) 지정 (JSON 데이터셋에서 페르소나별로 분석할 때 사용)"""
+        self.user_profile = persona
+        pipeline = self._ensure_pipeline_service()
+        pipeline.set_user_profile(persona)
+
     def _load_json(self, filename: str) -> Any:
         # dataset_root가 None이면 FileNotFoundError 발생
         if self.dataset_root is None:
@@ -569,6 +617,7 @@ class SmartAssistant:
         logger.info("✅ 초기화 완료 (오프라인 데이터셋)")
 
         
+    @traced("collect")
     async def collect_messages(
         self,
         email_limit: Optional[int] = None,
@@ -618,8 +667,10 @@ class SmartAssistant:
         
         # 메시지 병합 (연속된 메시지 합치기)
         # 주의: coalesce_messages는 미리보기용으로만 사용하고, 원본 메시지는 _message_index에 저장
-        merged = coalesce_messages(messages, window_seconds=90, max_chars=1200)
-        merged.sort(key=_sort_key, reverse=True)
+        with get_tracer().span("coalesce", messages=len(messages)) as span:
+            merged = coalesce_messages(messages, window_seconds=90, max_chars=1200)
+            merged.sort(key=_sort_key, reverse=True)
+            span.set(merged=len(merged))
 
         self.collected_messages = merged
         # 원본 메시지 전체 내용 보존을 위한 인덱스 (병합 전 원본 메시지 사용)
@@ -637,8 +688,36 @@ class SmartAssistant:
             len(chat_messages),
             len(email_messages),
         )
+        current_span().set(messages=len(messages), collected=len(self.collected_messages))
+        self._schedule_semantic_indexing(messages=messages)
         return self.collected_messages
 
+    def _schedule_semantic_indexing(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        todos: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """수집된 메시지/생성된 TODO를 의미 인덱스(FAISS)에 백그라운드로 추가
+
+        `semantic_indexing`이 꺼져 있거나 임베딩(sentence-transformers)을 사용할 수 없으면
+        아무 것도 하지 않습니다.
+        """
+        if not self.semantic_indexing:
+            return
+        try:
+            from src.services.semantic_index_service import get_semantic_index_service
+
+            index_service = get_semantic_index_service()
+            if not index_service.is_available():
+                return
+            if messages:
+                index_service.schedule_messages(messages)
+            if todos:
+                index_service.schedule_todos(todos)
+        except Exception as e:
+            logger.warning(f"⚠️ 의미 인덱싱 예약 실패: {e}")
+
+    @traced("analyze")
     async def analyze_messages(self):
         """메시지 분석 (레거시 호환성 유지)
         
@@ -712,7 +791,8 @@ class SmartAssistant:
 
         # 1) 우선순위 분류
         logger.info("🎯 우선순위 분류 중...")
-        self.ranked_messages = await self.priority_ranker.rank_messages(self.collected_messages)
+        with get_tracer().span("rank", messages=len(self.collected_messages)):
+            self.ranked_messages = await self.priority_ranker.rank_messages(self.collected_messages)
 
         # 2단계 TODO 생성 전략 (개선):
         # 1단계: 키워드 기반으로 임시 TODO 생성 (빠름, 제한 없음)
@@ -726,75 +806,79 @@ class SmartAssistant:
         all_messages = [m for (m, _) in self.ranked_messages]
         
         # 1-1) 사전 필터링: 너무 짧거나 단순 인사 메시지 제외
-        filtered_messages = []
-        too_short_count = 0
-        greeting_count = 0
-        simple_update_count = 0
-        
-        # 단순 인사 패턴
-        greeting_only_patterns = [
-            "안녕하세요", "안녕하십니까", "수고하세요", "수고하십시오", "감사합니다", "고맙습니다",
-            "hello", "hi there", "good morning", "good afternoon", "good evening",
-            "좋은 하루 되세요", "좋은 하루", "화이팅", "파이팅"
-        ]
-        
-        # 간단 업데이트 패턴 (의미 없는 상태 공유) - 제목이나 내용에 포함
-        simple_update_patterns = [
-            "간단 업데이트", "업무 공유", "현재 작업 상황", "작업 상황 공유", "오늘의 일정",
-            "현재 집중 작업", "작업자:", "업데이트:", "진행 상황", "상황 공유",
-            "simple update", "status update", "quick update", "daily update", "work update"
-        ]
-        
-        for msg in all_messages:
-            content = (msg.get("content") or msg.get("body") or "").strip()
-            subject = (msg.get("subject") or "").strip()
-            combined = f"{subject} {content}".lower()
+        with get_tracer().span("prefilter", messages=len(all_messages)) as prefilter_span:
+            filtered_messages = []
+            too_short_count = 0
+            greeting_count = 0
+            simple_update_count = 0
             
-            # 너무 짧은 메시지 (15자 미만)
-            if len(content) < 15:
-                too_short_count += 1
-                continue
+            # 단순 인사 패턴
+            greeting_only_patterns = [
+                "안녕하세요", "안녕하십니까", "수고하세요", "수고하십시오", "감사합니다", "고맙습니다",
+                "hello", "hi there", "good morning", "good afternoon", "good evening",
+                "좋은 하루 되세요", "좋은 하루", "화이팅", "파이팅"
+            ]
+            
+            # 간단 업데이트 패턴 (의미 없는 상태 공유) - 제목이나 내용에 포함
+            simple_update_patterns = [
+                "간단 업데이트", "업무 공유", "현재 작업 상황", "작업 상황 공유", "오늘의 일정",
+                "현재 집중 작업", "작업자:", "업데이트:", "진행 상황", "상황 공유",
+                "simple update", "status update", "quick update", "daily update", "work update"
+            ]
             
-            # 단순 인사만 있는 메시지 (40자 미만)
-            if len(content) < 40:
-                content_clean = content.lower().strip().replace("!", "").replace(".", "").replace("~", "").replace(",", "").strip()
-                is_greeting_only = any(pattern in content_clean for pattern in [p.lower() for p in greeting_only_patterns])
+            for msg in all_messages:
+                content = (msg.get("content") or msg.get("body") or "").strip()
+                subject = (msg.get("subject") or "").strip()
+                combined = f"{subject} {content}".lower()
                 
-                # 구체적인 내용이 없으면 제외
-                if is_greeting_only:
-                    greeting_count += 1
-                    logger.debug(f"[1차 필터링] 단순 인사 제외: {content[:30]}")
+                # 너무 짧은 메시지 (15자 미만)
+                if len(content) < 15:
+                    too_short_count += 1
                     continue
-            
-            # 간단 업데이트 메시지 (200자 미만이면서 간단 업데이트 패턴 포함하고 액션 키워드 없음)
-            if len(content) < 200:
-                has_simple_update = any(pattern in combined for pattern in simple_update_patterns)
                 
-                if has_simple_update:
-                    # 구체적인 액션 키워드가 있는지 확인
-                    action_keywords = [
-                        "요청", "부탁", "확인해", "검토해", "제출", "보고서", "회의", "미팅", "마감", "완료해",
-                        "필요", "해주", "드립니다", "바랍니다",
-                        "request", "please", "check", "review", "submit", "report", "meeting", "deadline", "need"
-                    ]
-                    has_action = any(keyword in combined for keyword in action_keywords)
+                # 단순 인사만 있는 메시지 (40자 미만)
+                if len(content) < 40:
+                    content_clean = content.lower().strip().replace("!", "").replace(".", "").replace("~", "").replace(",", "").strip()
+                    is_greeting_only = any(pattern in content_clean for pattern in [p.lower() for p in greeting_only_patterns])
                     
-                    if not has_action:
-                        simple_update_count += 1
-                        logger.debug(f"[1차 필터링] 간단 업데이트 제외: {subject[:30]} - {content[:50]}")
+                    # 구체적인 내용이 없으면 제외
+                    if is_greeting_only:
+                        greeting_count += 1
+                        logger.debug(f"[1차 필터링] 단순 인사 제외: {content[:30]}")
                         continue
+                
+                # 간단 업데이트 메시지 (200자 미만이면서 간단 업데이트 패턴 포함하고 액션 키워드 없음)
+                if len(content) < 200:
+                    has_simple_update = any(pattern in combined for pattern in simple_update_patterns)
+                    
+                    if has_simple_update:
+                        # 구체적인 액션 키워드가 있는지 확인
+                        action_keywords = [
+                            "요청", "부탁", "확인해", "검토해", "제출", "보고서", "회의", "미팅", "마감", "완료해",
+                            "필요", "해주", "드립니다", "바랍니다",
+                            "request", "please", "check", "review", "submit", "report", "meeting", "deadline", "need"
+                        ]
+                        has_action = any(keyword in combined for keyword in action_keywords)
+                        
+                        if not has_action:
+                            simple_update_count += 1
+                            logger.debug(f"[1차 필터링] 간단 업데이트 제외: {subject[:30]} - {content[:50]}")
+                            continue
+                
+                filtered_messages.append(msg)
             
-            filtered_messages.append(msg)
-        
-        if too_short_count > 0 or greeting_count > 0 or simple_update_count > 0:
-            logger.info(f"🔍 1차 필터링: 짧은 메시지 {too_short_count}개, 단순 인사 {greeting_count}개, 간단 업데이트 {simple_update_count}개 제외")
-            logger.info(f"   → {len(all_messages)}개 → {len(filtered_messages)}개 메시지로 TODO 후보 추출")
+            if too_short_count > 0 or greeting_count > 0 or simple_update_count > 0:
+                logger.info(f"🔍 1차 필터링: 짧은 메시지 {too_short_count}개, 단순 인사 {greeting_count}개, 간단 업데이트 {simple_update_count}개 제외")
+                logger.info(f"   → {len(all_messages)}개 → {len(filtered_messages)}개 메시지로 TODO 후보 추출")
+            prefilter_span.set(kept=len(filtered_messages))
         
         # 모든 메시지에서 키워드 기반 액션 추출
-        temp_actions = await self.action_extractor.batch_extract_actions(
-            filtered_messages,
-            user_email=user_email,
-        )
+        with get_tracer().span("extract_actions", messages=len(filtered_messages)) as span:
+            temp_actions = await self.action_extractor.batch_extract_actions(
+                filtered_messages,
+                user_email=user_email,
+            )
+            span.set(actions=len(temp_actions))
         logger.info(f"⚡ 1단계 완료: 키워드 기반 임시 TODO {len(temp_actions)}개 생성")
         
         # 1-0) 생성된 TODO 중 의미 없는 것만 필터링 (제목 길이는 상관없음)
@@ -819,98 +903,23 @@ class SmartAssistant:
         
         temp_actions = filtered_actions
         
-        # 1-1) 임시 TODO 중복 제거 (내용 기반, 90% 이상 유사도)
+        # 1-1) 임시 TODO 중복 제거 (같은 메시지 내 내용 90% 이상 유사도, MinHash-LSH)
         if temp_actions:
-            def _calculate_similarity(text1: str, text2: str) -> float:
-                """두 텍스트의 유사도 계산 (0.0 ~ 1.0)"""
-                if not text1 or not text2:
-                    return 0.0
-                
-                # 간단한 단어 기반 유사도 (Jaccard similarity)
-                words1 = set(text1.lower().split())
-                words2 = set(text2.lower().split())
-                
-                if not words1 or not words2:
-                    return 0.0
-                
-                intersection = words1 & words2
-                union = words1 | words2
-                
-                return len(intersection) / len(union) if union else 0.0
-            
-            # 같은 source_message_id로 그룹화
-            from collections import defaultdict
-            message_groups = defaultdict(list)
-            for action in temp_actions:
-                msg_id = action.source_message_id if hasattr(action, 'source_message_id') else None
-                if msg_id:
-                    message_groups[msg_id].append(action)
-            
-            # 각 그룹에서 중복 제거
-            filtered_actions = []
-            duplicate_count = 0
-            
-            for msg_id, actions in message_groups.items():
-                if len(actions) == 1:
-                    # 그룹에 액션이 1개면 그대로 추가
-                    filtered_actions.extend(actions)
-                else:
-                    # 여러 개면 내용 유사도 기반 중복 제거 (90% 이상)
-                    kept_actions = []
-                    
-                    for action in actions:
-                        is_duplicate = False
-                        action_desc = action.description if hasattr(action, 'description') else ""
-                        
-                        # 이미 유지하기로 한 액션들과 비교
-                        for kept in kept_actions:
-                            kept_desc = kept.description if hasattr(kept, 'description') else ""
-                            similarity = _calculate_similarity(action_desc, kept_desc)
-                            
-                            # 유사도 90% 이상이면 중복으로 간주
-                            if similarity >= 0.9:
-                                is_duplicate = True
-                                # 유형 우선순위: meeting > deadline > review > task > response
-                                type_priority = {
-                                    "meeting": 5,
-                                    "deadline": 4,
-                                    "review": 3,
-                                    "task": 2,
-                                    "response": 1
-                                }
-                                
-                                current_type = action.action_type if hasattr(action, 'action_type') else ""
-                                kept_type = kept.action_type if hasattr(kept, 'action_type') else ""
-                                
-                                current_type_priority = type_priority.get(current_type, 0)
-                                kept_type_priority = type_priority.get(kept_type, 0)
-                                
-                                # 현재 액션이 더 높은 우선순위 유형이면 교체
-                                if current_type_priority > kept_type_priority:
-                                    kept_actions.remove(kept)
-                                    kept_actions.append(action)
-                                    logger.debug(f"[임시TODO 중복제거] {kept_type} → {current_type} 교체 (유사도: {similarity:.2f})")
-                                else:
-                                    logger.debug(f"[임시TODO 중복제거] {current_type} 제거 (유사도: {similarity:.2f}, 유지: {kept_type})")
-                                
-                                duplicate_count += 1
-                                break
-                        
-                        if not is_duplicate:
-                            kept_actions.append(action)
-                    
-                    filtered_actions.extend(kept_actions)
-            
-            # 메시지 ID가 없는 액션들도 추가
-            for action in temp_actions:
-                msg_id = action.source_message_id if hasattr(action, 'source_message_id') else None
-                if not msg_id:
-                    filtered_actions.append(action)
+            from src.services.todo_deduplication_service import get_todo_deduplication_service
+
+            before_count = len(temp_actions)
+            temp_actions, duplicate_count = get_todo_deduplication_service().deduplicate(
+                temp_actions,
+                text_of=lambda action: getattr(action, "description", "") or "",
+                type_of=lambda action: getattr(action, "action_type", "") or "",
+                group_of=lambda action: getattr(action, "source_message_id", None),
+                threshold=0.9,
+                cross_group_threshold=None,  # 메시지 간 중복은 최종 TODO 단계에서 처리
+                type_priority=_DEDUP_TYPE_PRIORITY,
+            )
             
             if duplicate_count > 0:
-                logger.info(f"🔄 임시 TODO 중복 제거: {duplicate_count}개 제거 ({len(temp_actions)}개 → {len(filtered_actions)}개)")
-            
-            temp_actions = filtered_actions
+                logger.info(f"🔄 임시 TODO 중복 제거: {duplicate_count}개 제거 ({before_count}개 → {len(temp_actions)}개)")
         
         # 2) 임시 TODO가 생성된 메시지만 LLM 분석
         # 임시 TODO의 source_message_id로 원본 메시지 찾기
@@ -954,141 +963,144 @@ class SmartAssistant:
         logger.info(f"   → 임시 TODO가 생성된 {len(temp_action_msg_ids)}개 메시지 중 {total_to_analyze}개 분석 (배치 크기: {BATCH_SIZE}개)")
         
         # 배치로 나누어 분석 + 배치별 TODO 저장
-        all_summaries = []
-        num_batches = (total_to_analyze + BATCH_SIZE - 1) // BATCH_SIZE
-        
-        for batch_idx in range(num_batches):
-            start_idx = batch_idx * BATCH_SIZE
-            end_idx = min(start_idx + BATCH_SIZE, total_to_analyze)
-            batch_messages = messages_to_analyze[start_idx:end_idx]
-            
-            logger.info(f"   📦 배치 {batch_idx + 1}/{num_batches}: {len(batch_messages)}개 메시지 분석 중...")
-            
-            # 배치 분석
-            batch_summaries = await self.summarizer.batch_summarize(batch_messages)
-            all_summaries.extend(batch_summaries)
-            
-            logger.info(f"   ✅ 배치 {batch_idx + 1}/{num_batches} 완료 (누적: {len(all_summaries)}/{total_to_analyze}개)")
+        with get_tracer().span("summarize", messages=total_to_analyze, batch_size=BATCH_SIZE) as summarize_span:
+            all_summaries = []
+            num_batches = (total_to_analyze + BATCH_SIZE - 1) // BATCH_SIZE
             
-            # 배치별 TODO 생성 및 저장 (UI 즉시 업데이트)
-            try:
-                # 현재 배치의 summary를 msg_id로 매핑
-                batch_summary_by_id = {}
-                for m, s in zip(batch_messages, batch_summaries):
-                    if s and not getattr(s, "original_id", None):
-                        s.original_id = m.get("msg_id")
-                    batch_summary_by_id[m["msg_id"]] = s
+            for batch_idx in range(num_batches):
+                start_idx = batch_idx * BATCH_SIZE
+                end_idx = min(start_idx + BATCH_SIZE, total_to_analyze)
+                batch_messages = messages_to_analyze[start_idx:end_idx]
+                
+                logger.info(f"   📦 배치 {batch_idx + 1}/{num_batches}: {len(batch_messages)}개 메시지 분석 중...")
+                
+                # 배치 분석
+                with get_tracer().span("summarize_batch", batch=batch_idx + 1, messages=len(batch_messages)):
+                    batch_summaries = await self.summarizer.batch_summarize(batch_messages)
+                all_summaries.extend(batch_summaries)
                 
-                # 현재 배치의 액션만 필터링
-                batch_filtered_actions = []
-                for action in temp_actions:
-                    msg_id = action.source_message_id if hasattr(action, 'source_message_id') else None
-                    if msg_id in batch_summary_by_id:
-                        summary = batch_summary_by_id[msg_id]
-                        if summary and hasattr(summary, "action_required") and summary.action_required:
-                            batch_filtered_actions.append(action)
+                logger.info(f"   ✅ 배치 {batch_idx + 1}/{num_batches} 완료 (누적: {len(all_summaries)}/{total_to_analyze}개)")
                 
-                # 배치 TODO 생성
-                if batch_filtered_actions:
-                    batch_todos = []
-                    persona_name = self.user_profile.get('name') if hasattr(self, 'user_profile') and self.user_profile else None
+                # 배치별 TODO 생성 및 저장 (UI 즉시 업데이트)
+                try:
+                    # 현재 배치의 summary를 msg_id로 매핑
+                    batch_summary_by_id = {}
+                    for m, s in zip(batch_messages, batch_summaries):
+                        if s and not getattr(s, "original_id", None):
+                            s.original_id = m.get("msg_id")
+                        batch_summary_by_id[m["msg_id"]] = s
                     
-                    for action in batch_filtered_actions:
+                    # 현재 배치의 액션만 필터링
+                    batch_filtered_actions = []
+                    for action in temp_actions:
                         msg_id = action.source_message_id if hasattr(action, 'source_message_id') else None
-                        # 전체 메시지 리스트에서 찾기 (배치에 없을 수도 있음)
-                        message = msg_by_id.get(msg_id) if msg_id else None
-                        if message:
-                            # TODO 아이템 생성
-                            recipient_type = message.get("recipient_type", "to")
-                            platform = message.get("platform", "")
-                            source_type = "메일" if platform == "email" else "메시지"
-                            
-                            # 원본 메시지에서 전체 내용 가져오기
-                            original_content = message.get("content") or message.get("body") or ""
-                            original_subject = message.get("subject") or ""
-                            
-                            todo_item = {
-                                "id": action.action_id if hasattr(action, 'action_id') else action.get("action_id"),
-                                "title": action.title if hasattr(action, 'title') else action.get("title"),
-                                "description": action.description if hasattr(action, 'description') else action.get("description"),
-                                "priority": action.priority if hasattr(action, 'priority') else action.get("priority", "medium"),
-                                "deadline": action.deadline if hasattr(action, 'deadline') else action.get("deadline"),
-                                "requester": (action.requester if hasattr(action, 'requester') else action.get("requester")) or message.get("sender"),
-                                "type": action.action_type if hasattr(action, 'action_type') else action.get("action_type"),
-                                "status": "pending",
-                                "recipient_type": recipient_type,
-                                "source_type": source_type,
-                                "persona_name": persona_name,
-                                "source_message": {
-                                    "id": message.get("msg_id"),
-                                    "sender": message.get("sender"),
-                                    "subject": original_subject,
-                                    "content": original_content,  # 전체 내용 포함
-                                    "body": original_content,     # body도 포함 (호환성)
-                                    "platform": message.get("platform"),
-                                    "recipient_type": recipient_type,
-                                    "is_read": True,
-                                    "date": message.get("date") or message.get("timestamp") or message.get("sent_at"),
-                                },
-                                "created_at": action.created_at if hasattr(action, 'created_at') else action.get("created_at"),
-                                "_viewed": False,
-                            }
-                            batch_todos.append(todo_item)
+                        if msg_id in batch_summary_by_id:
+                            summary = batch_summary_by_id[msg_id]
+                            if summary and hasattr(summary, "action_required") and summary.action_required:
+                                batch_filtered_actions.append(action)
                     
-                    # DB에 저장 (직접 SQLite 사용)
-                    if batch_todos:
-                        import sqlite3
-                        from pathlib import Path
-                        
-                        # TODO DB 경로 (virtualoffice/src/virtualoffice/todos_cache.db)
-                        project_root = Path(__file__).parent
-                        db_path = project_root.parent / "virtualoffice" / "src" / "virtualoffice" / "todos_cache.db"
+                    # 배치 TODO 생성
+                    if batch_filtered_actions:
+                        batch_todos = []
+                        persona_name = self.user_profile.get('name') if hasattr(self, 'user_profile') and self.user_profile else None
                         
-                        conn = sqlite3.connect(str(db_path))
-                        cur = conn.cursor()
-                        _ensure_todo_table(conn)
-                        
-                        for todo in batch_todos:
-                            cur.execute("""
-                                INSERT OR REPLACE INTO todos (
-                                    id, title, description, priority, deadline, deadline_ts,
-                                    requester, type, status, source_message, created_at, updated_at,
-                                    snooze_until, is_top3, evidence, deadline_confidence,
-                                    recipient_type, source_type, persona_name, project_tag, draft_subject, draft_body
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                todo.get("id"),
-                                todo.get("title"),
-                                todo.get("description"),
-                                todo.get("priority"),
-                                todo.get("deadline"),
-                                None,  # deadline_ts
-                                todo.get("requester"),
-                                todo.get("type"),
-                                todo.get("status", "pending"),
-                                json.dumps(todo.get("source_message"), ensure_ascii=False) if todo.get("source_message") else None,
-                                todo.get("created_at") or datetime.now(timezone.utc).isoformat(),
-                                datetime.now(timezone.utc).isoformat(),
-                                None,  # snooze_until
-                                0,  # is_top3
-                                todo.get("evidence"),
-                                todo.get("deadline_confidence"),
-                                todo.get("recipient_type"),
-                                todo.get("source_type"),
-                                todo.get("persona_name"),
-                                todo.get("project"),
-                                todo.get("draft_subject"),
-                                todo.get("draft_body")
-                            ))
+                        for action in batch_filtered_actions:
+                            msg_id = action.source_message_id if hasattr(action, 'source_message_id') else None
+                            # 전체 메시지 리스트에서 찾기 (배치에 없을 수도 있음)
+                            message = msg_by_id.get(msg_id) if msg_id else None
+                            if message:
+                                # TODO 아이템 생성
+                                recipient_type = message.get("recipient_type", "to")
+                                platform = message.get("platform", "")
+                                source_type = "메일" if platform == "email" else "메시지"
+                                
+                                # 원본 메시지에서 전체 내용 가져오기
+                                original_content = message.get("content") or message.get("body") or ""
+                                original_subject = message.get("subject") or ""
+                                
+                                todo_item = {
+                                    "id": action.action_id if hasattr(action, 'action_id') else action.get("action_id"),
+                                    "title": action.title if hasattr(action, 'title') else action.get("title"),
+                                    "description": action.description if hasattr(action, 'description') else action.get("description"),
+                                    "priority": action.priority if hasattr(action, 'priority') else action.get("priority", "medium"),
+                                    "deadline": action.deadline if hasattr(action, 'deadline') else action.get("deadline"),
+                                    "requester": (action.requester if hasattr(action, 'requester') else action.get("requester")) or message.get("sender"),
+                                    "type": action.action_type if hasattr(action, 'action_type') else action.get("action_type"),
+                                    "status": "pending",
+                                    "recipient_type": recipient_type,
+                                    "source_type": source_type,
+                                    "persona_name": persona_name,
+                                    "source_message": {
+                                        "id": message.get("msg_id"),
+                                        "sender": message.get("sender"),
+                                        "subject": original_subject,
+                                        "content": original_content,  # 전체 내용 포함
+                                        "body": original_content,     # body도 포함 (호환성)
+                                        "platform": message.get("platform"),
+                                        "recipient_type": recipient_type,
+                                        "is_read": True,
+                                        "date": message.get("date") or message.get("timestamp") or message.get("sent_at"),
+                                    },
+                                    "created_at": action.created_at if hasattr(action, 'created_at') else action.get("created_at"),
+                                    "_viewed": False,
+                                }
+                                batch_todos.append(todo_item)
                         
-                        conn.commit()
-                        conn.close()
-                        logger.info(f"   💾 배치 {batch_idx + 1}/{num_batches}: {len(batch_todos)}개 TODO 저장 완료 → UI 업데이트 가능")
-            except Exception as e:
-                logger.error(f"   ❌ 배치 {batch_idx + 1} TODO 저장 실패: {e}", exc_info=True)
-        
-        self.summaries = all_summaries
-        logger.info(f"✅ 전체 LLM 분석 완료: {len(self.summaries)}개 메시지")
+                        # DB에 저장 (직접 SQLite 사용)
+                        if batch_todos and self.persist_batch_todos:
+                            import sqlite3
+                            from pathlib import Path
+                            
+                            # TODO DB 경로 (virtualoffice/src/virtualoffice/todos_cache.db)
+                            project_root = Path(__file__).parent
+                            db_path = project_root.parent / "virtualoffice" / "src" / "virtualoffice" / "todos_cache.db"
+                            
+                            conn = sqlite3.connect(str(db_path))
+                            cur = conn.cursor()
+                            _ensure_todo_table(conn)
+                            
+                            for todo in batch_todos:
+                                cur.execute("""
+                                    INSERT OR REPLACE INTO todos (
+                                        id, title, description, priority, deadline, deadline_ts,
+                                        requester, type, status, source_message, created_at, updated_at,
+                                        snooze_until, is_top3, evidence, deadline_confidence,
+                                        recipient_type, source_type, persona_name, project_tag, draft_subject, draft_body
+                                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                """, (
+                                    todo.get("id"),
+                                    todo.get("title"),
+                                    todo.get("description"),
+                                    todo.get("priority"),
+                                    todo.get("deadline"),
+                                    None,  # deadline_ts
+                                    todo.get("requester"),
+                                    todo.get("type"),
+                                    todo.get("status", "pending"),
+                                    json.dumps(todo.get("source_message"), ensure_ascii=False) if todo.get("source_message") else None,
+                                    todo.get("created_at") or datetime.now(timezone.utc).isoformat(),
+                                    datetime.now(timezone.utc).isoformat(),
+                                    None,  # snooze_until
+                                    0,  # is_top3
+                                    todo.get("evidence"),
+                                    todo.get("deadline_confidence"),
+                                    todo.get("recipient_type"),
+                                    todo.get("source_type"),
+                                    todo.get("persona_name"),
+                                    todo.get("project"),
+                                    todo.get("draft_subject"),
+                                    todo.get("draft_body")
+                                ))
+                            
+                            conn.commit()
+                            conn.close()
+                            logger.info(f"   💾 배치 {batch_idx + 1}/{num_batches}: {len(batch_todos)}개 TODO 저장 완료 → UI 업데이트 가능")
+                except Exception as e:
+                    logger.error(f"   ❌ 배치 {batch_idx + 1} TODO 저장 실패: {e}", exc_info=True)
+            
+            self.summaries = all_summaries
+            logger.info(f"✅ 전체 LLM 분석 완료: {len(self.summaries)}개 메시지")
+            summarize_span.set(batches=num_batches, summaries=len(all_summaries))
         
         # msg_id → summary 맵
         summary_by_id = {}
@@ -1156,7 +1168,8 @@ class SmartAssistant:
             try:
                 all_msgs = sorted(self.collected_messages, key=_sort_key)
                 if all_msgs:
-                    conv = await self.summarizer.summarize_conversation(all_msgs)
+                    with get_tracer().span("conversation_summary", messages=len(all_msgs)):
+                        conv = await self.summarizer.summarize_conversation(all_msgs)
                     summary_line = ""
                     if isinstance(conv, dict):
                         self.conversation_summary = conv
@@ -1178,14 +1191,17 @@ class SmartAssistant:
 
 
         # 6) 분석 결과 탭 텍스트 생성 (우선순위 섹션 포함)
-        sections_text = await build_overall_analysis_text(self, results)
+        with get_tracer().span("report", results=len(results)):
+            sections_text = await build_overall_analysis_text(self, results)
         self.analysis_report_text = sections_text
+        current_span().set(messages=len(self.collected_messages), results=len(results))
 
 
         logger.info(f"🔍 {len(results)}개 메시지 분석 완료")
         return results
 
         
+    @traced("todo_generation")
     async def generate_todo_list(self, analysis_results: List[Dict]) -> Dict:
         """TODO 리스트 생성"""
         logger.info("📋 TODO 리스트 생성 중...")
@@ -1406,94 +1422,27 @@ class SmartAssistant:
         # ❹ 정렬: 우선순위 내림차순, 마감 오름차순
         todo_items.sort(key=lambda x: (-x["_priority_val"], x["_deadline_dt"]))
         
-        # ❹-0 중복 제거: 같은 메시지에서 생성된 TODO 중 내용이 유사한 것 제거
+        # ❹-0 중복 제거 (MinHash-LSH 후보 + Jaccard 검증)
+        #   - 같은 메시지에서 생성된 TODO: 내용 70% 이상 유사
+        #   - 다른 메시지에서 생성된 TODO: 같은 요청자 + 내용 90% 이상 유사
         if todo_items:
-            def _calculate_similarity(text1: str, text2: str) -> float:
-                """두 텍스트의 유사도 계산 (0.0 ~ 1.0)"""
-                if not text1 or not text2:
-                    return 0.0
-                
-                # 간단한 단어 기반 유사도 (Jaccard similarity)
-                words1 = set(text1.lower().split())
-                words2 = set(text2.lower().split())
-                
-                if not words1 or not words2:
-                    return 0.0
-                
-                intersection = words1 & words2
-                union = words1 | words2
-                
-                return len(intersection) / len(union) if union else 0.0
-            
-            # 같은 source_message_id로 그룹화
-            from collections import defaultdict
-            message_groups = defaultdict(list)
-            for todo in todo_items:
-                msg_id = todo.get("source_message", {}).get("id")
-                if msg_id:
-                    message_groups[msg_id].append(todo)
-            
-            # 각 그룹에서 중복 제거
-            filtered_todos = []
-            duplicate_count = 0
-            
-            for msg_id, todos in message_groups.items():
-                if len(todos) == 1:
-                    # 그룹에 TODO가 1개면 그대로 추가
-                    filtered_todos.extend(todos)
-                else:
-                    # 여러 개면 내용 유사도 기반 중복 제거
-                    kept_todos = []
-                    
-                    for todo in todos:
-                        is_duplicate = False
-                        todo_desc = todo.get("description", "")
-                        
-                        # 이미 유지하기로 한 TODO들과 비교
-                        for kept in kept_todos:
-                            kept_desc = kept.get("description", "")
-                            similarity = _calculate_similarity(todo_desc, kept_desc)
-                            
-                            # 유사도 70% 이상이면 중복으로 간주
-                            if similarity >= 0.7:
-                                is_duplicate = True
-                                # 유형 우선순위: meeting > deadline > review > task > response
-                                type_priority = {
-                                    "meeting": 5,
-                                    "deadline": 4,
-                                    "review": 3,
-                                    "task": 2,
-                                    "response": 1
-                                }
-                                
-                                current_type_priority = type_priority.get(todo.get("type"), 0)
-                                kept_type_priority = type_priority.get(kept.get("type"), 0)
-                                
-                                # 현재 TODO가 더 높은 우선순위 유형이면 교체
-                                if current_type_priority > kept_type_priority:
-                                    kept_todos.remove(kept)
-                                    kept_todos.append(todo)
-                                    logger.info(f"[중복제거] {kept.get('type')} → {todo.get('type')} 교체 (유사도: {similarity:.2f})")
-                                else:
-                                    logger.info(f"[중복제거] {todo.get('type')} 제거 (유사도: {similarity:.2f}, 유지: {kept.get('type')})")
-                                
-                                duplicate_count += 1
-                                break
-                        
-                        if not is_duplicate:
-                            kept_todos.append(todo)
-                    
-                    filtered_todos.extend(kept_todos)
-            
-            # 메시지 ID가 없는 TODO들도 추가
-            for todo in todo_items:
-                if not todo.get("source_message", {}).get("id"):
-                    filtered_todos.append(todo)
+            from src.services.todo_deduplication_service import get_todo_deduplication_service
+
+            before_count = len(todo_items)
+            todo_items, duplicate_count = get_todo_deduplication_service().deduplicate(
+                todo_items,
+                text_of=lambda todo: todo.get("description", "") or "",
+                type_of=lambda todo: todo.get("type", "") or "",
+                group_of=lambda todo: (todo.get("source_message") or {}).get("id"),
+                owner_of=lambda todo: (todo.get("requester") or "").strip().lower(),
+                threshold=0.7,
+                cross_group_threshold=0.9,
+                type_priority=_DEDUP_TYPE_PRIORITY,
+            )
             
             if duplicate_count > 0:
-                logger.info(f"🔄 중복 TODO {duplicate_count}개 제거 ({len(todo_items)}개 → {len(filtered_todos)}개)")
+                logger.info(f"🔄 중복 TODO {duplicate_count}개 제거 ({before_count}개 → {len(todo_items)}개)")
             
-            todo_items = filtered_todos
             # 다시 정렬
             todo_items.sort(key=lambda x: (-x["_priority_val"], x["_deadline_dt"]))
 
@@ -1584,11 +1533,19 @@ class SmartAssistant:
             "items": todo_items,
         }
         logger.info(f"🔍 [DEBUG] 전체 actions: {total_actions}개, 최종 TODO: {len(todo_items)}개")
+        current_span().set(actions=total_actions, todos=len(todo_items))
+        self._schedule_semantic_indexing(todos=todo_items)
         return todo_list
         
     async def cleanup(self):
         """리소스 정리"""
         logger.info("🧹 리소스 정리 중...")
+        try:
+            from src.services.semantic_index_service import close_semantic_index_service
+
+            close_semantic_index_service()
+        except Exception as e:
+            logger.warning(f"⚠️ 의미 인덱스 저장 실패: {e}")
         logger.info("✅ 정리 완료")
     
     async def run_full_cycle(
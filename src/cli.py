@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 배치 분석 CLI
+
+GUI 없이 오프라인 JSON 데이터셋(team_personas.json, chat_communications.json,
+email_communications.json)을 페르소나별로 분석해 TODO 스냅샷을 만듭니다.
+페르소나마다 별도 프로세스에서 `SmartAssistant` 전체 파이프라인(수집 → 분석 → TODO 생성)을
+실행하고, 끝나는 순서대로 결과를 JSONL로 기록합니다.
+
+출력 (--out 디렉터리):
+- results.jsonl: 페르소나별 결과 한 줄 (TODO, 단계별 소요 시간, 오류)
+- summary.json: 전체 실행 요약 (단계별 합계/최대 시간)
+
+`--cache-db`를 주면 결과를 `PersonaTodoCacheService` 영구 캐시에도 저장하므로,
+서버에서 미리 만든 스냅샷 DB를 데스크톱에 복사해 바로 불러올 수 있습니다.
+
+사용 예:
+    python -m src.cli analyze --dataset data/multi_project_8week_ko --personas all --workers 4 --out results/
+    python -m src.cli analyze --dataset data/multi_project_8week_ko --personas pm,designer --out results/ \\
+        --cache-db data/persona_todo_cache.db --data-version 120
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+logger = logging.getLogger("src.cli")
+
+STAGES = ("init", "collect", "analyze", "todo")
+
+
+def _ensure_import_path() -> None:
+    """`main`과 src 하위 모듈을 임포트할 수 있도록 경로 추가 (spawn 자식 프로세스 포함)"""
+    for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def load_personas(dataset: Path) -> List[Dict[str, Any]]:
+    """데이터셋의 team_personas.json 로드"""
+    path = dataset / "team_personas.json"
+    if not path.exists():
+        raise FileNotFoundError(f"페르소나 파일을 찾을 수 없습니다: {path}")
+    with path.open("r", encoding="utf-8") as fp:
+        personas = json.load(fp)
+    return personas if isinstance(personas, list) else []
+
+
+def select_personas(personas: List[Dict[str, Any]], selector: str) -> List[Dict[str, Any]]:
+    """`all` 또는 쉼표로 구분한 이메일/핸들/이름으로 페르소나 선택"""
+    if not selector or selector.strip().lower() == "all":
+        return list(personas)
+    wanted = {token.strip().lower() for token in selector.split(",") if token.strip()}
+    selected = []
+    for persona in personas:
+        keys = {
+            str(persona.get(name) or "").strip().lower()
+            for name in ("email_address", "chat_handle", "name", "id")
+        }
+        if keys & wanted:
+            selected.append(persona)
+    return selected
+
+
+def persona_key(persona: Dict[str, Any]) -> str:
+    """GUI(`SmartAssistantGUI._build_persona_key`)와 같은 페르소나 캐시 식별자"""
+    email = str(persona.get("email_address") or "").strip()
+    handle = str(persona.get("chat_handle") or "").strip()
+    parts = [p for p in (email, handle) if p]
+    if not parts:
+        parts = [str(persona.get("id") or "").strip() or str(persona.get("name") or "").strip() or "unknown_persona"]
+    return "|".join(parts)
+
+
+def analyze_persona(job: Dict[str, Any]) -> Dict[str, Any]:
+    """한 페르소나 분석 (워커 프로세스에서 실행)
+
+    Args:
+        job: {"dataset", "persona", "collect_options", "log_level"}
+
+    Returns:
+        결과 레코드 (JSON 직렬화 가능)
+    """
+    _ensure_import_path()
+    from src.utils.async_logging import flush_logging, setup_logging
+
+    setup_logging(
+        level=job.get("log_level", "WARNING"),
+        fmt="%(asctime)s [%(processName)s] %(levelname)s %(name)s: %(message)s",
+    )
+    persona = job["persona"]
+    timings: Dict[str, float] = {}
+    record: Dict[str, Any] = {
+        "persona": persona_key(persona),
+        "persona_name": persona.get("name"),
+        "started_at": datetime.now().isoformat(),
+    }
+
+    def _timed(stage: str, started: float) -> None:
+        timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+    async def _run() -> None:
+        started = time.perf_counter()
+        from main import SmartAssistant
+
+        assistant = SmartAssistant()
+        # 서버 배치 결과는 JSONL/캐시로만 내보냄 (데스크톱 TODO DB에 쓰지 않음)
+        assistant.persist_batch_todos = False
+        # 워커 프로세스들이 같은 의미 인덱스 파일을 동시에 쓰지 않도록 인덱싱 끔
+        assistant.semantic_indexing = False
+        assistant.set_dataset_root(job["dataset"])
+        assistant.set_user_profile(persona)
+        _timed("init", started)
+
+        try:
+            started = time.perf_counter()
+            messages = await assistant.collect_messages(**job.get("collect_options", {}))
+            _timed("collect", started)
+            record["message_count"] = len(messages)
+            if not messages:
+                record["todos"] = []
+                return
+
+            started = time.perf_counter()
+            analysis_results = await assistant.analyze_messages()
+            _timed("analyze", started)
+
+            started = time.perf_counter()
+            todo_list = await assistant.generate_todo_list(analysis_results)
+            _timed("todo", started)
+
+            items = (todo_list or {}).get("items", [])
+            record["todos"] = items
+            record["todo_count"] = len(items)
+            record["analysis_count"] = len(analysis_results or [])
+            if job.get("include_analysis"):
+                record["analysis_results"] = analysis_results
+                record["messages"] = messages
+        finally:
+            await assistant.cleanup()
+
+    from src.utils.sampling_profiler import get_sampling_profiler
+    from src.utils.tracing import get_tracer
+
+    total_started = time.perf_counter()
+    run_span = get_tracer().start_span("analysis_run", category="run", persona=record["persona"])
+    profile = get_sampling_profiler().start("analysis_run")
+    try:
+        asyncio.run(_run())
+        record["status"] = "ok"
+        get_tracer().end_span(run_span)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+        get_tracer().end_span(run_span, error=e)
+    profile_files = get_sampling_profiler().stop(profile)
+    if profile_files:
+        record["profile_files"] = [str(path) for path in profile_files]
+    record["timings_ms"] = timings
+    # LLM 호출/토큰, 캐시 적중 등 트레이스 카운터 합계
+    record["trace_id"] = run_span.trace_id
+    record["counters"] = {**run_span.counter_snapshot(), **run_span.cache_ratios()}
+    record["total_ms"] = round((time.perf_counter() - total_started) * 1000, 1)
+    record["finished_at"] = datetime.now().isoformat()
+    # 풀 워커 프로세스는 atexit을 실행하지 않으므로 작업마다 로그 큐를 비움
+    flush_logging()
+    # 자식 프로세스에서 직렬화 문제를 미리 드러내도록 JSON 호환 형태로 변환
+    return json.loads(json.dumps(record, ensure_ascii=False, default=str))
+
+
+def _save_to_persona_cache(cache_service, record: Dict[str, Any], data_version: str) -> None:
+    """결과를 페르소나 영구 캐시에 저장 (GUI가 같은 틱에서 바로 불러옴)"""
+    from src.services.persona_todo_cache_service import CacheKey, CachedAnalysisResult
+
+    cache_key = CacheKey(
+        persona_id=record["persona"],
+        time_range_start=None,
+        time_range_end=None,
+        data_version=data_version,
+    )
+    todos = record.get("todos", [])
+    cache_service.put(
+        cache_key,
+        CachedAnalysisResult(
+            cache_key=cache_key.to_hash(),
+            persona_id=record["persona"],
+            todo_list=todos,
+            messages=record.get("messages", []),
+            analysis_summary={
+                "total_messages": record.get("message_count", 0),
+                "todo_count": len(todos),
+                "source": "cli",
+            },
+            analysis_data=record.get("analysis_results", []),
+            created_at=datetime.now(),
+            last_accessed_at=datetime.now(),
+        ),
+    )
+
+
+def _summarize(records: List[Dict[str, Any]], wall_ms: float) -> Dict[str, Any]:
+    stage_totals = {stage: 0.0 for stage in STAGES}
+    stage_max = {stage: 0.0 for stage in STAGES}
+    for record in records:
+        for stage, value in (record.get("timings_ms") or {}).items():
+            stage_totals[stage] = round(stage_totals.get(stage, 0.0) + value, 1)
+            stage_max[stage] = max(stage_max.get(stage, 0.0), value)
+    return {
+        "personas": len(records),
+        "succeeded": sum(1 for r in records if r.get("status") == "ok"),
+        "failed": [r["persona"] for r in records if r.get("status") != "ok"],
+        "todo_count": sum(r.get("todo_count", 0) for r in records),
+        "wall_ms": round(wall_ms, 1),
+        "stage_total_ms": stage_totals,
+        "stage_max_ms": stage_max,
+    }
+
+
+def run_analyze(args: argparse.Namespace) -> int:
+    dataset = Path(args.dataset).resolve()
+    personas = select_personas(load_personas(dataset), args.personas)
+    if not personas:
+        print(f"분석할 페르소나가 없습니다: --personas {args.personas}", file=sys.stderr)
+        return 2
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results_path = out_dir / "results.jsonl"
+
+    collect_options: Dict[str, Any] = {"force_reload": True}
+    if args.limit:
+        collect_options["overall_limit"] = args.limit
+
+    cache_service = None
+    if args.cache_db:
+        from src.services.persona_todo_cache_service import (
+            PersonaTodoCacheService,
+            dataset_identity,
+            make_data_version,
+        )
+
+        cache_service = PersonaTodoCacheService(db_path=args.cache_db)
+        # 같은 틱이라도 데이터셋이 다르면 다른 캐시 키가 되도록 데이터셋 식별자 포함
+        data_version = make_data_version(args.data_version, dataset_identity(str(dataset)))
+        cache_service.set_data_version(data_version)
+
+    jobs = [
+        {
+            "dataset": str(dataset),
+            "persona": persona,
+            "collect_options": collect_options,
+            "log_level": args.log_level,
+            "include_analysis": bool(args.cache_db or args.include_analysis),
+        }
+        for persona in personas
+    ]
+    workers = max(1, min(args.workers, len(jobs)))
+    print(f"▶ {len(jobs)}명 분석 시작 (프로세스 {workers}개) → {results_path}", file=sys.stderr)
+
+    records: List[Dict[str, Any]] = []
+    wall_started = time.perf_counter()
+    # Windows와 동일하게 spawn 사용 (부모 프로세스의 스레드/락 상태를 물려받지 않음)
+    context = multiprocessing.get_context("spawn")
+    with results_path.open("w", encoding="utf-8") as results_fp, ProcessPoolExecutor(
+        max_workers=workers, mp_context=context
+    ) as executor:
+        futures = {executor.submit(analyze_persona, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                record = future.result()
+            except Exception as e:  # 워커 프로세스 비정상 종료
+                record = {
+                    "persona": persona_key(futures[future]["persona"]),
+                    "status": "error",
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            if cache_service is not None and record.get("status") == "ok":
+                _save_to_persona_cache(cache_service, record, data_version)
+            if not args.include_analysis:
+                record.pop("analysis_results", None)
+                record.pop("messages", None)
+
+            results_fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+            results_fp.flush()
+            records.append(record)
+
+            timings = " ".join(f"{k}={v:.0f}ms" for k, v in (record.get("timings_ms") or {}).items())
+            status = "✅" if record.get("status") == "ok" else f"❌ {record.get('error')}"
+            print(
+                f"  [{len(records)}/{len(jobs)}] {record['persona']}: TODO {record.get('todo_count', 0)}개 "
+                f"{timings} {status}",
+                file=sys.stderr,
+            )
+
+    if cache_service is not None:
+        cache_service.close()
+
+    summary = _summarize(records, (time.perf_counter() - wall_started) * 1000)
+    with (out_dir / "summary.json").open("w", encoding="utf-8") as fp:
+        json.dump(summary, fp, ensure_ascii=False, indent=2)
+    print(
+        f"■ 완료: 성공 {summary['succeeded']}/{summary['personas']}, TODO {summary['todo_count']}개, "
+        f"{summary['wall_ms'] / 1000:.1f}초 | 단계 합계 "
+        + " ".join(f"{k}={v / 1000:.1f}s" for k, v in summary["stage_total_ms"].items()),
+        file=sys.stderr,
+    )
+    return 0 if not summary["failed"] else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Smart Assistant 헤드리스 배치 분석")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser("analyze", help="오프라인 데이터셋을 페르소나별로 분석")
+    analyze.add_argument("--dataset", required=True, help="데이터셋 디렉터리 (team_personas.json 등)")
+    analyze.add_argument("--personas", default="all", help="all 또는 쉼표 구분 이메일/핸들/이름")
+    analyze.add_argument("--workers", type=int, default=max(1, (multiprocessing.cpu_count() or 2) // 2),
+                         help="동시 분석 프로세스 수")
+    analyze.add_argument("--out", default="results", help="결과 디렉터리 (results.jsonl, summary.json)")
+    analyze.add_argument("--limit", type=int, default=None, help="페르소나별 최대 메시지 수")
+    analyze.add_argument("--include-analysis", action="store_true",
+                         help="JSONL에 분석 결과와 메시지 원본도 포함")
+    analyze.add_argument("--cache-db", default=None, help="결과를 저장할 페르소나 영구 캐시 DB 경로")
+    analyze.add_argument("--data-version", default="0", help="캐시 키 데이터 버전 (시뮬레이션 틱)")
+    analyze.add_argument("--log-level", default="WARNING", help="워커 로그 레벨")
+    analyze.set_defaults(func=run_analyze)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    _ensure_import_path()
+    args = build_parser().parse_args(argv)
+    from src.utils.async_logging import setup_logging
+
+    setup_logging(level=args.log_level, fmt="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
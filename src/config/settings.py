@@ -15,6 +15,26 @@ load_dotenv(PROJECT_ROOT / ".env", override=True)
 # 데이터베이스 경로
 DATABASE_PATH = PROJECT_ROOT / "data" / "assistant.db"
 FAISS_INDEX_PATH = PROJECT_ROOT / "data" / "faiss_index"
+# 일별/주별/월별 그룹 요약 영구 캐시
+GROUP_SUMMARY_CACHE_PATH = PROJECT_ROOT / "data" / "group_summary_cache.db"
+# 페르소나별 분석 결과 캐시 (메모리 LRU + 디스크 스냅샷)
+PERSONA_TODO_CACHE_CONFIG = {
+    "db_path": os.getenv("PERSONA_CACHE_DB", str(PROJECT_ROOT / "data" / "persona_todo_cache.db")),
+    "persistent": os.getenv("PERSONA_CACHE_PERSIST", "1") not in ("0", "false", "False"),
+    "max_entries": 10,
+    "max_memory_mb": 64,
+    "max_disk_mb": 256,
+}
+# 최근 전환한 페르소나 백그라운드 선분석 (유휴 시간에만 실행)
+PERSONA_PREFETCH_CONFIG = {
+    "enabled": os.getenv("PERSONA_PREFETCH_ENABLED", "1") not in ("0", "false", "False"),
+    "max_concurrency": int(os.getenv("PERSONA_PREFETCH_CONCURRENCY", "1")),
+    "max_personas": 3,          # 한 번에 선분석할 최대 페르소나 수
+    "idle_delay_sec": 10,       # 전경 작업 종료 후 선분석 시작까지 대기 시간
+    "history_size": 8,          # 기억할 최근 전환 페르소나 수
+    "max_runs_per_hour": int(os.getenv("PERSONA_PREFETCH_MAX_RUNS_PER_HOUR", "6")),  # 시간당 최대 선분석 수
+    "min_refresh_sec": 600,     # 같은 페르소나 재선분석 최소 간격 (틱이 바뀌어도 이 시간 안에는 건너뜀)
+}
 
 # 로그 경로
 LOG_PATH = PROJECT_ROOT / "logs"
@@ -22,15 +42,6 @@ LOG_PATH = PROJECT_ROOT / "logs"
 
 # LLM 설정 및 로컬 저장소 경로
 CONFIG_STORE_PATH = PROJECT_ROOT / "config" / "settings_rules.json"
-CONFIG_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
-if not CONFIG_STORE_PATH.exists():
-    with open(CONFIG_STORE_PATH, "w", encoding="utf-8") as fh:
-        json.dump(
-            {"top3_rules": {"weights": None, "entities": None}},
-            fh,
-            ensure_ascii=False,
-            indent=2,
-        )
 
 
 LLM_CONFIG = {
@@ -61,6 +72,68 @@ LLM_CONFIG = {
     "temperature": 0.2,
 }
 
+# 로컬 임베딩 설정 (sentence-transformers, CPU)
+EMBEDDING_CONFIG = {
+    # 한국어/영어 혼용 업무 메시지용 다국어 경량 모델
+    "model": os.getenv("EMBEDDING_MODEL", "paraphrase-multilingual-MiniLM-L12-v2"),
+    "device": os.getenv("EMBEDDING_DEVICE", "cpu"),
+    "batch_size": 32,
+    "cache_size": 5000,  # 내용 해시 기준 임베딩 캐시 항목 수
+}
+
+# 메시지/TODO 의미 인덱스 (FAISS_INDEX_PATH, 사용 시 TODO 검색창에 의미 검색 결과 포함)
+SEMANTIC_INDEX_CONFIG = {
+    "enabled": os.getenv("SEMANTIC_INDEX", "0").lower() in ("1", "true", "yes"),
+    "search_top_k": 20,      # 검색어당 의미 검색 후보 수
+    "min_similarity": 0.5,   # 이 유사도 이상만 검색 결과에 포함
+}
+
+# Top3 LLM 후보 사전 순위화 (후보가 많을 때 프롬프트 크기 제한)
+TOP3_PRERANK_CONFIG = {
+    "min_candidates": 40,   # 후보가 이보다 많을 때만 사전 순위화
+    "semantic_top_k": 30,   # 규칙과 의미적으로 가까운 후보 수
+    "score_top_k": 20,      # 점수 기반 상위 후보 수
+}
+
+# 프로젝트 태그 점수 기반 캐스케이드 (결정적 신호 신뢰도가 낮을 때만 LLM 호출)
+PROJECT_TAG_CASCADE_CONFIG = {
+    "llm_threshold": float(os.getenv("PROJECT_TAG_LLM_THRESHOLD", "0.8")),  # 이 이상이면 LLM 생략
+    "min_confidence": 0.4,            # LLM 실패 시 결정적 신호를 그대로 쓰는 최소 신뢰도
+    "sender_single_confidence": 0.7,  # 단일 프로젝트 발신자 신호 신뢰도
+    "chat_score_scale": 80,           # 채팅 매칭 점수 → 신뢰도 (점수 / scale)
+    "use_classifier": True,           # ProjectClassifier 키워드 점수 사용 여부
+}
+
+# 대화 요약 (긴 대화는 구간별 요약 후 병합하는 map-reduce 방식)
+CONVERSATION_SUMMARY_CONFIG = {
+    "max_chars": 12000,      # 한 번의 요약 프롬프트에 넣는 최대 대화 길이
+    "chunk_chars": 6000,     # map 단계 구간(채팅방/스레드 + 일자) 최대 길이
+    "map_concurrency": 4,    # 동시에 요약하는 구간 수
+    "cache_size": 512,       # 구간/병합 요약 캐시 항목 수 (내용 해시 기준)
+}
+
+# 분석 단계별 트레이싱 (스팬은 항상 메모리에 기록, 파일 내보내기는 선택)
+TRACING_CONFIG = {
+    "export_enabled": os.getenv("TRACE_EXPORT", "0") not in ("0", "false", "False"),
+    "export_format": os.getenv("TRACE_FORMAT", "chrome"),  # chrome | otlp | both
+    "export_dir": os.getenv("TRACE_DIR", str(PROJECT_ROOT / "data" / "traces")),
+    "max_files": 50,         # 내보내기 디렉터리에 유지할 최대 파일 수
+    "buffer_size": 5000,     # 메모리에 보관할 최근 스팬 수
+    "history_size": 20,      # 보관할 최근 분석 실행 수
+}
+
+# 샘플링 프로파일러 (분석 실행/GUI 새로고침 중 스택 샘플링, 성능 패널에서도 켜고 끌 수 있음)
+PROFILING_CONFIG = {
+    "enabled": os.getenv("PROFILE_SAMPLING", "0") not in ("0", "false", "False"),
+    "interval_ms": float(os.getenv("PROFILE_INTERVAL_MS", "10")),  # 샘플링 간격
+    "output_format": os.getenv("PROFILE_FORMAT", "both"),  # collapsed | speedscope | both
+    "output_dir": os.getenv("PROFILE_DIR", str(PROJECT_ROOT / "data" / "profiles")),
+    "max_depth": 64,         # 샘플당 최대 스택 깊이
+    "max_files": 40,         # 출력 디렉터리에 유지할 최대 파일 수
+    "min_duration_ms": 200,  # 이보다 짧은 세션은 파일로 쓰지 않음 (잦은 GUI 새로고침)
+    "history_size": 20,      # 보관할 최근 프로파일 요약 수
+}
+
 # UI 설정
 UI_CONFIG = {
     "window_width": 1200,
@@ -144,3 +217,36 @@ LOGGING_CONFIG = {
         "handlers": ["console"]
     }
 }
+
+# 로깅 프로필 (src/utils/async_logging.py)
+# - 로그는 큐에 넣기만 하고 별도 스레드(QueueListener)가 포맷/출력
+# - 같은 호출 위치의 INFO 이하 로그는 window_seconds마다 per_window개까지만 출력 (나머지는 개수만 요약)
+# - sample_rates: 모듈(로거 이름 접두사, "src." 생략)별 INFO 이하 로그 샘플링 비율
+# - production: 항목별 로그는 DEBUG로만 남기고, 반복 로그를 더 강하게 억제하며 JSON 한 줄 형식으로 출력
+LOG_PROFILE = os.getenv("LOG_PROFILE", "development")
+LOG_PROFILES = {
+    "development": {
+        "level": os.getenv("LOG_LEVEL", "INFO"),
+        "format": os.getenv("LOG_FORMAT", "text"),  # text | json
+        "file": os.getenv("LOG_FILE"),
+        "rate_limit": {"per_window": 50, "window_seconds": 10.0},
+        "sample_rates": {},
+        "module_levels": {},
+    },
+    "production": {
+        "level": os.getenv("LOG_LEVEL", "INFO"),
+        "format": os.getenv("LOG_FORMAT", "json"),
+        "file": os.getenv("LOG_FILE"),
+        "rate_limit": {"per_window": 5, "window_seconds": 30.0},
+        "sample_rates": {
+            "ui.todo_panel": 0.2,
+            "services.async_project_tag_service": 0.2,
+            "services.project_tag_cache_service": 0.2,
+        },
+        "module_levels": {
+            "urllib3": "WARNING",
+            "httpx": "WARNING",
+            "openai": "WARNING",
+        },
+    },
+}
@@ -1,14 +1,21 @@
-"""VirtualOffice 연동 모듈"""
-
-from .virtualoffice_client import VirtualOfficeClient
-from .models import SimulationStatus, PersonaInfo, VirtualOfficeConfig
-from .converters import (
-    convert_email_to_internal_format,
-    convert_message_to_internal_format,
-    build_persona_maps
-)
-from .polling_worker import PollingWorker
-from .simulation_monitor import SimulationMonitor
+"""VirtualOffice 연동 모듈
+
+공개 이름은 처음 접근할 때 해당 하위 모듈을 임포트합니다 (PEP 562).
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    'VirtualOfficeClient': '.virtualoffice_client',
+    'SimulationStatus': '.models',
+    'PersonaInfo': '.models',
+    'VirtualOfficeConfig': '.models',
+    'convert_email_to_internal_format': '.converters',
+    'convert_message_to_internal_format': '.converters',
+    'build_persona_maps': '.converters',
+    'PollingWorker': '.polling_worker',
+    'SimulationMonitor': '.simulation_monitor',
+}
 
 __all__ = [
     'VirtualOfficeClient',
@@ -21,3 +28,16 @@ __all__ = [
     'PollingWorker',
     'SimulationMonitor',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -104,8 +104,7 @@ class VirtualOfficeManager:
             
             logger.info(f"PollingWorker 시작 중... (폴링 간격: {interval}초)")
             self.polling_worker = PollingWorker(data_source, polling_interval=interval)
-            self.polling_worker.new_data_received.connect(self.main_window.on_new_data_received)
-            self.polling_worker.error_occurred.connect(self.main_window.on_polling_error)
+            self.main_window._connect_polling_worker(self.polling_worker)
             self.polling_worker.start()
             logger.info("✅ PollingWorker 시작됨")
             
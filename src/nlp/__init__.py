@@ -1,10 +1,28 @@
 # -*- coding: utf-8 -*-
 """
 NLP 패키지 - 자연어 처리 모듈들 (요약, 우선순위 분류, 액션 추출)
+
+LLM 클라이언트 등 무거운 의존성은 클래스에 처음 접근할 때 임포트합니다 (PEP 562).
 """
+import importlib
 
-from .summarize import MessageSummarizer
-from .priority_ranker import PriorityRanker
-from .action_extractor import ActionExtractor
+_LAZY_EXPORTS = {
+    'MessageSummarizer': '.summarize',
+    'PriorityRanker': '.priority_ranker',
+    'ActionExtractor': '.action_extractor',
+}
 
 __all__ = ['MessageSummarizer', 'PriorityRanker', 'ActionExtractor']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
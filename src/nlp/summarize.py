@@ -3,16 +3,21 @@
 메시지 요약 모듈 - LLM을 사용하여 이메일/메신저 메시지 요약
 """
 import asyncio
+import hashlib
 import logging
 import json
 import os
-from typing import Dict, List, Optional, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import functools
 import requests
 
-from config.settings import LLM_CONFIG, PRIORITY_RULES
+from config.settings import CONVERSATION_SUMMARY_CONFIG, LLM_CONFIG, PRIORITY_RULES
+from src.utils.tracing import get_tracer, trace_cache, trace_count
 
 logger = logging.getLogger(__name__)
 
@@ -54,25 +59,40 @@ class MessageSummary:
             "created_at": self.created_at.isoformat()
         }
 
+
+def _empty_conversation_summary() -> Dict[str, Any]:
+    """빈 대화 요약 결과"""
+    return {"summary": "", "key_points": [], "decisions": [], "unresolved": [], "risks": [], "action_items": []}
+
+
+_SUBJECT_PREFIX_RE = re.compile(r"^\s*((re|fw|fwd|회신|전달)\s*:\s*)+", re.IGNORECASE)
+
 class MessageSummarizer:
     """메시지 요약기"""
     
+    @staticmethod
+    def _message_ts(m: Dict) -> str:
+        return (m.get("date") or m.get("timestamp") or m.get("datetime") or "")
+
+    @staticmethod
+    def _transcript_line(m: Dict) -> Optional[str]:
+        """대화 전개문 한 줄 (본문이 없거나 시스템 메시지면 None)"""
+        sender = (m.get("sender") or m.get("username") or "").strip()
+        text   = (m.get("content") or m.get("body") or m.get("message") or "").strip()
+        if not text:
+            return None
+        if (m.get("type") == "system") or (sender.lower() == "system"):
+            return None
+        return f"{sender}: {text}"
+
     def _build_transcript(self, messages: List[Dict], max_chars: int = 12000) -> str:
         """여러 메시지를 시간순으로 묶어 한 번에 요약할 수 있는 전개문 생성"""
         rows, total = [], 0
 
-        def _ts(m):
-            return (m.get("date") or m.get("timestamp") or m.get("datetime") or "")
-
-        for m in sorted(messages, key=_ts):
-            sender = (m.get("sender") or m.get("username") or "").strip()
-            text   = (m.get("content") or m.get("body") or m.get("message") or "").strip()
-            if not text:
-                continue
-            if (m.get("type") == "system") or (sender.lower() == "system"):
+        for m in sorted(messages, key=self._message_ts):
+            line = self._transcript_line(m)
+            if line is None:
                 continue
-
-            line = f"{sender}: {text}"
             if total + len(line) > max_chars:
                 break
             rows.append(line)
@@ -80,6 +100,56 @@ class MessageSummarizer:
 
         return "\n".join(rows)
 
+    @staticmethod
+    def _conversation_thread_key(m: Dict) -> str:
+        """map 단계 구간 분할용 대화 단위 (채팅방 / 이메일 스레드 / 제목)"""
+        room = m.get("room_slug") or m.get("room_id") or (m.get("metadata") or {}).get("room_slug")
+        if room:
+            return f"채팅방 {room}"
+        if m.get("thread_id"):
+            return f"스레드 {m['thread_id']}"
+        subject = _SUBJECT_PREFIX_RE.sub("", (m.get("subject") or "").strip())
+        if subject:
+            return f"메일 '{subject[:40]}'"
+        return "기타"
+
+    def _chunk_conversation(self, messages: List[Dict], chunk_chars: int) -> List[Tuple[str, str]]:
+        """대화를 (채팅방/스레드, 일자) 구간으로 나누고 길면 `chunk_chars` 단위로 분할
+
+        구간 경계가 메시지 내용에만 의존하므로, 새 메시지가 추가되면
+        해당 구간(대개 마지막 구간)만 내용이 바뀌고 나머지는 요약 캐시를 재사용합니다.
+
+        Returns:
+            시간순 [(구간 레이블, 전개문)] 리스트
+        """
+        buckets: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+        first_ts: Dict[Tuple[str, str], str] = {}
+        for m in sorted(messages, key=self._message_ts):
+            line = self._transcript_line(m)
+            if line is None:
+                continue
+            ts = str(self._message_ts(m))
+            key = (self._conversation_thread_key(m), ts[:10] or "날짜 없음")
+            buckets.setdefault(key, []).append(line[:chunk_chars])
+            first_ts.setdefault(key, ts)
+
+        chunks: List[Tuple[str, str, str]] = []
+        for (thread_key, day), lines in buckets.items():
+            label = f"{day} {thread_key}"
+            part, size, index = [], 0, 1
+            for line in lines:
+                if part and size + len(line) > chunk_chars:
+                    chunks.append((first_ts[(thread_key, day)], f"{label} #{index}", "\n".join(part)))
+                    part, size, index = [], 0, index + 1
+                part.append(line)
+                size += len(line) + 1
+            if part:
+                chunk_label = f"{label} #{index}" if index > 1 else label
+                chunks.append((first_ts[(thread_key, day)], chunk_label, "\n".join(part)))
+
+        chunks.sort(key=lambda chunk: chunk[0])
+        return [(label, transcript) for _, label, transcript in chunks]
+
     def _conversation_prompt(self, transcript: str) -> str:
         return f"""
     아래는 여러 사람이 주고받은 대화 전체입니다. 대화 흐름을 분석해 **순수 JSON만** 출력하세요.
@@ -141,12 +211,23 @@ class MessageSummarizer:
             return "\n".join(parts)
 
     async def summarize_conversation(self, messages: List[Dict]) -> Dict:
-        """대화 전체를 1회 호출로 요약하여 dict(JSON)으로 반환"""
-        transcript = self._build_transcript(messages, max_chars=12000)
+        """대화 전체를 요약하여 dict(JSON)으로 반환
+
+        전개문이 `max_chars` 이하면 1회 호출로 요약하고,
+        넘으면 `_map_reduce_conversation()`으로 구간별 요약 후 병합합니다.
+        """
+        max_chars = CONVERSATION_SUMMARY_CONFIG["max_chars"]
+        transcript = self._build_transcript(messages, max_chars=float("inf"))
         if not transcript or not self.is_available or not self.chat_url:
-            return {"summary": "", "key_points": [], "decisions": [], "unresolved": [], "risks": [], "action_items": []}
+            return _empty_conversation_summary()
+
+        if len(transcript) > max_chars:
+            return await self._map_reduce_conversation(messages)
+
+        return await self._summarize_prompt(self._conversation_prompt(transcript))
 
-        prompt = self._conversation_prompt(transcript)
+    async def _summarize_prompt(self, prompt: str) -> Dict:
+        """대화 요약 프롬프트 1회 호출 → dict(JSON)"""
         resp_json = await self._call_chat_completion(
             [
                 {"role": "system", "content": "당신은 회의/대화 요약 전문가입니다. 액션아이템을 명확히 뽑습니다."},
@@ -156,7 +237,7 @@ class MessageSummarizer:
             max_tokens=self.max_tokens,
         )
         if not resp_json:
-            return {"summary": "", "key_points": [], "decisions": [], "unresolved": [], "risks": [], "action_items": []}
+            return _empty_conversation_summary()
 
         choices = resp_json.get("choices") or []
         text = ""
@@ -168,7 +249,104 @@ class MessageSummarizer:
         try:
             return json.loads(text[s:e])
         except Exception:
-            return {"summary": text, "key_points": [], "decisions": [], "unresolved": [], "risks": [], "action_items": []}
+            return {**_empty_conversation_summary(), "summary": text}
+
+    async def _cached_summary(self, prompt: str) -> Dict:
+        """프롬프트 내용 해시 기준으로 캐시된 요약 호출 (빈 결과는 캐시하지 않음)"""
+        cache = self._chunk_summary_cache
+        key = hashlib.sha1(f"{self.provider}|{self.model}|{prompt}".encode("utf-8")).hexdigest()
+        cached = cache.get(key)
+        trace_cache("summary_prompt", hit=cached is not None)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+        result = await self._summarize_prompt(prompt)
+        if result.get("summary"):
+            cache[key] = result
+            while len(cache) > CONVERSATION_SUMMARY_CONFIG["cache_size"]:
+                cache.popitem(last=False)
+        return result
+
+    def _reduce_prompt(self, segments: List[Tuple[str, Dict]]) -> str:
+        segment_text = "\n\n".join(
+            f"[{label}]\n" + json.dumps(summary, ensure_ascii=False)
+            for label, summary in segments
+        )
+        return f"""
+    아래는 긴 대화를 구간(채팅방/스레드, 일자)별로 나누어 요약한 결과입니다.
+    구간 요약을 시간 흐름에 맞게 하나로 병합해 **순수 JSON만** 출력하세요.
+    반드시 소문자 json이라는 단어를 포함한 json 문자열로 출력하세요.
+    중복된 포인트/결정/실행 항목은 하나로 합치고, 이후 구간에서 해결된 이슈는 unresolved에서 제외하세요.
+
+    <구간 요약>
+    {segment_text}
+
+    JSON 스키마:
+    {{
+    "summary": "대화 전체 핵심 요약 (3~6문장)",
+    "key_points": ["핵심 포인트 1", "핵심 포인트 2"],
+    "decisions": ["확정된 결정 사항"],
+    "unresolved": ["미해결/후속 필요 이슈"],
+    "risks": ["리스크/주의사항"],
+    "action_items": [
+        {{"title":"해야 할 일", "priority":"High|Medium|Low", "owner":"선택", "due":"선택"}}
+    ]
+    }}
+    """
+
+    async def _map_reduce_conversation(self, messages: List[Dict]) -> Dict:
+        """긴 대화를 구간별로 동시에 요약(map)한 뒤 계층적으로 병합(reduce)
+
+        구간 요약과 병합 결과는 프롬프트 내용 해시로 캐시되므로, 새 메시지가 추가된
+        재요약에서는 바뀐 구간과 그 위의 병합 단계만 다시 호출합니다.
+        """
+        max_chars = CONVERSATION_SUMMARY_CONFIG["max_chars"]
+        chunks = self._chunk_conversation(messages, CONVERSATION_SUMMARY_CONFIG["chunk_chars"])
+        sem = asyncio.Semaphore(CONVERSATION_SUMMARY_CONFIG["map_concurrency"])
+
+        async def summarize_chunk(label: str, transcript: str) -> Tuple[str, Dict]:
+            async with sem:
+                return label, await self._cached_summary(self._conversation_prompt(f"[{label}]\n{transcript}"))
+
+        logger.info(f"[Summarizer] 대화 map-reduce 요약: 메시지 {len(messages)}개 → 구간 {len(chunks)}개")
+        mapped = await asyncio.gather(*(summarize_chunk(label, transcript) for label, transcript in chunks))
+        segments = [(label, summary) for label, summary in mapped if summary.get("summary")]
+        if not segments:
+            return _empty_conversation_summary()
+
+        # 병합 입력이 max_chars를 넘으면 인접 구간끼리 먼저 병합 (계층적 reduce)
+        level = 1
+        while len(segments) > 1:
+            groups: List[List[Tuple[str, Dict]]] = [[]]
+            size = 0
+            for segment in segments:
+                segment_size = len(json.dumps(segment[1], ensure_ascii=False)) + len(segment[0])
+                if groups[-1] and size + segment_size > max_chars:
+                    groups.append([])
+                    size = 0
+                groups[-1].append(segment)
+                size += segment_size
+
+            if len(groups) == 1:
+                return await self._cached_summary(self._reduce_prompt(segments))
+            if all(len(group) == 1 for group in groups):
+                # 구간 하나가 max_chars를 넘는 경우: 두 개씩 묶어 진행 보장
+                groups = [segments[i:i + 2] for i in range(0, len(segments), 2)]
+
+            async def reduce_group(group: List[Tuple[str, Dict]]) -> Tuple[str, Dict]:
+                label = group[0][0] if len(group) == 1 else f"{group[0][0]} ~ {group[-1][0]}"
+                if len(group) == 1:
+                    return group[0]
+                async with sem:
+                    return label, await self._cached_summary(self._reduce_prompt(group))
+
+            logger.info(f"[Summarizer] reduce {level}단계: 구간 {len(segments)}개 → {len(groups)}개")
+            reduced = await asyncio.gather(*(reduce_group(group) for group in groups))
+            segments = [(label, summary) for label, summary in reduced if summary.get("summary")]
+            level += 1
+
+        return segments[0][1] if segments else _empty_conversation_summary()
 
     def __init__(self, api_key: str = None):
         self.provider = (LLM_CONFIG.get("provider") or "azure").lower()
@@ -181,6 +359,8 @@ class MessageSummarizer:
         self.headers: Dict[str, str] = {}
         self.payload_model: Optional[str] = self.model
         self.session = requests.Session()
+        # 대화 요약 프롬프트 해시 → 요약 결과 (LRU, CONVERSATION_SUMMARY_CONFIG["cache_size"]개)
+        self._chunk_summary_cache: "OrderedDict[str, Dict]" = OrderedDict()
 
         if self.provider == "azure":
             key = api_key or LLM_CONFIG.get("azure_api_key") or os.getenv("AZURE_OPENAI_KEY")
@@ -239,7 +419,9 @@ class MessageSummarizer:
             if force_json or self.provider == "openai":
                 payload["response_format"] = {"type": "json_object"}
 
-        logger.info("[Summarizer][LLM] provider=%s messages=%s", self.provider, json.dumps(messages, ensure_ascii=False)[:400])
+        # 요청 본문 덤프는 DEBUG에서만 (레벨이 꺼져 있으면 json.dumps 자체를 건너뜀)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Summarizer][LLM] provider=%s messages=%s", self.provider, json.dumps(messages, ensure_ascii=False)[:400])
 
         def _request():
             resp = self.session.post(self.chat_url, headers=self.headers, json=payload, timeout=40)
@@ -252,13 +434,22 @@ class MessageSummarizer:
         
         for attempt in range(max_retries):
             try:
+                started = time.perf_counter()
                 data = await asyncio.to_thread(_request)
-                logger.debug("[Summarizer][LLM] response=%s", json.dumps(data, ensure_ascii=False)[:500])
+                get_tracer().record_latency("llm", time.perf_counter() - started)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[Summarizer][LLM] response=%s", json.dumps(data, ensure_ascii=False)[:500])
+                trace_count("llm.calls")
+                usage = data.get("usage") if isinstance(data, dict) else None
+                if isinstance(usage, dict):
+                    trace_count("llm.tokens", usage.get("total_tokens") or 0)
                 return data
             except Exception as exc:
                 error_str = str(exc)
                 
                 # Check if it's a 429 (Too Many Requests) error
+                if "429" in error_str:
+                    trace_count("llm.rate_limited")
                 if "429" in error_str and attempt < max_retries - 1:
                     delay = base_delay * (2 ** attempt)  # Exponential backoff: 5s, 10s, 20s
                     logger.warning(f"[Summarizer][LLM] 429 Rate Limit - 재시도 {attempt + 1}/{max_retries} (대기: {delay}초)")
@@ -266,6 +457,7 @@ class MessageSummarizer:
                     continue
                 else:
                     logger.warning("[Summarizer][LLM] request error: %s", exc)
+                    trace_count("llm.errors")
                     return None
         
         return None
@@ -1,15 +1,30 @@
 # -*- coding: utf-8 -*-
 """
 서비스 모듈
+
+하위 모듈은 처음 접근할 때 임포트합니다 (PEP 562 `__getattr__`).
+`from src.services.time_filter_service import ...`처럼 개별 모듈만 쓰는 경우
+날씨/Top3/LLM 클라이언트 등 무거운 의존성을 함께 로드하지 않습니다.
 """
-from .weather_service import WeatherService
-from .top3_service import Top3Service, TOP3_RULE_DEFAULT, ENTITY_RULES_DEFAULT
-from .llm_client import LLMClient
-from .persona_todo_cache_service import (
-    PersonaTodoCacheService,
-    CacheKey,
-    CachedAnalysisResult
-)
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_LAZY_EXPORTS = {
+    'WeatherService': '.weather_service',
+    'Top3Service': '.top3_service',
+    'TOP3_RULE_DEFAULT': '.top3_service',
+    'ENTITY_RULES_DEFAULT': '.top3_service',
+    'LLMClient': '.llm_client',
+    'PersonaTodoCacheService': '.persona_todo_cache_service',
+    'CacheKey': '.persona_todo_cache_service',
+    'CachedAnalysisResult': '.persona_todo_cache_service',
+    'EmbeddingService': '.embedding_service',
+    'get_embedding_service': '.embedding_service',
+    'SemanticIndexService': '.semantic_index_service',
+    'get_semantic_index_service': '.semantic_index_service',
+    'GroupSummaryCacheService': '.group_summary_cache_service',
+    'get_group_summary_cache_service': '.group_summary_cache_service',
+}
 
 __all__ = [
     'WeatherService',
@@ -19,5 +34,24 @@ __all__ = [
     'PersonaTodoCacheService',
     'CacheKey',
     'CachedAnalysisResult',
-    'LLMClient'
+    'LLMClient',
+    'EmbeddingService',
+    'get_embedding_service',
+    'SemanticIndexService',
+    'get_semantic_index_service',
+    'GroupSummaryCacheService',
+    'get_group_summary_cache_service'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
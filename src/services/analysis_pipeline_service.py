@@ -10,6 +10,8 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from src.utils.tracing import current_span, get_tracer, traced
+
 logger = logging.getLogger(__name__)
 
 # TODO 중복 제거 서비스 import
@@ -82,6 +84,7 @@ class AnalysisPipelineService:
         self._user_profile = user_profile
         logger.debug(f"사용자 프로필 업데이트: {user_profile.get('name', 'Unknown')}")
     
+    @traced("pipeline", category="run")
     async def analyze_messages(
         self,
         persona_id: str,
@@ -127,6 +130,7 @@ class AnalysisPipelineService:
             }
         """
         logger.info(f"🚀 분석 파이프라인 시작 (페르소나: {persona_id})")
+        current_span().set(persona=persona_id, top_n=top_n)
         
         # 1. 메시지 수집
         messages = await self._collect_messages(
@@ -169,12 +173,8 @@ class AnalysisPipelineService:
         # 통계 업데이트
         self._stats["total_messages_analyzed"] = len(messages)
         
-        # 7. 전체 대화 요약 (메시지가 50개 이하일 때만)
-        conversation_summary = None
-        if len(messages) <= 50:
-            conversation_summary = await self._summarize_conversation(messages)
-        else:
-            logger.info(f"메시지가 {len(messages)}개로 많아 전체 대화 요약을 스킵합니다.")
+        # 7. 전체 대화 요약 (긴 대화는 요약기가 구간별 map-reduce로 처리)
+        conversation_summary = await self._summarize_conversation(messages)
         
         # 8. 분석 리포트 텍스트 생성
         analysis_report_text = await self._build_analysis_report(
@@ -190,6 +190,7 @@ class AnalysisPipelineService:
         )
         
         logger.info(f"✅ 분석 파이프라인 완료 (메시지: {len(messages)}개, TODO: {len(todo_list)}개)")
+        current_span().set(messages=len(messages), todos=len(todo_list))
         
         # 10. 자연어 규칙이 있으면 자동으로 LLM Top3 선정 (선택적)
         # Top3Service가 주입되어 있고, 자연어 규칙이 설정되어 있으면 실행
@@ -224,6 +225,7 @@ class AnalysisPipelineService:
             "analysis_report_text": analysis_report_text
         }
     
+    @traced("collect")
     async def _collect_messages(
         self,
         time_range_start: Optional[datetime],
@@ -258,7 +260,9 @@ class AnalysisPipelineService:
         # TODO 생성용 메시지 필터링 적용
         from utils.message_filters import apply_all_filters
         original_count = len(messages)
-        messages, filter_stats = apply_all_filters(messages)
+        with get_tracer().span("filter", messages=original_count) as span:
+            messages, filter_stats = apply_all_filters(messages)
+            span.set(kept=len(messages))
         
         logger.info(
             f"🔍 TODO 생성용 필터링: {original_count}개 → {len(messages)}개 "
@@ -276,8 +280,10 @@ class AnalysisPipelineService:
         
         # 메시지 병합 (연속된 메시지 합치기)
         from main import coalesce_messages, _sort_key
-        merged = coalesce_messages(messages, window_seconds=90, max_chars=1200)
-        merged.sort(key=_sort_key, reverse=True)
+        with get_tracer().span("coalesce", messages=len(messages)) as span:
+            merged = coalesce_messages(messages, window_seconds=90, max_chars=1200)
+            merged.sort(key=_sort_key, reverse=True)
+            span.set(merged=len(merged))
         
         # 메시지 타입 분석
         email_count = len([m for m in merged if m.get("type") == "email" or m.get("platform") == "email"])
@@ -291,6 +297,7 @@ class AnalysisPipelineService:
         
         return merged
     
+    @traced("rank")
     async def _rank_messages(
         self,
         messages: List[Dict[str, Any]]
@@ -298,10 +305,12 @@ class AnalysisPipelineService:
         """우선순위 분류"""
         logger.info("🎯 우선순위 분류 중...")
         ranked = await self._priority_ranker.rank_messages(messages)
+        current_span().set(messages=len(ranked))
         logger.debug(f"우선순위 분류 완료: {len(ranked)}개")
         return ranked
     
 
+    @traced("summarize")
     async def _summarize_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -324,10 +333,12 @@ class AnalysisPipelineService:
         # - Rate limit 회피 (0.2초 지연 + 자동 재시도)
         # - LLM이 action_required를 정확하게 판단
         summaries = await self._summarizer.batch_summarize(messages, batch_callback=batch_callback)
+        current_span().set(messages=len(messages), summaries=len(summaries))
         
         logger.info(f"✅ 메시지 요약 완료: {len(summaries)}개")
         return summaries
     
+    @traced("extract_actions")
     async def _extract_actions(
         self,
         messages: List[Dict[str, Any]],
@@ -437,6 +448,7 @@ class AnalysisPipelineService:
         logger.debug(f"결과 병합 완료: {len(results)}개")
         return results
     
+    @traced("todo_generation")
     def _generate_todo_list(
         self,
         analysis_results: List[Dict[str, Any]],
@@ -463,9 +475,11 @@ class AnalysisPipelineService:
             if not d:
                 return datetime.max.replace(tzinfo=timezone.utc)
             try:
-                return datetime.fromisoformat(d.replace("Z", "+00:00"))
+                parsed = datetime.fromisoformat(d.replace("Z", "+00:00"))
             except Exception:
                 return datetime.max.replace(tzinfo=timezone.utc)
+            # 액션 추출기는 naive 마감일을 돌려주므로 UTC로 맞춰 비교
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
         
         # 1단계: TO/CC 중복 제거를 위한 메시지 그룹화
         # 같은 이메일을 TO와 CC로 받았을 때, TO만 유지
@@ -522,7 +536,6 @@ class AnalysisPipelineService:
             # 날짜를 분 단위까지만 사용 (초는 무시)
             if date_str:
                 try:
-                    from datetime import datetime
                     dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
                     # 분 단위까지만 (초/마이크로초 제거)
                     date_key = dt.strftime('%Y-%m-%d %H:%M')
@@ -693,6 +706,7 @@ class AnalysisPipelineService:
         
         return todo_items
     
+    @traced("conversation_summary")
     async def _summarize_conversation(
         self,
         messages: List[Dict[str, Any]]
@@ -723,6 +737,7 @@ class AnalysisPipelineService:
             logger.warning(f"대화 요약 실패: {e}")
             return None
     
+    @traced("report")
     async def _build_analysis_report(
         self,
         analysis_results: List[Dict[str, Any]],
@@ -806,6 +821,11 @@ class AnalysisPipelineService:
         """파이프라인 통계 반환"""
         stats = self._stats.copy()
         
+        # 직전 분석 실행의 단계별 소요 시간 (트레이싱)
+        last_runs = get_tracer().recent_runs(1)
+        if last_runs:
+            stats["last_run"] = last_runs[0]
+        
         # 중복 제거 서비스 통계 추가
         if self._deduplication_service:
             dedup_stats = self._deduplication_service.get_deduplication_stats()
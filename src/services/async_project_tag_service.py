@@ -4,15 +4,25 @@
 비동기 프로젝트 태그 분석 서비스
 
 새로운 TODO가 들어올 때 백그라운드에서 프로젝트 태그를 분석하고 DB에 저장합니다.
+
+워커는 큐에서 최대 `batch_size`개(또는 `batch_window`초 동안 모인 만큼)의 작업을 꺼내
+한 번의 LLM 프롬프트로 분류하고, 결과를 작업별 콜백으로 나눠 전달합니다.
+동시에 처리하는 배치 수는 `max_concurrent_batches`로 제한합니다.
 """
 import asyncio
 import logging
 import threading
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Optional, Callable
-from queue import Queue, PriorityQueue
+from queue import Empty, Queue, PriorityQueue
 from dataclasses import dataclass
 from datetime import datetime
+
+from .todo_change_feed import CHANGE_PROJECT, get_todo_change_feed
+from src.utils.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -33,19 +43,43 @@ class ProjectTagTask:
 class AsyncProjectTagService:
     """비동기 프로젝트 태그 분석 서비스"""
     
-    def __init__(self, project_service, repository):
+    def __init__(
+        self,
+        project_service,
+        repository,
+        batch_size: int = 8,
+        batch_window: float = 0.3,
+        max_concurrent_batches: int = 2,
+    ):
+        """
+        Args:
+            project_service: ProjectTagService
+            repository: TODO 저장소
+            batch_size: 한 번의 LLM 호출로 분류할 최대 TODO 수
+            batch_window: 첫 작업 이후 배치를 채우기 위해 기다리는 최대 시간 (초)
+            max_concurrent_batches: 동시에 처리하는 배치 수
+        """
         self.project_service = project_service
         self.repository = repository
         self.task_queue = PriorityQueue()  # 우선순위 큐로 변경
         self.is_running = False
         self.worker_thread = None
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._batch_slots = threading.Semaphore(self.max_concurrent_batches)
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.stats = {
             "processed": 0,
             "cached": 0,
+            "content_cached": 0,
             "analyzed": 0,
-            "errors": 0
+            "errors": 0,
+            "batches": 0,
         }
+        self._stats_lock = threading.Lock()  # 배치 스레드들이 동시에 갱신
         self._task_counter = 0  # 같은 우선순위 내에서 순서 보장
+        self.change_feed = get_todo_change_feed()
         
         # VDOS DB와 같은 경로의 todos_cache.db 사용
         self.db_path = self._get_vdos_todos_db_path()
@@ -128,16 +162,35 @@ class AsyncProjectTagService:
             return
             
         self.is_running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_batches,
+            thread_name_prefix="project-tag-batch",
+        )
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
         self.worker_thread.start()
-        logger.info("🚀 비동기 프로젝트 태그 서비스 시작")
+        logger.info(
+            f"🚀 비동기 프로젝트 태그 서비스 시작 "
+            f"(배치 {self.batch_size}개, 동시 배치 {self.max_concurrent_batches}개)"
+        )
     
     def stop(self):
-        """백그라운드 워커 중지"""
+        """백그라운드 워커 중지
+
+        아직 실행되지 않은 배치는 취소하고(완료 콜백에서 큐 작업 완료 처리 및 슬롯 반환),
+        큐에 남은 작업도 완료 처리하여 비웁니다. 진행 중인 배치는 기다리지 않습니다.
+        """
         self.is_running = False
         if self.worker_thread:
             self.worker_thread.join(timeout=5.0)
-        logger.info("⏹️ 비동기 프로젝트 태그 서비스 중지")
+        executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        dropped = self._drain_queue()
+        logger.info(f"⏹️ 비동기 프로젝트 태그 서비스 중지 (대기 작업 {dropped}개 취소)")
+    
+    def _inc_stat(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
     
     def queue_todo_for_analysis(self, todo_id: str, todo_data: Dict, callback: Optional[Callable] = None, priority: bool = False):
         """TODO를 프로젝트 태그 분석 큐에 추가
@@ -180,9 +233,32 @@ class AsyncProjectTagService:
             cached = self.cache_service.get_cached_tag(cache_key)
             if cached and cached.get('project_tag'):
                 cached_project = cached['project_tag']
-                logger.info(f"[AsyncProjectTag] {todo_id}: 영구 캐시 히트 - {cached_project} (키: {cache_key})")
+                logger.debug("[AsyncProjectTag] %s: 영구 캐시 히트 - %s (키: %s)", todo_id, cached_project, cache_key)
+                todo_data["project"] = cached_project
+                self._inc_stat("cached")
+                self._publish_project_change(todo_id, cached_project)
+                if callback:
+                    callback(todo_id, cached_project)
+                return
+            
+            # 같은 내용의 메시지로 이미 분류된 결과 확인 (TODO ID가 바뀐 재분석 등)
+            content_key = self._content_cache_key(todo_data)
+            cached = self.cache_service.get_cached_tag_by_content(content_key)
+            if cached and cached.get('project_tag'):
+                cached_project = cached['project_tag']
+                logger.debug("[AsyncProjectTag] %s: 내용 해시 캐시 히트 - %s", todo_id, cached_project)
                 todo_data["project"] = cached_project
-                self.stats["cached"] += 1
+                self._inc_stat("cached")
+                self._inc_stat("content_cached")
+                self.cache_service.save_tag(
+                    cache_key,
+                    cached_project,
+                    confidence=cached.get('confidence'),
+                    analysis_method=cached.get('analysis_method'),
+                    classification_reason=cached.get('classification_reason'),
+                    project_full_name=cached.get('project_full_name'),
+                )
+                self._publish_project_change(todo_id, cached_project, cached.get('project_full_name'))
                 if callback:
                     callback(todo_id, cached_project)
                 return
@@ -190,9 +266,10 @@ class AsyncProjectTagService:
         # DB에서 캐시된 프로젝트 태그 확인
         cached_project = self._get_cached_project(todo_id)
         if cached_project:
-            logger.debug(f"[AsyncProjectTag] {todo_id}: DB 캐시 히트 - {cached_project}")
+            logger.debug("[AsyncProjectTag] %s: DB 캐시 히트 - %s", todo_id, cached_project)
             todo_data["project"] = cached_project
-            self.stats["cached"] += 1
+            self._inc_stat("cached")
+            self._publish_project_change(todo_id, cached_project)
             if callback:
                 callback(todo_id, cached_project)
             return
@@ -204,7 +281,7 @@ class AsyncProjectTagService:
         # (우선순위, 카운터, 태스크) 튜플로 저장
         self.task_queue.put((priority_value, self._task_counter, task))
         priority_label = "우선" if priority else "일반"
-        logger.debug(f"[AsyncProjectTag] {todo_id}: 분석 큐에 추가 ({priority_label}, 큐 크기: {self.task_queue.qsize()})")
+        logger.debug("[AsyncProjectTag] %s: 분석 큐에 추가 (%s, 큐 크기: %d)", todo_id, priority_label, self.task_queue.qsize())
     
     def queue_multiple_todos(self, todos: List[Dict], callback: Optional[Callable] = None):
         """여러 TODO를 배치로 큐에 추가"""
@@ -272,32 +349,121 @@ class AsyncProjectTagService:
         
         while self.is_running:
             try:
-                # 큐에서 작업 가져오기 (타임아웃 1초)
-                try:
-                    priority, counter, task = self.task_queue.get(timeout=1.0)
-                except:
-                    continue  # 타임아웃 시 계속 루프
+                # 배치 슬롯이 날 때까지 큐에서 꺼내지 않음 (대기 중 들어온 우선 작업이 먼저 처리되도록)
+                if not self._batch_slots.acquire(timeout=1.0):
+                    continue
+                batch = self._drain_batch()
+                if not batch:
+                    self._batch_slots.release()
+                    continue
                 
-                # 프로젝트 태그 분석
-                self._process_task(task)
-                self.task_queue.task_done()
+                executor = self._executor
+                if executor is None or not self.is_running:
+                    # stop() 이후 꺼낸 배치는 실행하지 않고 완료 처리
+                    self._ack_batch(batch)
+                    break
+                try:
+                    future = executor.submit(self._run_batch, batch)
+                except RuntimeError:
+                    # stop()이 실행기를 먼저 종료한 경우
+                    self._ack_batch(batch)
+                    break
+                future.add_done_callback(partial(self._ack_if_cancelled, batch))
                 
             except Exception as e:
                 logger.error(f"프로젝트 태그 워커 오류: {e}")
-                self.stats["errors"] += 1
+                self._inc_stat("errors")
         
         logger.info("⏹️ 프로젝트 태그 분석 워커 종료")
     
+    def _drain_batch(self) -> List[ProjectTagTask]:
+        """큐에서 최대 batch_size개 작업 꺼내기 (첫 작업 이후 batch_window초까지 대기)"""
+        try:
+            _, _, first = self.task_queue.get(timeout=1.0)
+        except Empty:
+            return []
+        
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                _, _, task = self.task_queue.get(timeout=remaining)
+            except Empty:
+                break
+            batch.append(task)
+        return batch
+    
+    def _run_batch(self, tasks: List[ProjectTagTask]):
+        """배치 실행 (배치 스레드 풀)"""
+        try:
+            with get_tracer().span("tagging_batch", category="tagging", tasks=len(tasks)):
+                self._process_batch(tasks)
+        except Exception as e:
+            logger.error(f"프로젝트 태그 배치 오류: {e}")
+            self._inc_stat("errors")
+        finally:
+            self._ack_batch(tasks)
+    
+    def _ack_batch(self, tasks: List[ProjectTagTask]) -> None:
+        """배치의 큐 작업 완료 처리 및 배치 슬롯 반환"""
+        for _ in tasks:
+            self.task_queue.task_done()
+        self._batch_slots.release()
+    
+    def _ack_if_cancelled(self, tasks: List[ProjectTagTask], future) -> None:
+        """실행되지 못하고 취소된 배치 완료 처리 (실행된 배치는 _run_batch에서 처리)"""
+        if future.cancelled():
+            self._ack_batch(tasks)
+    
+    def _process_batch(self, tasks: List[ProjectTagTask]):
+        """여러 작업을 한 번의 LLM 호출로 분류하고 작업별로 결과 적용"""
+        batch_extract = getattr(self.project_service, "extract_projects_from_messages", None)
+        if len(tasks) == 1 or batch_extract is None:
+            for task in tasks:
+                self._process_task(task)
+            return
+        
+        started = time.perf_counter()
+        try:
+            messages = [self._build_tag_message(task.todo_data) for task in tasks]
+            results = batch_extract(messages, use_cache=False, return_details=True)
+        except Exception as e:
+            logger.error(f"[AsyncProjectTag] 배치 분류 오류 → 개별 처리: {e}")
+            for task in tasks:
+                self._process_task(task)
+            return
+        
+        self._inc_stat("batches")
+        logger.info(
+            f"[AsyncProjectTag] 배치 분류 완료: {len(tasks)}개 "
+            f"({time.perf_counter() - started:.1f}초, 대기 {self.task_queue.qsize()}개)"
+        )
+        for task, project_result in zip(tasks, results):
+            self._apply_result(task, project_result)
+    
     def _process_task(self, task: ProjectTagTask):
         """프로젝트 태그 분석 작업 처리"""
+        try:
+            logger.debug(f"[AsyncProjectTag] {task.todo_id}: 프로젝트 태그 분석 시작")
+            
+            # 프로젝트 태그 추출
+            project_result = self._extract_project_tag(task.todo_data, return_reason=True)
+        except Exception as e:
+            logger.error(f"프로젝트 태그 분석 오류 ({task.todo_id}): {e}")
+            self._inc_stat("errors")
+            return
+        
+        self._apply_result(task, project_result)
+    
+    def _apply_result(self, task: ProjectTagTask, project_result):
+        """추출 결과를 DB/캐시에 저장하고 변경 알림 및 콜백 전달"""
         try:
             todo_id = task.todo_id
             todo_data = task.todo_data
             
-            logger.debug(f"[AsyncProjectTag] {todo_id}: 프로젝트 태그 분석 시작")
-            
-            # 프로젝트 태그 추출
-            project_result = self._extract_project_tag(todo_data, return_reason=True)
             if isinstance(project_result, tuple):
                 project, classification_reason = project_result
             else:
@@ -316,8 +482,8 @@ class AsyncProjectTagService:
                     project_full_name=project_fullname,
                 )
                 
-                logger.info(f"[AsyncProjectTag] ✅ {todo_id}: {project}")
-                self.stats["analyzed"] += 1
+                logger.debug("[AsyncProjectTag] ✅ %s: %s", todo_id, project)
+                self._inc_stat("analyzed")
                 
                 # 영구 캐시에 저장 (원본 메시지 ID를 키로 사용)
                 if self.cache_service:
@@ -346,6 +512,17 @@ class AsyncProjectTagService:
                         project_full_name=project_fullname,
                     )
                     logger.debug(f"[AsyncProjectTag] 영구 캐시 저장: {cache_key} → {project}")
+                    self.cache_service.save_content_tag(
+                        self._content_cache_key(todo_data),
+                        project,
+                        confidence='llm',
+                        analysis_method='async',
+                        classification_reason=classification_reason,
+                        project_full_name=project_fullname,
+                    )
+                
+                # 변경 알림 발행 (UI는 해당 TODO 행만 갱신)
+                self._publish_project_change(todo_id, project, project_fullname)
                 
                 # 콜백 호출
                 if task.callback:
@@ -353,12 +530,25 @@ class AsyncProjectTagService:
             else:
                 logger.debug(f"[AsyncProjectTag] {todo_id}: 프로젝트 태그 추출 실패")
             
-            self.stats["processed"] += 1
+            self._inc_stat("processed")
             
         except Exception as e:
             logger.error(f"프로젝트 태그 분석 오류 ({task.todo_id}): {e}")
-            self.stats["errors"] += 1
+            self._inc_stat("errors")
     
+    def _publish_project_change(self, todo_id: str, project: str, project_full_name: Optional[str] = None):
+        """프로젝트 태그 변경 이벤트 발행"""
+        try:
+            self.change_feed.publish(
+                CHANGE_PROJECT,
+                todo_id,
+                source="async_project_tag",
+                project=project,
+                project_full_name=project_full_name,
+            )
+        except Exception as e:
+            logger.debug(f"[AsyncProjectTag] 변경 알림 발행 오류 ({todo_id}): {e}")
+
     def _resolve_project_full_name(self, project_code: Optional[str]) -> Optional[str]:
         """프로젝트 코드에 해당하는 풀네임을 찾는다."""
         if not project_code:
@@ -464,38 +654,7 @@ class AsyncProjectTagService:
     def _extract_project_tag(self, todo_data: Dict, return_reason: bool = False):
         """TODO 데이터에서 프로젝트 태그 추출"""
         try:
-            # TODO 데이터에서 직접 정보 추출
-            title = todo_data.get("title", "")
-            description = todo_data.get("description", "")
-            requester = todo_data.get("requester", "")
-            
-            # 소스 메시지도 참고 (있으면)
-            source_message = todo_data.get("source_message", "")
-            sender = ""
-            subject = title
-            
-            if source_message:
-                import json
-                try:
-                    if source_message.startswith("{"):
-                        msg_data = json.loads(source_message)
-                        sender = msg_data.get("sender", requester)
-                        subject = msg_data.get("subject", title)
-                except:
-                    pass
-            
-            # 제목과 설명을 합쳐서 더 많은 컨텍스트 제공
-            full_content = f"{title}\n\n{description}" if description else title
-            
-            # 메시지 데이터 구성
-            message = {
-                "content": full_content,
-                "subject": subject,
-                "sender": sender or requester,
-            }
-            message["id"] = todo_data.get("id") or todo_data.get("todo_id")
-            
-            logger.debug(f"[AsyncProjectTag] 분석할 메시지: 제목={subject}, 발신자={sender or requester}")
+            message = self._build_tag_message(todo_data)
             
             # 프로젝트 서비스로 추출
             if self.project_service:
@@ -511,23 +670,97 @@ class AsyncProjectTagService:
             logger.debug(f"프로젝트 태그 추출 오류: {e}")
             return None
     
+    def _build_tag_message(self, todo_data: Dict) -> Dict:
+        """TODO 데이터를 프로젝트 분류용 메시지로 변환"""
+        # TODO 데이터에서 직접 정보 추출
+        title = todo_data.get("title", "")
+        description = todo_data.get("description", "")
+        requester = todo_data.get("requester", "")
+        
+        # 소스 메시지도 참고 (있으면)
+        source_message = todo_data.get("source_message", "")
+        sender = ""
+        subject = title
+        
+        if source_message:
+            import json
+            try:
+                if source_message.startswith("{"):
+                    msg_data = json.loads(source_message)
+                    sender = msg_data.get("sender", requester)
+                    subject = msg_data.get("subject", title)
+            except:
+                pass
+        
+        # 제목과 설명을 합쳐서 더 많은 컨텍스트 제공
+        full_content = f"{title}\n\n{description}" if description else title
+        
+        # 메시지 데이터 구성
+        message = {
+            "content": full_content,
+            "subject": subject,
+            "sender": sender or requester,
+        }
+        message["id"] = todo_data.get("id") or todo_data.get("todo_id")
+        
+        logger.debug(f"[AsyncProjectTag] 분석할 메시지: 제목={subject}, 발신자={sender or requester}")
+        return message
+    
+    def _content_cache_key(self, todo_data: Dict) -> Optional[str]:
+        """내용 해시 캐시 키 (원본 메시지가 있으면 원본 기준, 없으면 분류용 메시지 기준)
+        
+        영구 캐시가 원본 메시지 ID를 키로 쓰는 것과 같은 이유로,
+        같은 원본 메시지에서 나온 TODO들은 같은 키를 갖습니다.
+        """
+        key_fn = getattr(self.project_service, "content_cache_key", None)
+        if key_fn is None:
+            return None
+        
+        message = None
+        source_message = todo_data.get("source_message")
+        if isinstance(source_message, dict):
+            message = source_message
+        elif isinstance(source_message, str) and source_message.startswith("{"):
+            try:
+                import json
+                message = json.loads(source_message)
+            except ValueError:
+                message = None
+        if not isinstance(message, dict) or not (message.get("content") or message.get("subject")):
+            message = self._build_tag_message(todo_data)
+        
+        try:
+            return key_fn(message)
+        except Exception as e:
+            logger.debug(f"[AsyncProjectTag] 내용 해시 계산 오류: {e}")
+            return None
+    
     def get_stats(self) -> Dict:
         """통계 정보 반환"""
+        with self._stats_lock:
+            stats = dict(self.stats)
         return {
-            **self.stats,
+            **stats,
             "queue_size": self.task_queue.qsize(),
             "is_running": self.is_running
         }
     
     def clear_queue(self):
         """큐 비우기"""
-        while not self.task_queue.empty():
+        self._drain_queue()
+        logger.info("🧹 프로젝트 태그 분석 큐 비움")
+    
+    def _drain_queue(self) -> int:
+        """큐에 남은 작업을 꺼내 완료 처리하고 개수 반환"""
+        dropped = 0
+        while True:
             try:
                 self.task_queue.get_nowait()
-                self.task_queue.task_done()
-            except:
+            except Empty:
                 break
-        logger.info("🧹 프로젝트 태그 분석 큐 비움")
+            self.task_queue.task_done()
+            dropped += 1
+        return dropped
 
     def _ensure_todo_table(self, db_path: str, connection: Optional[sqlite3.Connection] = None) -> None:
         """필요 시 todos 테이블 생성 (다른 스레드에서도 사용)."""
@@ -8,6 +8,9 @@
 - 발신자/수신자 프로젝트 참여 정보
 - 메시지 시간대와 프로젝트 기간
 - 메시지 내용 키워드 분석
+
+VDOS 참조 데이터 조회는 `VDOSChatSnapshot`(인메모리, mtime 변경 시 재로드)을 사용하고,
+스냅샷을 사용할 수 없을 때만 SQL로 직접 조회합니다.
 """
 
 import sqlite3
@@ -17,24 +20,29 @@ from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 from pathlib import Path
 
+from .vdos_chat_snapshot import VDOSChatSnapshot, get_vdos_chat_snapshot
+
 logger = logging.getLogger(__name__)
 
 
 class ChatProjectMatcher:
     """채팅 메시지 기반 프로젝트 매칭"""
     
-    def __init__(self, vdos_db_path: str, project_tags: Dict, person_project_mapping: Dict, project_periods: Dict):
+    def __init__(self, vdos_db_path: str, project_tags: Dict, person_project_mapping: Dict, project_periods: Dict,
+                 snapshot: Optional[VDOSChatSnapshot] = None):
         """
         Args:
             vdos_db_path: VDOS 데이터베이스 경로
             project_tags: 프로젝트 태그 딕셔너리
             person_project_mapping: 사람-프로젝트 매핑
             project_periods: 프로젝트 기간 정보
+            snapshot: VDOS 채팅 스냅샷 (None이면 DB 경로별 공유 스냅샷 사용)
         """
         self.vdos_db_path = vdos_db_path
         self.project_tags = project_tags
         self.person_project_mapping = person_project_mapping
         self.project_periods = project_periods
+        self.snapshot = snapshot or get_vdos_chat_snapshot(vdos_db_path)
     
     def match_project_from_chat(self, sender: str, message_date: str = None, 
                                 todo_content: str = None) -> Optional[Tuple[str, str]]:
@@ -48,6 +56,20 @@ class ChatProjectMatcher:
         Returns:
             (프로젝트 코드, 분류 근거) 튜플 또는 None
         """
+        scored = self.score_project_from_chat(sender, message_date, todo_content)
+        if not scored:
+            return None
+        project_code, score, reason_text = scored
+        logger.info(f"[채팅 매칭] {sender} → {project_code} (점수: {score}, {reason_text})")
+        return (project_code, f"채팅분석: {reason_text}")
+    
+    def score_project_from_chat(self, sender: str, message_date: str = None,
+                                todo_content: str = None) -> Optional[Tuple[str, int, str]]:
+        """채팅 메시지의 최고 점수 프로젝트와 점수 반환
+        
+        Returns:
+            (프로젝트 코드, 점수, 근거) 튜플 또는 None (최소 점수 미달 포함)
+        """
         try:
             # 1. VDOS DB에서 채팅 메시지 정보 가져오기
             chat_info = self._fetch_chat_info(sender, message_date)
@@ -74,9 +96,7 @@ class ChatProjectMatcher:
                 project_code, (score, reasons) = best_project
                 
                 if score >= 10:  # 최소 점수 임계값
-                    reason_text = ", ".join(reasons)
-                    logger.info(f"[채팅 매칭] {sender} → {project_code} (점수: {score}, {reason_text})")
-                    return (project_code, f"채팅분석: {reason_text}")
+                    return (project_code, score, ", ".join(reasons))
             
             return None
             
@@ -85,7 +105,26 @@ class ChatProjectMatcher:
             return None
     
     def _fetch_chat_info(self, sender: str, message_date: str = None) -> Optional[Dict]:
-        """VDOS DB에서 채팅 정보 가져오기"""
+        """VDOS DB에서 채팅 정보 가져오기 (스냅샷 우선)"""
+        if self.snapshot.ensure_fresh():
+            message = self.snapshot.nearest_message(sender, message_date)
+            if not message:
+                return None
+            room = self.snapshot.room_info(message.room_id)
+            if room is not None:
+                room_name, is_dm = room
+                return {
+                    'id': message.id,
+                    'sender': message.sender,
+                    'body': message.body,
+                    'sent_at': message.sent_at,
+                    'room_id': message.room_id,
+                    'room_name': room_name,
+                    'is_dm': is_dm,
+                    'room_members': self.snapshot.room_members(message.room_id)
+                }
+            # 조회 도중 스냅샷이 다시 로드되어 채팅방이 사라진 경우 → SQL 조회로 폴백
+        
         try:
             conn = sqlite3.connect(self.vdos_db_path)
             cur = conn.cursor()
@@ -258,7 +297,10 @@ class ChatProjectMatcher:
         return {k: v for k, v in project_scores.items() if v[0] > 0}
     
     def _get_email_from_handle(self, handle: str) -> Optional[str]:
-        """채팅 핸들에서 이메일 주소 조회"""
+        """채팅 핸들에서 이메일 주소 조회 (스냅샷 우선)"""
+        if self.snapshot.ensure_fresh():
+            return self.snapshot.email_for_handle(handle)
+        
         try:
             conn = sqlite3.connect(self.vdos_db_path)
             cur = conn.cursor()
@@ -3,14 +3,97 @@
 마감일 검증 서비스
 
 규칙 기반으로 추출된 마감일을 LLM으로 검증하여 정확도를 높입니다.
+
+LLM 호출을 줄이기 위해:
+- 명확한 경우(질문, 과거 완료, 명확한 요청 + "까지")는 규칙으로 바로 판정
+- 판정 결과를 정규화된 텍스트 + 추출 날짜 + 메시지 날짜 키로 메모이즈
+- 여러 마감일은 `validate_deadlines_batch()`로 한 번의 JSON 모드 요청으로 검증
 """
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from datetime import datetime
 from src.services import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# (텍스트, 추출된 마감일, 메시지 수신 시간)
+DeadlineItem = Tuple[str, Optional[datetime], Optional[datetime]]
+
+# 프롬프트에 나열된 무효/유효 판단 기준 (단건/배치 프롬프트 공용)
+_VALIDATION_RULES = """다음 경우는 **유효하지 않은** 마감일입니다:
+1. 질문 형태 ("언제까지 가능하신가요?", "언제까지 공유해주실 수 있을까요?")
+2. 과거 완료 표현 ("오늘 리뷰한", "오늘 진행한", "오늘 완료된")
+3. 단순 정보 공유 ("오늘 진행 상황", "오늘 회의 내용")
+4. 불확실한 표현 ("가능하면", "여유 있을 때")
+
+다음 경우는 **유효한** 마감일입니다:
+1. 명확한 요청 + 날짜 ("내일까지 제출해주세요", "12월 20일까지 완료 부탁드립니다")
+2. 마감 표현 ("오늘 중으로 검토 부탁", "내일까지 피드백 주세요")
+
+**마감 시간 추출 규칙:**
+- "오늘 중으로", "오늘까지" → 18:00
+- "내일까지" (시간 명시 없음) → 18:00
+- "내일 오전까지" → 12:00
+- "내일 오후까지" → 18:00
+- "내일 저녁까지" → 21:00
+- "X시까지" → 명시된 시간
+- "X시 Y분까지" → 명시된 시간"""
+
+# 규칙 사전 판정용 표현 (프롬프트의 판단 기준과 동일)
+_QUESTION_PATTERNS = (
+    "언제까지", "언제쯤", "가능하신가요", "가능할까요",
+    "주실 수 있을까요", "주실 수 있나요",
+    "when can", "when could", "is it possible",
+)
+_PAST_PATTERNS = (
+    "리뷰한", "진행한", "완료된", "작성한", "정리한",
+    "reviewed", "completed", "finished",
+)
+_INFO_PATTERNS = ("진행 상황", "회의 내용")
+_UNCERTAIN_PATTERNS = ("가능하면", "여유 있을 때", "if possible")
+_REQUEST_PATTERNS = (
+    "부탁", "주세요", "바랍니다", "해 주시기", "해주시기", "please", "요청드립니다",
+)
+_DEADLINE_MARKERS = (
+    "까지", "중으로", "마감", "deadline", "due", " by ",
+    "오늘", "내일", "모레", "이번 주", "다음 주", "요일",
+)
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。？\n])")
+_WHITESPACE_RE = re.compile(r"\s+")
+_EXPLICIT_TIME_RE = re.compile(r"(오전|오후)?\s*(\d{1,2})\s*시(?:\s*(\d{1,2})\s*분)?\s*까지")
+
+
+@dataclass
+class DeadlineVerdict:
+    """마감일 판정 결과"""
+    valid: bool
+    time: Optional[Tuple[int, int]] = None  # 유효한 경우 (시, 분)
+    reason: str = ""
+    source: str = "llm"  # rule | llm | memo | error
+
+
+def _normalize_text(text: str) -> str:
+    """메모 키용 텍스트 정규화 (프롬프트에 들어가는 앞 500자 기준)"""
+    return _WHITESPACE_RE.sub(" ", (text or "")[:500]).strip().lower()
+
+
+def _parse_time(value) -> Optional[Tuple[int, int]]:
+    """"HH:MM" 문자열을 (시, 분)으로 변환"""
+    match = re.search(r"(\d{1,2}):(\d{2})", str(value or ""))
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if 0 <= hour <= 23 and 0 <= minute <= 59:
+        return hour, minute
+    return None
+
 
 class DeadlineValidatorService:
     """마감일 검증 서비스
@@ -18,12 +101,31 @@ class DeadlineValidatorService:
     규칙 기반으로 추출된 마감일이 실제로 유효한지 LLM으로 검증합니다.
     """
     
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        memo_size: int = 2048,
+        batch_size: int = 20,
+    ):
         """
         Args:
             llm_client: LLM 클라이언트 (None이면 새로 생성)
+            memo_size: 판정 결과 메모 캐시 최대 항목 수
+            batch_size: 배치 검증 시 한 번의 LLM 요청에 넣는 최대 항목 수
         """
         self.llm_client = llm_client or LLMClient()
+        self.memo_size = memo_size
+        self.batch_size = max(1, batch_size)
+        self._memo: "OrderedDict[Tuple[str, str, str], DeadlineVerdict]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self.stats = {
+            "memo_hits": 0,
+            "rule_valid": 0,
+            "rule_invalid": 0,
+            "llm_items": 0,
+            "llm_calls": 0,
+            "batch_calls": 0,
+        }
         logger.info("DeadlineValidatorService 초기화 완료")
     
     def validate_deadline(
@@ -50,9 +152,14 @@ class DeadlineValidatorService:
         if not text or len(text.strip()) < 10:
             return extracted_deadline
         
-        # LLM으로 검증 (시간도 함께 추출)
+        # 메모 → 규칙 사전 판정 → LLM 순으로 검증 (시간도 함께 추출)
         try:
-            validated_deadline = self._validate_with_llm(text, extracted_deadline, message_time)
+            key = self._memo_key(text, extracted_deadline, message_time)
+            verdict = self._lookup_memo(key) or self._rule_verdict(text)
+            if verdict is None:
+                verdict = self._llm_verdict(text, extracted_deadline, message_time)
+            self._store_memo(key, verdict)
+            validated_deadline = self._apply_verdict(extracted_deadline, verdict)
             
             if validated_deadline:
                 logger.info(f"✅ 마감일 검증 성공: {validated_deadline.strftime('%Y-%m-%d %H:%M')}")
@@ -66,6 +173,149 @@ class DeadlineValidatorService:
             # 오류 시 원본 마감일 유지 (보수적 접근)
             return extracted_deadline
     
+    def validate_deadlines_batch(self, items: Sequence[DeadlineItem]) -> List[Optional[datetime]]:
+        """여러 마감일을 한 번에 검증
+        
+        메모/규칙으로 판정되지 않은 항목만 모아 `batch_size`개씩 하나의
+        JSON 모드 요청으로 검증합니다. 같은 키의 항목은 한 번만 묻습니다.
+        
+        Args:
+            items: (텍스트, 추출된 마감일, 메시지 수신 시간) 튜플 목록
+            
+        Returns:
+            입력 순서대로 `validate_deadline()`과 같은 결과 목록
+        """
+        results: List[Optional[datetime]] = [None] * len(items)
+        verdicts: Dict[Tuple[str, str, str], DeadlineVerdict] = {}
+        pending: "OrderedDict[Tuple[str, str, str], DeadlineItem]" = OrderedDict()
+        keys: Dict[int, Tuple[str, str, str]] = {}
+        
+        for index, (text, deadline, message_time) in enumerate(items):
+            if not deadline:
+                continue
+            if not text or len(text.strip()) < 10:
+                results[index] = deadline
+                continue
+            key = self._memo_key(text, deadline, message_time)
+            keys[index] = key
+            if key in verdicts or key in pending:
+                continue
+            verdict = self._lookup_memo(key) or self._rule_verdict(text)
+            if verdict is None:
+                pending[key] = (text, deadline, message_time)
+            else:
+                verdicts[key] = verdict
+        
+        pending_keys = list(pending)
+        for start in range(0, len(pending_keys), self.batch_size):
+            chunk = pending_keys[start:start + self.batch_size]
+            chunk_verdicts = self._llm_verdicts_batch([pending[key] for key in chunk])
+            for key, verdict in zip(chunk, chunk_verdicts):
+                verdicts[key] = verdict
+        
+        for key, verdict in verdicts.items():
+            self._store_memo(key, verdict)
+        
+        for index, key in keys.items():
+            results[index] = self._apply_verdict(items[index][1], verdicts[key])
+        
+        logger.info(
+            f"[DeadlineValidator] 배치 검증 {len(items)}개: "
+            f"LLM {len(pending_keys)}개, 규칙/메모 {len(verdicts) - len(pending_keys)}개"
+        )
+        return results
+    
+    def _memo_key(
+        self,
+        text: str,
+        deadline: datetime,
+        message_time: Optional[datetime],
+    ) -> Tuple[str, str, str]:
+        """메모 키: 정규화 텍스트 해시 + 추출 날짜 + 메시지 날짜 (상대 표현 기준일)"""
+        text_key = hashlib.md5(_normalize_text(text).encode("utf-8")).hexdigest()
+        time_bucket = message_time.strftime('%Y-%m-%d') if message_time else ""
+        return text_key, deadline.strftime('%Y-%m-%d'), time_bucket
+    
+    def _lookup_memo(self, key: Tuple[str, str, str]) -> Optional[DeadlineVerdict]:
+        with self._memo_lock:
+            verdict = self._memo.get(key)
+            if verdict is not None:
+                self._memo.move_to_end(key)
+                self.stats["memo_hits"] += 1
+        return verdict
+    
+    def _store_memo(self, key: Tuple[str, str, str], verdict: DeadlineVerdict) -> None:
+        # 오류로 인한 보수적 판정은 저장하지 않음 (다음에 다시 검증)
+        if verdict.source == "error":
+            return
+        with self._memo_lock:
+            self._memo[key] = verdict
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+    
+    def _apply_verdict(self, deadline: datetime, verdict: DeadlineVerdict) -> Optional[datetime]:
+        """판정 결과를 마감일에 반영 (무효면 None, 시간이 있으면 시간 갱신)"""
+        if not verdict.valid:
+            return None
+        if verdict.time:
+            hour, minute = verdict.time
+            return deadline.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return deadline
+    
+    def _rule_verdict(self, text: str) -> Optional[DeadlineVerdict]:
+        """명확한 경우만 규칙으로 판정 (애매하면 None → LLM)
+        
+        마감 표현이 들어 있는 문장만 봅니다.
+        - 질문/불확실 표현이 아니고 요청 표현 + "까지"가 있는 문장이 있으면 유효 (시간은 프롬프트 규칙과 동일)
+          ("어제 작성한 보고서 내일까지 검토 부탁드립니다"처럼 과거형 수식어가 있어도 요청이 우선)
+        - 모두 질문/불확실/과거 완료/정보 공유 표현이면 무효 (과거 완료·정보 공유는 요청 표현이 없을 때만)
+        """
+        sentences = [
+            sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(text[:500])
+            if any(marker in sentence.lower() for marker in _DEADLINE_MARKERS)
+        ]
+        if not sentences:
+            return None
+        
+        invalid_reasons = []
+        for sentence in sentences:
+            lowered = sentence.lower()
+            has_request = any(p in lowered for p in _REQUEST_PATTERNS)
+            if sentence.rstrip().endswith(("?", "？")) or any(p in lowered for p in _QUESTION_PATTERNS):
+                invalid_reasons.append("질문 형태")
+            elif any(p in lowered for p in _UNCERTAIN_PATTERNS):
+                invalid_reasons.append("불확실한 표현")
+            elif has_request and "까지" in sentence:
+                self.stats["rule_valid"] += 1
+                return DeadlineVerdict(True, self._rule_time(sentence), "명확한 요청 + 마감 표현", "rule")
+            elif has_request:
+                return None  # 요청은 있지만 "까지"가 없음 → LLM 판단
+            elif any(p in lowered for p in _PAST_PATTERNS):
+                invalid_reasons.append("과거 완료 표현")
+            elif any(p in lowered for p in _INFO_PATTERNS):
+                invalid_reasons.append("단순 정보 공유")
+            else:
+                return None  # 애매한 문장 → LLM 판단
+        
+        self.stats["rule_invalid"] += 1
+        return DeadlineVerdict(False, None, ", ".join(sorted(set(invalid_reasons))), "rule")
+    
+    def _rule_time(self, sentence: str) -> Tuple[int, int]:
+        """프롬프트의 마감 시간 추출 규칙을 그대로 적용"""
+        match = _EXPLICIT_TIME_RE.search(sentence)
+        if match:
+            meridiem, hour, minute = match.group(1), int(match.group(2)), int(match.group(3) or 0)
+            if meridiem == "오후" and hour < 12:
+                hour += 12
+            if 0 <= hour <= 23 and 0 <= minute <= 59:
+                return hour, minute
+        if "오전까지" in sentence or "오전 중" in sentence:
+            return 12, 0
+        if "저녁까지" in sentence:
+            return 21, 0
+        return 18, 0
+    
     def _validate_with_llm(
         self,
         text: str,
@@ -82,6 +332,15 @@ class DeadlineValidatorService:
         Returns:
             유효한 마감일 (시간 업데이트됨) 또는 None (무효)
         """
+        return self._apply_verdict(deadline, self._llm_verdict(text, deadline, message_time))
+    
+    def _llm_verdict(
+        self,
+        text: str,
+        deadline: datetime,
+        message_time: Optional[datetime]
+    ) -> DeadlineVerdict:
+        """단건 LLM 판정 (응답 파싱 실패/오류 시 보수적으로 유효)"""
         # 메시지 시간 포맷팅
         msg_time_str = ""
         if message_time:
@@ -97,24 +356,7 @@ class DeadlineValidatorService:
 
 추출된 마감일: {deadline_str}
 
-다음 경우는 **유효하지 않은** 마감일입니다:
-1. 질문 형태 ("언제까지 가능하신가요?", "언제까지 공유해주실 수 있을까요?")
-2. 과거 완료 표현 ("오늘 리뷰한", "오늘 진행한", "오늘 완료된")
-3. 단순 정보 공유 ("오늘 진행 상황", "오늘 회의 내용")
-4. 불확실한 표현 ("가능하면", "여유 있을 때")
-
-다음 경우는 **유효한** 마감일입니다:
-1. 명확한 요청 + 날짜 ("내일까지 제출해주세요", "12월 20일까지 완료 부탁드립니다")
-2. 마감 표현 ("오늘 중으로 검토 부탁", "내일까지 피드백 주세요")
-
-**마감 시간 추출 규칙:**
-- "오늘 중으로", "오늘까지" → 18:00
-- "내일까지" (시간 명시 없음) → 18:00
-- "내일 오전까지" → 12:00
-- "내일 오후까지" → 18:00
-- "내일 저녁까지" → 21:00
-- "X시까지" → 명시된 시간
-- "X시 Y분까지" → 명시된 시간
+{_VALIDATION_RULES}
 
 판단 결과를 다음 형식으로 답변해주세요:
 VALID: [YES/NO]
@@ -133,6 +375,8 @@ REASON: "내일 오전까지"는 명확한 마감 요청이며 오전은 12:00
 """
         
         try:
+            self.stats["llm_calls"] += 1
+            self.stats["llm_items"] += 1
             llm_response = self.llm_client.generate(
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,  # 낮은 온도로 일관성 확보
@@ -142,44 +386,115 @@ REASON: "내일 오전까지"는 명확한 마감 요청이며 오전은 12:00
             result = llm_response.content.strip()
             result_upper = result.upper()
             
+            reason = ""
+            if "REASON:" in result:
+                reason = result.split("REASON:")[1].strip().split('\n')[0]
+            
             # 응답 파싱
             if "VALID: YES" in result_upper:
                 # 시간 추출
-                if "TIME:" in result_upper:
-                    time_line = [line for line in result.split('\n') if 'TIME:' in line.upper()]
-                    if time_line:
-                        time_str = time_line[0].split(':', 1)[1].strip()
-                        # HH:MM 형식 파싱
-                        import re
-                        time_match = re.search(r'(\d{1,2}):(\d{2})', time_str)
-                        if time_match:
-                            hour = int(time_match.group(1))
-                            minute = int(time_match.group(2))
-                            # deadline의 시간 부분 업데이트
-                            deadline = deadline.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                            logger.info(f"✅ 마감 시간 추출: {hour:02d}:{minute:02d}")
-                
-                # 이유 추출
-                if "REASON:" in result_upper:
-                    reason = result.split("REASON:")[1].strip().split('\n')[0]
-                    logger.debug(f"마감일 유효: {reason}")
-                
-                return deadline  # 업데이트된 deadline 반환
+                time_value = None
+                time_line = [line for line in result.split('\n') if 'TIME:' in line.upper()]
+                if time_line:
+                    time_value = _parse_time(time_line[0].split(':', 1)[1])
+                    if time_value:
+                        logger.info(f"✅ 마감 시간 추출: {time_value[0]:02d}:{time_value[1]:02d}")
+                logger.debug(f"마감일 유효: {reason}")
+                return DeadlineVerdict(True, time_value, reason, "llm")
             elif "VALID: NO" in result_upper:
-                # 이유 추출
-                if "REASON:" in result_upper:
-                    reason = result.split("REASON:")[1].strip().split('\n')[0]
-                    logger.debug(f"마감일 무효: {reason}")
-                return None  # 무효
+                logger.debug(f"마감일 무효: {reason}")
+                return DeadlineVerdict(False, None, reason, "llm")
+            elif llm_response.error:
+                logger.error(f"LLM 검증 오류: {llm_response.error}")
+                return DeadlineVerdict(True, None, "LLM 오류", "error")
             else:
                 # 파싱 실패 시 보수적으로 유효로 처리
                 logger.warning(f"LLM 응답 파싱 실패: {result}")
-                return deadline  # 원본 deadline 반환
+                return DeadlineVerdict(True, None, "응답 파싱 실패", "error")
                 
         except Exception as e:
             logger.error(f"LLM 검증 오류: {e}")
             # 오류 시 보수적으로 원본 deadline 반환
-            return deadline
+            return DeadlineVerdict(True, None, str(e), "error")
+    
+    def _llm_verdicts_batch(self, items: Sequence[DeadlineItem]) -> List[DeadlineVerdict]:
+        """여러 항목을 하나의 JSON 모드 요청으로 판정
+        
+        응답이 없거나 파싱에 실패하면 항목별 단건 요청으로 폴백합니다.
+        """
+        if len(items) == 1:
+            text, deadline, message_time = items[0]
+            return [self._llm_verdict(text, deadline, message_time)]
+        
+        payload = []
+        for index, (text, deadline, message_time) in enumerate(items):
+            payload.append({
+                "index": index,
+                "text": text[:500],
+                "deadline": deadline.strftime('%Y-%m-%d'),
+                "message_time": message_time.strftime('%Y-%m-%d %H:%M') if message_time else None,
+            })
+        
+        prompt = f"""다음 메시지들에서 각각 추출된 마감일이 실제로 유효한 마감일인지 판단하고, 정확한 마감 시간을 추출해주세요.
+
+{_VALIDATION_RULES}
+
+항목 (index를 그대로 사용):
+{json.dumps(payload, ensure_ascii=False, indent=1)}
+
+반드시 json 객체로만 답변해주세요:
+{{"results": [{{"index": 0, "valid": true, "time": "18:00", "reason": "한 줄 이유"}}]}}
+- 무효인 경우 "valid": false, "time": null
+"""
+        
+        try:
+            self.stats["llm_calls"] += 1
+            self.stats["batch_calls"] += 1
+            self.stats["llm_items"] += len(items)
+            llm_response = self.llm_client.generate(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                max_tokens=min(4000, 60 * len(items) + 50),
+                json_mode=True,
+            )
+            data = json.loads(llm_response.content.strip()) if llm_response.content else None
+            entries = data.get("results", []) if isinstance(data, dict) else data
+            
+            verdicts: Dict[int, DeadlineVerdict] = {}
+            for entry in entries or []:
+                if not isinstance(entry, dict):
+                    continue
+                try:
+                    index = int(entry.get("index"))
+                except (TypeError, ValueError):
+                    continue
+                if not 0 <= index < len(items):
+                    continue
+                valid = entry.get("valid")
+                if isinstance(valid, str):
+                    valid = valid.strip().upper() in ("YES", "TRUE")
+                verdicts[index] = DeadlineVerdict(
+                    bool(valid),
+                    _parse_time(entry.get("time")) if valid else None,
+                    str(entry.get("reason") or ""),
+                    "llm",
+                )
+        except Exception as e:
+            logger.warning(f"[DeadlineValidator] 배치 응답 처리 실패 → 단건 검증: {e}")
+            verdicts = {}
+        
+        if not verdicts:
+            return [self._llm_verdict(text, deadline, message_time) for text, deadline, message_time in items]
+        
+        # 응답에서 빠진 항목은 단건으로 검증
+        return [
+            verdicts.get(index) or self._llm_verdict(*items[index])
+            for index in range(len(items))
+        ]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 반환"""
+        return {**self.stats, "memo_size": len(self._memo)}
     
     def has_deadline_keyword(self, text: str) -> bool:
         """마감일 관련 키워드가 있는지 확인
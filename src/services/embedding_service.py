@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 임베딩 서비스
+
+sentence-transformers(CPU)로 텍스트/TODO를 임베딩합니다.
+임베딩은 텍스트 내용 해시를 키로 LRU 캐시에 저장하므로
+같은 TODO를 반복해서 임베딩하지 않습니다.
+
+sentence-transformers/numpy가 설치되어 있지 않으면 `is_available()`이 False를 반환하고,
+호출 측은 기존 로직(점수 기반/Jaccard 등)으로 폴백합니다.
+모델 로드(첫 실행 시 다운로드 포함)는 수 초가 걸리므로, GUI 스레드에서 부르는 쪽은
+`warm_up()`으로 백그라운드 로드를 시작하고 `is_ready()`가 True가 될 때까지 폴백 로직을 씁니다.
+"""
+import hashlib
+import importlib.util
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+from src.config.settings import EMBEDDING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# TODO 임베딩 텍스트에 들어가는 필드
+TODO_TEXT_FIELDS = ("title", "description", "project", "project_full_name", "requester", "type")
+
+
+def text_hash(text: str) -> str:
+    """임베딩 캐시 키 (텍스트 내용 해시)"""
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def todo_embedding_text(todo: Dict[str, Any]) -> str:
+    """TODO를 임베딩용 한 줄 텍스트로 변환"""
+    parts = [str(todo.get(name) or "").strip() for name in TODO_TEXT_FIELDS]
+    return " | ".join(part for part in parts if part)
+
+
+class EmbeddingService:
+    """sentence-transformers 기반 임베딩 서비스 (모델은 처음 사용할 때 로드)"""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            model_name: sentence-transformers 모델 이름 (None이면 EMBEDDING_CONFIG 사용)
+            device: 실행 장치 (기본값: cpu)
+            batch_size: 인코딩 배치 크기
+            cache_size: 임베딩 LRU 캐시 최대 항목 수
+        """
+        self.model_name = model_name or EMBEDDING_CONFIG["model"]
+        self.device = device or EMBEDDING_CONFIG["device"]
+        self.batch_size = batch_size or EMBEDDING_CONFIG["batch_size"]
+        self.cache_size = cache_size or EMBEDDING_CONFIG["cache_size"]
+
+        self._model = None
+        self._load_failed = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "encode_calls": 0,
+        }
+
+    def is_available(self) -> bool:
+        """임베딩 사용 가능 여부 (모델 로드 전에는 패키지 존재 여부만 확인)"""
+        if self._load_failed or np is None:
+            return False
+        if self._model is not None:
+            return True
+        return importlib.util.find_spec("sentence_transformers") is not None
+
+    def is_ready(self) -> bool:
+        """모델이 로드되어 바로 인코딩할 수 있는지 여부 (로드를 시작하지 않음)"""
+        return self._model is not None
+
+    def warm_up(self) -> None:
+        """백그라운드 스레드에서 모델 로드 시작 (이미 로드되었거나 로드 중이면 무시)"""
+        if self._model is not None or not self.is_available():
+            return
+        with self._lock:
+            if self._warmup_thread is not None:
+                return
+            self._warmup_thread = threading.Thread(
+                target=self._get_model, name="EmbeddingWarmup", daemon=True
+            )
+            self._warmup_thread.start()
+        logger.info(f"[Embedding] 백그라운드 모델 로드 시작: {self.model_name}")
+
+    def _get_model(self):
+        """모델 lazy 로드 (torch 임포트가 무거우므로 처음 사용할 때만)"""
+        if self._model is None and not self._load_failed:
+            with self._load_lock:
+                if self._model is None and not self._load_failed:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+
+                        logger.info(f"[Embedding] 모델 로드 중: {self.model_name} ({self.device})")
+                        model = SentenceTransformer(self.model_name, device=self.device)
+                        self._model = model
+                        logger.info(f"[Embedding] ✅ 모델 로드 완료: 차원={self.dimension}")
+                    except Exception as e:
+                        self._load_failed = True
+                        logger.warning(f"[Embedding] 모델 로드 실패 → 임베딩 비활성화: {e}")
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        """임베딩 차원 (모델 로드 필요)"""
+        model = self._get_model()
+        return int(model.get_sentence_embedding_dimension()) if model is not None else 0
+
+    def encode_texts(self, texts: Sequence[str]) -> Optional["np.ndarray"]:
+        """텍스트 리스트 임베딩 (L2 정규화, float32)
+
+        캐시에 없는 텍스트만 한 번의 배치로 인코딩합니다.
+
+        Returns:
+            (len(texts), dim) 배열, 임베딩을 사용할 수 없으면 None
+        """
+        if not texts:
+            return None
+        if not self.is_available() or self._get_model() is None:
+            return None
+
+        keys = [text_hash(text) for text in texts]
+        vectors: List[Optional["np.ndarray"]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    vectors[i] = cached
+                    self.stats["cache_hits"] += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+
+        if missing:
+            self.stats["cache_misses"] += len(missing)
+            self.stats["encode_calls"] += 1
+            order = list(missing)
+            try:
+                encoded = self._model.encode(
+                    [texts[missing[key][0]] for key in order],
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False,
+                )
+            except Exception as e:
+                logger.error(f"[Embedding] 인코딩 실패: {e}")
+                return None
+
+            encoded = np.asarray(encoded, dtype=np.float32)
+            with self._lock:
+                for key, vector in zip(order, encoded):
+                    for i in missing[key]:
+                        vectors[i] = vector
+                    self._cache[key] = vector
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return np.vstack(vectors)
+
+    def encode_text(self, text: str) -> Optional["np.ndarray"]:
+        """단일 텍스트 임베딩 (1차원 벡터)"""
+        matrix = self.encode_texts([text])
+        return matrix[0] if matrix is not None else None
+
+    def encode_todos(self, todos: Sequence[Dict[str, Any]]) -> Optional["np.ndarray"]:
+        """TODO 리스트 임베딩 (내용 해시 캐시 사용)"""
+        return self.encode_texts([todo_embedding_text(todo) for todo in todos])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 반환"""
+        return {
+            **self.stats,
+            "cache_size": len(self._cache),
+            "model": self.model_name,
+            "loaded": self._model is not None,
+        }
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_embedding_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """임베딩 서비스 싱글톤 인스턴스 반환"""
+    global _embedding_service
+
+    if _embedding_service is None:
+        with _service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+
+    return _embedding_service
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+그룹 요약 영구 캐시 서비스
+
+일별/주별/월별 메시지 그룹 요약을 (페르소나, 종류, 단위, 그룹 키) 단위로 디스크에 저장합니다.
+각 항목은 그룹에 속한 메시지 ID 목록으로 만든 지문(fingerprint)과 함께 저장되므로,
+지난 기간처럼 메시지가 바뀌지 않은 그룹은 재시작 후에도 바로 재사용하고
+지문이 바뀐 그룹(대개 오늘/이번 주)만 다시 요약합니다.
+
+종류(kind):
+- "panel": 메시지 요약 패널용 규칙 기반 요약 (`MainWindow._update_message_summaries`)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config.settings import GROUP_SUMMARY_CACHE_PATH
+from src.utils.tracing import trace_cache
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올려서 기존 항목을 무효화
+SCHEMA_VERSION = "1"
+
+
+def _message_key(message: Dict) -> str:
+    """메시지 식별자 (msg_id가 없으면 발신자/시각/본문 해시)"""
+    msg_id = message.get("msg_id") or message.get("id")
+    if msg_id:
+        return str(msg_id)
+    payload = "\x1f".join(
+        str(message.get(name) or "")
+        for name in ("sender", "date", "subject", "content", "body")
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def group_fingerprint(messages: Iterable[Dict], extra: str = "") -> str:
+    """그룹 구성 메시지 지문 생성
+
+    Args:
+        messages: 그룹에 속한 메시지 목록 (순서 무관)
+        extra: 요약 결과에 영향을 주는 추가 입력 (예: 메시지별 우선순위)
+
+    Returns:
+        SHA-1 hex 문자열
+    """
+    keys = sorted(_message_key(message) for message in messages)
+    payload = "\n".join([SCHEMA_VERSION, extra or ""] + keys)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class GroupSummaryCacheService:
+    """그룹 요약 영구 캐시 관리"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로 (예: data/group_summary_cache.db)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "saved": 0,
+        }
+        self._init_database()
+        logger.info(f"✅ 그룹 요약 캐시 초기화: {db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_database(self):
+        """캐시 데이터베이스 초기화"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+
+            # 같은 그룹에는 최신 지문의 요약 하나만 유지 (지문이 바뀌면 덮어씀)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS group_summary_cache (
+                    persona TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    unit TEXT NOT NULL,
+                    group_key TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    summary_json TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (persona, kind, unit, group_key)
+                )
+            """)
+
+            conn.commit()
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"❌ 그룹 요약 캐시 DB 초기화 실패: {e}")
+
+    def get_many(
+        self,
+        persona: str,
+        kind: str,
+        unit: str,
+        fingerprints: Dict[str, str],
+    ) -> Dict[str, Dict]:
+        """지문이 일치하는 그룹 요약 조회
+
+        Args:
+            persona: 페르소나 ID
+            kind: 요약 종류 (예: "panel")
+            unit: 그룹화 단위
+            fingerprints: {그룹 키: 현재 지문}
+
+        Returns:
+            {그룹 키: 요약 dict} (지문이 일치하는 그룹만)
+        """
+        if not fingerprints:
+            return {}
+
+        hits: Dict[str, Dict] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT group_key, fingerprint, summary_json
+                    FROM group_summary_cache
+                    WHERE persona = ? AND kind = ? AND unit = ?
+                    """,
+                    (persona, kind, unit),
+                )
+                rows = cursor.fetchall()
+                conn.close()
+
+            for group_key, fingerprint, summary_json in rows:
+                if fingerprints.get(group_key) != fingerprint:
+                    continue
+                try:
+                    hits[group_key] = json.loads(summary_json)
+                except ValueError:
+                    continue
+
+        except Exception as e:
+            logger.error(f"❌ 그룹 요약 캐시 조회 실패: {e}")
+
+        self.stats["hits"] += len(hits)
+        self.stats["misses"] += len(fingerprints) - len(hits)
+        trace_cache("group_summary", hit=True, count=len(hits))
+        trace_cache("group_summary", hit=False, count=len(fingerprints) - len(hits))
+        return hits
+
+    def save_many(
+        self,
+        persona: str,
+        kind: str,
+        unit: str,
+        entries: Dict[str, Tuple[str, Dict]],
+    ) -> bool:
+        """그룹 요약 저장
+
+        Args:
+            persona: 페르소나 ID
+            kind: 요약 종류 (예: "panel")
+            unit: 그룹화 단위
+            entries: {그룹 키: (지문, 요약 dict)}
+
+        Returns:
+            성공 여부
+        """
+        if not entries:
+            return True
+
+        now = datetime.now().isoformat()
+        rows: List[Tuple] = []
+        for group_key, (fingerprint, summary) in entries.items():
+            try:
+                summary_json = json.dumps(summary, ensure_ascii=False)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"[GroupSummaryCache] 직렬화 불가 요약 건너뜀 ({group_key}): {e}")
+                continue
+            rows.append((persona, kind, unit, str(group_key), fingerprint, summary_json, now))
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO group_summary_cache
+                    (persona, kind, unit, group_key, fingerprint, summary_json, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+                conn.close()
+            self.stats["saved"] += len(rows)
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ 그룹 요약 캐시 저장 실패: {e}")
+            return False
+
+    def clear_cache(self, persona: Optional[str] = None) -> int:
+        """캐시 삭제
+
+        Args:
+            persona: 지정하면 해당 페르소나 항목만 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.cursor()
+                if persona is None:
+                    cursor.execute("DELETE FROM group_summary_cache")
+                else:
+                    cursor.execute("DELETE FROM group_summary_cache WHERE persona = ?", (persona,))
+                deleted = cursor.rowcount
+                conn.commit()
+                conn.close()
+            logger.info(f"🗑️ 그룹 요약 캐시 삭제: {deleted}개")
+            return deleted
+
+        except Exception as e:
+            logger.error(f"❌ 그룹 요약 캐시 삭제 실패: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        """통계 정보 반환"""
+        total = 0
+        try:
+            with self._lock:
+                conn = self._connect()
+                total = conn.execute("SELECT COUNT(*) FROM group_summary_cache").fetchone()[0]
+                conn.close()
+        except Exception as e:
+            logger.debug(f"[GroupSummaryCache] 통계 조회 실패: {e}")
+        return {**self.stats, "total": total}
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_group_summary_cache: Optional[GroupSummaryCacheService] = None
+_service_lock = threading.Lock()
+
+
+def get_group_summary_cache_service() -> GroupSummaryCacheService:
+    """그룹 요약 캐시 싱글톤 인스턴스 반환"""
+    global _group_summary_cache
+
+    if _group_summary_cache is None:
+        with _service_lock:
+            if _group_summary_cache is None:
+                GROUP_SUMMARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                _group_summary_cache = GroupSummaryCacheService(str(GROUP_SUMMARY_CACHE_PATH))
+
+    return _group_summary_cache
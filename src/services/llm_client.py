@@ -10,6 +10,8 @@ import time
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from src.utils.tracing import current_span, get_tracer, trace_count, traced
+
 logger = logging.getLogger(__name__)
 
 # 로깅 레벨 확인을 위한 상수
@@ -113,12 +115,14 @@ class LLMClient:
         else:
             raise RuntimeError("사용 가능한 LLM 제공자가 없습니다")
     
+    @traced("llm_call", category="llm")
     def generate(
         self,
         messages: List[Dict[str, str]],
         model: str = "gpt-4o-mini",
         temperature: float = 0.3,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False
     ) -> LLMResponse:
         """LLM 텍스트 생성
         
@@ -127,12 +131,14 @@ class LLMClient:
             model: 모델 이름
             temperature: 온도 (0.0 ~ 1.0)
             max_tokens: 최대 토큰 수
+            json_mode: True면 JSON 객체 응답 강제 (response_format=json_object)
             
         Returns:
             LLMResponse 객체
         """
         provider = self._select_provider()
         start_time = time.time()
+        current_span().set(provider=provider, model=model)
         
         # 요청 로깅 (DEBUG)
         logger.debug(f"[LLMClient] 호출 시작: provider={provider}, model={model}, temp={temperature}")
@@ -146,15 +152,18 @@ class LLMClient:
         
         try:
             if provider == "openai":
-                response = self._call_openai(messages, model, temperature, max_tokens)
+                response = self._call_openai(messages, model, temperature, max_tokens, json_mode)
             elif provider == "azure":
-                response = self._call_azure(messages, model, temperature, max_tokens)
+                response = self._call_azure(messages, model, temperature, max_tokens, json_mode)
             elif provider == "openrouter":
-                response = self._call_openrouter(messages, model, temperature, max_tokens)
+                response = self._call_openrouter(messages, model, temperature, max_tokens, json_mode)
             else:
                 raise RuntimeError(f"지원하지 않는 제공자: {provider}")
             
             response.response_time = time.time() - start_time
+            get_tracer().record_latency("llm", response.response_time)
+            trace_count("llm.calls")
+            trace_count("llm.tokens", response.tokens_used or 0)
             
             # 응답 로깅 (INFO/DEBUG)
             logger.info(
@@ -180,6 +189,7 @@ class LLMClient:
             
         except Exception as e:
             elapsed = time.time() - start_time
+            trace_count("llm.errors")
             logger.error(f"[LLMClient] 호출 실패 ({elapsed:.2f}초): {e}")
             logger.debug(f"[LLMClient] 제공자: {provider}, 모델: {model}")
             import traceback
@@ -198,7 +208,8 @@ class LLMClient:
         messages: List[Dict[str, str]],
         model: str,
         temperature: float,
-        max_tokens: Optional[int]
+        max_tokens: Optional[int],
+        json_mode: bool = False
     ) -> LLMResponse:
         """OpenAI API 호출"""
         try:
@@ -221,6 +232,9 @@ class LLMClient:
         if max_tokens:
             kwargs["max_tokens"] = max_tokens
         
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        
         response = client.chat.completions.create(**kwargs)
         
         return LLMResponse(
@@ -235,7 +249,8 @@ class LLMClient:
         messages: List[Dict[str, str]],
         model: str,
         temperature: float,
-        max_tokens: Optional[int]
+        max_tokens: Optional[int],
+        json_mode: bool = False
     ) -> LLMResponse:
         """Azure OpenAI API 호출"""
         try:
@@ -263,6 +278,9 @@ class LLMClient:
         if max_tokens:
             kwargs["max_tokens"] = max_tokens
         
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        
         response = client.chat.completions.create(**kwargs)
         
         return LLMResponse(
@@ -277,7 +295,8 @@ class LLMClient:
         messages: List[Dict[str, str]],
         model: str,
         temperature: float,
-        max_tokens: Optional[int]
+        max_tokens: Optional[int],
+        json_mode: bool = False
     ) -> LLMResponse:
         """OpenRouter API 호출"""
         try:
@@ -304,6 +323,9 @@ class LLMClient:
         if max_tokens:
             payload["max_tokens"] = max_tokens
         
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        
         response = requests.post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers=headers,
@@ -325,6 +347,15 @@ class LLMClient:
         """LLM 클라이언트 사용 가능 여부"""
         return len(self._available_providers) > 0
     
+    @staticmethod
+    def get_latency_stats() -> Dict[str, float]:
+        """최근 LLM 호출 지연 시간 백분위 (ms, 요약기 호출 포함)
+        
+        Returns:
+            {"count", "p50", "p90", "p99", "max"}
+        """
+        return get_tracer().latency_percentiles("llm")
+    
     def get_available_providers(self) -> List[str]:
         """사용 가능한 제공자 목록"""
         return self._available_providers.copy()
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+페르소나 예측 선분석(prefetch) 서비스
+
+사용자가 최근에 전환했던 페르소나들을 유휴 시간에 백그라운드에서 미리 수집·분석해
+`PersonaTodoCacheService`에 채워 둡니다. 다음 전환 때는 캐시 히트로 즉시 표시됩니다.
+
+- 대상 순서: 최근 전환 기록 순 (현재 페르소나 제외)
+- 동시 실행 수는 `max_concurrency`로 제한 (스레드별 전용 SmartAssistant 사용)
+- 시간당 실행 수는 `max_runs_per_hour`로 제한하고, `min_refresh_sec` 안에 선분석한
+  페르소나는 틱이 바뀌어도 다시 분석하지 않음 (틱마다 전체 분석이 반복되지 않도록)
+- `pause()`가 호출되면 진행 중인 작업을 다음 await 지점에서 취소하고 대기열로 되돌림
+  (전경 작업이 시작되면 UI 쪽에서 즉시 호출)
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .persona_todo_cache_service import CacheKey, CachedAnalysisResult, PersonaTodoCacheService
+from src.utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchCancelled(Exception):
+    """전경 작업 시작/중지로 선분석이 중단됨"""
+
+
+@dataclass
+class PrefetchTarget:
+    """선분석 대상"""
+    persona_key: str
+    persona: Any  # PersonaInfo 또는 페르소나 dict
+    cache_key: CacheKey
+    collect_options: Dict[str, Any] = field(default_factory=dict)
+
+
+class PersonaPrefetchService:
+    """최근 전환한 페르소나를 유휴 시간에 미리 분석하는 서비스"""
+
+    def __init__(
+        self,
+        cache_service: PersonaTodoCacheService,
+        assistant_factory: Callable[[], Any],
+        client: Any = None,
+        max_concurrency: int = 1,
+        history_size: int = 8,
+        max_runs_per_hour: int = 6,
+        min_refresh_sec: float = 600.0,
+    ):
+        """
+        Args:
+            cache_service: 결과를 채울 페르소나 캐시
+            assistant_factory: 워커 스레드 전용 SmartAssistant 생성 함수
+            client: VirtualOfficeClient (set_client로 나중에 지정 가능)
+            max_concurrency: 동시에 분석할 페르소나 수
+            history_size: 기억할 최근 전환 페르소나 수
+            max_runs_per_hour: 최근 1시간 동안 시작할 수 있는 최대 선분석 수
+            min_refresh_sec: 같은 페르소나를 다시 선분석하기까지 최소 간격 (초)
+        """
+        self.cache_service = cache_service
+        self.assistant_factory = assistant_factory
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self.history_size = history_size
+        self.max_runs_per_hour = max(0, max_runs_per_hour)
+        self.min_refresh_sec = min_refresh_sec
+
+        self._history: "OrderedDict[str, Any]" = OrderedDict()  # 최근 전환 순 (마지막이 최신)
+        self._queue: List[PrefetchTarget] = []
+        self._active: Dict[str, PrefetchTarget] = {}
+        self._run_times: "deque[float]" = deque()  # 최근 1시간 선분석 시작 시각 (monotonic)
+        self._refreshed_at: Dict[str, float] = {}  # 페르소나별 마지막 선분석 완료 시각 (monotonic)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._paused = threading.Event()
+        self._paused.set()  # 전경이 유휴 상태가 될 때까지 대기
+        self._stopped = False
+        self._workers: List[threading.Thread] = []
+        self._local = threading.local()
+
+        self.stats = {
+            "completed": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "skipped_cached": 0,
+            "skipped_fresh": 0,
+            "budget_waits": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 전환 기록 / 제어
+    # ------------------------------------------------------------------
+    def set_client(self, client: Any) -> None:
+        """VirtualOffice 클라이언트 지정 (연결 후)"""
+        self.client = client
+
+    def record_switch(self, persona_key: str, persona: Any) -> None:
+        """페르소나 전환 기록 (최근 전환 페르소나가 우선 선분석 대상)"""
+        with self._lock:
+            self._history.pop(persona_key, None)
+            self._history[persona_key] = persona
+            while len(self._history) > self.history_size:
+                self._history.popitem(last=False)
+
+    def recent_personas(self, exclude: Optional[str] = None) -> List[tuple]:
+        """최근 전환 순 (persona_key, persona) 목록"""
+        with self._lock:
+            items = list(self._history.items())
+        return [(key, persona) for key, persona in reversed(items) if key != exclude]
+
+    def pause(self) -> None:
+        """선분석 일시 중지 (진행 중인 작업은 취소 후 대기열로 복귀)"""
+        if not self._paused.is_set():
+            logger.info("[Prefetch] ⏸️ 전경 작업 시작 → 선분석 일시 중지")
+        self._paused.set()
+
+    def resume(self) -> None:
+        """선분석 재개"""
+        if self._paused.is_set():
+            logger.debug("[Prefetch] ▶️ 선분석 재개")
+        self._paused.clear()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused.is_set()
+
+    def schedule(self, targets: List[PrefetchTarget]) -> int:
+        """선분석 대기열 교체 (이미 캐시에 있거나, 최근에 선분석했거나, 진행 중인 대상은 제외)
+
+        Returns:
+            대기열에 추가된 대상 수
+        """
+        now = time.monotonic()
+        pending: List[PrefetchTarget] = []
+        for target in targets:
+            if self.cache_service.contains(target.cache_key):
+                self.stats["skipped_cached"] += 1
+                continue
+            refreshed_at = self._refreshed_at.get(target.persona_key)
+            if refreshed_at is not None and now - refreshed_at < self.min_refresh_sec:
+                self.stats["skipped_fresh"] += 1
+                continue
+            pending.append(target)
+
+        with self._wakeup:
+            active = {target.cache_key.to_hash() for target in self._active.values()}
+            self._queue = [t for t in pending if t.cache_key.to_hash() not in active]
+            queued = len(self._queue)
+            if queued:
+                self._ensure_workers()
+                self._wakeup.notify_all()
+        if queued:
+            logger.info(f"[Prefetch] 📋 선분석 대기열: {[t.persona_key for t in self._queue]}")
+        return queued
+
+    def stop(self, timeout: float = 3.0) -> None:
+        """워커 종료"""
+        self._stopped = True
+        self._paused.set()
+        with self._wakeup:
+            self._queue.clear()
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 반환"""
+        with self._lock:
+            return {
+                **self.stats,
+                "queued": len(self._queue),
+                "active": list(self._active),
+                "paused": self._paused.is_set(),
+                "runs_last_hour": len(self._run_times),
+                "history": list(reversed(self._history)),
+            }
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+    def _ensure_workers(self) -> None:
+        """필요한 만큼 워커 스레드 시작 (lock 보유 상태에서 호출)"""
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.max_concurrency:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"PersonaPrefetch-{len(self._workers) + 1}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _budget_available(self, now: float) -> bool:
+        """최근 1시간 선분석 시작 수가 한도 미만인지 (lock 보유 상태에서 호출)"""
+        while self._run_times and now - self._run_times[0] >= 3600:
+            self._run_times.popleft()
+        return len(self._run_times) < self.max_runs_per_hour
+
+    def _next_target(self) -> Optional[PrefetchTarget]:
+        """재개 상태에서 다음 대상을 꺼냄 (중지되면 None, 시간당 한도를 넘으면 대기)"""
+        budget_waiting = False
+        with self._wakeup:
+            while not self._stopped:
+                if not self._paused.is_set() and self._queue:
+                    now = time.monotonic()
+                    if self._budget_available(now):
+                        target = self._queue.pop(0)
+                        self._active[target.persona_key] = target
+                        self._run_times.append(now)
+                        return target
+                    if not budget_waiting:
+                        budget_waiting = True
+                        self.stats["budget_waits"] += 1
+                        logger.info(f"[Prefetch] ⏳ 시간당 선분석 한도({self.max_runs_per_hour}회) 도달 → 대기")
+                self._wakeup.wait(timeout=1.0)
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            target = self._next_target()
+            if target is None:
+                return
+            try:
+                self._prefetch(target)
+                self.stats["completed"] += 1
+                with self._lock:
+                    self._refreshed_at[target.persona_key] = time.monotonic()
+            except PrefetchCancelled:
+                self.stats["cancelled"] += 1
+                if not self._stopped:
+                    with self._wakeup:
+                        # 재개 후 다시 시도 (그 사이 새 대기열이 들어왔으면 뒤에 추가)
+                        if all(t.persona_key != target.persona_key for t in self._queue):
+                            self._queue.insert(0, target)
+                logger.info(f"[Prefetch] ⏹️ 선분석 중단: {target.persona_key}")
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.warning(f"[Prefetch] ⚠️ 선분석 실패 ({target.persona_key}): {e}")
+            finally:
+                with self._lock:
+                    self._active.pop(target.persona_key, None)
+
+    def _assistant(self) -> Any:
+        """워커 스레드 전용 SmartAssistant (스레드마다 한 번 생성)"""
+        assistant = getattr(self._local, "assistant", None)
+        if assistant is None:
+            assistant = self.assistant_factory()
+            # 선분석 결과는 캐시에만 저장 (전경 TODO DB에 쓰지 않음)
+            assistant.persist_batch_todos = False
+            self._local.assistant = assistant
+        return assistant
+
+    def _check_cancelled(self) -> None:
+        if self._stopped or self._paused.is_set():
+            raise PrefetchCancelled()
+
+    async def _guarded(self, coro):
+        """전경 작업이 시작되면 코루틴을 취소"""
+        task = asyncio.ensure_future(coro)
+        while not task.done():
+            if self._stopped or self._paused.is_set():
+                task.cancel()
+                try:
+                    await task
+                except BaseException:
+                    pass
+                raise PrefetchCancelled()
+            await asyncio.wait({task}, timeout=0.2)
+        return task.result()
+
+    def _prefetch(self, target: PrefetchTarget) -> None:
+        """대상 페르소나 수집 → 분석 → TODO 생성 → 캐시 저장"""
+        if self.cache_service.contains(target.cache_key):
+            self.stats["skipped_cached"] += 1
+            return
+        if self.client is None:
+            raise RuntimeError("VirtualOffice 클라이언트가 없습니다")
+
+        started = datetime.now()
+        logger.info(f"[Prefetch] 🔮 선분석 시작: {target.persona_key}")
+        assistant = self._assistant()
+        assistant.set_virtualoffice_source(self.client, target.persona)
+
+        loop = asyncio.new_event_loop()
+        try:
+            with get_tracer().span("prefetch_run", category="run", persona=target.persona_key):
+                self._check_cancelled()
+                messages = loop.run_until_complete(
+                    self._guarded(assistant.collect_messages(**target.collect_options))
+                )
+                if not messages:
+                    logger.info(f"[Prefetch] 수집된 메시지 없음: {target.persona_key}")
+                    return
+
+                self._check_cancelled()
+                analysis_results = loop.run_until_complete(self._guarded(assistant.analyze_messages()))
+
+                self._check_cancelled()
+                todo_list = loop.run_until_complete(
+                    self._guarded(assistant.generate_todo_list(analysis_results))
+                )
+        finally:
+            loop.close()
+
+        items = (todo_list or {}).get("items", [])
+        self.cache_service.put(
+            target.cache_key,
+            CachedAnalysisResult(
+                cache_key=target.cache_key.to_hash(),
+                persona_id=target.persona_key,
+                todo_list=items,
+                messages=list(messages),
+                analysis_summary={
+                    "total_messages": len(messages),
+                    "todo_count": len(items),
+                    "prefetched": True,
+                },
+                analysis_data=list(analysis_results or []),
+                created_at=datetime.now(),
+                last_accessed_at=datetime.now(),
+            ),
+        )
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(
+            f"[Prefetch] ✅ 선분석 완료: {target.persona_key} "
+            f"(메시지 {len(messages)}개, TODO {len(items)}개, {elapsed:.1f}초)"
+        )
@@ -2,18 +2,38 @@
 페르소나별 TODO 캐시 관리 서비스
 
 페르소나 전환 시 분석 결과를 캐싱하여 빠른 응답을 제공합니다.
-LRU 정책으로 최대 10개의 캐시를 유지하며, 캐시 통계를 수집합니다.
+메모리 계층은 LRU 정책으로 항목 수(max_cache_size)와 추정 바이트(max_memory_bytes)를
+함께 제한하고, 캐시 통계를 수집합니다.
+
+`db_path`를 지정하면 SQLite 영구 계층을 사용합니다.
+- 분석 결과를 pickle + zlib으로 압축한 스냅샷을 `CacheKey.to_hash()` 키로 저장
+- 저장은 백그라운드 스레드에서 write-behind로 처리 (GUI 스레드 블로킹 없음)
+- 메모리에서 제거된 항목이나 재시작 후 조회는 디스크에서 복원
+- 마지막 데이터 버전(틱)을 기록해 재시작 시 같은 틱이면 모든 페르소나 결과를 즉시 표시
+- 데이터 버전은 "틱@데이터셋 식별자" 형식이라 다른 시뮬레이션/데이터셋의 같은 틱과 섞이지 않음
 """
 
 import logging
 import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from queue import Queue
+from typing import Optional, Dict, Any, List, Callable
 from collections import OrderedDict
 
+from src.utils.tracing import trace_cache
+
 logger = logging.getLogger(__name__)
 
+# 스냅샷 형식이 바뀌면 올려서 기존 디스크 항목을 무시
+SNAPSHOT_FORMAT = 1
+
 
 @dataclass
 class CacheKey:
@@ -32,6 +52,44 @@ class CacheKey:
         return f"CacheKey({self.persona_id}, {self.time_range_start}~{self.time_range_end}, v{self.data_version})"
 
 
+def dataset_identity(path: Optional[str]) -> str:
+    """데이터셋 식별자 (절대 경로 + 파일 생성 정보 해시)
+    
+    VDOS DB 파일은 장치/inode 번호와 생성 시각(지원하는 플랫폼만)을 사용합니다.
+    SQLite는 읽기 전용 연결을 닫을 때의 체크포인트만으로도 본 파일 mtime을 바꾸므로
+    수정 시각은 쓰지 않습니다 (재시작 후 같은 틱이면 같은 식별자여야 함).
+    새 시뮬레이션이 DB 파일을 다시 만들면 inode/생성 시각이 바뀌어 식별자도 바뀝니다.
+    디렉터리(오프라인 JSON 데이터셋)는 읽기만으로 바뀌지 않는 JSON 파일의 이름/크기/수정 시각을 사용합니다.
+    경로가 없거나 접근할 수 없으면 빈 문자열을 반환합니다.
+    """
+    if not path:
+        return ""
+    path = os.path.abspath(path)
+    try:
+        if os.path.isdir(path):
+            files = sorted(
+                (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                for entry in os.scandir(path)
+                if entry.is_file() and entry.name.endswith(".json")
+            )
+            marker = repr(files)
+        else:
+            stat = os.stat(path)
+            # st_birthtime: macOS/BSD (Windows는 st_ctime이 생성 시각)
+            created = getattr(stat, "st_birthtime", None)
+            if created is None and os.name == "nt":
+                created = stat.st_ctime
+            marker = f"{stat.st_dev}|{stat.st_ino}|{created}"
+    except OSError:
+        return ""
+    return hashlib.sha256(f"{path}|{marker}".encode()).hexdigest()[:12]
+
+
+def make_data_version(tick, dataset_id: str = "") -> str:
+    """캐시 키용 데이터 버전 ("틱@데이터셋 식별자", 식별자가 없으면 틱만)"""
+    return f"{tick}@{dataset_id}" if dataset_id else str(tick)
+
+
 @dataclass
 class CachedAnalysisResult:
     """캐시된 분석 결과"""
@@ -49,60 +107,374 @@ class CachedAnalysisResult:
         self.last_accessed_at = datetime.now()
 
 
+def _estimate_bytes(result: CachedAnalysisResult) -> int:
+    """직렬화 전 메모리 사용량 추정 (write-behind에서 실제 크기로 갱신)"""
+    return (
+        2048
+        + 1500 * len(result.messages or [])
+        + 800 * len(result.todo_list or [])
+        + 1500 * len(result.analysis_data or [])
+    )
+
+
+def decode_snapshot(blob: bytes) -> CachedAnalysisResult:
+    """압축 스냅샷 → 분석 결과"""
+    return pickle.loads(zlib.decompress(blob))
+
+
 class PersonaTodoCacheService:
     """페르소나별 TODO 캐시 관리 서비스
     
-    LRU(Least Recently Used) 정책으로 최대 max_cache_size개의 캐시를 유지합니다.
+    LRU(Least Recently Used) 정책으로 최대 max_cache_size개, max_memory_bytes 이하의 캐시를 유지합니다.
+    `db_path`가 있으면 메모리에서 제거된 항목도 디스크에서 복원합니다.
     캐시 히트/미스 통계를 수집하고 로깅합니다.
     """
     
-    def __init__(self, max_cache_size: int = 10):
+    def __init__(
+        self,
+        max_cache_size: int = 10,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        db_path: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
         """
         Args:
-            max_cache_size: 최대 캐시 개수 (기본값: 10)
+            max_cache_size: 메모리 계층 최대 캐시 개수 (기본값: 10)
+            max_memory_bytes: 메모리 계층 최대 추정 바이트 (기본값: 64MB)
+            db_path: 영구 캐시 DB 경로 (None이면 메모리 캐시만 사용)
+            max_disk_bytes: 영구 캐시 최대 압축 바이트 (기본값: 256MB)
         """
         self._cache: OrderedDict[str, CachedAnalysisResult] = OrderedDict()
+        self._entry_bytes: Dict[str, int] = {}
+        self._memory_bytes = 0
         self._max_cache_size = max_cache_size
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._lock = threading.RLock()
         self._stats = {
             "hits": 0,
             "misses": 0,
             "evictions": 0,
-            "invalidations": 0
+            "invalidations": 0,
+            "disk_hits": 0,
+            "disk_writes": 0,
         }
-        logger.info(f"PersonaTodoCacheService 초기화 (max_size={max_cache_size})")
+        
+        # 영구 계층 (write-behind)
+        self._db_path = db_path
+        self._pending: Dict[str, CachedAnalysisResult] = {}
+        self._write_queue: "Queue[Optional[Callable[[], None]]]" = Queue()
+        self._writer: Optional[threading.Thread] = None
+        if db_path:
+            if not self._init_database():
+                self._db_path = None
+            else:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="PersonaCacheWriter", daemon=True
+                )
+                self._writer.start()
+        
+        logger.info(
+            f"PersonaTodoCacheService 초기화 (max_size={max_cache_size}, "
+            f"max_memory={max_memory_bytes // (1024 * 1024)}MB, 영구 캐시={self._db_path or '사용 안 함'})"
+        )
+    
+    # ------------------------------------------------------------------
+    # 영구 계층
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=5)
+    
+    def _init_database(self) -> bool:
+        """영구 캐시 데이터베이스 초기화"""
+        try:
+            directory = os.path.dirname(os.path.abspath(self._db_path))
+            os.makedirs(directory, exist_ok=True)
+            conn = self._connect()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS persona_cache (
+                    key_hash TEXT PRIMARY KEY,
+                    persona_id TEXT NOT NULL,
+                    format INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    snapshot BLOB NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS persona_cache_meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            conn.commit()
+            conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"❌ 페르소나 영구 캐시 초기화 실패 → 메모리 캐시만 사용: {e}")
+            return False
+    
+    def _writer_loop(self) -> None:
+        """write-behind 작업 처리 (요청 순서대로 단일 스레드에서 실행)"""
+        while True:
+            task = self._write_queue.get()
+            try:
+                if task is None:
+                    return
+                task()
+            except Exception as e:
+                logger.error(f"❌ 페르소나 영구 캐시 쓰기 오류: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def _enqueue(self, task: Callable[[], None]) -> None:
+        if self._writer is not None:
+            self._write_queue.put(task)
+    
+    def _write_snapshot(self, key_hash: str) -> None:
+        """대기 중인 분석 결과를 직렬화해 디스크에 저장 (writer 스레드)"""
+        with self._lock:
+            result = self._pending.get(key_hash)
+        if result is None:
+            return  # 저장 전에 무효화됨
+        
+        try:
+            raw = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"⚠️ 영구 캐시 직렬화 실패 → 메모리에만 유지 ({key_hash}): {e}")
+            with self._lock:
+                if self._pending.get(key_hash) is result:
+                    del self._pending[key_hash]
+            return
+        blob = zlib.compress(raw, 3)
+        
+        with self._lock:
+            if self._pending.get(key_hash) is not result:
+                return  # 직렬화 중 무효화/교체됨
+        
+        # 디스크 쓰기는 lock 밖에서 (GUI 스레드의 get/put/contains를 막지 않음)
+        # 쓰는 동안 무효화되면 삭제 작업이, 교체되면 새 저장 작업이 이 작업 뒤에 실행됨
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO persona_cache
+                (key_hash, persona_id, format, size, snapshot, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key_hash, result.persona_id, SNAPSHOT_FORMAT, len(blob), blob, time.time()),
+            )
+            conn.commit()
+            
+            with self._lock:
+                if self._pending.get(key_hash) is result:
+                    del self._pending[key_hash]
+                    
+                    # 실제 크기로 메모리 사용량 갱신
+                    if key_hash in self._entry_bytes:
+                        self._memory_bytes += len(raw) - self._entry_bytes[key_hash]
+                        self._entry_bytes[key_hash] = len(raw)
+                self._stats["disk_writes"] += 1
+                self._enforce_memory_limit()
+            self._prune_disk(conn)
+        finally:
+            conn.close()
+        logger.debug(f"💽 영구 캐시 저장: {key_hash} ({len(raw) // 1024}KB → {len(blob) // 1024}KB)")
+    
+    def _prune_disk(self, conn: sqlite3.Connection) -> None:
+        """영구 캐시가 max_disk_bytes를 넘으면 오래된 스냅샷부터 삭제"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM persona_cache").fetchone()[0]
+        if total <= self._max_disk_bytes:
+            return
+        removed = 0
+        for key_hash, size in conn.execute(
+            "SELECT key_hash, size FROM persona_cache ORDER BY updated_at"
+        ).fetchall():
+            if total <= self._max_disk_bytes:
+                break
+            conn.execute("DELETE FROM persona_cache WHERE key_hash = ?", (key_hash,))
+            total -= size
+            removed += 1
+        conn.commit()
+        logger.debug(f"🔄 영구 캐시 정리: {removed}개 삭제")
+    
+    def _load_snapshot(self, key_hash: str) -> Optional[CachedAnalysisResult]:
+        """디스크에서 스냅샷 복원"""
+        if not self._db_path:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT format, snapshot FROM persona_cache WHERE key_hash = ?",
+                    (key_hash,),
+                ).fetchone()
+                if row is None or row[0] != SNAPSHOT_FORMAT:
+                    return None
+                conn.execute(
+                    "UPDATE persona_cache SET updated_at = ? WHERE key_hash = ?",
+                    (time.time(), key_hash),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            return decode_snapshot(row[1])
+        except Exception as e:
+            logger.warning(f"⚠️ 영구 캐시 복원 실패 ({key_hash}): {e}")
+            return None
+    
+    def _delete_persisted(self, persona_id: Optional[str]) -> None:
+        """디스크 스냅샷 삭제 (writer 스레드, 대기 중인 저장 이후 실행)"""
+        conn = self._connect()
+        try:
+            if persona_id is None:
+                conn.execute("DELETE FROM persona_cache")
+            else:
+                conn.execute("DELETE FROM persona_cache WHERE persona_id = ?", (persona_id,))
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 write-behind 작업 완료 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        
+        Returns:
+            모든 작업 완료 여부
+        """
+        if self._writer is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._write_queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """대기 중인 저장을 마치고 writer 스레드 종료"""
+        if self._writer is None:
+            return
+        if not self.flush(timeout):
+            logger.warning("⚠️ 페르소나 영구 캐시 저장이 끝나지 않은 상태로 종료")
+        self._write_queue.put(None)
+        self._writer.join(timeout=1.0)
+        self._writer = None
+    
+    def set_data_version(self, data_version: str) -> None:
+        """현재 데이터 버전(틱) 기록 (재시작 시 `last_data_version()`으로 복원)"""
+        if not self._db_path:
+            return
+        
+        def _save():
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO persona_cache_meta (name, value) VALUES ('data_version', ?)",
+                    (str(data_version),),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        
+        self._enqueue(_save)
     
+    def last_data_version(self) -> Optional[str]:
+        """마지막으로 기록된 데이터 버전 (영구 캐시가 없으면 None)"""
+        if not self._db_path:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM persona_cache_meta WHERE name = 'data_version'"
+                ).fetchone()
+            finally:
+                conn.close()
+            return row[0] if row else None
+        except Exception as e:
+            logger.debug(f"데이터 버전 조회 실패: {e}")
+            return None
+    
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
     def get(self, cache_key: CacheKey) -> Optional[CachedAnalysisResult]:
-        """캐시에서 분석 결과 조회
+        """캐시에서 분석 결과 조회 (메모리 → 저장 대기 → 디스크 순)
         
         Args:
             cache_key: 조회할 캐시 키
-            
+        
         Returns:
             캐시된 분석 결과 또는 None (캐시 미스)
         """
         key_hash = cache_key.to_hash()
         
-        if key_hash in self._cache:
+        with self._lock:
+            result = self._cache.get(key_hash)
+            if result is None:
+                result = self._pending.get(key_hash)
+                if result is not None:
+                    self._remember(key_hash, result)
+        
+        if result is None:
+            result = self._load_snapshot(key_hash)
+            if result is not None:
+                with self._lock:
+                    self._remember(key_hash, result)
+                    self._stats["disk_hits"] += 1
+                logger.info(f"💽 영구 캐시에서 복원: {cache_key}")
+        
+        if result is not None:
             # 캐시 히트
-            result = self._cache[key_hash]
-            result.update_access_time()
-            
-            # LRU 순서 업데이트 (가장 최근 사용으로 이동)
-            self._cache.move_to_end(key_hash)
-            
-            self._stats["hits"] += 1
+            with self._lock:
+                result.update_access_time()
+                
+                # LRU 순서 업데이트 (가장 최근 사용으로 이동)
+                if key_hash in self._cache:
+                    self._cache.move_to_end(key_hash)
+                
+                self._stats["hits"] += 1
+            trace_cache("persona_todo", hit=True)
             logger.info(f"✅ 캐시 히트: {cache_key} (히트율: {self.get_hit_rate():.1%})")
             logger.debug(f"캐시 생성 시간: {result.created_at}, 마지막 접근: {result.last_accessed_at}")
             
             return result
         else:
             # 캐시 미스
-            self._stats["misses"] += 1
+            with self._lock:
+                self._stats["misses"] += 1
+            trace_cache("persona_todo", hit=False)
             logger.info(f"❌ 캐시 미스: {cache_key} (히트율: {self.get_hit_rate():.1%})")
             return None
     
+    def contains(self, cache_key: CacheKey) -> bool:
+        """캐시 보유 여부 (통계/LRU 순서에 영향 없음)"""
+        key_hash = cache_key.to_hash()
+        with self._lock:
+            if key_hash in self._cache or key_hash in self._pending:
+                return True
+        if not self._db_path:
+            return False
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT 1 FROM persona_cache WHERE key_hash = ? AND format = ?",
+                    (key_hash, SNAPSHOT_FORMAT),
+                ).fetchone()
+            finally:
+                conn.close()
+            return row is not None
+        except Exception as e:
+            logger.debug(f"영구 캐시 조회 실패 ({key_hash}): {e}")
+            return False
+    
     def put(self, cache_key: CacheKey, result: CachedAnalysisResult) -> None:
-        """분석 결과를 캐시에 저장
+        """분석 결과를 캐시에 저장 (영구 계층은 백그라운드에서 저장)
         
         Args:
             cache_key: 캐시 키
@@ -110,23 +482,46 @@ class PersonaTodoCacheService:
         """
         key_hash = cache_key.to_hash()
         
-        # 캐시 크기 확인 및 LRU 제거
-        if len(self._cache) >= self._max_cache_size and key_hash not in self._cache:
-            self._evict_lru()
+        with self._lock:
+            self._remember(key_hash, result)
+            if self._writer is not None:
+                self._pending[key_hash] = result
+        if self._writer is not None:
+            self._enqueue(lambda: self._write_snapshot(key_hash))
+        
+        logger.info(
+            f"💾 캐시 저장: {cache_key} (현재 캐시 수: {len(self._cache)}/{self._max_cache_size}, "
+            f"메모리 {self._memory_bytes // 1024}KB)"
+        )
+        logger.debug(f"TODO 개수: {len(result.todo_list)}, 메시지 개수: {len(result.messages)}")
+    
+    def _remember(self, key_hash: str, result: CachedAnalysisResult) -> None:
+        """메모리 계층에 추가하고 LRU 한도 적용 (lock 보유 상태에서 호출)"""
+        previous = self._entry_bytes.pop(key_hash, 0)
+        self._memory_bytes -= previous
         
-        # 캐시에 저장
         self._cache[key_hash] = result
         self._cache.move_to_end(key_hash)  # 가장 최근 사용으로 이동
+        size = _estimate_bytes(result)
+        self._entry_bytes[key_hash] = size
+        self._memory_bytes += size
         
-        logger.info(f"💾 캐시 저장: {cache_key} (현재 캐시 수: {len(self._cache)}/{self._max_cache_size})")
-        logger.debug(f"TODO 개수: {len(result.todo_list)}, 메시지 개수: {len(result.messages)}")
+        self._enforce_memory_limit()
+    
+    def _enforce_memory_limit(self) -> None:
+        """항목 수/바이트 한도를 넘으면 LRU 제거 (가장 최근 항목은 유지)"""
+        while len(self._cache) > 1 and (
+            len(self._cache) > self._max_cache_size
+            or self._memory_bytes > self._max_memory_bytes
+        ):
+            self._evict_lru()
     
     def invalidate(self, persona_id: Optional[str] = None) -> int:
-        """캐시 무효화
+        """캐시 무효화 (영구 계층 포함)
         
         Args:
             persona_id: 특정 페르소나의 캐시만 무효화 (None이면 전체 무효화)
-            
+        
         Returns:
             무효화된 캐시 개수
         """
@@ -134,13 +529,18 @@ class PersonaTodoCacheService:
             return self.invalidate_all()
         
         # 특정 페르소나의 캐시만 제거
-        keys_to_remove = [
-            key for key, cached_result in self._cache.items()
-            if cached_result.persona_id == persona_id
-        ]
-        
-        for key in keys_to_remove:
-            del self._cache[key]
+        with self._lock:
+            keys_to_remove = [
+                key for key, cached_result in self._cache.items()
+                if cached_result.persona_id == persona_id
+            ]
+            
+            for key in keys_to_remove:
+                del self._cache[key]
+                self._memory_bytes -= self._entry_bytes.pop(key, 0)
+            for key in [k for k, v in self._pending.items() if v.persona_id == persona_id]:
+                del self._pending[key]
+        self._enqueue(lambda: self._delete_persisted(persona_id))
         
         count = len(keys_to_remove)
         if count > 0:
@@ -149,14 +549,25 @@ class PersonaTodoCacheService:
         
         return count
     
-    def invalidate_all(self) -> int:
+    def invalidate_all(self, keep_persisted: bool = False) -> int:
         """모든 캐시 무효화
         
+        Args:
+            keep_persisted: True면 메모리 계층만 비움. 디스크 스냅샷은 데이터 버전이
+                키에 포함되어 있으므로 틱 진행 시에는 남겨 두어도 잘못 조회되지 않습니다.
+        
         Returns:
             무효화된 캐시 개수
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._entry_bytes.clear()
+            self._memory_bytes = 0
+            if not keep_persisted:
+                self._pending.clear()
+        if not keep_persisted:
+            self._enqueue(lambda: self._delete_persisted(None))
         
         if count > 0:
             self._stats["invalidations"] += count
@@ -178,9 +589,15 @@ class PersonaTodoCacheService:
             "misses": self._stats["misses"],
             "evictions": self._stats["evictions"],
             "invalidations": self._stats["invalidations"],
+            "disk_hits": self._stats["disk_hits"],
+            "disk_writes": self._stats["disk_writes"],
+            "pending_writes": len(self._pending),
             "hit_rate": hit_rate,
             "current_cache_size": len(self._cache),
-            "max_cache_size": self._max_cache_size
+            "max_cache_size": self._max_cache_size,
+            "memory_bytes": self._memory_bytes,
+            "max_memory_bytes": self._max_memory_bytes,
+            "persistent": bool(self._db_path),
         }
     
     def get_hit_rate(self) -> float:
@@ -197,19 +614,21 @@ class PersonaTodoCacheService:
         stats = self.get_stats()
         logger.debug(
             f"📊 캐시 통계: "
-            f"히트={stats['hits']}, 미스={stats['misses']}, "
+            f"히트={stats['hits']} (디스크 {stats['disk_hits']}), 미스={stats['misses']}, "
             f"히트율={stats['hit_rate']:.1%}, "
             f"제거={stats['evictions']}, 무효화={stats['invalidations']}, "
-            f"현재 크기={stats['current_cache_size']}/{stats['max_cache_size']}"
+            f"현재 크기={stats['current_cache_size']}/{stats['max_cache_size']} "
+            f"({stats['memory_bytes'] // 1024}KB)"
         )
     
     def _evict_lru(self) -> None:
-        """LRU 정책으로 가장 오래된 캐시 제거"""
+        """LRU 정책으로 가장 오래된 캐시 제거 (영구 계층에는 남아 있음)"""
         if not self._cache:
             return
         
         # OrderedDict의 첫 번째 항목이 가장 오래된 항목
         oldest_key, oldest_result = self._cache.popitem(last=False)
+        self._memory_bytes -= self._entry_bytes.pop(oldest_key, 0)
         
         self._stats["evictions"] += 1
         logger.debug(
@@ -219,12 +638,14 @@ class PersonaTodoCacheService:
         )
     
     def clear(self) -> None:
-        """모든 캐시 및 통계 초기화"""
-        self._cache.clear()
+        """모든 캐시(영구 계층 포함) 및 통계 초기화"""
+        self.invalidate_all()
         self._stats = {
             "hits": 0,
             "misses": 0,
             "evictions": 0,
-            "invalidations": 0
+            "invalidations": 0,
+            "disk_hits": 0,
+            "disk_writes": 0,
         }
         logger.info("🧹 캐시 및 통계 초기화 완료")
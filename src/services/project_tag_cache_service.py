@@ -3,16 +3,55 @@
 """
 프로젝트 태그 영구 캐시 서비스
 TODO ID별 프로젝트 태그를 별도 DB에 저장하여 재분석 방지
+
+TODO ID 캐시와 별도로 메시지 내용 해시(발신자 + 제목 + 본문 + 프로젝트 카탈로그 버전)를
+키로 하는 보조 캐시를 둡니다. 같은 원본 메시지에서 여러 TODO가 나오거나
+재분석으로 TODO ID가 바뀌어도 분류 캐스케이드(LLM 포함)를 다시 실행하지 않습니다.
 """
 
+import hashlib
+import re
 import sqlite3
 import logging
 import os
+import unicodedata
 from typing import Optional, Dict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 제목 앞의 회신/전달 접두어 (RE:, FW:, 회신: 등)
+_SUBJECT_PREFIX_RE = re.compile(r"^\s*((re|fw|fwd|회신|전달|답장)\s*(\[\d+\])?\s*:\s*)+", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_text(text) -> str:
+    """해시용 텍스트 정규화 (NFKC, 소문자, 공백 축약)"""
+    text = unicodedata.normalize("NFKC", str(text or ""))
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def message_content_hash(message: Dict, catalog_version: str = "") -> Optional[str]:
+    """메시지 내용 기반 캐시 키 생성
+
+    발신자, 제목(회신/전달 접두어 제거), 본문을 정규화해 해시하고
+    프로젝트 카탈로그 버전을 함께 섞어 프로젝트 목록이 바뀌면 키도 바뀌게 합니다.
+
+    Args:
+        message: 메시지 데이터 (sender/sender_email, subject, content/body)
+        catalog_version: 프로젝트 카탈로그 버전 문자열
+
+    Returns:
+        SHA-1 hex 문자열, 제목과 본문이 모두 비어 있으면 None
+    """
+    subject = _SUBJECT_PREFIX_RE.sub("", _normalize_text(message.get("subject")))
+    content = _normalize_text(message.get("content") or message.get("body"))
+    if not subject and not content:
+        return None
+    sender = _normalize_text(message.get("sender") or message.get("sender_email"))
+    payload = "\x1f".join((catalog_version or "", sender, subject, content))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
 
 class ProjectTagCacheService:
     """프로젝트 태그 영구 캐시 관리"""
@@ -61,6 +100,25 @@ class ProjectTagCacheService:
                 ON project_tag_cache(updated_at)
             """)
             
+            # 메시지 내용 해시 보조 캐시 테이블
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS project_tag_content_cache (
+                    content_hash TEXT PRIMARY KEY,
+                    project_tag TEXT NOT NULL,
+                    confidence TEXT,
+                    analysis_method TEXT,
+                    classification_reason TEXT,
+                    project_full_name TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_content_updated_at 
+                ON project_tag_content_cache(updated_at)
+            """)
+            
             conn.commit()
             conn.close()
             
@@ -223,13 +281,107 @@ class ProjectTagCacheService:
             
             # 로그에 분류 근거 포함
             if classification_reason:
-                logger.info(f"✅ 캐시 저장: {todo_id} → {project_tag} ({classification_reason})")
+                logger.debug("✅ 캐시 저장: %s → %s (%s)", todo_id, project_tag, classification_reason)
             else:
-                logger.debug(f"✅ 캐시 저장: {todo_id} → {project_tag}")
+                logger.debug("✅ 캐시 저장: %s → %s", todo_id, project_tag)
             
         except Exception as e:
             logger.error(f"❌ 캐시 저장 실패 ({todo_id}): {e}")
     
+    def get_cached_tag_by_content(self, content_hash: Optional[str]) -> Optional[Dict[str, str]]:
+        """
+        메시지 내용 해시로 프로젝트 태그 조회
+        
+        Args:
+            content_hash: `message_content_hash()` 결과
+            
+        Returns:
+            캐시된 태그 정보 또는 None
+        """
+        if not content_hash:
+            return None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT project_tag, confidence, analysis_method,
+                       classification_reason, project_full_name,
+                       created_at, updated_at
+                FROM project_tag_content_cache
+                WHERE content_hash = ?
+            """, (content_hash,))
+            
+            result = cursor.fetchone()
+            conn.close()
+            
+            if result:
+                return {
+                    'project_tag': result[0],
+                    'confidence': result[1],
+                    'analysis_method': result[2],
+                    'classification_reason': result[3],
+                    'project_full_name': result[4],
+                    'evidence': result[3],
+                    'created_at': result[5],
+                    'updated_at': result[6]
+                }
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"❌ 내용 해시 캐시 조회 실패 ({content_hash[:12]}): {e}")
+            return None
+    
+    def save_content_tag(self, content_hash: Optional[str], project_tag: str,
+                         confidence: str = None, analysis_method: str = None,
+                         classification_reason: str = None,
+                         project_full_name: Optional[str] = None):
+        """
+        메시지 내용 해시 기준으로 프로젝트 태그 저장
+        
+        Args:
+            content_hash: `message_content_hash()` 결과 (None이면 저장하지 않음)
+            project_tag: 프로젝트 태그
+            confidence: 신뢰도
+            analysis_method: 분석 방법
+            classification_reason: 분류 근거
+        """
+        if not content_hash or not project_tag:
+            return
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            now = datetime.now().isoformat()
+            resolved_full_name = project_full_name or self._resolve_project_full_name(project_tag)
+            
+            cursor.execute("""
+                INSERT OR REPLACE INTO project_tag_content_cache 
+                (content_hash, project_tag, confidence, analysis_method,
+                 classification_reason, project_full_name, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, 
+                    COALESCE((SELECT created_at FROM project_tag_content_cache WHERE content_hash = ?), ?),
+                    ?)
+            """, (
+                content_hash,
+                project_tag,
+                confidence,
+                analysis_method,
+                classification_reason,
+                resolved_full_name,
+                content_hash,
+                now,
+                now,
+            ))
+            
+            conn.commit()
+            conn.close()
+            logger.debug("✅ 내용 해시 캐시 저장: %s → %s", content_hash[:12], project_tag)
+            
+        except Exception as e:
+            logger.error(f"❌ 내용 해시 캐시 저장 실패 ({content_hash[:12]}): {e}")
+    
     def get_cache_stats(self) -> Dict[str, int]:
         """캐시 통계 조회"""
         try:
@@ -248,16 +400,21 @@ class ProjectTagCacheService:
             """)
             by_project = dict(cursor.fetchall())
             
+            # 내용 해시 캐시 개수
+            cursor.execute("SELECT COUNT(*) FROM project_tag_content_cache")
+            content_total = cursor.fetchone()[0]
+            
             conn.close()
             
             return {
                 'total': total,
-                'by_project': by_project
+                'by_project': by_project,
+                'content_total': content_total
             }
             
         except Exception as e:
             logger.error(f"❌ 캐시 통계 조회 실패: {e}")
-            return {'total': 0, 'by_project': {}}
+            return {'total': 0, 'by_project': {}, 'content_total': 0}
     
     def clear_cache(self, older_than_days: int = None):
         """
@@ -278,10 +435,15 @@ class ProjectTagCacheService:
                     WHERE updated_at < ?
                 """, (cutoff_date,))
                 deleted = cursor.rowcount
+                cursor.execute("""
+                    DELETE FROM project_tag_content_cache 
+                    WHERE updated_at < ?
+                """, (cutoff_date,))
                 logger.info(f"🗑️ {older_than_days}일 이상 된 캐시 {deleted}개 삭제")
             else:
                 cursor.execute("DELETE FROM project_tag_cache")
                 deleted = cursor.rowcount
+                cursor.execute("DELETE FROM project_tag_content_cache")
                 logger.info(f"🗑️ 전체 캐시 {deleted}개 삭제")
             
             conn.commit()
@@ -5,13 +5,38 @@
 메시지와 TODO에서 프로젝트 정보를 자동으로 추출하고 태그를 생성하는 서비스입니다.
 """
 import re
+import json
+import hashlib
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from config.settings import PROJECT_TAG_CASCADE_CONFIG
 from utils.project_fullname_mapper import generate_project_code
+from services.project_tag_cache_service import message_content_hash
 
 logger = logging.getLogger(__name__)
 
+# extract_project_from_message의 llm_result 기본값 (아직 LLM을 호출하지 않음)
+_LLM_NOT_COMPUTED = object()
+
+# 명시적 패턴 우선순위 점수 → 신뢰도
+_EXPLICIT_PATTERN_CONFIDENCE = {
+    100: 0.95,  # 대괄호 포함
+    90: 0.85,   # 전체 이름
+    80: 0.8,    # 공백 제거 이름
+    70: 0.6,    # 이름에서 추출한 키워드
+    50: 0.45,   # 프로젝트 코드
+    40: 0.4,    # 숫자 버전 이름의 첫 단어
+}
+
+# 캐스케이드 단계 (통계 출력 순서)
+CASCADE_STAGES = (
+    "cache", "explicit", "sender", "chat", "classifier",
+    "llm", "llm_batch", "signal_fallback", "advanced", "sender_fallback", "unclassified",
+)
+
 
 @dataclass
 class ProjectTag:
@@ -22,6 +47,25 @@ class ProjectTag:
     description: str = ""  # 프로젝트 설명
 
 
+@dataclass
+class TagSignal:
+    """결정적(저비용) 분류 단계가 낸 프로젝트 후보"""
+    stage: str  # explicit | sender | chat | classifier
+    project_code: str
+    confidence: float  # 0.0 ~ 1.0
+    reason: str
+
+
+@dataclass
+class CascadeResult:
+    """결정적 신호를 프로젝트별로 합산한 결과"""
+    project_code: Optional[str] = None
+    confidence: float = 0.0
+    reason: str = ""
+    stage: str = ""  # 가장 크게 기여한 단계
+    signals: Optional[List[TagSignal]] = None
+
+
 class ProjectTagService:
     """프로젝트 태그 서비스"""
     
@@ -33,6 +77,18 @@ class ProjectTagService:
         self.vdos_db_path = None  # VDOS 데이터베이스 경로
         self.tag_cache = None  # 초기화 후 설정
         self._custom_cache_path = cache_db_path  # 사용자 지정 경로 저장
+        self._catalog_version = None  # 프로젝트 목록 변경 시 초기화
+        
+        # 점수 기반 캐스케이드 설정 (신뢰도가 llm_threshold 미만일 때만 LLM 호출)
+        self.llm_threshold = PROJECT_TAG_CASCADE_CONFIG["llm_threshold"]
+        self.min_signal_confidence = PROJECT_TAG_CASCADE_CONFIG["min_confidence"]
+        self._project_classifier = None
+        self._classifier_failed = not PROJECT_TAG_CASCADE_CONFIG.get("use_classifier", True)
+        self._stats_lock = threading.Lock()
+        self.cascade_stats = {
+            stage: {"calls": 0, "hits": 0, "decided": 0, "timed": 0, "total_ms": 0.0}
+            for stage in CASCADE_STAGES
+        }
         
         # VDOS 프로젝트 로드 (vdos_db_path 설정됨)
         self._load_projects_from_vdos()
@@ -262,141 +318,399 @@ class ProjectTagService:
         message: Dict,
         use_cache: bool = True,
         return_details: bool = False,
+        llm_result=_LLM_NOT_COMPUTED,
+        signals: Optional[CascadeResult] = None,
     ):
-        """메시지에서 프로젝트 코드 추출 (캐시 우선, LLM 기반 지능 분류)
+        """메시지에서 프로젝트 코드 추출 (캐시 우선, 점수 기반 캐스케이드)
         
-        분석 우선순위:
-        1. 캐시 조회 (이미 분석된 TODO)
-        2. 명시적 프로젝트명 (대괄호 패턴 등)
-        3. LLM 기반 내용 분석 (메시지 내용 우선)
-        4. 고급 분석 (프로젝트 기간, 설명, 발신자 종합)
-        5. 발신자 정보 참고 (폴백, 여러 프로젝트 가능하므로 참고용)
+        분석 순서:
+        1. 캐시 조회 (이미 분석된 TODO, 또는 같은 내용의 메시지)
+        2. 결정적 신호 점수화 (명시적 패턴, 단일 프로젝트 발신자, 채팅방 멤버, 키워드 분류기)
+           - 합산 신뢰도가 `llm_threshold` 이상이면 LLM 없이 바로 결정
+        3. LLM 기반 내용 분석 (신뢰도가 임계값 미만일 때만)
+        4. LLM이 판단하지 못하면 `min_confidence` 이상의 결정적 신호 사용
+        5. 고급 분석 (프로젝트 기간, 설명, 발신자 종합)
+        6. 발신자 정보 참고 (폴백, 여러 프로젝트 가능하므로 참고용)
         
         Args:
             message: 메시지 데이터
             use_cache: 캐시 사용 여부
+            llm_result: 미리 계산된 LLM 분류 결과 ((코드, 근거) 또는 None).
+                `classify_projects_batch()`로 여러 메시지를 한 번에 분류한 경우 전달하며,
+                생략하면 필요할 때 메시지 단위로 LLM을 호출합니다.
+            signals: 미리 계산된 `score_deterministic_signals()` 결과
             
         Returns:
             프로젝트 코드 (예: "WELL", "WI", "CC") 또는 None.
             return_details=True이면 (프로젝트 코드, 분류 근거) 튜플을 반환.
         """
         try:
-            todo_id = message.get('id')
-            
-            # 0. 캐시 조회 (가장 우선)
-            if use_cache and todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                cached = self.tag_cache.get_cached_tag(todo_id)
+            # 0. 캐시 조회 (가장 우선: TODO ID → 메시지 내용 해시)
+            if use_cache:
+                started = time.perf_counter()
+                cached = self.lookup_cached_tag(message)
+                self._record_stage("cache", bool(cached), started, decided=bool(cached))
                 if cached:
-                    reason = cached.get('classification_reason', '')
-                    if reason:
-                        logger.debug(f"[프로젝트 태그] 캐시 히트: {todo_id} → {cached['project_tag']} ({reason})")
-                    else:
-                        logger.debug(f"[프로젝트 태그] 캐시 히트: {todo_id} → {cached['project_tag']}")
-                    return (cached['project_tag'], reason) if return_details else cached['project_tag']
-            
-            # 1. 명시적 프로젝트명 확인 (대괄호 패턴 등 명확한 경우만)
-            explicit_project = self._extract_explicit_project(message)
-            if explicit_project:
-                reason = f"명시적 패턴 매칭"
-                
-                # 명시적 패턴이 발견되면 LLM으로 검증
+                    project_code, reason = cached
+                    return (project_code, reason) if return_details else project_code
+            
+            # 1. 결정적 신호 점수화 (임계값을 넘으면 남은 단계 생략)
+            if signals is None:
+                signals = self.score_deterministic_signals(message)
+            
+            if signals.project_code and signals.confidence >= self.llm_threshold:
+                reason = f"{signals.reason} (신뢰도 {signals.confidence:.2f})"
+                logger.info(f"[프로젝트 태그] 점수 캐스케이드: {signals.project_code} ({reason})")
+                self._record_decision(signals.stage)
+                self._save_cached_tag(message, signals.project_code, signals.stage, 'scored_cascade', reason)
+                return (signals.project_code, reason) if return_details else signals.project_code
+            
+            # 2. LLM 기반 지능 분류 (결정적 신호가 부족할 때만)
+            if llm_result is _LLM_NOT_COMPUTED:
+                started = time.perf_counter()
                 llm_result = self._extract_project_by_llm(message)
-                if llm_result:
-                    llm_project, llm_reason = llm_result
-                    if llm_project and llm_project != 'UNKNOWN':
-                        logger.info(f"[프로젝트 태그] LLM 검증: {llm_project} ({llm_reason})")
-                        result = llm_project
-                        reason = llm_reason
-                    else:
-                        logger.info(f"[프로젝트 태그] 명시적 프로젝트 사용: {explicit_project}")
-                        result = explicit_project
-                else:
-                    logger.info(f"[프로젝트 태그] 명시적 프로젝트 사용: {explicit_project}")
-                    result = explicit_project
-                
-                # 캐시 저장
-                if todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                    project_full_name = self._get_project_full_name(result)
-                    self.tag_cache.save_tag(
-                        todo_id,
-                        result,
-                        'explicit',
-                        'pattern_match',
-                        reason,
-                        project_full_name=project_full_name,
-                    )
-                return (result, reason) if return_details else result
+                self._record_stage("llm", bool(llm_result), started)
+            else:
+                self._record_stage("llm", bool(llm_result))
             
-            # 2. LLM 기반 지능 분류 (메시지 내용 우선 분석)
-            llm_result = self._extract_project_by_llm(message)
             if llm_result:
                 llm_project, llm_reason = llm_result
                 if llm_project and llm_project != 'UNKNOWN':
                     logger.info(f"[프로젝트 태그] LLM 분석: {llm_project} ({llm_reason})")
-                    
-                    # 캐시 저장
-                    if todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                        project_full_name = self._get_project_full_name(llm_project)
-                        self.tag_cache.save_tag(
-                            todo_id,
-                            llm_project,
-                            'llm',
-                            'content_analysis',
-                            llm_reason,
-                            project_full_name=project_full_name,
-                        )
+                    self._record_decision("llm")
+                    self._save_cached_tag(message, llm_project, 'llm', 'content_analysis', llm_reason)
                     return (llm_project, llm_reason) if return_details else llm_project
             
-            # 3. 고급 분석 (프로젝트 기간, 설명, 발신자 종합)
+            # 3. LLM이 판단하지 못하면 임계값 미만이라도 결정적 신호 사용
+            if signals.project_code and signals.confidence >= self.min_signal_confidence:
+                reason = f"{signals.reason} (신뢰도 {signals.confidence:.2f})"
+                logger.info(f"[프로젝트 태그] 결정적 신호 사용: {signals.project_code} ({reason})")
+                self._record_stage("signal_fallback", True, decided=True)
+                self._save_cached_tag(message, signals.project_code, signals.stage, 'signal_fallback', reason)
+                return (signals.project_code, reason) if return_details else signals.project_code
+            
+            # 4. 고급 분석 (프로젝트 기간, 설명, 발신자 종합)
+            started = time.perf_counter()
             advanced_result = self._extract_project_by_advanced_analysis(message)
+            self._record_stage("advanced", bool(advanced_result), started, decided=bool(advanced_result))
             if advanced_result:
                 project_code, reason = advanced_result
                 logger.info(f"[프로젝트 태그] 고급 분석: {project_code} ({reason})")
-                
-                # 캐시 저장
-                if todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                    project_full_name = self._get_project_full_name(project_code)
-                    self.tag_cache.save_tag(
-                        todo_id,
-                        project_code,
-                        'advanced',
-                        'advanced_analysis',
-                        reason,
-                        project_full_name=project_full_name,
-                    )
+                self._save_cached_tag(message, project_code, 'advanced', 'advanced_analysis', reason)
                 return (project_code, reason) if return_details else project_code
             
-            # 4. 발신자 정보 참고 (폴백 - 여러 프로젝트 가능하므로 참고용)
+            # 5. 발신자 정보 참고 (폴백 - 여러 프로젝트 가능하므로 참고용)
+            started = time.perf_counter()
             sender_project = self._extract_project_by_sender(message)
+            self._record_stage("sender_fallback", bool(sender_project), started, decided=bool(sender_project))
             if sender_project:
                 reason = "발신자 기본 프로젝트"
                 logger.info(f"[프로젝트 태그] 발신자 폴백: {sender_project} ({reason})")
-                
-                # 캐시 저장
-                if todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                    project_full_name = self._get_project_full_name(sender_project)
-                    self.tag_cache.save_tag(
-                        todo_id,
-                        sender_project,
-                        'sender',
-                        'sender_fallback',
-                        reason,
-                        project_full_name=project_full_name,
-                    )
+                self._save_cached_tag(message, sender_project, 'sender', 'sender_fallback', reason)
                 return (sender_project, reason) if return_details else sender_project
             
-            # 5. 최종 폴백: "미분류" 태그 부여 (프로젝트를 전혀 식별할 수 없는 경우)
+            # 6. 최종 폴백: "미분류" 태그 부여 (프로젝트를 전혀 식별할 수 없는 경우)
             logger.info("[프로젝트 태그] 최종 폴백: 미분류")
-            if todo_id and hasattr(self, 'tag_cache') and self.tag_cache:
-                self.tag_cache.save_tag(todo_id, "미분류", 'fallback', 'unclassified', "프로젝트 특정 불가")
+            self._record_stage("unclassified", True, decided=True)
+            self._save_cached_tag(message, "미분류", 'fallback', 'unclassified', "프로젝트 특정 불가")
             return ("미분류", "프로젝트 특정 불가") if return_details else "미분류"
             
         except Exception as e:
             logger.error(f"프로젝트 추출 오류: {e}")
             return None
     
+    def score_deterministic_signals(self, message: Dict) -> CascadeResult:
+        """저비용 결정적 신호로 프로젝트 후보와 신뢰도 계산
+        
+        비용이 낮은 단계부터 실행하고, 합산 신뢰도가 `llm_threshold`에 도달하면
+        남은 단계는 건너뜁니다. 같은 프로젝트를 가리키는 신호는
+        noisy-OR(1 - Π(1 - 신뢰도))로 합산합니다.
+        """
+        signals: List[TagSignal] = []
+        result = CascadeResult(signals=signals)
+        
+        stages = (
+            ("explicit", self._signal_from_explicit),
+            ("sender", self._signal_from_sender),
+            ("chat", self._signal_from_chat),
+            ("classifier", self._signal_from_classifier),
+        )
+        for stage, scorer in stages:
+            started = time.perf_counter()
+            try:
+                signal = scorer(message)
+            except Exception as e:
+                logger.debug(f"[프로젝트 태그] {stage} 신호 계산 오류: {e}")
+                signal = None
+            if signal is None or signal.project_code not in self.project_tags:
+                self._record_stage(stage, False, started)
+                continue
+            self._record_stage(stage, True, started)
+            signals.append(signal)
+            
+            result = self._combine_signals(signals)
+            if result.confidence >= self.llm_threshold:
+                break
+        
+        return result
+    
+    def _combine_signals(self, signals: List[TagSignal]) -> CascadeResult:
+        """신호를 프로젝트별로 noisy-OR 합산하여 최고 신뢰도 후보 반환"""
+        by_project: Dict[str, List[TagSignal]] = {}
+        for signal in signals:
+            by_project.setdefault(signal.project_code, []).append(signal)
+        
+        best = CascadeResult(signals=signals)
+        for project_code, project_signals in by_project.items():
+            miss = 1.0
+            for signal in project_signals:
+                miss *= 1.0 - max(0.0, min(1.0, signal.confidence))
+            confidence = 1.0 - miss
+            if confidence > best.confidence:
+                strongest = max(project_signals, key=lambda item: item.confidence)
+                best = CascadeResult(
+                    project_code=project_code,
+                    confidence=confidence,
+                    reason=" + ".join(item.reason for item in project_signals),
+                    stage=strongest.stage,
+                    signals=signals,
+                )
+        return best
+    
+    def _signal_from_explicit(self, message: Dict) -> Optional[TagSignal]:
+        """명시적 프로젝트명 신호 (대괄호 패턴일수록 높은 신뢰도)"""
+        match = self._match_explicit_project(message)
+        if not match:
+            return None
+        project_code, pattern, priority = match
+        confidence = _EXPLICIT_PATTERN_CONFIDENCE.get(priority, 0.4)
+        return TagSignal("explicit", project_code, confidence, f"명시적 패턴 '{pattern}'")
+    
+    def _signal_from_sender(self, message: Dict) -> Optional[TagSignal]:
+        """발신자가 하나의 프로젝트에만 참여하는 경우의 신호"""
+        projects = self._get_sender_projects(message)
+        if len(set(projects)) != 1:
+            return None
+        return TagSignal(
+            "sender",
+            projects[0],
+            PROJECT_TAG_CASCADE_CONFIG["sender_single_confidence"],
+            "단일 프로젝트 발신자",
+        )
+    
+    def _signal_from_chat(self, message: Dict) -> Optional[TagSignal]:
+        """채팅방 멤버/내용 기반 신호 (채팅 메시지만)"""
+        sender = message.get("sender", "")
+        is_chat_message = (
+            not message.get("content") and not message.get("subject")
+            and sender and '@' not in sender
+        )
+        if not is_chat_message or not self.vdos_db_path:
+            return None
+        
+        scored = self._score_project_from_chat(
+            sender, message.get("timestamp", ""), message.get("todo_content", "")
+        )
+        if not scored:
+            return None
+        project_code, score, reason = scored
+        confidence = min(0.95, score / PROJECT_TAG_CASCADE_CONFIG["chat_score_scale"])
+        return TagSignal("chat", project_code, confidence, f"채팅분석: {reason}")
+    
+    def _signal_from_classifier(self, message: Dict) -> Optional[TagSignal]:
+        """ProjectClassifier 키워드 점수 신호
+
+        발신자 근거는 `_signal_from_sender`에서 따로 반영하므로 분류기의 발신자 점수는 빼고
+        키워드 점수만 사용합니다. (noisy-OR 합산은 신호가 서로 독립이라고 가정)
+        """
+        classifier = self._get_project_classifier()
+        if classifier is None:
+            return None
+        
+        content = message.get("content", "") or message.get("body", "")
+        subject = message.get("subject", "")
+        if not content and not subject:
+            return None
+        
+        classification = classifier.classify_by_keywords(content, subject)
+        if not classification.is_classified or not classification.project_name:
+            return None
+        
+        project_code = self._project_code_for_name(classification.project_name)
+        if not project_code:
+            return None
+        keywords = ", ".join(classification.matched_keywords[:3])
+        reason = f"키워드 분류: {keywords}" if keywords else "키워드 분류"
+        return TagSignal("classifier", project_code, classification.confidence, reason)
+    
+    def _get_project_classifier(self):
+        """ProjectClassifier lazy 로드 (VDOS 연결 실패 시 비활성화)"""
+        if self._project_classifier is None and not self._classifier_failed:
+            try:
+                from utils.project_classifier import get_project_classifier
+                self._project_classifier = get_project_classifier()
+            except Exception as e:
+                self._classifier_failed = True
+                logger.warning(f"[프로젝트 태그] 키워드 분류기 비활성화: {e}")
+        return self._project_classifier
+    
+    def _project_code_for_name(self, project_name: str) -> Optional[str]:
+        """프로젝트 전체 이름으로 코드 조회"""
+        name_lower = project_name.strip().lower()
+        for project_code, project_tag in self.project_tags.items():
+            if project_tag.name.strip().lower() == name_lower:
+                return project_code
+        return None
+    
+    def _record_stage(
+        self,
+        stage: str,
+        hit: bool,
+        started: Optional[float] = None,
+        decided: bool = False,
+    ) -> None:
+        """캐스케이드 단계별 호출/적중/지연 시간 기록"""
+        with self._stats_lock:
+            stats = self.cascade_stats[stage]
+            stats["calls"] += 1
+            if hit:
+                stats["hits"] += 1
+            if decided:
+                stats["decided"] += 1
+            if started is not None:
+                stats["timed"] += 1
+                stats["total_ms"] += (time.perf_counter() - started) * 1000
+    
+    def _record_decision(self, stage: str) -> None:
+        """해당 단계가 최종 결과를 결정했음을 기록"""
+        with self._stats_lock:
+            self.cascade_stats[stage]["decided"] += 1
+    
+    def get_cascade_stats(self) -> Dict[str, Any]:
+        """단계별 호출 수, 적중률, 결정 수, 평균 지연 시간 반환 (임계값 튜닝용)"""
+        with self._stats_lock:
+            stages = {}
+            for stage, stats in self.cascade_stats.items():
+                stages[stage] = {
+                    **stats,
+                    "total_ms": round(stats["total_ms"], 2),
+                    "hit_rate": round(stats["hits"] / stats["calls"], 3) if stats["calls"] else 0.0,
+                    "avg_ms": round(stats["total_ms"] / stats["timed"], 2) if stats["timed"] else 0.0,
+                }
+        return {
+            "llm_threshold": self.llm_threshold,
+            "min_confidence": self.min_signal_confidence,
+            "stages": stages,
+        }
+    
+    def reset_cascade_stats(self) -> None:
+        """캐스케이드 통계 초기화"""
+        with self._stats_lock:
+            for stats in self.cascade_stats.values():
+                stats.update(calls=0, hits=0, decided=0, timed=0, total_ms=0.0)
+    
+    @property
+    def catalog_version(self) -> str:
+        """프로젝트 카탈로그 버전 (프로젝트/설명/참여자 매핑의 해시)
+        
+        내용 해시 캐시 키에 포함되므로 프로젝트 목록이 바뀌면 기존 분류 결과를 재사용하지 않습니다.
+        """
+        if self._catalog_version is None:
+            catalog = {
+                "projects": sorted(
+                    (tag.code, tag.name, tag.description) for tag in self.project_tags.values()
+                ),
+                "people": sorted(
+                    (person, sorted(set(codes))) for person, codes in self.person_project_mapping.items()
+                ),
+            }
+            payload = json.dumps(catalog, ensure_ascii=False, sort_keys=True)
+            self._catalog_version = hashlib.md5(payload.encode("utf-8")).hexdigest()[:12]
+        return self._catalog_version
+    
+    def content_cache_key(self, message: Dict) -> Optional[str]:
+        """메시지 내용 해시 캐시 키 (발신자 + 제목 + 본문 + 카탈로그 버전)"""
+        return message_content_hash(message, self.catalog_version)
+    
+    def lookup_cached_tag(self, message: Dict) -> Optional[Tuple[str, str]]:
+        """캐시에서 (프로젝트 코드, 분류 근거) 조회
+        
+        TODO ID 캐시를 먼저 보고, 없으면 메시지 내용 해시 캐시를 봅니다.
+        내용 해시로 찾은 결과는 TODO ID 캐시에도 기록해 다음 조회를 빠르게 합니다.
+        """
+        if not self.tag_cache:
+            return None
+        
+        todo_id = message.get('id')
+        if todo_id:
+            cached = self.tag_cache.get_cached_tag(todo_id)
+            if cached:
+                reason = cached.get('classification_reason') or ''
+                logger.debug(f"[프로젝트 태그] 캐시 히트: {todo_id} → {cached['project_tag']} ({reason})")
+                return cached['project_tag'], reason
+        
+        content_hash = self.content_cache_key(message)
+        cached = self.tag_cache.get_cached_tag_by_content(content_hash)
+        if not cached:
+            return None
+        
+        project_code = cached['project_tag']
+        reason = cached.get('classification_reason') or ''
+        logger.debug(f"[프로젝트 태그] 내용 해시 캐시 히트: {todo_id or content_hash[:12]} → {project_code} ({reason})")
+        if todo_id:
+            self.tag_cache.save_tag(
+                todo_id,
+                project_code,
+                cached.get('confidence'),
+                cached.get('analysis_method'),
+                reason,
+                project_full_name=cached.get('project_full_name'),
+            )
+        return project_code, reason
+    
+    def _save_cached_tag(
+        self,
+        message: Dict,
+        project_code: str,
+        confidence: str,
+        analysis_method: str,
+        reason: str,
+    ) -> None:
+        """분류 결과를 TODO ID 캐시와 내용 해시 캐시에 저장"""
+        if not self.tag_cache:
+            return
+        
+        project_full_name = self._get_project_full_name(project_code)
+        todo_id = message.get('id')
+        if todo_id:
+            self.tag_cache.save_tag(
+                todo_id,
+                project_code,
+                confidence,
+                analysis_method,
+                reason,
+                project_full_name=project_full_name,
+            )
+        self.tag_cache.save_content_tag(
+            self.content_cache_key(message),
+            project_code,
+            confidence,
+            analysis_method,
+            reason,
+            project_full_name=project_full_name,
+        )
+    
     def _extract_explicit_project(self, message: Dict) -> Optional[str]:
         """메시지에서 명시적으로 언급된 프로젝트명 추출 (동적 매칭)"""
+        match = self._match_explicit_project(message)
+        return match[0] if match else None
+    
+    def _match_explicit_project(self, message: Dict) -> Optional[Tuple[str, str, int]]:
+        """명시적 프로젝트명 매칭
+        
+        Returns:
+            (프로젝트 코드, 매칭된 패턴, 패턴 우선순위 점수) 또는 None
+        """
         content = message.get("content", "")
         subject = message.get("subject", "")
         text = f"{subject} {content}".lower()
@@ -434,16 +748,16 @@ class ProjectTagService:
                 if pattern and pattern in text:
                     # 패턴 길이도 고려 (더 긴 패턴이 더 구체적)
                     final_score = score + len(pattern)
-                    matches.append((project_code, pattern, final_score))
+                    matches.append((project_code, pattern, final_score, score))
                     break  # 첫 번째 매칭만 사용
         
         # 가장 높은 점수의 매칭 반환
         if matches:
             matches.sort(key=lambda x: x[2], reverse=True)  # 점수 내림차순 정렬
             best_match = matches[0]
-            project_code, pattern, score = best_match
+            project_code, pattern, score, priority = best_match
             logger.info(f"[프로젝트 태그] 명시적 패턴 매칭: '{pattern}' → {project_code} (점수: {score})")
-            return project_code
+            return project_code, pattern, priority
         
         return None
     
@@ -491,11 +805,7 @@ class ProjectTagService:
         sender_name = message.get("sender_name", "")
         
         # 발신자의 프로젝트 목록 가져오기
-        projects = []
-        if sender_email and sender_email in self.person_project_mapping:
-            projects = self.person_project_mapping[sender_email]
-        elif sender_name and sender_name in self.person_project_mapping:
-            projects = self.person_project_mapping[sender_name]
+        projects = self._get_sender_projects(message)
         
         if not projects:
             return None
@@ -507,6 +817,16 @@ class ProjectTagService:
         # 여러 프로젝트인 경우 스마트 선택
         return self._smart_project_selection(message, projects, sender_email or sender_name)
     
+    def _get_sender_projects(self, message: Dict) -> List[str]:
+        """발신자(이메일 → 이름 순)가 참여하는 프로젝트 목록"""
+        sender_email = message.get("sender_email", "") or message.get("sender", "")
+        sender_name = message.get("sender_name", "")
+        if sender_email and sender_email in self.person_project_mapping:
+            return self.person_project_mapping[sender_email]
+        if sender_name and sender_name in self.person_project_mapping:
+            return self.person_project_mapping[sender_name]
+        return []
+    
     def _smart_project_selection(self, message: Dict, projects: List[str], sender_id: str) -> Optional[str]:
         """여러 프로젝트 중 가장 적합한 프로젝트 선택
         
@@ -766,6 +1086,29 @@ class ProjectTagService:
             logger.error(f"채팅 프로젝트 매칭 오류: {e}")
             return None
     
+    def _score_project_from_chat(self, sender: str, message_date: str = None,
+                                 todo_content: str = None) -> Optional[Tuple[str, int, str]]:
+        """채팅 매칭 점수 조회 (캐스케이드 신뢰도 계산용)
+        
+        Returns:
+            (프로젝트 코드, 점수, 근거) 튜플 또는 None
+        """
+        try:
+            from services.chat_project_matcher import ChatProjectMatcher
+            
+            matcher = ChatProjectMatcher(
+                vdos_db_path=self.vdos_db_path,
+                project_tags=self.project_tags,
+                person_project_mapping=self.person_project_mapping,
+                project_periods=self.project_periods
+            )
+            
+            return matcher.score_project_from_chat(sender, message_date, todo_content)
+            
+        except Exception as e:
+            logger.error(f"채팅 프로젝트 매칭 오류: {e}")
+            return None
+    
     def _fetch_chat_content_from_vdos(self, sender: str, message_date: str = None) -> Optional[str]:
         """VDOS DB에서 채팅 메시지 내용 가져오기
         
@@ -780,6 +1123,13 @@ class ProjectTagService:
             if not self.vdos_db_path:
                 return None
             
+            # 스냅샷 우선 (발신자별 메시지 이진 탐색, 호출마다 julianday 정렬 SQL 실행 안 함)
+            from services.vdos_chat_snapshot import get_vdos_chat_snapshot
+            snapshot = get_vdos_chat_snapshot(self.vdos_db_path)
+            if snapshot.ensure_fresh():
+                message = snapshot.nearest_message(sender, message_date)
+                return message.body if message else None
+            
             import sqlite3
             conn = sqlite3.connect(self.vdos_db_path)
             cur = conn.cursor()
@@ -845,6 +1195,147 @@ class ProjectTagService:
             logger.error(f"LLM 프로젝트 분류 오류: {e}")
             return None
     
+    def extract_projects_from_messages(
+        self,
+        messages: List[Dict],
+        use_cache: bool = True,
+        return_details: bool = False,
+    ) -> List:
+        """여러 메시지의 프로젝트를 한 번의 LLM 호출로 분류
+        
+        결정적 신호만으로 신뢰도가 부족한 메시지만 `classify_projects_batch()`로 묶어서
+        한 번 LLM을 호출하고, 나머지 단계(고급 분석, 발신자 폴백, 캐시 저장)는
+        `extract_project_from_message()`와 동일하게 메시지별로 적용합니다.
+        배치 호출 자체가 실패하면 메시지 단위 호출로 폴백합니다.
+        
+        Returns:
+            입력 순서대로 `extract_project_from_message()`와 같은 형태의 결과 리스트
+        """
+        # 캐시(TODO ID 또는 내용 해시)에 이미 있는 메시지는 LLM 배치에서 제외
+        pending = [
+            index for index, message in enumerate(messages)
+            if not (use_cache and self.lookup_cached_tag(message))
+        ]
+        
+        # 결정적 신호만으로 임계값을 넘는 메시지도 LLM 배치에서 제외
+        signals = {index: self.score_deterministic_signals(messages[index]) for index in pending}
+        needs_llm = [index for index in pending if signals[index].confidence < self.llm_threshold]
+        
+        batch_results = None
+        if len(needs_llm) > 1:
+            started = time.perf_counter()
+            classified = self.classify_projects_batch([messages[index] for index in needs_llm])
+            self._record_stage("llm_batch", classified is not None, started)
+            if classified is not None:
+                batch_results = {needs_llm[j]: result for j, result in classified.items()}
+        
+        results = []
+        for index, message in enumerate(messages):
+            if index not in signals:
+                results.append(self.extract_project_from_message(
+                    message, use_cache=use_cache, return_details=return_details
+                ))
+            elif batch_results is None or index not in needs_llm:
+                results.append(self.extract_project_from_message(
+                    message,
+                    use_cache=False,
+                    return_details=return_details,
+                    signals=signals[index],
+                ))
+            else:
+                results.append(self.extract_project_from_message(
+                    message,
+                    use_cache=False,
+                    return_details=return_details,
+                    llm_result=batch_results.get(index),
+                    signals=signals[index],
+                ))
+        return results
+    
+    def classify_projects_batch(self, messages: List[Dict]) -> Optional[Dict[int, Tuple[str, str]]]:
+        """여러 메시지를 하나의 JSON 모드 프롬프트로 LLM 분류
+        
+        프로젝트 컨텍스트는 시스템 프롬프트에 한 번만 포함합니다.
+        
+        Returns:
+            {메시지 인덱스: (프로젝트 코드, 분류 근거)} - UNKNOWN/알 수 없는 코드는 제외.
+            LLM 호출 또는 응답 파싱에 실패하면 None
+        """
+        items = []
+        for index, message in enumerate(messages):
+            content = message.get("content", "")
+            subject = message.get("subject", "")
+            if not content and not subject:
+                continue
+            items.append({
+                "index": index,
+                "sender": message.get("sender", ""),
+                "subject": subject,
+                "content": content[:600],
+            })
+        
+        if not items:
+            return {}
+        
+        project_context = self._build_project_context()
+        system_prompt = f"""당신은 업무 메시지를 분석하여 관련 프로젝트를 분류하는 전문가입니다.
+
+다음은 현재 진행 중인 프로젝트들과 관련 정보입니다:
+
+{project_context}
+
+각 메시지마다 가장 관련성이 높은 프로젝트 코드를 선택하세요.
+
+규칙:
+1. **메시지 제목이나 내용에 프로젝트명이 명시**되어 있으면 해당 프로젝트를 우선 선택
+2. **발신자가 특정 프로젝트에만 참여**하고 있다면 해당 프로젝트 선택
+3. **메시지 내용의 키워드와 프로젝트 설명을 매칭**하여 판단
+4. **발신자가 여러 프로젝트에 참여하는 경우** 업무 유형(디자인, 개발, 마케팅 등)을 고려하여 추론
+5. **정말 판단할 수 없는 경우에만** 'UNKNOWN' 반환 (최후의 수단)
+
+반드시 json 객체로만 응답하세요:
+{{"results": [{{"index": 0, "project": "프로젝트코드", "reason": "10단어 이내 분류근거"}}]}}"""
+
+        user_prompt = (
+            f"다음 {len(items)}개 메시지를 각각 분류해주세요 (index를 그대로 사용):\n\n"
+            + json.dumps(items, ensure_ascii=False, indent=1)
+        )
+        
+        response = self._call_llm_api(
+            system_prompt,
+            user_prompt,
+            max_tokens=min(4000, 60 * len(items) + 50),
+            json_mode=True,
+        )
+        if not response:
+            logger.warning(f"[프로젝트 태그] 배치 LLM 분류 실패 ({len(items)}개)")
+            return None
+        
+        try:
+            text = response.strip()
+            if text.startswith("```"):
+                text = "\n".join(text.split("\n")[1:-1])
+            data = json.loads(text)
+            entries = data.get("results", []) if isinstance(data, dict) else data
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"[프로젝트 태그] 배치 응답 파싱 실패: {e}")
+            return None
+        
+        results: Dict[int, Tuple[str, str]] = {}
+        for entry in entries or []:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            project_code = str(entry.get("project") or "").strip().upper()
+            if project_code in self.project_tags and 0 <= index < len(messages):
+                results[index] = (project_code, str(entry.get("reason") or "LLM 내용 분석"))
+        
+        logger.info(f"[프로젝트 태그] 배치 LLM 분류: {len(results)}/{len(items)}개 분류")
+        return results
+    
     def _recover_chat_message_content(self, message: Dict) -> Optional[Dict]:
         """채팅 메시지 내용 복구
         
@@ -1126,8 +1617,19 @@ class ProjectTagService:
         
         return "\n".join(context_lines)
     
-    def _call_llm_api(self, system_prompt: str, user_prompt: str) -> Optional[str]:
-        """LLM API 호출 (환경 설정 기반)"""
+    def _call_llm_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 50,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        """LLM API 호출 (환경 설정 기반)
+        
+        Args:
+            max_tokens: 최대 출력 토큰 (단건 분류는 50이면 충분)
+            json_mode: True면 JSON 객체 응답 강제 (배치 분류용)
+        """
         try:
             import os
             import requests
@@ -1161,7 +1663,7 @@ class ProjectTagService:
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt}
                     ],
-                    "max_tokens": 50,
+                    "max_tokens": max_tokens,
                     "temperature": 0.1
                 }
                 
@@ -1172,7 +1674,7 @@ class ProjectTagService:
                 
                 if not api_key or not endpoint:
                     # OpenAI 폴백
-                    return self._call_openai_api(system_prompt, user_prompt)
+                    return self._call_openai_api(system_prompt, user_prompt, max_tokens, json_mode)
                 
                 url = f"{endpoint}/openai/deployments/gpt-4o/chat/completions?api-version=2024-02-15-preview"
                 headers = {
@@ -1185,10 +1687,13 @@ class ProjectTagService:
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt}
                     ],
-                    "max_tokens": 50,
+                    "max_tokens": max_tokens,
                     "temperature": 0.1
                 }
             
+            if json_mode:
+                payload["response_format"] = {"type": "json_object"}
+            
             # API 호출
             response = requests.post(url, headers=headers, json=payload, timeout=30)
             response.raise_for_status()
@@ -1202,7 +1707,13 @@ class ProjectTagService:
             logger.error(f"LLM API 호출 오류: {e}")
             return None
     
-    def _call_openai_api(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+    def _call_openai_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 50,
+        json_mode: bool = False,
+    ) -> Optional[str]:
         """OpenAI API 폴백 호출"""
         try:
             import os
@@ -1231,9 +1742,11 @@ class ProjectTagService:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                "max_tokens": 50,
+                "max_tokens": max_tokens,
                 "temperature": 0.1
             }
+            if json_mode:
+                payload["response_format"] = {"type": "json_object"}
             
             response = requests.post(url, headers=headers, json=payload, timeout=30)
             response.raise_for_status()
@@ -1394,6 +1907,7 @@ class ProjectTagService:
             color=color,
             description=project_description
         )
+        self._catalog_version = None
         
         logger.info(f"✅ 새 프로젝트 동적 추가: {project_code} ({project_name})")
         return project_code
@@ -1407,4 +1921,5 @@ class ProjectTagService:
         self.project_tags.clear()
         self.person_project_mapping.clear()
         self._load_projects_from_vdos()
+        self._catalog_version = None
         logger.info(f"✅ 프로젝트 재로드 완료: {len(self.project_tags)}개")
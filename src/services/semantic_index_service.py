@@ -0,0 +1,508 @@
+# -*- coding: utf-8 -*-
+"""
+의미 기반 유사도 인덱스 (FAISS)
+
+수집된 메시지와 생성된 TODO를 로컬 임베딩으로 증분 인덱싱하고
+k-NN 검색 API를 제공합니다. `SEMANTIC_INDEX=1`일 때만 인덱싱하며,
+TODO 패널 검색창은 문자열 일치 외에 의미적으로 가까운 TODO도 보여줍니다.
+
+저장 형식 (`settings.FAISS_INDEX_PATH` 아래, 컬렉션별):
+- `{name}.vectors.f32`: L2 정규화된 float32 벡터 (append-only)
+- `{name}.meta.json`: 행 → id 목록, id → (행, 내용 해시), 모델/차원 정보
+
+내용이 바뀐 항목은 새 행으로 추가되고 이전 행은 무효(tombstone)가 됩니다.
+무효 행 비율이 `COMPACT_RATIO`를 넘으면 살아있는 행만 다시 써서 압축합니다.
+faiss가 없으면 numpy 행렬곱으로 같은 검색을 수행합니다.
+"""
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - faiss 미설치 환경
+    faiss = None
+
+from src.config.settings import FAISS_INDEX_PATH
+
+from .embedding_service import EmbeddingService, get_embedding_service, text_hash, todo_embedding_text
+
+logger = logging.getLogger(__name__)
+
+# 컬렉션 이름
+COLLECTION_MESSAGES = "messages"
+COLLECTION_TODOS = "todos"
+
+MESSAGE_TEXT_LIMIT = 1000  # 메시지 임베딩 텍스트 최대 길이
+
+
+def message_embedding_text(message: Dict[str, Any]) -> str:
+    """메시지를 임베딩용 텍스트로 변환 (제목 + 본문)"""
+    subject = (message.get("subject") or "").strip()
+    body = (message.get("body") or message.get("content") or "").strip()
+    text = f"{subject}\n{body}" if subject and body else (subject or body)
+    return text[:MESSAGE_TEXT_LIMIT]
+
+
+class SemanticIndex:
+    """단일 컬렉션 벡터 인덱스 (append-only + 주기적 압축)"""
+
+    COMPACT_RATIO = 0.25   # 무효 행 비율이 이 값을 넘으면 압축
+    COMPACT_MIN_ROWS = 256  # 너무 작은 인덱스는 압축하지 않음
+
+    def __init__(self, name: str, base_dir: Path, embedder: EmbeddingService):
+        """
+        Args:
+            name: 컬렉션 이름 (파일명 접두사)
+            base_dir: 저장 디렉터리
+            embedder: 임베딩 서비스
+        """
+        self.name = name
+        self.base_dir = Path(base_dir)
+        self.embedder = embedder
+        self.vectors_path = self.base_dir / f"{name}.vectors.f32"
+        self.meta_path = self.base_dir / f"{name}.meta.json"
+
+        self._lock = threading.RLock()
+        self._dim = 0
+        self._rows: List[str] = []                    # 행 번호 → id
+        self._entries: Dict[str, Tuple[int, str]] = {}  # id → (행 번호, 내용 해시)
+        self._vectors = None                          # (행 수, 차원) float32
+        self._faiss_index = None
+        self._persisted_rows = 0                      # 디스크에 기록된 행 수
+        self._needs_rewrite = False                   # 압축 후 벡터 파일 전체 재작성 필요
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.meta_path.exists() or not self.vectors_path.exists():
+            return
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as fh:
+                meta = json.load(fh)
+            if meta.get("model") != self.embedder.model_name:
+                logger.info(f"[SemanticIndex:{self.name}] 임베딩 모델 변경 → 인덱스 재생성")
+                return
+            dim = int(meta.get("dim") or 0)
+            rows = list(meta.get("rows") or [])
+            vectors = np.fromfile(self.vectors_path, dtype=np.float32)
+            if dim <= 0 or vectors.size % dim:
+                raise ValueError(f"벡터 파일 크기 불일치 (dim={dim}, size={vectors.size})")
+            vectors = vectors.reshape(-1, dim)
+            # 메타 기록 전에 중단된 경우 벡터 파일 꼬리 무시
+            count = min(len(rows), vectors.shape[0])
+            self._dim = dim
+            self._rows = rows[:count]
+            self._vectors = np.ascontiguousarray(vectors[:count])
+            self._entries = {
+                item_id: (int(row), content_hash)
+                for item_id, (row, content_hash) in (meta.get("entries") or {}).items()
+                if int(row) < count
+            }
+            self._persisted_rows = count
+            self._rebuild_faiss()
+            logger.info(f"[SemanticIndex:{self.name}] 로드 완료: {len(self._entries)}개 (행 {count}개)")
+        except Exception as e:
+            logger.warning(f"[SemanticIndex:{self.name}] 로드 실패 → 빈 인덱스로 시작: {e}")
+            self._reset()
+
+    def _reset(self) -> None:
+        self._dim = 0
+        self._rows = []
+        self._entries = {}
+        self._vectors = None
+        self._faiss_index = None
+        self._persisted_rows = 0
+        self._needs_rewrite = False
+
+    def save(self) -> None:
+        """새 행은 벡터 파일 끝에 추가하고 메타 파일을 교체"""
+        with self._lock:
+            if self._vectors is None:
+                return
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            if self._needs_rewrite:
+                self._persisted_rows = 0
+                self._needs_rewrite = False
+            mode = "ab" if self._persisted_rows else "wb"
+            with open(self.vectors_path, mode) as fh:
+                fh.write(self._vectors[self._persisted_rows:].tobytes())
+            self._persisted_rows = len(self._rows)
+
+            meta = {
+                "model": self.embedder.model_name,
+                "dim": self._dim,
+                "rows": self._rows,
+                "entries": {item_id: [row, content_hash] for item_id, (row, content_hash) in self._entries.items()},
+            }
+            tmp_path = self.meta_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(meta, fh, ensure_ascii=False)
+            tmp_path.replace(self.meta_path)
+
+    # ------------------------------------------------------------------
+    # 인덱싱
+    # ------------------------------------------------------------------
+    def upsert(self, items: Iterable[Tuple[str, str]]) -> int:
+        """(id, 텍스트) 목록을 증분 인덱싱
+
+        내용 해시가 같은 항목은 건너뛰고, 바뀐 항목만 한 번의 배치로 임베딩합니다.
+
+        Returns:
+            새로 임베딩한 항목 수
+        """
+        with self._lock:
+            self._ensure_loaded()
+            pending: Dict[str, Tuple[str, str]] = {}
+            for item_id, text in items:
+                if not item_id or not text:
+                    continue
+                content_hash = text_hash(text)
+                current = self._entries.get(item_id)
+                if current and current[1] == content_hash:
+                    continue
+                pending[item_id] = (text, content_hash)
+
+        if not pending:
+            return 0
+
+        # 임베딩은 잠금 밖에서 수행 (그동안 검색이 막히지 않도록)
+        ids = list(pending)
+        vectors = self.embedder.encode_texts([pending[item_id][0] for item_id in ids])
+        if vectors is None:
+            return 0
+
+        with self._lock:
+            if self._vectors is None:
+                self._dim = int(vectors.shape[1])
+                self._vectors = np.empty((0, self._dim), dtype=np.float32)
+
+            start = len(self._rows)
+            self._vectors = np.vstack([self._vectors, vectors.astype(np.float32)])
+            for offset, item_id in enumerate(ids):
+                self._rows.append(item_id)
+                self._entries[item_id] = (start + offset, pending[item_id][1])
+
+            if self._faiss_index is not None:
+                self._faiss_index.add(vectors.astype(np.float32))
+            else:
+                self._rebuild_faiss()
+
+            self._maybe_compact()
+            logger.debug(f"[SemanticIndex:{self.name}] {len(ids)}개 인덱싱 (전체 {len(self._entries)}개)")
+            return len(ids)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """항목 삭제 (행은 무효 처리, 압축 시 제거)"""
+        with self._lock:
+            self._ensure_loaded()
+            removed = sum(1 for item_id in ids if self._entries.pop(item_id, None) is not None)
+            if removed:
+                self._maybe_compact()
+            return removed
+
+    def _dead_rows(self) -> int:
+        return len(self._rows) - len(self._entries)
+
+    def _maybe_compact(self) -> None:
+        total = len(self._rows)
+        if total >= self.COMPACT_MIN_ROWS and self._dead_rows() / total > self.COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """살아있는 행만 남기고 인덱스 재구성 (다음 save()에서 파일 재작성)"""
+        with self._lock:
+            if self._vectors is None or not self._dead_rows():
+                return
+            live = sorted(self._entries.items(), key=lambda item: item[1][0])
+            keep_rows = [row for _, (row, _) in live]
+            before = len(self._rows)
+            self._vectors = np.ascontiguousarray(self._vectors[keep_rows])
+            self._rows = [item_id for item_id, _ in live]
+            self._entries = {item_id: (new_row, content_hash) for new_row, (item_id, (_, content_hash)) in enumerate(live)}
+            self._needs_rewrite = True
+            self._rebuild_faiss()
+            logger.info(f"[SemanticIndex:{self.name}] 압축 완료: 행 {before}개 → {len(self._rows)}개")
+
+    def _rebuild_faiss(self) -> None:
+        if faiss is None or self._vectors is None:
+            self._faiss_index = None
+            return
+        index = faiss.IndexFlatIP(self._dim)
+        if len(self._vectors):
+            index.add(self._vectors)
+        self._faiss_index = index
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def vector_for(self, item_id: str) -> Optional["np.ndarray"]:
+        """인덱싱된 항목의 벡터 반환"""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(item_id)
+            return self._vectors[entry[0]] if entry else None
+
+    def search_vectors(
+        self,
+        queries: "np.ndarray",
+        k: int = 5,
+        exclude: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """벡터 k-NN 검색 (코사인 유사도 내림차순)
+
+        Args:
+            queries: (쿼리 수, 차원) 정규화 벡터
+            k: 쿼리당 결과 수
+            exclude: 쿼리별로 결과에서 제외할 id (자기 자신 등)
+
+        Returns:
+            쿼리별 [(id, 유사도), ...]
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._vectors is None or not len(self._entries) or k <= 0:
+                return [[] for _ in range(len(queries))]
+
+            queries = np.ascontiguousarray(np.atleast_2d(queries), dtype=np.float32)
+            # 무효 행/제외 항목을 건너뛸 수 있도록 여유 있게 조회
+            fetch = min(len(self._rows), k + self._dead_rows() + 1)
+            if self._faiss_index is not None:
+                scores, rows = self._faiss_index.search(queries, fetch)
+            else:
+                sims = queries @ self._vectors.T
+                rows = np.argsort(-sims, axis=1, kind="stable")[:, :fetch]
+                scores = np.take_along_axis(sims, rows, axis=1)
+
+            results: List[List[Tuple[str, float]]] = []
+            for qi in range(len(queries)):
+                skip = exclude[qi] if exclude else None
+                hits: List[Tuple[str, float]] = []
+                for row, score in zip(rows[qi], scores[qi]):
+                    if row < 0:
+                        continue
+                    item_id = self._rows[row]
+                    entry = self._entries.get(item_id)
+                    if entry is None or entry[0] != row or item_id == skip:
+                        continue
+                    hits.append((item_id, float(score)))
+                    if len(hits) >= k:
+                        break
+                results.append(hits)
+            return results
+
+    def search_text(self, text: str, k: int = 5) -> List[Tuple[str, float]]:
+        """텍스트 k-NN 검색"""
+        vector = self.embedder.encode_text(text)
+        if vector is None:
+            return []
+        return self.search_vectors(vector[None, :], k)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 반환"""
+        with self._lock:
+            return {
+                "items": len(self._entries),
+                "rows": len(self._rows),
+                "dead_rows": self._dead_rows(),
+                "dim": self._dim,
+                "backend": "faiss" if self._faiss_index is not None else "numpy",
+            }
+
+
+class SemanticIndexService:
+    """메시지/TODO 의미 인덱스 관리자
+
+    인덱싱은 단일 백그라운드 스레드에서 배치로 수행하고(`schedule_*`),
+    검색은 호출 스레드에서 바로 수행합니다.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, embedder: Optional[EmbeddingService] = None):
+        """
+        Args:
+            base_dir: 인덱스 저장 디렉터리 (None이면 settings.FAISS_INDEX_PATH)
+            embedder: 임베딩 서비스 (None이면 싱글톤 사용)
+        """
+        self.base_dir = Path(base_dir or FAISS_INDEX_PATH)
+        self.embedder = embedder or get_embedding_service()
+        self._indexes: Dict[str, SemanticIndex] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def is_available(self) -> bool:
+        """임베딩 사용 가능 여부"""
+        return np is not None and self.embedder.is_available()
+
+    def get_index(self, collection: str) -> SemanticIndex:
+        """컬렉션 인덱스 반환 (처음 접근할 때 디스크에서 로드)"""
+        with self._lock:
+            index = self._indexes.get(collection)
+            if index is None:
+                index = SemanticIndex(collection, self.base_dir, self.embedder)
+                self._indexes[collection] = index
+            return index
+
+    # ------------------------------------------------------------------
+    # 인덱싱
+    # ------------------------------------------------------------------
+    def index_messages(self, messages: Iterable[Dict[str, Any]]) -> int:
+        """메시지 증분 인덱싱 (msg_id 기준)"""
+        if not self.is_available():
+            return 0
+        items = [(m.get("msg_id"), message_embedding_text(m)) for m in messages]
+        added = self.get_index(COLLECTION_MESSAGES).upsert(items)
+        if added:
+            self.get_index(COLLECTION_MESSAGES).save()
+        return added
+
+    def index_todos(self, todos: Iterable[Dict[str, Any]]) -> int:
+        """TODO 증분 인덱싱 (id 기준)"""
+        if not self.is_available():
+            return 0
+        items = [(t.get("id"), todo_embedding_text(t)) for t in todos]
+        added = self.get_index(COLLECTION_TODOS).upsert(items)
+        if added:
+            self.get_index(COLLECTION_TODOS).save()
+        return added
+
+    def _submit(self, fn, payload: List[Dict[str, Any]]) -> Optional[Future]:
+        if not payload or not self.is_available():
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-index")
+
+        def _run() -> int:
+            try:
+                added = fn(payload)
+                if added:
+                    logger.info(f"[SemanticIndex] 백그라운드 인덱싱: {added}개 추가")
+                return added
+            except Exception as e:
+                logger.error(f"[SemanticIndex] 백그라운드 인덱싱 오류: {e}", exc_info=True)
+                return 0
+
+        return self._executor.submit(_run)
+
+    def schedule_messages(self, messages: Iterable[Dict[str, Any]]) -> Optional[Future]:
+        """메시지 인덱싱을 백그라운드 스레드에 예약"""
+        return self._submit(self.index_messages, list(messages))
+
+    def schedule_todos(self, todos: Iterable[Dict[str, Any]]) -> Optional[Future]:
+        """TODO 인덱싱을 백그라운드 스레드에 예약"""
+        return self._submit(self.index_todos, list(todos))
+
+    def remove_todos(self, todo_ids: Iterable[str]) -> int:
+        """TODO 인덱스에서 삭제"""
+        return self.get_index(COLLECTION_TODOS).remove(todo_ids)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search_messages(self, text: str, k: int = 5) -> List[Tuple[str, float]]:
+        """텍스트와 유사한 메시지 (msg_id, 유사도) 목록"""
+        if not self.is_available():
+            return []
+        return self.get_index(COLLECTION_MESSAGES).search_text(text, k)
+
+    def search_todos(self, text: str, k: int = 5) -> List[Tuple[str, float]]:
+        """텍스트와 유사한 TODO (id, 유사도) 목록"""
+        if not self.is_available():
+            return []
+        return self.get_index(COLLECTION_TODOS).search_text(text, k)
+
+    def search_todo_ids(self, text: str, k: int, min_similarity: float) -> Optional[Set[str]]:
+        """검색어와 유사도가 `min_similarity` 이상인 TODO ID (GUI 스레드용)
+
+        임베딩 모델이 아직 로드되지 않았으면 백그라운드 로드만 시작하고 None을 반환합니다.
+        """
+        if not text or not self.is_available():
+            return set()
+        if not self.embedder.is_ready():
+            self.embedder.warm_up()
+            return None
+        return {item_id for item_id, score in self.search_todos(text, k) if score >= min_similarity}
+
+    def similar_messages(self, msg_id: str, k: int = 5) -> List[Tuple[str, float]]:
+        """인덱싱된 메시지와 유사한 다른 메시지 목록 (자기 자신 제외)"""
+        index = self.get_index(COLLECTION_MESSAGES)
+        vector = index.vector_for(msg_id)
+        if vector is None:
+            return []
+        return index.search_vectors(vector[None, :], k, exclude=[msg_id])[0]
+
+    def similar_todos(self, todos: Sequence[Dict[str, Any]], k: int = 5) -> List[List[Tuple[str, float]]]:
+        """TODO별 유사 TODO 목록 (한 번의 배치 임베딩 + 배치 검색, 자기 자신 제외)"""
+        if not todos or not self.is_available():
+            return [[] for _ in todos]
+        vectors = self.embedder.encode_todos(todos)
+        if vectors is None:
+            return [[] for _ in todos]
+        return self.get_index(COLLECTION_TODOS).search_vectors(
+            vectors, k, exclude=[t.get("id") for t in todos]
+        )
+
+    def save(self) -> None:
+        """모든 컬렉션 저장"""
+        with self._lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            index.save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 반환"""
+        with self._lock:
+            indexes = dict(self._indexes)
+        return {name: index.get_stats() for name, index in indexes.items()}
+
+    def close(self, wait: bool = False) -> None:
+        """백그라운드 인덱싱 종료
+
+        대기 중인 배치는 취소합니다. 배치마다 끝나면 바로 저장하므로 기본값(wait=False)은
+        진행 중인 배치를 기다리지 않습니다. wait=True면 진행 중인 배치를 마친 뒤 전체 저장합니다.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        if wait:
+            self.save()
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_semantic_index_service: Optional[SemanticIndexService] = None
+_service_lock = threading.Lock()
+
+
+def get_semantic_index_service() -> SemanticIndexService:
+    """의미 인덱스 서비스 싱글톤 인스턴스 반환"""
+    global _semantic_index_service
+
+    if _semantic_index_service is None:
+        with _service_lock:
+            if _semantic_index_service is None:
+                _semantic_index_service = SemanticIndexService()
+
+    return _semantic_index_service
+
+
+def close_semantic_index_service(wait: bool = False) -> None:
+    """생성된 경우에만 백그라운드 인덱싱 종료"""
+    if _semantic_index_service is not None:
+        _semantic_index_service.close(wait=wait)
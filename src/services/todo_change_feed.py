@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+TODO 변경 알림 채널 (in-process pub/sub)
+
+TodoRepository 쓰기, 비동기 프로젝트 태그 분석, Top-3 플래그 갱신 등에서
+TODO id 단위 변경 이벤트를 발행하고, UI는 이를 구독하여 영향 받은 행만 갱신합니다.
+구독 콜백은 발행한 스레드에서 호출되므로 Qt 위젯은
+`src.ui.todo.change_bridge.TodoChangeBridge`를 통해 메인 스레드로 전달받아야 합니다.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류
+CHANGE_UPSERTED = "upserted"   # 신규 추가 또는 내용 변경
+CHANGE_PROJECT = "project"     # 프로젝트 태그 변경
+CHANGE_STATUS = "status"       # 완료/스누즈 등 상태 변경
+CHANGE_TOP3 = "top3"           # Top-3 플래그 변경
+CHANGE_DELETED = "deleted"     # 삭제
+CHANGE_RESET = "reset"         # 전체 교체/일괄 변경 (todo_id 없음)
+
+
+@dataclass
+class TodoChangeEvent:
+    """TODO 단위 변경 이벤트"""
+    kind: str
+    todo_id: Optional[str] = None
+    fields: Dict[str, Any] = field(default_factory=dict)
+    source: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+Subscriber = Callable[[List[TodoChangeEvent]], None]
+
+
+class TodoChangeFeed:
+    """스레드 안전한 TODO 변경 이벤트 발행/구독 채널"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._token_counter = itertools.count(1)
+        self.stats = {
+            "published": 0,
+            "deliveries": 0,
+            "errors": 0,
+        }
+
+    def subscribe(self, callback: Subscriber) -> int:
+        """구독 등록
+
+        Args:
+            callback: 이벤트 리스트를 받는 콜백 (발행 스레드에서 호출됨)
+
+        Returns:
+            int: 구독 해제용 토큰
+        """
+        with self._lock:
+            token = next(self._token_counter)
+            self._subscribers[token] = callback
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """구독 해제"""
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def publish(
+        self,
+        kind: str,
+        todo_id: Optional[str] = None,
+        source: str = "",
+        **fields: Any,
+    ) -> None:
+        """단일 이벤트 발행"""
+        self.publish_many([TodoChangeEvent(kind=kind, todo_id=todo_id, fields=fields, source=source)])
+
+    def publish_many(self, events: Iterable[TodoChangeEvent]) -> None:
+        """여러 이벤트를 한 번에 발행 (구독자별로 한 번씩 호출)"""
+        events = list(events)
+        if not events:
+            return
+
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+            self.stats["published"] += len(events)
+
+        for callback in subscribers:
+            try:
+                callback(events)
+            except Exception as e:
+                with self._lock:
+                    self.stats["errors"] += 1
+                logger.error(f"[TodoChangeFeed] 구독자 콜백 오류: {e}")
+            else:
+                with self._lock:
+                    self.stats["deliveries"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 정보 반환"""
+        with self._lock:
+            return {**self.stats, "subscribers": len(self._subscribers)}
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_todo_change_feed: Optional[TodoChangeFeed] = None
+_feed_lock = threading.Lock()
+
+
+def get_todo_change_feed() -> TodoChangeFeed:
+    """TODO 변경 알림 채널 싱글톤 인스턴스 반환"""
+    global _todo_change_feed
+
+    if _todo_change_feed is None:
+        with _feed_lock:
+            if _todo_change_feed is None:
+                _todo_change_feed = TodoChangeFeed()
+
+    return _todo_change_feed
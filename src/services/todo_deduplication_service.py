@@ -3,14 +3,123 @@ TODO 중복 제거 서비스
 
 한 메시지에서 여러 유형의 TODO가 생성되는 것을 방지하고,
 기존 중복 TODO를 정리합니다.
+
+내용 기반 유사 중복 탐지(`deduplicate`)는 MinHash-LSH로 후보 쌍만 찾은 뒤
+정확한 단어 Jaccard 유사도로 검증하므로, 같은 메시지 안뿐 아니라
+전체 TODO 목록에서도 거의 선형 시간에 중복을 찾습니다.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
+import random
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
 logger = logging.getLogger(__name__)
 
+_MINHASH_PRIME = 4294967291  # 2^32 미만 최대 소수 (a*x + b가 uint64 안에 들어감)
+
+
+def word_tokens(text: str) -> FrozenSet[str]:
+    """단어 집합 (소문자, 공백 기준 - 기존 Jaccard 비교와 동일)"""
+    return frozenset((text or "").lower().split())
+
+
+def jaccard_similarity(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """단어 집합 Jaccard 유사도 (0.0 ~ 1.0)"""
+    if not tokens1 or not tokens2:
+        return 0.0
+    union = len(tokens1 | tokens2)
+    return len(tokens1 & tokens2) / union if union else 0.0
+
+
+class MinHashLSH:
+    """MinHash 서명 + 밴딩 LSH 인덱스
+
+    Jaccard 유사도 s인 두 집합이 후보로 잡힐 확률은 1 - (1 - s^rows)^bands 입니다.
+    기본값(42밴드 × 3행)에서 s=0.7이면 사실상 100%(누락 확률 약 1e-8),
+    s=0.2이면 약 29%, s=0.1이면 약 4%라서 검증할 후보 쌍이 적습니다.
+    """
+
+    def __init__(self, num_perm: int = 126, bands: int = 42, seed: int = 1):
+        """
+        Args:
+            num_perm: 해시 함수(순열) 수
+            bands: 밴드 수 (num_perm의 약수)
+            seed: 해시 계수 시드 (고정값 → 실행 간 결과 동일)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MINHASH_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MINHASH_PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+        self._buckets: List[Dict[Tuple[int, ...], Set[Any]]] = [{} for _ in range(bands)]
+        self._keys: Dict[Any, List[Tuple[int, ...]]] = {}
+
+    @staticmethod
+    def _token_hash(token: str) -> int:
+        return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash 서명"""
+        hashes = [self._token_hash(token) for token in tokens]
+        if not hashes:
+            return tuple()
+        if np is not None:
+            x = np.array(hashes, dtype=np.uint64)[None, :]
+            return tuple(((self._a_np * x + self._b_np) % _MINHASH_PRIME).min(axis=1).tolist())
+        return tuple(
+            min((a * x + b) % _MINHASH_PRIME for x in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[i * self.rows:(i + 1) * self.rows] for i in range(self.bands)]
+
+    def add(self, key: Any, signature: Tuple[int, ...]) -> None:
+        """키 등록"""
+        if not signature:
+            return
+        band_keys = self._band_keys(signature)
+        self._keys[key] = band_keys
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Any) -> None:
+        """키 삭제"""
+        band_keys = self._keys.pop(key, None)
+        if not band_keys:
+            return
+        for bucket, band_key in zip(self._buckets, band_keys):
+            members = bucket.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del bucket[band_key]
+
+    def query(self, signature: Tuple[int, ...]) -> Set[Any]:
+        """같은 밴드를 공유하는 후보 키 집합"""
+        if not signature:
+            return set()
+        candidates: Set[Any] = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket.get(band_key)
+            if members:
+                candidates.update(members)
+        return candidates
+
 
 class TodoDeduplicationService:
     """TODO 중복 제거 서비스"""
@@ -36,7 +145,9 @@ class TodoDeduplicationService:
             "duplicates_prevented": 0,
             "duplicates_removed": 0,
             "todos_kept": 0,
+            "near_duplicates_removed": 0,
         }
+        self._stats_lock = threading.Lock()
         
         logger.info("TodoDeduplicationService 초기화 완료")
     
@@ -57,7 +168,7 @@ class TodoDeduplicationService:
         Returns:
             (생성 여부, 기존 TODO ID)
         """
-        self._stats["checked"] += 1
+        self._inc_stat("checked")
         
         # 1. 메모리 캐시 확인
         if source_message in self._source_message_cache:
@@ -66,7 +177,7 @@ class TodoDeduplicationService:
                 f"중복 감지 (캐시): source_message={source_message}, "
                 f"existing_todo={existing_todo_id}"
             )
-            self._stats["duplicates_prevented"] += 1
+            self._inc_stat("duplicates_prevented")
             return False, existing_todo_id
         
         # 2. DB 조회 (캐시 미스 시)
@@ -79,7 +190,7 @@ class TodoDeduplicationService:
                     f"중복 감지 (DB): source_message={source_message}, "
                     f"existing_todo={existing_todo['id']}"
                 )
-                self._stats["duplicates_prevented"] += 1
+                self._inc_stat("duplicates_prevented")
                 return False, existing_todo["id"]
         
         # 3. 중복 없음 - 생성 가능
@@ -166,8 +277,9 @@ class TodoDeduplicationService:
             # 캐시 업데이트
             self._source_message_cache[source_message] = best_todo["id"]
         
-        self._stats["duplicates_removed"] = removed_count
-        self._stats["todos_kept"] = kept_count
+        with self._stats_lock:
+            self._stats["duplicates_removed"] = removed_count
+            self._stats["todos_kept"] = kept_count
         
         logger.info(
             f"중복 TODO 정리 완료: "
@@ -190,6 +302,11 @@ class TodoDeduplicationService:
         self._source_message_cache[source_message] = todo_id
         logger.debug(f"TODO 캐시 등록: {source_message} → {todo_id}")
     
+    def _inc_stat(self, name: str, value: int = 1) -> None:
+        """통계 카운터 증가 (분석 워커와 태그 배치 스레드가 동시에 갱신)"""
+        with self._stats_lock:
+            self._stats[name] = self._stats.get(name, 0) + value
+    
     def get_deduplication_stats(self) -> Dict[str, int]:
         """
         중복 제거 통계 반환
@@ -197,9 +314,115 @@ class TodoDeduplicationService:
         Returns:
             통계 정보
         """
-        return self._stats.copy()
+        with self._stats_lock:
+            return self._stats.copy()
     
     def clear_cache(self):
         """캐시 초기화"""
         self._source_message_cache.clear()
         logger.debug("중복 제거 캐시 초기화")
+    
+    def deduplicate(
+        self,
+        items: Sequence[Any],
+        text_of: Callable[[Any], str],
+        type_of: Optional[Callable[[Any], str]] = None,
+        group_of: Optional[Callable[[Any], Optional[str]]] = None,
+        owner_of: Optional[Callable[[Any], Optional[str]]] = None,
+        threshold: float = 0.7,
+        cross_group_threshold: Optional[float] = 0.9,
+        type_priority: Optional[Dict[str, int]] = None,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> Tuple[List[Any], int]:
+        """내용 유사도 기반 중복 제거 (MinHash-LSH 후보 + 정확한 Jaccard 검증)
+        
+        앞에서부터 처리하며, 이미 유지된 항목과 유사하면 중복으로 봅니다.
+        중복 쌍에서는 유형 우선순위가 더 높은 쪽을 남깁니다 (같으면 먼저 나온 항목).
+        
+        Args:
+            items: TODO/액션 목록
+            text_of: 비교할 텍스트 (보통 description)
+            type_of: 유형 (우선순위 비교용)
+            group_of: 원본 메시지 ID 등 그룹 키 (같은 그룹이면 `threshold` 적용)
+            owner_of: 요청자 등 (그룹이 다를 때는 같은 owner끼리만 비교)
+            threshold: 같은 그룹 내 중복 기준 유사도
+            cross_group_threshold: 다른 그룹 간 중복 기준 유사도 (None이면 그룹 간 비교 안 함)
+            type_priority: 유형 → 우선순위 (None이면 TYPE_PRIORITY)
+            merge: (남길 항목, 버릴 항목) → 병합된 항목 (None이면 남길 항목 그대로)
+            
+        Returns:
+            (중복 제거된 목록 - 입력 순서 유지, 제거된 개수)
+        """
+        priorities = type_priority if type_priority is not None else self.TYPE_PRIORITY
+        lsh = MinHashLSH()
+        slots: List[Any] = []                     # 유지 항목 (입력 순서)
+        slot_meta: List[Tuple[FrozenSet[str], Optional[str], Optional[str]]] = []
+        alive: List[bool] = []
+        removed = 0
+        
+        for item in items:
+            tokens = word_tokens(text_of(item))
+            group = group_of(item) if group_of else None
+            owner = owner_of(item) if owner_of else None
+            signature = lsh.signature(tokens) if tokens else tuple()
+            
+            match: Optional[Tuple[int, float]] = None
+            for slot in sorted(lsh.query(signature)):
+                kept_tokens, kept_group, kept_owner = slot_meta[slot]
+                same_group = group is not None and group == kept_group
+                if same_group:
+                    required = threshold
+                elif cross_group_threshold is None or (owner_of and owner != kept_owner):
+                    continue
+                else:
+                    required = cross_group_threshold
+                similarity = jaccard_similarity(tokens, kept_tokens)
+                if similarity >= required:
+                    match = (slot, similarity)
+                    break
+            
+            if match is None:
+                lsh.add(len(slots), signature)
+                slots.append(item)
+                slot_meta.append((tokens, group, owner))
+                alive.append(True)
+                continue
+            
+            slot, similarity = match
+            kept = slots[slot]
+            removed += 1
+            current_type = type_of(item) if type_of else ""
+            kept_type = type_of(kept) if type_of else ""
+            if priorities.get(current_type, 0) > priorities.get(kept_type, 0):
+                # 현재 항목이 더 높은 우선순위 유형이면 교체 (기존 위치는 비우고 현재 위치에 추가)
+                alive[slot] = False
+                lsh.remove(slot)
+                lsh.add(len(slots), signature)
+                slots.append(merge(item, kept) if merge else item)
+                slot_meta.append((tokens, group, owner))
+                alive.append(True)
+                logger.debug(f"[중복제거] {kept_type} → {current_type} 교체 (유사도: {similarity:.2f})")
+            else:
+                if merge:
+                    slots[slot] = merge(kept, item)
+                logger.debug(f"[중복제거] {current_type} 제거 (유사도: {similarity:.2f}, 유지: {kept_type})")
+        
+        self._inc_stat("near_duplicates_removed", removed)
+        return [item for item, is_alive in zip(slots, alive) if is_alive], removed
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_deduplication_service: Optional[TodoDeduplicationService] = None
+_service_lock = threading.Lock()
+
+
+def get_todo_deduplication_service() -> TodoDeduplicationService:
+    """TODO 중복 제거 서비스 싱글톤 인스턴스 반환"""
+    global _deduplication_service
+    
+    if _deduplication_service is None:
+        with _service_lock:
+            if _deduplication_service is None:
+                _deduplication_service = TodoDeduplicationService()
+    
+    return _deduplication_service
@@ -3,15 +3,36 @@
 Top3 캐시 관리 모듈
 
 LLM 호출 결과를 캐싱하여 성능을 개선합니다.
+
+두 단계로 캐싱합니다:
+1. 전체 키 캐시: TODO ID 목록 + 규칙 + 지시사항이 완전히 같으면 결과 재사용
+2. 델타 캐시: 규칙별로 마지막 선정 스냅샷(후보별 내용 해시 + 선정 결과)과
+   후보별 LLM 판정(내용 해시 + 규칙 해시 키)을 저장해 두고,
+   후보가 조금만 바뀌면 새로 추가/변경된 후보만 기존 선정 결과(incumbent)와 비교
 """
 import time
+import json
 import hashlib
 import logging
-from typing import Optional, Dict, Any, Set
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Set, List, Tuple
+from dataclasses import dataclass, field
+
+from src.utils.tracing import trace_cache
 
 logger = logging.getLogger(__name__)
 
+# LLM 프롬프트에 들어가는 필드 (이 값이 바뀌면 후보 내용이 바뀐 것으로 간주)
+PROMPT_FIELDS = (
+    "id", "title", "project", "project_full_name", "requester", "type",
+    "source_type", "created_at", "updated_at", "deadline", "priority", "status",
+)
+
+# 델타 계획 종류
+DELTA_REUSE = "reuse"      # 변경 없음 → LLM 호출 없이 기존 결과 재사용
+DELTA_PARTIAL = "partial"  # 소규모 변경 → incumbent + 변경 후보만 LLM에 전달
+DELTA_FULL = "full"        # 스냅샷 없음/대규모 변경 → 전체 후보로 LLM 호출
+
 
 @dataclass
 class CacheEntry:
@@ -26,17 +47,91 @@ class CacheEntry:
         return time.time() - self.created_at > self.ttl
 
 
+@dataclass
+class CandidateJudgment:
+    """후보별 LLM 판정 (내용 해시 + 규칙 해시 키)"""
+    todo_id: str
+    selected: bool
+    incumbent_sig: str  # 판정 당시 비교 대상이던 incumbent 집합 서명
+    created_at: float
+
+
+@dataclass
+class SelectionSnapshot:
+    """규칙별 마지막 선정 스냅샷"""
+    rule_hash: str
+    content_hashes: Dict[str, str]  # todo_id → 내용 해시 (당시 전체 후보)
+    incumbents: Set[str]            # 선정된 TODO ID
+    reasoning: str
+    created_at: float
+    ttl: float
+
+    def is_expired(self) -> bool:
+        """만료 여부 확인"""
+        return time.time() - self.created_at > self.ttl
+
+    def incumbent_sig(self) -> str:
+        """incumbent 집합 서명 (ID + 내용 해시)"""
+        parts = sorted(f"{tid}:{self.content_hashes.get(tid, '')}" for tid in self.incumbents)
+        return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+@dataclass
+class DeltaPlan:
+    """델타 선정 계획
+
+    Attributes:
+        mode: DELTA_REUSE / DELTA_PARTIAL / DELTA_FULL
+        candidates: LLM에 전달할 후보 (partial이면 incumbent + 변경 후보)
+        incumbents: 기존 선정 결과 중 그대로 유효한 ID
+        reasoning: 재사용 시 기존 선정 이유
+        reason: 계획 사유 (로그용)
+    """
+    mode: str
+    candidates: List[Dict] = field(default_factory=list)
+    incumbents: Set[str] = field(default_factory=set)
+    reasoning: str = ""
+    reason: str = ""
+
+
+def todo_content_hash(todo: Dict[str, Any]) -> str:
+    """프롬프트에 들어가는 필드 기준 TODO 내용 해시"""
+    payload = "\x1f".join(str(todo.get(name) or "") for name in PROMPT_FIELDS)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+def rule_hash(rules: Optional[Dict[str, Any]] = None, instruction: Optional[str] = None) -> str:
+    """엔티티 규칙 + 자연어 지시사항 해시"""
+    try:
+        rules_str = json.dumps(rules or {}, sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        rules_str = repr(rules)
+    return hashlib.md5(f"{rules_str}|{instruction or ''}".encode("utf-8")).hexdigest()
+
+
 class Top3CacheManager:
     """Top3 선정 결과 캐시 관리자
     
     LLM 호출 결과를 메모리에 캐싱하여 동일한 조건에서 재호출을 방지합니다.
+    후보가 조금만 바뀐 경우에는 `plan_delta()`로 변경분만 LLM에 묻도록 계획합니다.
     """
     
-    def __init__(self, default_ttl: float = 300.0, ttl_seconds: Optional[float] = None):
+    MAX_JUDGMENTS = 5000   # 후보별 판정 최대 보관 수
+    MAX_SNAPSHOTS = 16     # 규칙별 스냅샷 최대 보관 수
+    
+    def __init__(
+        self,
+        default_ttl: float = 300.0,
+        ttl_seconds: Optional[float] = None,
+        delta_ttl: float = 1800.0,
+        max_delta: int = 5
+    ):
         """
         Args:
             default_ttl: 기본 TTL (초, 기본값: 5분)
             ttl_seconds: TTL (초, 호환성용 - default_ttl과 동일)
+            delta_ttl: 델타 스냅샷 TTL (초, 기본값: 30분)
+            max_delta: 부분 재선정을 허용하는 최대 변경 후보 수 (기본값: 5)
         """
         # 호환성을 위해 ttl_seconds 파라미터도 지원
         if ttl_seconds is not None:
@@ -46,6 +141,18 @@ class Top3CacheManager:
         self._cache: Dict[str, CacheEntry] = {}
         self._hit_count = 0
         self._miss_count = 0
+        
+        # 델타 캐시
+        self.delta_ttl = delta_ttl
+        self.max_delta = max_delta
+        self._snapshots: "OrderedDict[str, SelectionSnapshot]" = OrderedDict()
+        self._judgments: "OrderedDict[Tuple[str, str], CandidateJudgment]" = OrderedDict()
+        self._delta_stats = {
+            DELTA_REUSE: 0,
+            DELTA_PARTIAL: 0,
+            DELTA_FULL: 0,
+            "judgment_skips": 0,
+        }
     
     def _generate_cache_key(
         self,
@@ -112,10 +219,12 @@ class Top3CacheManager:
         
         if entry and not entry.is_expired():
             self._hit_count += 1
+            trace_cache("top3", hit=True)
             logger.info(f"[Top3Cache] 캐시 히트: {cache_key[:16]}... (TTL 남음: {entry.ttl - (time.time() - entry.created_at):.0f}초)")
             return entry.value
         
         self._miss_count += 1
+        trace_cache("top3", hit=False)
         logger.debug(f"[Top3Cache] 캐시 미스: {cache_key[:16]}...")
         return None
     
@@ -166,6 +275,8 @@ class Top3CacheManager:
             # 전체 무효화
             count = len(self._cache)
             self._cache.clear()
+            self._snapshots.clear()
+            self._judgments.clear()
             logger.info(f"[Top3Cache] 전체 캐시 무효화: {count}개 항목 삭제")
         else:
             # 특정 키 무효화
@@ -174,6 +285,142 @@ class Top3CacheManager:
                 del self._cache[cache_key]
                 logger.info(f"[Top3Cache] 캐시 무효화: {cache_key[:16]}...")
     
+    def plan_delta(
+        self,
+        candidates: List[Dict],
+        rules: Optional[Dict[str, Any]] = None,
+        instruction: Optional[str] = None
+    ) -> DeltaPlan:
+        """마지막 선정 스냅샷과 비교하여 LLM 호출 범위 결정
+        
+        - incumbent가 모두 그대로이고 새로 추가/변경된 후보가 없으면 재사용
+        - incumbent가 그대로이고 변경 후보가 `max_delta`개 이하이면
+          incumbent + 변경 후보만 비교 (같은 incumbent에 대해 이미 탈락 판정된
+          내용 해시는 제외)
+        - incumbent가 사라지거나 바뀌었으면 기존 탈락 후보 간 순위를 모르므로 전체 호출
+        
+        Args:
+            candidates: 현재 후보 TODO 리스트 (완료/마감 지남 제외 후)
+            rules: 엔티티 규칙
+            instruction: 자연어 지시사항
+            
+        Returns:
+            DeltaPlan
+        """
+        rhash = rule_hash(rules, instruction)
+        snapshot = self._snapshots.get(rhash)
+        
+        if snapshot is None or snapshot.is_expired():
+            if snapshot is not None:
+                del self._snapshots[rhash]
+            return self._count_plan(DeltaPlan(mode=DELTA_FULL, candidates=candidates, reason="스냅샷 없음"))
+        
+        current = {t.get("id"): (t, todo_content_hash(t)) for t in candidates if t.get("id")}
+        
+        for tid in snapshot.incumbents:
+            entry = current.get(tid)
+            if entry is None or entry[1] != snapshot.content_hashes.get(tid):
+                return self._count_plan(DeltaPlan(
+                    mode=DELTA_FULL, candidates=candidates, reason=f"incumbent 변경: {tid}"
+                ))
+        
+        incumbent_sig = snapshot.incumbent_sig()
+        changed: List[Dict] = []
+        for tid, (todo, chash) in current.items():
+            if tid in snapshot.incumbents or snapshot.content_hashes.get(tid) == chash:
+                continue
+            judgment = self._judgments.get((rhash, chash))
+            if judgment and not judgment.selected and judgment.incumbent_sig == incumbent_sig:
+                # 같은 incumbent와 비교해 이미 탈락한 내용 → 다시 묻지 않음
+                self._delta_stats["judgment_skips"] += 1
+                continue
+            changed.append(todo)
+        
+        incumbents = [current[tid][0] for tid in snapshot.incumbents]
+        self._snapshots.move_to_end(rhash)
+        
+        if not changed:
+            return self._count_plan(DeltaPlan(
+                mode=DELTA_REUSE,
+                incumbents=set(snapshot.incumbents),
+                reasoning=snapshot.reasoning,
+                reason="변경 후보 없음",
+            ))
+        
+        if len(changed) <= self.max_delta:
+            return self._count_plan(DeltaPlan(
+                mode=DELTA_PARTIAL,
+                candidates=incumbents + changed,
+                incumbents=set(snapshot.incumbents),
+                reason=f"변경 후보 {len(changed)}개",
+            ))
+        
+        return self._count_plan(DeltaPlan(
+            mode=DELTA_FULL, candidates=candidates, reason=f"변경 후보 {len(changed)}개 > {self.max_delta}"
+        ))
+    
+    def record_selection(
+        self,
+        candidates: List[Dict],
+        judged: List[Dict],
+        selected: Set[str],
+        rules: Optional[Dict[str, Any]] = None,
+        instruction: Optional[str] = None,
+        reasoning: str = ""
+    ) -> None:
+        """LLM 선정 결과를 델타 캐시에 기록
+        
+        Args:
+            candidates: 현재 전체 후보 (스냅샷 기준)
+            judged: 이번에 LLM 프롬프트에 들어간 후보 (판정 기록 대상)
+            selected: 선정된 TODO ID 집합
+            rules: 엔티티 규칙
+            instruction: 자연어 지시사항
+            reasoning: 선정 이유
+        """
+        rhash = rule_hash(rules, instruction)
+        content_hashes = {t.get("id"): todo_content_hash(t) for t in candidates if t.get("id")}
+        now = time.time()
+        
+        snapshot = SelectionSnapshot(
+            rule_hash=rhash,
+            content_hashes=content_hashes,
+            incumbents=set(selected),
+            reasoning=reasoning,
+            created_at=now,
+            ttl=self.delta_ttl,
+        )
+        self._snapshots[rhash] = snapshot
+        self._snapshots.move_to_end(rhash)
+        while len(self._snapshots) > self.MAX_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
+        
+        incumbent_sig = snapshot.incumbent_sig()
+        for todo in judged:
+            tid = todo.get("id")
+            if not tid:
+                continue
+            key = (rhash, content_hashes.get(tid) or todo_content_hash(todo))
+            self._judgments[key] = CandidateJudgment(
+                todo_id=tid,
+                selected=tid in selected,
+                incumbent_sig=incumbent_sig,
+                created_at=now,
+            )
+            self._judgments.move_to_end(key)
+        while len(self._judgments) > self.MAX_JUDGMENTS:
+            self._judgments.popitem(last=False)
+        
+        logger.debug(
+            f"[Top3Cache] 델타 스냅샷 저장: {rhash[:8]}... "
+            f"(후보 {len(content_hashes)}개, 판정 {len(judged)}개)"
+        )
+    
+    def _count_plan(self, plan: DeltaPlan) -> DeltaPlan:
+        self._delta_stats[plan.mode] += 1
+        logger.info(f"[Top3Cache] 델타 계획: {plan.mode} ({plan.reason})")
+        return plan
+    
     def _cleanup_expired(self) -> None:
         """만료된 캐시 항목 정리"""
         expired_keys = [
@@ -198,16 +445,26 @@ class Top3CacheManager:
             "miss_count": self._miss_count,
             "total_requests": total_requests,
             "hit_rate": hit_rate,
+            "delta_snapshots": len(self._snapshots),
+            "delta_judgments": len(self._judgments),
+            "delta_reuse": self._delta_stats[DELTA_REUSE],
+            "delta_partial": self._delta_stats[DELTA_PARTIAL],
+            "delta_full": self._delta_stats[DELTA_FULL],
+            "delta_judgment_skips": self._delta_stats["judgment_skips"],
         }
     
     def clear_stats(self) -> None:
         """통계 초기화"""
         self._hit_count = 0
         self._miss_count = 0
+        for key in self._delta_stats:
+            self._delta_stats[key] = 0
         logger.debug("[Top3Cache] 통계 초기화")
     
     def clear(self) -> None:
         """캐시 전체 삭제"""
         count = len(self._cache)
         self._cache.clear()
+        self._snapshots.clear()
+        self._judgments.clear()
         logger.info(f"[Top3Cache] 캐시 전체 삭제: {count}개 항목")
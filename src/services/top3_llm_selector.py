@@ -9,8 +9,10 @@ import logging
 from typing import Dict, List, Set, Optional, Tuple
 from datetime import datetime
 
+from src.config.settings import TOP3_PRERANK_CONFIG
+
 from .llm_client import LLMClient
-from .top3_cache_manager import Top3CacheManager
+from .top3_cache_manager import Top3CacheManager, DELTA_REUSE, DELTA_PARTIAL
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,11 @@ class Top3LLMSelector:
         self.cache_manager = cache_manager or Top3CacheManager()
         self.email_to_name = email_to_name or {}
         self.last_reasoning = ""  # 마지막 선정 이유 (한국어)
+        self._prerank_score_only = False  # 마지막 사전 순위화가 임베딩 없이 점수만 사용했는지
+        
+        # 사전 순위화용 임베딩 모델은 백그라운드에서 미리 로드 (첫 선정이 GUI 스레드를 막지 않도록)
+        from .embedding_service import get_embedding_service
+        get_embedding_service().warm_up()
     
     def select_top3(
         self,
@@ -98,13 +105,44 @@ class Top3LLMSelector:
             logger.warning("[Top3LLM] LLM 클라이언트를 사용할 수 없습니다 → 폴백 모드")
             return self._fallback_selection(candidates, simulation_time)
         
-        # 사전 필터링 없이 모든 TODO를 LLM에 전달
-        # (자연어 규칙을 정확히 적용하려면 전체를 봐야 함)
-        logger.info(f"[Top3LLM] TODO {len(candidates)}개를 LLM에 전달 (사전 필터링 없음)")
+        # 델타 캐시: 마지막 선정 이후 바뀐 후보만 LLM에 묻기
+        plan = self.cache_manager.plan_delta(candidates, entity_rules, natural_rule)
+        
+        if plan.mode == DELTA_REUSE:
+            self.cache_manager.set(todos, plan.incumbents, entity_rules, natural_rule)
+            self.last_reasoning = plan.reasoning
+            logger.info(f"[Top3LLM] 델타 재사용: 변경된 후보 없음 → {len(plan.incumbents)}개 반환")
+            return set(plan.incumbents)
+        
+        if plan.mode == DELTA_PARTIAL:
+            logger.info(
+                f"[Top3LLM] 부분 재선정: 후보 {len(plan.candidates)}개만 LLM에 전달 "
+                f"(incumbent {len(plan.incumbents)}개 + 변경 {len(plan.candidates) - len(plan.incumbents)}개)"
+            )
+            try:
+                result = self._try_llm_selection(
+                    plan.candidates, natural_rule, entity_rules, todos, all_candidates=candidates
+                )
+                if result:
+                    return result
+            except Exception as e:
+                logger.error(f"[Top3LLM] 부분 재선정 실패: {e}")
+            logger.warning("[Top3LLM] 부분 재선정 실패 → 전체 후보로 재시도")
+        
+        # 후보가 많으면 로컬 임베딩으로 사전 순위화하여 프롬프트 크기 제한
+        # (의미적으로 규칙과 가까운 후보 + 점수 상위 후보를 함께 전달)
+        prompt_candidates = self._prerank_candidates(candidates, natural_rule, now)
+        logger.info(f"[Top3LLM] TODO {len(prompt_candidates)}/{len(candidates)}개를 LLM에 전달")
+        
+        # 점수만으로 줄인 경우 빠진 후보는 판정되지 않았으므로 델타 스냅샷에는 전달한 후보만 기록
+        # (다음 호출에서 변경 후보로 보고 LLM에 다시 전달)
+        snapshot_candidates = prompt_candidates if self._prerank_score_only else candidates
         
         # LLM 시도
         try:
-            result = self._try_llm_selection(candidates, natural_rule, entity_rules, todos)
+            result = self._try_llm_selection(
+                prompt_candidates, natural_rule, entity_rules, todos, all_candidates=snapshot_candidates
+            )
             if result:
                 return result
         except Exception as e:
@@ -187,15 +225,95 @@ class Top3LLMSelector:
         
         return top_50
     
+    def _prerank_candidates(
+        self,
+        candidates: List[Dict],
+        natural_rule: str,
+        now: datetime
+    ) -> List[Dict]:
+        """로컬 임베딩 기반 후보 사전 순위화
+        
+        자연어 규칙과 각 TODO를 임베딩하여 코사인 유사도 상위 `semantic_top_k`개와
+        폴백 점수 상위 `score_top_k`개의 합집합만 남깁니다 (원래 순서 유지).
+        임베딩 모델이 아직 로드 중이면 점수만으로 같은 개수를 남기고,
+        임베딩을 사용할 수 없으면 기존 마감일 기반 사전 필터링으로 대체합니다.
+        
+        Args:
+            candidates: 후보 TODO 리스트
+            natural_rule: 자연어 규칙
+            now: 기준 시간 (점수 계산용)
+            
+        Returns:
+            LLM에 전달할 후보 리스트
+        """
+        config = TOP3_PRERANK_CONFIG
+        self._prerank_score_only = False
+        if len(candidates) <= config["min_candidates"]:
+            return candidates
+        
+        from .embedding_service import get_embedding_service
+        
+        embedder = get_embedding_service()
+        if embedder.is_available() and not embedder.is_ready():
+            # 모델 로드(다운로드 포함)를 기다리지 않고 이번에는 점수만으로 사전 순위화
+            embedder.warm_up()
+            keep_k = config["semantic_top_k"] + config["score_top_k"]
+            keep = set(self._rank_by_fallback_score(candidates, now)[:keep_k])
+            selected = [todo for i, todo in enumerate(candidates) if i in keep]
+            self._prerank_score_only = True
+            logger.info(
+                f"[Top3LLM] 임베딩 모델 로드 중 → 점수 기반 사전 순위화: "
+                f"{len(candidates)}개 → {len(selected)}개"
+            )
+            return selected
+        
+        todo_vectors = embedder.encode_todos(candidates) if embedder.is_available() else None
+        rule_vector = embedder.encode_text(natural_rule) if todo_vectors is not None else None
+        
+        if rule_vector is None:
+            logger.info("[Top3LLM] 임베딩 사용 불가 → 마감일 기반 사전 필터링")
+            return self._smart_prefilter(candidates, natural_rule)
+        
+        import numpy as np
+        
+        # 정규화된 벡터이므로 내적 = 코사인 유사도
+        similarities = todo_vectors @ rule_vector
+        semantic_k = min(config["semantic_top_k"], len(candidates))
+        semantic_idx = np.argsort(-similarities, kind="stable")[:semantic_k]
+        
+        score_idx = self._rank_by_fallback_score(candidates, now)[:config["score_top_k"]]
+        
+        keep = set(int(i) for i in semantic_idx) | set(score_idx)
+        selected = [todo for i, todo in enumerate(candidates) if i in keep]
+        
+        logger.info(
+            f"[Top3LLM] 임베딩 사전 순위화: {len(candidates)}개 → {len(selected)}개 "
+            f"(의미 {semantic_k}개 + 점수 {len(score_idx)}개, 중복 제외)"
+        )
+        return selected
+    
+    def _rank_by_fallback_score(self, candidates: List[Dict], now: datetime) -> List[int]:
+        """폴백 점수 내림차순 후보 인덱스"""
+        return sorted(
+            range(len(candidates)),
+            key=lambda i: self._fallback_score(candidates[i], now),
+            reverse=True
+        )
+    
     def _try_llm_selection(
         self, 
         candidates: List[Dict], 
         natural_rule: str, 
         entity_rules: Optional[Dict], 
-        original_todos: List[Dict]
+        original_todos: List[Dict],
+        all_candidates: Optional[List[Dict]] = None
     ) -> Optional[Set[str]]:
         """LLM 선정 시도
         
+        Args:
+            candidates: 프롬프트에 넣을 후보 (부분 재선정이면 incumbent + 변경 후보)
+            all_candidates: 델타 스냅샷 기준이 되는 전체 후보 (None이면 candidates)
+        
         Returns:
             성공 시 선정된 ID 집합, 실패 시 None
         """
@@ -256,6 +374,14 @@ class Top3LLMSelector:
         
         # 캐시 저장
         self.cache_manager.set(original_todos, valid_ids, entity_rules, natural_rule)
+        self.cache_manager.record_selection(
+            all_candidates if all_candidates is not None else candidates,
+            candidates,
+            valid_ids,
+            entity_rules,
+            natural_rule,
+            reasoning,
+        )
         
         # 선정 이유 저장 (한국어)
         self.last_reasoning = reasoning
@@ -278,6 +404,46 @@ class Top3LLMSelector:
         
         return valid_ids
     
+    def _fallback_score(self, todo: Dict, now: datetime) -> float:
+        """폴백/사전 순위화용 간단 점수 (우선순위 + 마감 임박도 + 수신 타입)"""
+        score = 0.0
+        
+        # 우선순위 점수
+        priority = (todo.get("priority") or "medium").lower()
+        if priority == "high":
+            score += 3.0
+        elif priority == "medium":
+            score += 2.0
+        else:
+            score += 1.0
+        
+        # 마감일 처리
+        deadline = todo.get("deadline")
+        if deadline:
+            try:
+                if isinstance(deadline, str):
+                    dl = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
+                    hours_left = (dl - now).total_seconds() / 3600.0
+                    
+                    # 마감이 지났으면 점수 대폭 감소
+                    if hours_left < 0:
+                        score -= 10.0  # 마감 지난 TODO는 우선순위 최하위
+                        logger.debug(f"[Top3LLM] 마감 지남: {todo.get('id')} (점수 -10)")
+                    # 마감이 임박하면 점수 증가
+                    elif hours_left < 24:
+                        score += 2.0
+                    elif hours_left < 72:
+                        score += 1.0
+            except Exception:
+                pass
+        
+        # 수신 타입 (TO가 우선)
+        recipient_type = (todo.get("recipient_type") or "to").lower()
+        if recipient_type == "to":
+            score += 0.5
+        
+        return score
+    
     def _fallback_selection(self, todos: List[Dict], simulation_time: Optional[datetime] = None) -> Set[str]:
         """폴백 선정 (점수 기반)
         
@@ -297,43 +463,7 @@ class Top3LLMSelector:
         now = simulation_time if simulation_time else datetime.now()
         
         for todo in todos:
-            score = 0.0
-            
-            # 우선순위 점수
-            priority = (todo.get("priority") or "medium").lower()
-            if priority == "high":
-                score += 3.0
-            elif priority == "medium":
-                score += 2.0
-            else:
-                score += 1.0
-            
-            # 마감일 처리
-            deadline = todo.get("deadline")
-            if deadline:
-                try:
-                    if isinstance(deadline, str):
-                        dl = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
-                        hours_left = (dl - now).total_seconds() / 3600.0
-                        
-                        # 마감이 지났으면 점수 대폭 감소
-                        if hours_left < 0:
-                            score -= 10.0  # 마감 지난 TODO는 우선순위 최하위
-                            logger.debug(f"[Top3LLM] 마감 지남: {todo.get('id')} (점수 -10)")
-                        # 마감이 임박하면 점수 증가
-                        elif hours_left < 24:
-                            score += 2.0
-                        elif hours_left < 72:
-                            score += 1.0
-                except Exception:
-                    pass
-            
-            # 수신 타입 (TO가 우선)
-            recipient_type = (todo.get("recipient_type") or "to").lower()
-            if recipient_type == "to":
-                score += 0.5
-            
-            scored.append((score, todo))
+            scored.append((self._fallback_score(todo, now), todo))
         
         # 점수순 정렬 후 상위 3개
         scored.sort(key=lambda x: x[0], reverse=True)
@@ -3,14 +3,59 @@
 Top3 점수 계산 모듈
 
 TODO 항목의 우선순위 점수를 계산하고 상위 3개를 선정합니다.
+후보가 많을 때는 `calculate_scores`가 후보 목록을 한 번에 열(column) 배열로 변환해
+NumPy 벡터 연산으로 점수를 계산합니다 (결과는 `calculate_score`와 동일).
 """
+import functools
 import json
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 없으면 스칼라 경로 사용
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# 요청자 특별 매칭 패턴 (임호규, 이메일 주소 포함) - 순서대로 첫 번째 규칙만 적용
+HONGYU_PATTERNS = ("임호규", "hongyu", "imhokyu", "lim", "ho", "gyu")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_deadline_str(deadline: str) -> Optional[datetime]:
+    try:
+        dl = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
+    except Exception:
+        try:
+            dl = datetime.fromisoformat(deadline)
+        except Exception:
+            return None
+    if dl.tzinfo is None:
+        dl = dl.replace(tzinfo=timezone.utc)
+    return dl
+
+
+def _parse_deadline(deadline) -> Optional[datetime]:
+    """데드라인 문자열 → timezone-aware datetime (문자열별로 캐시)"""
+    if not isinstance(deadline, str):
+        return None
+    return _parse_deadline_str(deadline)
+
+
+def _evidence_count(evidence) -> int:
+    """evidence 컬럼(list 또는 JSON 문자열)의 항목 수"""
+    if not isinstance(evidence, list):
+        try:
+            evidence = json.loads(evidence or "[]")
+        except Exception:
+            evidence = []
+    return len(evidence)
+
 
 class Top3ScoreCalculator:
     """점수 기반 Top3 선정기
@@ -34,11 +79,12 @@ class Top3ScoreCalculator:
         self.entity_rules = entity_rules
         # email_to_name은 호환성을 위해 받지만 사용하지 않음
     
-    def calculate_score(self, todo: Dict) -> float:
+    def calculate_score(self, todo: Dict, now: Optional[datetime] = None) -> float:
         """TODO 항목의 점수 계산
         
         Args:
             todo: TODO 항목 딕셔너리
+            now: 기준 시각 (None이면 현재 UTC 시각)
             
         Returns:
             계산된 점수
@@ -48,23 +94,11 @@ class Top3ScoreCalculator:
         w_priority = self.rules.get(f"priority_{priority}", self.rules.get("priority_low", 1.0))
         
         # 데드라인 임박 가중치
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         deadline = todo.get("deadline_ts") or todo.get("deadline")
-        
-        if deadline:
-            try:
-                dl = datetime.fromisoformat(deadline.replace("Z", "+00:00"))
-            except Exception:
-                try:
-                    dl = datetime.fromisoformat(deadline)
-                except Exception:
-                    dl = None
-        else:
-            dl = None
+        dl = _parse_deadline(deadline) if deadline else None
         
         if dl:
-            if dl.tzinfo is None:
-                dl = dl.replace(tzinfo=timezone.utc)
             hours_left = (dl - now).total_seconds() / 3600.0
             
             # 마감이 지났으면 큰 패널티 적용
@@ -83,16 +117,9 @@ class Top3ScoreCalculator:
             w_deadline = 1.0
         
         # 근거 가중치
-        evidence = todo.get("evidence")
-        if not isinstance(evidence, list):
-            try:
-                evidence = json.loads(evidence or "[]")
-            except Exception:
-                evidence = []
-        
         per_item = self.rules.get("evidence_per_item", 0.1)
         max_bonus = self.rules.get("evidence_max_bonus", 0.5)
-        w_evidence = 1.0 + min(max_bonus, per_item * len(evidence))
+        w_evidence = 1.0 + min(max_bonus, per_item * _evidence_count(todo.get("evidence")))
         
         # 엔티티 규칙 적용 (자연어 규칙)
         rule_multiplier = 1.0
@@ -107,9 +134,8 @@ class Top3ScoreCalculator:
                     rule_multiplier += bonus * 0.25
             
             # 임호규 특별 매칭 (이메일 주소 포함)
-            hongyu_patterns = ["임호규", "hongyu", "imhokyu", "lim", "ho", "gyu"]
-            if any(pattern in requester for pattern in hongyu_patterns):
-                for pattern in hongyu_patterns:
+            if any(pattern in requester for pattern in HONGYU_PATTERNS):
+                for pattern in HONGYU_PATTERNS:
                     if pattern in self.entity_rules.get("requester", {}):
                         bonus = self.entity_rules["requester"][pattern]
                         priority_bonus += bonus
@@ -158,6 +184,123 @@ class Top3ScoreCalculator:
         score = (priority_term * rule_multiplier) * w_deadline * w_evidence * cc_penalty
         return score
     
+    def calculate_scores(self, todos: Sequence[Dict], now: Optional[datetime] = None) -> List[float]:
+        """여러 TODO 점수를 한 번에 계산 (배치 경로)
+        
+        `calculate_score`와 같은 순서로 같은 연산을 수행하므로 결과가 비트 단위로 일치합니다.
+        NumPy가 없으면 스칼라 경로로 계산합니다.
+        
+        Args:
+            todos: TODO 항목 리스트
+            now: 기준 시각 (None이면 현재 UTC 시각, 모든 항목에 동일하게 적용)
+            
+        Returns:
+            입력 순서와 같은 점수 리스트
+        """
+        if not todos:
+            return []
+        now = now or datetime.now(timezone.utc)
+        if np is None:
+            return [self.calculate_score(todo, now=now) for todo in todos]
+        return self._score_array(todos, now).tolist()
+    
+    def _score_array(self, todos: Sequence[Dict], now: datetime) -> "np.ndarray":
+        """후보 목록을 열 배열로 변환한 뒤 벡터 연산으로 점수 계산"""
+        n = len(todos)
+        rules = self.rules
+        
+        # 1. 열 배열 변환 (항목당 한 번만 파싱/소문자화)
+        priority_low = rules.get("priority_low", 1.0)
+        w_priority = np.fromiter(
+            (rules.get(f"priority_{(t.get('priority') or 'low').lower()}", priority_low) for t in todos),
+            dtype=np.float64, count=n,
+        )
+        
+        deadline_us = np.zeros(n, dtype=np.int64)
+        has_deadline = np.zeros(n, dtype=bool)
+        for i, todo in enumerate(todos):
+            deadline = todo.get("deadline_ts") or todo.get("deadline")
+            dl = _parse_deadline(deadline) if deadline else None
+            if dl:
+                deadline_us[i] = (dl - _EPOCH) // _MICROSECOND
+                has_deadline[i] = True
+        
+        evidence_count = np.fromiter(
+            (_evidence_count(t.get("evidence")) for t in todos), dtype=np.int64, count=n
+        )
+        
+        requesters = [(t.get("requester") or "").lower() for t in todos]
+        texts = [
+            " ".join([t.get("title", ""), t.get("description", ""), t.get("type", "")]).lower()
+            for t in todos
+        ]
+        types = [(t.get("type") or "").lower() for t in todos]
+        
+        cc = rules.get("recipient_type_cc_penalty", 0.7)
+        penalty_by_type = {"cc": cc, "bcc": cc * 0.9}
+        cc_penalty = np.fromiter(
+            (penalty_by_type.get((t.get("recipient_type") or "to").lower(), 1.0) for t in todos),
+            dtype=np.float64, count=n,
+        )
+        
+        # 2. 규칙별 매칭 마스크 → 보너스 누적 (스칼라 경로와 같은 규칙 순서로 더함)
+        priority_bonus = np.zeros(n, dtype=np.float64)
+        rule_multiplier = np.ones(n, dtype=np.float64)
+        
+        def _apply(mask: "np.ndarray", bonus_term: float, bonus: float) -> None:
+            if mask.any():
+                priority_bonus[mask] += bonus_term
+                rule_multiplier[mask] += bonus * 0.25
+        
+        requester_rules = self.entity_rules.get("requester", {})
+        for match, bonus in requester_rules.items():
+            if match:
+                _apply(self._match_mask(match, requesters), bonus, bonus)
+        
+        hongyu_rule = next((p for p in HONGYU_PATTERNS if p in requester_rules), None)
+        if hongyu_rule is not None:
+            hongyu_mask = np.fromiter(
+                (any(p in r for p in HONGYU_PATTERNS) for r in requesters), dtype=bool, count=n
+            )
+            bonus = requester_rules[hongyu_rule]
+            _apply(hongyu_mask, bonus, bonus)
+        
+        for match, bonus in self.entity_rules.get("keyword", {}).items():
+            if match:
+                _apply(self._match_mask(match, texts), bonus * 0.5, bonus)
+        
+        for match, bonus in self.entity_rules.get("type", {}).items():
+            if match:
+                _apply(self._match_mask(match, types), bonus * 0.5, bonus)
+        
+        # 3. 점수 계산
+        rule_multiplier = np.maximum(0.5, np.minimum(rule_multiplier, 6.0))
+        priority_floor = np.where(
+            priority_bonus > 0,
+            np.maximum(rules.get("priority_high", 3.0) + priority_bonus, 3.5),
+            0.0,
+        )
+        priority_term = np.maximum(np.maximum(0.1, w_priority + priority_bonus), priority_floor)
+        
+        now_us = (now - _EPOCH) // _MICROSECOND
+        hours_left = ((deadline_us - now_us) / 1_000_000) / 3600.0
+        emphasis = rules.get("deadline_emphasis", 24.0)
+        base = rules.get("deadline_base", 1.0)
+        overdue = 0.1 / (1.0 + np.abs(hours_left) / 24.0)
+        upcoming = base + (emphasis / (emphasis + np.maximum(0.0, hours_left)))
+        w_deadline = np.where(has_deadline, np.where(hours_left < 0, overdue, upcoming), 1.0)
+        
+        per_item = rules.get("evidence_per_item", 0.1)
+        max_bonus = rules.get("evidence_max_bonus", 0.5)
+        w_evidence = 1.0 + np.minimum(max_bonus, per_item * evidence_count)
+        
+        return (priority_term * rule_multiplier) * w_deadline * w_evidence * cc_penalty
+    
+    @staticmethod
+    def _match_mask(match: str, values: List[str]) -> "np.ndarray":
+        """규칙 문자열이 포함된 항목 마스크"""
+        return np.fromiter((match in v for v in values), dtype=bool, count=len(values))
+    
     def update_rules(self, rules: Dict[str, float]) -> None:
         """규칙 업데이트 (호환성 메서드)
         
@@ -228,14 +371,16 @@ class Top3ScoreCalculator:
             logger.info("[Top3ScoreCalculator] 후보 TODO가 없습니다")
             return set()
         
-        # 2. 모든 후보의 점수 계산
-        for item in candidates:
-            item["_top3_score"] = self.calculate_score(item)
+        # 2. 모든 후보의 점수 계산 (배치)
+        scores = self.calculate_scores(candidates)
+        for item, score in zip(candidates, scores):
+            item["_top3_score"] = score
         
         def _created_iso(x):
             return x.get("created_at") or datetime.now().isoformat()
         
-        # 3. 점수순으로 정렬
+        # 3. 점수순 상위 후보만 정렬 (동점 처리를 위해 k번째 점수 이상은 모두 포함)
+        candidates = self._top_k_pool(candidates, scores, 5 if logger.isEnabledFor(logging.DEBUG) else 3)
         candidates.sort(key=lambda x: (x["_top3_score"], _created_iso(x)), reverse=True)
         
         # 4. 상위 3개 선정
@@ -246,7 +391,7 @@ class Top3ScoreCalculator:
         
         logger.info(
             f"[Top3ScoreCalculator] 점수 기반 선정 완료: "
-            f"{len(candidates)}개 중 {len(top3_ids)}개 선정"
+            f"{len(scores)}개 중 {len(top3_ids)}개 선정"
         )
         
         # 디버그: 상위 5개 점수 로깅
@@ -259,3 +404,17 @@ class Top3ScoreCalculator:
                 )
         
         return top3_ids
+    
+    @staticmethod
+    def _top_k_pool(candidates: List[Dict], scores: List[float], k: int) -> List[Dict]:
+        """점수 상위 k개와 k번째 점수 동점 후보를 원래 순서대로 반환
+        
+        전체 정렬 대신 `argpartition`으로 k번째 점수를 구하므로 후보 수에 대해 선형 시간입니다.
+        반환 목록을 (점수, 생성시각) 기준으로 안정 정렬하면 전체 정렬의 상위 k개와 같습니다.
+        """
+        if np is None or len(candidates) <= k:
+            return list(candidates)
+        score_array = np.asarray(scores, dtype=np.float64)
+        top_idx = np.argpartition(-score_array, k - 1)[:k]
+        threshold = score_array[top_idx].min()
+        return [candidates[i] for i in np.flatnonzero(score_array >= threshold)]
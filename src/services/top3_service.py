@@ -9,6 +9,7 @@ TODO 항목의 우선순위를 계산하고 Top3를 자동으로 선정합니다
 - Top3LLMSelector: LLM 기반 Top3 선정
 - Top3ScoreCalculator: 점수 기반 Top3 선정 (폴백)
 - Top3CacheManager: 선정 결과 캐싱
+- Top3Tracker: 점수 기반 선정의 증분 추적 (변경된 TODO만 재계산)
 """
 import os
 import json
@@ -18,6 +19,8 @@ from copy import deepcopy
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple, Set
 
+from src.utils.tracing import current_span, traced
+
 logger = logging.getLogger(__name__)
 
 # Top-3 규칙 기본값
@@ -99,6 +102,7 @@ class Top3Service:
         self._llm_selector = None
         self._score_calculator = None
         self._cache_manager = None
+        self._tracker = None
         self._llm_enabled = True  # LLM 사용 여부
         self._llm_failure_count = 0  # 연속 실패 횟수
         self._max_llm_failures = 3  # 최대 연속 실패 횟수
@@ -138,6 +142,26 @@ class Top3Service:
         
         return self._score_calculator
     
+    def _get_tracker(self):
+        """Top3Tracker lazy initialization (TODO 변경 알림 구독)"""
+        if self._tracker is None:
+            from .top3_tracker import Top3Tracker
+            from .todo_change_feed import get_todo_change_feed
+            
+            self._tracker = Top3Tracker(
+                self._get_score_calculator(),
+                feed=get_todo_change_feed(),
+            )
+            logger.debug("[Top3Service] Top3 Tracker 초기화 완료")
+        
+        return self._tracker
+    
+    def _select_by_score(self, candidates: List[Dict]) -> Set[str]:
+        """점수 기반 Top3 선정 (증분 추적기 사용, id 없는 후보가 있으면 전체 계산)"""
+        if all(item.get("id") for item in candidates):
+            return self._get_tracker().sync(candidates)
+        return self._get_score_calculator().select_top3(candidates)
+    
     def _get_cache_manager(self):
         """Cache Manager lazy initialization"""
         if self._cache_manager is None:
@@ -199,6 +223,12 @@ class Top3Service:
         """마지막 자연어 지시사항 반환"""
         return self._last_instruction
     
+    def get_cache_stats(self) -> Dict:
+        """Top3 LLM 캐시 통계 반환 (캐시가 아직 생성되지 않았으면 빈 딕셔너리)"""
+        if self._cache_manager is None:
+            return {}
+        return self._cache_manager.get_stats()
+    
     def set_rules(self, new_rules: Dict[str, float]) -> None:
         """규칙 설정"""
         for key, default in TOP3_RULE_DEFAULT.items():
@@ -245,6 +275,8 @@ class Top3Service:
         # ScoreCalculator 업데이트
         if self._score_calculator is not None:
             self._score_calculator.update_rules(self._rules)
+        if self._tracker is not None:
+            self._tracker.invalidate()
     
     def update_entity_rules(self, new_rules: Optional[Dict[str, Dict[str, float]]], reset: bool = False) -> None:
         """엔티티 규칙 업데이트"""
@@ -294,14 +326,24 @@ class Top3Service:
         # ScoreCalculator 업데이트
         if self._score_calculator is not None:
             self._score_calculator.update_entity_rules(self._entity_rules)
+        if self._tracker is not None:
+            self._tracker.invalidate()
     
     def calculate_score(self, todo: Dict) -> float:
         """TODO 항목의 점수 계산 (ScoreCalculator로 위임)"""
         score_calculator = self._get_score_calculator()
         return score_calculator.calculate_score(todo)
     
+    def calculate_scores(self, todos: List[Dict]) -> List[float]:
+        """여러 TODO 점수를 한 번에 계산 (추적 중인 점수 재사용, 나머지는 배치 계산)"""
+        if self._tracker is not None:
+            return self._tracker.scores_for(todos)
+        score_calculator = self._get_score_calculator()
+        return score_calculator.calculate_scores(todos)
+    
 
     
+    @traced("top3", category="top3")
     def pick_top3(self, items: List[Dict], use_llm: bool = True, simulation_time: Optional[datetime] = None) -> Set[str]:
         """Top3 TODO 선정 (LLM 또는 점수 기반)
         
@@ -340,6 +382,11 @@ class Top3Service:
             self._entity_rules.get("type")
         )
         
+        current_span().set(
+            candidates=len(candidates),
+            mode="llm" if (has_natural_rules and self._llm_enabled and use_llm) else "score",
+        )
+        
         # 3. LLM 선정 시도 (조건: 자연어 규칙 있음 + LLM 활성화 + use_llm=True)
         if has_natural_rules and self._llm_enabled and use_llm:
             logger.info(f"[Top3Service] 🤖 LLM 모드: 자연어 규칙 기반 Top3 선정 시도")
@@ -388,11 +435,7 @@ class Top3Service:
             # 자연어 규칙이 있으면 규칙 매칭 TODO만 선정
             logger.info(f"[Top3Service] 🔒 강제 모드: 자연어 규칙에 맞는 TODO만 선정")
             
-            score_calculator = self._get_score_calculator()
-            top3_ids = score_calculator.select_top3_with_rules(
-                candidates=candidates,
-                entity_rules=self._entity_rules
-            )
+            top3_ids = self._select_by_score(candidates)
             
             if not top3_ids:
                 logger.warning(f"[Top3Service] ⚠️ 규칙에 맞는 TODO가 없음 (전체 {len(candidates)}개 중)")
@@ -404,8 +447,7 @@ class Top3Service:
             # 자연어 규칙이 없으면 일반 점수 기반 선정
             logger.info(f"[Top3Service] 📊 일반 모드: 점수 기반 Top3 선정")
             
-            score_calculator = self._get_score_calculator()
-            top3_ids = score_calculator.select_top3(candidates)
+            top3_ids = self._select_by_score(candidates)
             
             logger.info(f"[Top3Service] ✅ 일반 모드 완료: {len(candidates)}개 중 {len(top3_ids)}개 선정")
             return top3_ids
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+Top3 증분 추적 모듈
+
+TODO별 점수와 점수 힙을 유지하여, 추가/수정/삭제된 TODO만 다시 점수를 계산합니다.
+규칙(가중치/엔티티 규칙)이 바뀌거나 기준 시각 구간(clock bucket)이 바뀔 때만
+전체 후보를 다시 계산합니다.
+
+- 변경 1건당 O(log n) (힙 push), Top-k 조회는 O(k log n)
+- 삭제는 지연 삭제(lazy deletion)로 처리하고 힙이 커지면 압축
+- `TodoChangeFeed`를 구독해 완료/삭제/일괄 변경 이벤트를 즉시 반영하고,
+  내용 변경(upserted) 이벤트로 받은 ID만 동기화 때 다시 확인
+"""
+import heapq
+import itertools
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .todo_change_feed import (
+    CHANGE_DELETED,
+    CHANGE_RESET,
+    CHANGE_STATUS,
+    CHANGE_UPSERTED,
+    TodoChangeEvent,
+    TodoChangeFeed,
+)
+
+logger = logging.getLogger(__name__)
+
+# 점수 계산에 쓰이는 TODO 필드 (변경 감지용 지문)
+SCORE_FIELDS = (
+    "priority", "deadline_ts", "deadline", "evidence", "requester",
+    "title", "description", "type", "recipient_type", "created_at",
+)
+
+
+def score_fingerprint(todo: Dict) -> Tuple:
+    """점수에 영향을 주는 필드만 모은 지문"""
+    values = []
+    for name in SCORE_FIELDS:
+        value = todo.get(name)
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+        values.append(value)
+    return tuple(values)
+
+
+class _Desc:
+    """힙(최소 힙)에서 내림차순 비교를 위한 래퍼"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Desc") -> bool:
+        return self.value > other.value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Desc) and self.value == other.value
+
+
+@dataclass
+class _Entry:
+    score: float
+    created: str
+    fingerprint: Tuple
+    seq: int
+
+
+class Top3Tracker:
+    """TODO 점수 힙 기반 Top-k 증분 추적기"""
+
+    def __init__(
+        self,
+        score_calculator,
+        k: int = 3,
+        clock_bucket_seconds: int = 300,
+        feed: Optional[TodoChangeFeed] = None,
+    ):
+        """
+        Args:
+            score_calculator: Top3ScoreCalculator 인스턴스 (rules/entity_rules를 참조)
+            k: 추적할 상위 개수 (기본값: 3)
+            clock_bucket_seconds: 기준 시각 구간 길이 (초). 구간이 바뀌면 전체 재계산
+            feed: 완료/삭제 이벤트를 받을 TodoChangeFeed (None이면 구독 안 함)
+        """
+        self.calculator = score_calculator
+        self.k = k
+        self.clock_bucket_seconds = max(1, int(clock_bucket_seconds))
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, _Entry] = {}
+        self._heap: List[Tuple[float, _Desc, int, str]] = []
+        self._seq = itertools.count()
+        self._rules_signature: Optional[str] = None
+        self._bucket: Optional[int] = None
+        self._bucket_now: Optional[datetime] = None
+        # 변경 알림으로 받은, 다음 동기화 때 지문을 다시 확인할 ID
+        self._dirty: Set[str] = set()
+
+        self.stats = {
+            "full_rescores": 0,
+            "incremental_updates": 0,
+            "removals": 0,
+            "syncs": 0,
+        }
+
+        self._feed = feed
+        self._feed_token: Optional[int] = feed.subscribe(self._on_changes) if feed else None
+
+    # ------------------------------------------------------------------
+    # 상태 확인
+    # ------------------------------------------------------------------
+    def _current_rules_signature(self) -> str:
+        return json.dumps(
+            [self.calculator.rules, self.calculator.entity_rules],
+            ensure_ascii=False, sort_keys=True, default=str,
+        )
+
+    def _bucket_of(self, now: datetime) -> int:
+        return int(now.timestamp()) // self.clock_bucket_seconds
+
+    def _needs_full_rescore(self, now: datetime) -> bool:
+        return (
+            self._rules_signature != self._current_rules_signature()
+            or self._bucket != self._bucket_of(now)
+        )
+
+    def invalidate(self) -> None:
+        """다음 동기화 때 전체 재계산하도록 상태 초기화 (규칙 변경 시 호출)"""
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._rules_signature = None
+            self._bucket = None
+            self._bucket_now = None
+            self._dirty.clear()
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def _push(self, todo_id: str, score: float, created: str, fingerprint: Tuple) -> None:
+        seq = next(self._seq)
+        self._entries[todo_id] = _Entry(score, created, fingerprint, seq)
+        heapq.heappush(self._heap, (-score, _Desc(created), seq, todo_id))
+
+    def _score_many(self, todos: Sequence[Dict]) -> List[float]:
+        return self.calculator.calculate_scores(todos, now=self._bucket_now)
+
+    def upsert(self, todo: Dict) -> None:
+        """TODO 한 건 추가/수정 (지문이 같으면 무시)"""
+        todo_id = todo.get("id")
+        if not todo_id:
+            return
+        with self._lock:
+            fingerprint = score_fingerprint(todo)
+            entry = self._entries.get(todo_id)
+            if entry and entry.fingerprint == fingerprint:
+                return
+            now = self._bucket_now or datetime.now(timezone.utc)
+            score = self.calculator.calculate_score(todo, now=now)
+            self._push(todo_id, score, _created_key(todo), fingerprint)
+            self.stats["incremental_updates"] += 1
+            # 점수가 바뀐 TODO의 이전 힙 항목도 지연 삭제 대상이므로 압축 검사
+            self._maybe_compact()
+
+    def remove(self, todo_id: str) -> None:
+        """TODO 제거 (힙에서는 지연 삭제)"""
+        with self._lock:
+            if self._entries.pop(todo_id, None) is not None:
+                self.stats["removals"] += 1
+                self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [
+                item for item in self._heap
+                if (entry := self._entries.get(item[3])) is not None and entry.seq == item[2]
+            ]
+            heapq.heapify(self._heap)
+
+    def _rebuild(self, todos: Sequence[Dict], now: datetime) -> None:
+        self._entries.clear()
+        self._heap = []
+        self._rules_signature = self._current_rules_signature()
+        self._bucket = self._bucket_of(now)
+        self._bucket_now = now
+        self._dirty.clear()
+        scores = self._score_many(todos)
+        for todo, score in zip(todos, scores):
+            seq = next(self._seq)
+            self._entries[todo["id"]] = _Entry(score, _created_key(todo), score_fingerprint(todo), seq)
+            self._heap.append((-score, _Desc(self._entries[todo["id"]].created), seq, todo["id"]))
+        heapq.heapify(self._heap)
+        self.stats["full_rescores"] += 1
+
+    def sync(
+        self,
+        todos: Sequence[Dict],
+        now: Optional[datetime] = None,
+        changed_ids: Optional[Iterable[str]] = None,
+    ) -> Set[str]:
+        """현재 후보 목록에 맞춰 상태를 갱신하고 Top-k ID 반환
+
+        후보 목록에 없는 TODO는 제거하고, 새로 추가되었거나 점수 관련 필드가 바뀐 TODO만
+        다시 계산합니다. 각 후보의 `_top3_score`도 채웁니다.
+
+        변경 알림을 구독 중이면 지문은 처음 보는 TODO와 알림/`changed_ids`로 받은 TODO만 비교하고,
+        나머지는 추적 중인 점수를 그대로 씁니다. (알림 없이 바뀐 항목은 다음 시각 구간의
+        전체 재계산 때 반영) 구독하지 않았으면 모든 후보의 지문을 비교합니다.
+
+        Args:
+            todos: 후보 TODO 리스트 (모두 id가 있어야 함)
+            now: 기준 시각 (None이면 현재 UTC 시각)
+            changed_ids: 호출자가 알고 있는 변경 TODO ID (변경 알림 외 추가분)
+        """
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            self.stats["syncs"] += 1
+            if self._needs_full_rescore(now):
+                self._rebuild(todos, now)
+            else:
+                self._sync_changed(todos, changed_ids)
+
+            entries = self._entries
+            for todo in todos:
+                todo["_top3_score"] = entries[todo["id"]].score
+            return set(self.top_ids())
+
+    def _sync_changed(self, todos: Sequence[Dict], changed_ids: Optional[Iterable[str]]) -> None:
+        dirty = self._dirty
+        self._dirty = set()
+        if changed_ids:
+            dirty.update(changed_ids)
+        check_all = self._feed_token is None
+
+        entries = self._entries
+        current_ids: Set[str] = set()
+        changed = []
+        for todo in todos:
+            todo_id = todo["id"]
+            current_ids.add(todo_id)
+            entry = entries.get(todo_id)
+            if entry is None or check_all or todo_id in dirty:
+                fingerprint = score_fingerprint(todo)
+                if entry is None or entry.fingerprint != fingerprint:
+                    changed.append((todo, fingerprint))
+        if changed:
+            scores = self._score_many([todo for todo, _ in changed])
+            for (todo, fingerprint), score in zip(changed, scores):
+                self._push(todo["id"], score, _created_key(todo), fingerprint)
+            self.stats["incremental_updates"] += len(changed)
+
+        # 모든 후보가 추적 중이므로 개수가 같으면 후보에서 빠진 TODO가 없음
+        if len(entries) > len(current_ids):
+            for todo_id in [tid for tid in entries if tid not in current_ids]:
+                entries.pop(todo_id)
+                self.stats["removals"] += 1
+        self._maybe_compact()
+
+    def top_ids(self, k: Optional[int] = None) -> List[str]:
+        """점수 상위 k개 ID (점수, 생성 시각 내림차순)"""
+        k = self.k if k is None else k
+        with self._lock:
+            picked: List[Tuple[float, _Desc, int, str]] = []
+            while self._heap and len(picked) < k:
+                item = heapq.heappop(self._heap)
+                entry = self._entries.get(item[3])
+                if entry is not None and entry.seq == item[2]:
+                    picked.append(item)
+            for item in picked:
+                heapq.heappush(self._heap, item)
+            return [item[3] for item in picked]
+
+    def scores_for(self, todos: Sequence[Dict]) -> List[float]:
+        """추적 중인 점수를 재사용하여 점수 리스트 반환 (변경/미추적 항목만 계산)
+
+        추적 상태는 바꾸지 않습니다. 규칙/시각 구간이 바뀐 경우 모두 새로 계산합니다.
+        """
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            if self._bucket_now is None or self._needs_full_rescore(now):
+                return self.calculator.calculate_scores(todos, now=now)
+
+            scores: List[Optional[float]] = []
+            misses: List[int] = []
+            for index, todo in enumerate(todos):
+                entry = self._entries.get(todo.get("id")) if todo.get("id") else None
+                if entry is not None and entry.fingerprint == score_fingerprint(todo):
+                    scores.append(entry.score)
+                else:
+                    scores.append(None)
+                    misses.append(index)
+            if misses:
+                computed = self._score_many([todos[i] for i in misses])
+                for index, score in zip(misses, computed):
+                    scores[index] = score
+            return scores
+
+    # ------------------------------------------------------------------
+    # 변경 알림
+    # ------------------------------------------------------------------
+    def _on_changes(self, events: Iterable[TodoChangeEvent]) -> None:
+        for event in events:
+            if event.kind == CHANGE_RESET:
+                self.invalidate()
+            elif event.kind == CHANGE_UPSERTED and event.todo_id:
+                with self._lock:
+                    self._dirty.add(event.todo_id)
+            elif event.kind == CHANGE_DELETED and event.todo_id:
+                self.remove(event.todo_id)
+            elif event.kind == CHANGE_STATUS and event.todo_id and event.fields.get("status") == "done":
+                self.remove(event.todo_id)
+
+    def close(self) -> None:
+        """변경 알림 구독 해제"""
+        if self._feed is not None and self._feed_token is not None:
+            self._feed.unsubscribe(self._feed_token)
+            self._feed_token = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 정보 반환"""
+        with self._lock:
+            return {**self.stats, "tracked": len(self._entries), "heap_size": len(self._heap)}
+
+
+def _created_key(todo: Dict) -> str:
+    # Top3ScoreCalculator.select_top3와 같은 동점 처리 (생성 시각 없으면 현재 시각)
+    return todo.get("created_at") or datetime.now().isoformat()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VDOS 채팅 참조 데이터 인메모리 스냅샷
+
+`ChatProjectMatcher`가 호출마다 실행하던 SQL 조회
+(발신자 전체 채팅 이력을 `ORDER BY ABS(julianday(...))`로 정렬, 채팅방 멤버 조회,
+핸들 → 이메일 LIKE 조회)를 한 번의 로드로 대체합니다.
+
+- 채팅방/멤버: dict 조회
+- 발신자별 메시지: 전송 시각 기준 정렬 리스트 → bisect로 가장 가까운 메시지 탐색
+- 핸들 → 이메일: people 테이블 이메일 목록 접두어 매칭 (결과 캐시)
+
+VDOS DB 파일(및 WAL 파일)의 mtime이 바뀌면 다음 조회 때 다시 로드합니다.
+"""
+
+import bisect
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChatMessageRef:
+    """채팅 메시지 참조 정보"""
+    id: int
+    sender: str
+    body: str
+    sent_at: str
+    room_id: int
+
+
+@dataclass
+class SenderTimeline:
+    """발신자별 메시지 (전송 시각 오름차순)"""
+    timestamps: List[float] = field(default_factory=list)
+    messages: List[ChatMessageRef] = field(default_factory=list)
+    latest: Optional[ChatMessageRef] = None  # id가 가장 큰 메시지
+
+
+def parse_timestamp(value) -> Optional[float]:
+    """ISO 형식 시각 문자열을 epoch 초로 변환 (타임존 없으면 UTC, SQLite julianday와 동일)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class VDOSChatSnapshot:
+    """VDOS 채팅방/멤버/발신자별 메시지 스냅샷"""
+
+    def __init__(self, vdos_db_path: str, check_interval: float = 2.0):
+        """
+        Args:
+            vdos_db_path: VDOS 데이터베이스 경로
+            check_interval: 파일 mtime 확인 최소 간격 (초)
+        """
+        self.vdos_db_path = vdos_db_path
+        self.check_interval = check_interval
+
+        self._lock = threading.RLock()
+        self._signature: Optional[Tuple[float, float]] = None
+        self._last_check = 0.0
+        self._loaded = False
+
+        self._rooms: Dict[int, Tuple[str, bool]] = {}
+        self._room_members: Dict[int, List[str]] = {}
+        self._senders: Dict[str, SenderTimeline] = {}
+        self._emails: List[Tuple[str, str]] = []  # (소문자 이메일, 원본 이메일) people 테이블 순서
+        self._email_by_handle: Dict[str, Optional[str]] = {}
+
+        self.stats = {
+            "loads": 0,
+            "lookups": 0,
+            "load_ms": 0.0,
+        }
+
+    def _file_signature(self) -> Optional[Tuple[float, float]]:
+        """DB 파일과 WAL 파일의 mtime (WAL 모드에서는 체크포인트 전까지 본 파일이 안 바뀜)"""
+        try:
+            db_mtime = os.path.getmtime(self.vdos_db_path)
+        except OSError:
+            return None
+        try:
+            wal_mtime = os.path.getmtime(f"{self.vdos_db_path}-wal")
+        except OSError:
+            wal_mtime = 0.0
+        return (db_mtime, wal_mtime)
+
+    def ensure_fresh(self) -> bool:
+        """필요하면 스냅샷 (재)로드
+
+        Returns:
+            스냅샷 사용 가능 여부 (False면 호출 측이 SQL 조회로 폴백)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._loaded and now - self._last_check < self.check_interval:
+                return True
+            self._last_check = now
+
+            signature = self._file_signature()
+            if signature is None:
+                return False
+            if self._loaded and signature == self._signature:
+                return True
+
+            try:
+                self._load()
+            except Exception as e:
+                logger.warning(f"[VDOSChatSnapshot] 스냅샷 로드 실패 → SQL 조회 사용: {e}")
+                self._loaded = False
+                return False
+            self._signature = signature
+            return True
+
+    def _load(self):
+        """채팅방, 멤버, 발신자별 메시지, 이메일 목록 로드"""
+        started = time.perf_counter()
+        conn = sqlite3.connect(self.vdos_db_path)
+        try:
+            cur = conn.cursor()
+
+            cur.execute("SELECT id, name, is_dm FROM chat_rooms")
+            rooms = {room_id: (name, bool(is_dm)) for room_id, name, is_dm in cur.fetchall()}
+
+            room_members: Dict[int, List[str]] = {}
+            cur.execute("SELECT room_id, handle FROM chat_members")
+            for room_id, handle in cur.fetchall():
+                room_members.setdefault(room_id, []).append(handle)
+
+            # 채팅방이 있는 메시지만 (기존 JOIN chat_rooms 조회와 동일)
+            senders: Dict[str, SenderTimeline] = {}
+            undated: Dict[str, List[ChatMessageRef]] = {}
+            cur.execute("SELECT id, sender, body, sent_at, room_id FROM chat_messages ORDER BY id")
+            dated: Dict[str, List[Tuple[float, int, ChatMessageRef]]] = {}
+            for msg_id, sender, body, sent_at, room_id in cur.fetchall():
+                if room_id not in rooms:
+                    continue
+                ref = ChatMessageRef(msg_id, sender, body or "", sent_at, room_id)
+                timeline = senders.setdefault(sender, SenderTimeline())
+                timeline.latest = ref  # id 오름차순이므로 마지막이 최신
+                ts = parse_timestamp(sent_at)
+                if ts is None:
+                    undated.setdefault(sender, []).append(ref)
+                else:
+                    dated.setdefault(sender, []).append((ts, msg_id, ref))
+
+            for sender, entries in dated.items():
+                entries.sort(key=lambda entry: (entry[0], entry[1]))
+                timeline = senders[sender]
+                timeline.timestamps = [entry[0] for entry in entries]
+                timeline.messages = [entry[2] for entry in entries]
+
+            emails: List[Tuple[str, str]] = []
+            try:
+                cur.execute("SELECT email_address FROM people")
+                emails = [(email.lower(), email) for (email,) in cur.fetchall() if email]
+            except sqlite3.Error as e:
+                logger.debug(f"[VDOSChatSnapshot] people 테이블 조회 실패: {e}")
+        finally:
+            conn.close()
+
+        self._rooms = rooms
+        self._room_members = room_members
+        self._senders = senders
+        self._emails = emails
+        self._email_by_handle = {}
+        self._loaded = True
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats["loads"] += 1
+        self.stats["load_ms"] = round(elapsed_ms, 2)
+        message_count = sum(len(t.messages) for t in senders.values()) + sum(len(v) for v in undated.values())
+        logger.info(
+            f"[VDOSChatSnapshot] ✅ 로드 완료: 채팅방 {len(rooms)}개, 발신자 {len(senders)}명, "
+            f"메시지 {message_count}개 ({elapsed_ms:.0f}ms)"
+        )
+
+    def nearest_message(self, sender: str, message_date: str = None) -> Optional[ChatMessageRef]:
+        """발신자의 메시지 중 `message_date`와 가장 가까운 메시지 (날짜가 없으면 최신 메시지)"""
+        with self._lock:
+            self.stats["lookups"] += 1
+            timeline = self._senders.get(sender)
+        if timeline is None:
+            return None
+
+        target = parse_timestamp(message_date) if message_date else None
+        if target is None or not timeline.timestamps:
+            return timeline.latest
+
+        index = bisect.bisect_left(timeline.timestamps, target)
+        if index == 0:
+            return timeline.messages[0]
+        if index == len(timeline.timestamps):
+            return timeline.messages[-1]
+        before = target - timeline.timestamps[index - 1]
+        after = timeline.timestamps[index] - target
+        return timeline.messages[index - 1] if before <= after else timeline.messages[index]
+
+    def room_info(self, room_id: int) -> Optional[Tuple[str, bool]]:
+        """채팅방 (이름, DM 여부)"""
+        with self._lock:
+            return self._rooms.get(room_id)
+
+    def room_members(self, room_id: int) -> List[str]:
+        """채팅방 멤버 핸들 목록"""
+        with self._lock:
+            return list(self._room_members.get(room_id, ()))
+
+    def email_for_handle(self, handle: str) -> Optional[str]:
+        """채팅 핸들로 시작하는 첫 번째 이메일 (기존 `LIKE handle || '%'` 조회와 동일)"""
+        key = handle.replace('@', '')
+        with self._lock:
+            if key in self._email_by_handle:
+                return self._email_by_handle[key]
+            prefix = key.lower()
+            email = next((original for lowered, original in self._emails if lowered.startswith(prefix)), None)
+            self._email_by_handle[key] = email
+            return email
+
+    def get_stats(self) -> Dict:
+        """통계 정보 반환"""
+        return {
+            **self.stats,
+            "loaded": self._loaded,
+            "rooms": len(self._rooms),
+            "senders": len(self._senders),
+        }
+
+
+# DB 경로별 스냅샷 (여러 ChatProjectMatcher 인스턴스가 공유)
+_snapshots: Dict[str, VDOSChatSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_vdos_chat_snapshot(vdos_db_path: str) -> VDOSChatSnapshot:
+    """VDOS DB 경로별 스냅샷 인스턴스 반환"""
+    key = os.path.abspath(vdos_db_path)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = VDOSChatSnapshot(key)
+            _snapshots[key] = snapshot
+        return snapshot
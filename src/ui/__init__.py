@@ -1,10 +1,29 @@
 # -*- coding: utf-8 -*-
 """
 UI 패키지 - PyQt6 기반 사용자 인터페이스
+
+`src.ui.todo_panel` 등 하위 모듈을 임포트할 때 메인 윈도우 전체가 함께 로드되지 않도록
+공개 클래스는 처음 접근할 때 임포트합니다 (PEP 562).
 """
+import importlib
 
-from .main_window import SmartAssistantGUI
-from .settings_dialog import SettingsDialog
-from .todo_panel import TodoPanel
+_LAZY_EXPORTS = {
+    'SmartAssistantGUI': '.main_window',
+    'SettingsDialog': '.settings_dialog',
+    'TodoPanel': '.todo_panel',
+}
 
 __all__ = ['SmartAssistantGUI', 'SettingsDialog', 'TodoPanel']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -3,5 +3,6 @@
 UI 다이얼로그 모듈
 """
 from .top3_rule_dialog import Top3RuleDialog, Top3NaturalRuleDialog
+from .performance_dialog import PerformanceDialog
 
-__all__ = ['Top3RuleDialog', 'Top3NaturalRuleDialog']
+__all__ = ['Top3RuleDialog', 'Top3NaturalRuleDialog', 'PerformanceDialog']
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+성능 다이얼로그
+
+최근 분석 실행의 단계별 소요 시간, 프로젝트 태깅 큐 길이, 캐시 적중률,
+LLM 지연 시간 백분위와 샘플링 프로파일 결과를 한 화면에 표시합니다.
+사용자 PC에서 느려질 때 디버그 로그 없이 원인을 좁히기 위한 패널입니다.
+"""
+import logging
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QWidget
+)
+from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtGui import QFont, QDesktopServices
+
+from src.services.llm_client import LLMClient
+from src.utils.sampling_profiler import get_sampling_profiler
+from src.utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_MS = 2000
+
+
+class PerformanceDialog(QDialog):
+    """성능 다이얼로그
+
+    열려 있는 동안 2초마다 통계를 갱신합니다.
+    """
+
+    def __init__(self, top3_service=None, persona_cache_service=None, parent: Optional[QWidget] = None):
+        """PerformanceDialog 초기화
+
+        Args:
+            top3_service: Top3Service 인스턴스 (Top3 캐시 적중률)
+            persona_cache_service: PersonaTodoCacheService 인스턴스 (페르소나 캐시 적중률)
+            parent: 부모 위젯 (선택적)
+        """
+        super().__init__(parent)
+        self.top3_service = top3_service
+        self.persona_cache_service = persona_cache_service
+
+        self.setWindowTitle("성능")
+        self.setMinimumSize(820, 620)
+
+        self._setup_ui()
+        self.refresh()
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_INTERVAL_MS)
+
+    def _setup_ui(self) -> None:
+        """UI 구성"""
+        layout = QVBoxLayout(self)
+
+        # 헤더
+        header_layout = QHBoxLayout()
+        title_label = QLabel("⚡ 성능 대시보드")
+        title_font = QFont()
+        title_font.setPointSize(12)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+
+        self.profiler_checkbox = QCheckBox("샘플링 프로파일러 사용")
+        self.profiler_checkbox.setToolTip("분석 실행/TODO 새로고침 중 호출 스택을 샘플링해 data/profiles/에 저장합니다")
+        self.profiler_checkbox.setChecked(get_sampling_profiler().enabled)
+        self.profiler_checkbox.toggled.connect(self._on_profiler_toggled)
+        header_layout.addWidget(self.profiler_checkbox)
+        layout.addLayout(header_layout)
+
+        # 현재 상태 (큐/캐시/LLM)
+        status_group = QGroupBox("현재 상태")
+        status_layout = QGridLayout(status_group)
+        self._status_labels: Dict[str, QLabel] = {}
+        for row, (key, caption) in enumerate([
+            ("tag_queue", "프로젝트 태깅 큐"),
+            ("top3_cache", "Top3 캐시 적중률"),
+            ("persona_cache", "페르소나 캐시 적중률"),
+            ("llm_latency", "LLM 지연 시간"),
+        ]):
+            status_layout.addWidget(QLabel(caption), row, 0)
+            value_label = QLabel("-")
+            value_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            status_layout.addWidget(value_label, row, 1)
+            self._status_labels[key] = value_label
+        status_layout.setColumnStretch(1, 1)
+        layout.addWidget(status_group)
+
+        # 최근 분석 실행 (단계별 소요 시간)
+        runs_group = QGroupBox("최근 분석 실행")
+        runs_layout = QVBoxLayout(runs_group)
+        self.runs_table = self._create_table(["시작", "실행", "총 시간", "단계별 시간", "LLM 호출/토큰"])
+        runs_layout.addWidget(self.runs_table)
+        layout.addWidget(runs_group, 2)
+
+        # 최근 프로파일
+        profiles_group = QGroupBox("최근 프로파일")
+        profiles_layout = QVBoxLayout(profiles_group)
+        self.profiles_table = self._create_table(["시작", "세션", "시간", "샘플", "상위 함수"])
+        profiles_layout.addWidget(self.profiles_table)
+        layout.addWidget(profiles_group, 1)
+
+        # 하단 버튼
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        open_btn = QPushButton("📂 프로파일 폴더")
+        open_btn.clicked.connect(self._open_profile_dir)
+        button_layout.addWidget(open_btn)
+
+        refresh_btn = QPushButton("🔄 새로고침")
+        refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_btn)
+
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+
+    def _create_table(self, headers: List[str]) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setAlternatingRowColors(True)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        header = table.horizontalHeader()
+        for column in range(len(headers)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(len(headers) - 2, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        """통계 다시 읽기"""
+        try:
+            self._refresh_status()
+            self._refresh_runs()
+            self._refresh_profiles()
+        except Exception as e:
+            logger.warning(f"⚠️ 성능 통계 갱신 실패: {e}")
+
+    def _refresh_status(self) -> None:
+        from src.services.async_project_tag_service import get_async_project_tag_service
+
+        tag_service = get_async_project_tag_service()
+        if tag_service is not None:
+            stats = tag_service.get_stats()
+            self._status_labels["tag_queue"].setText(
+                f"대기 {stats.get('queue_size', 0)}개 | 처리 {stats.get('processed', 0)}개 "
+                f"(캐시 {stats.get('cached', 0)}, 분석 {stats.get('analyzed', 0)}, 배치 {stats.get('batches', 0)}) | "
+                f"오류 {stats.get('errors', 0)} | {'실행 중' if stats.get('is_running') else '정지'}"
+            )
+        else:
+            self._status_labels["tag_queue"].setText("서비스 없음")
+
+        top3_stats = self.top3_service.get_cache_stats() if self.top3_service is not None else {}
+        if top3_stats:
+            self._status_labels["top3_cache"].setText(
+                f"{top3_stats.get('hit_rate', 0.0):.1f}% "
+                f"(히트 {top3_stats.get('hit_count', 0)} / 요청 {top3_stats.get('total_requests', 0)}, "
+                f"델타 재사용 {top3_stats.get('delta_reuse', 0)})"
+            )
+        else:
+            self._status_labels["top3_cache"].setText("아직 LLM 선정 없음")
+
+        if self.persona_cache_service is not None:
+            stats = self.persona_cache_service.get_stats()
+            self._status_labels["persona_cache"].setText(
+                f"{stats.get('hit_rate', 0.0):.1%} "
+                f"(히트 {stats.get('hits', 0)}, 미스 {stats.get('misses', 0)}, 디스크 {stats.get('disk_hits', 0)}) | "
+                f"{stats.get('current_cache_size', 0)}/{stats.get('max_cache_size', 0)}개, "
+                f"{stats.get('memory_bytes', 0) / (1024 * 1024):.1f}MB"
+            )
+        else:
+            self._status_labels["persona_cache"].setText("서비스 없음")
+
+        latency = LLMClient.get_latency_stats()
+        if latency.get("count"):
+            self._status_labels["llm_latency"].setText(
+                f"p50 {latency['p50']:.0f}ms | p90 {latency['p90']:.0f}ms | "
+                f"p99 {latency['p99']:.0f}ms | 최대 {latency['max']:.0f}ms (최근 {latency['count']}회)"
+            )
+        else:
+            self._status_labels["llm_latency"].setText("호출 기록 없음")
+
+    def _refresh_runs(self) -> None:
+        runs = get_tracer().recent_runs(10)
+        self.runs_table.setRowCount(len(runs))
+        for row, run in enumerate(runs):
+            stages = ", ".join(f"{name} {ms:.0f}ms" for name, ms in run.get("stages", {}).items())
+            counters = run.get("counters", {})
+            llm_text = f"{int(counters.get('llm.calls', 0))}회 / {int(counters.get('llm.tokens', 0))}"
+            values = [
+                run.get("started_at", "").replace("T", " "),
+                run.get("name", ""),
+                f"{run.get('duration_ms', 0) / 1000:.1f}초",
+                stages,
+                llm_text,
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if run.get("status") == "error":
+                    item.setForeground(Qt.GlobalColor.red)
+                self.runs_table.setItem(row, column, item)
+
+    def _refresh_profiles(self) -> None:
+        profiles = get_sampling_profiler().recent_profiles(10)
+        self.profiles_table.setRowCount(len(profiles))
+        for row, profile in enumerate(profiles):
+            top = ", ".join(f"{name} {count}" for name, count in profile.get("top_functions", [])[:3])
+            values = [
+                profile.get("started_at", "").replace("T", " "),
+                profile.get("name", ""),
+                f"{profile.get('duration_ms', 0):.0f}ms",
+                str(profile.get("samples", 0)),
+                top,
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if profile.get("files"):
+                    item.setToolTip("\n".join(profile["files"]))
+                self.profiles_table.setItem(row, column, item)
+
+    # ------------------------------------------------------------------
+    # 이벤트
+    # ------------------------------------------------------------------
+    def _on_profiler_toggled(self, checked: bool) -> None:
+        get_sampling_profiler().enabled = checked
+        logger.info(f"🔬 샘플링 프로파일러 {'활성화' if checked else '비활성화'}")
+
+    def _open_profile_dir(self) -> None:
+        output_dir = get_sampling_profiler().output_dir
+        if output_dir is None:
+            return
+        output_dir.mkdir(parents=True, exist_ok=True)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(output_dir)))
+
+    def done(self, result: int) -> None:
+        self._timer.stop()
+        super().done(result)
@@ -3,5 +3,6 @@
 UI 헬퍼 모듈
 """
 from .wrap_helper import WrapHelper
+from .coalescing_dispatcher import CoalescingDispatcher
 
-__all__ = ['WrapHelper']
+__all__ = ['WrapHelper', 'CoalescingDispatcher']
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 워커 이벤트 병합 전달기
+
+워커 스레드에서 발생하는 잦은 이벤트(프로젝트 태그 분석 결과, 폴링 결과,
+배치 요약 진행 상황 등)를 채널별로 버퍼링했다가, GUI 스레드에서
+최대 `interval_ms`마다 한 번씩 묶어서 전달합니다.
+이벤트가 몰려도 메인 스레드 이벤트 큐에는 주기당 하나의 깨우기 이벤트만 쌓입니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingDispatcher(QObject):
+    """채널별 이벤트를 모아 일정 주기로 GUI 스레드에 일괄 전달
+
+    Signals:
+        flushed: (channel, payloads) - 주기마다 채널별로 한 번 발생
+    """
+
+    flushed = pyqtSignal(str, list)
+    _wake = pyqtSignal()
+
+    def __init__(self, interval_ms: int = 100, parent: Optional[QObject] = None) -> None:
+        """
+        Args:
+            interval_ms: 최소 전달 간격 (밀리초, 기본값: 100)
+            parent: 부모 QObject (GUI 스레드 소속이어야 함)
+        """
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, List[Any]] = {}
+        self._handlers: Dict[str, Callable[[List[Any]], None]] = {}
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        # 다른 스레드에서 emit되면 큐 연결로 GUI 스레드에서 실행됨
+        self._wake.connect(self._schedule_flush)
+
+        self.stats = {
+            "posted": 0,
+            "flushes": 0,
+            "max_batch": 0,
+        }
+
+    def register(self, channel: str, handler: Callable[[List[Any]], None]) -> None:
+        """채널 핸들러 등록 (GUI 스레드에서 payload 리스트로 호출됨)"""
+        self._handlers[channel] = handler
+
+    def post(self, channel: str, payload: Any) -> None:
+        """이벤트 추가 (모든 스레드에서 호출 가능)"""
+        with self._lock:
+            self._buffers.setdefault(channel, []).append(payload)
+            self.stats["posted"] += 1
+            wake = not self._pending
+            self._pending = True
+        if wake:
+            self._wake.emit()
+
+    def poster(self, channel: str) -> Callable[..., None]:
+        """시그널/콜백에 바로 연결할 수 있는 post 함수 반환
+
+        인자가 하나면 그대로, 여러 개면 튜플로 버퍼에 추가합니다.
+        """
+        def _post(*args: Any) -> None:
+            self.post(channel, args[0] if len(args) == 1 else args)
+        return _post
+
+    def async_poster(self, channel: str) -> Callable[..., Any]:
+        """`await callback(...)` 형태로 호출되는 콜백용 post 함수 반환
+
+        예: `MessageSummarizer.batch_summarize(batch_callback=...)`
+        """
+        post = self.poster(channel)
+
+        async def _post(*args: Any) -> None:
+            post(*args)
+        return _post
+
+    def _schedule_flush(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """버퍼를 비우고 채널별로 한 번씩 전달 (GUI 스레드)"""
+        with self._lock:
+            buffers = self._buffers
+            self._buffers = {}
+            self._pending = False
+
+        if not buffers:
+            return
+
+        self.stats["flushes"] += 1
+        for channel, payloads in buffers.items():
+            if not payloads:
+                continue
+            self.stats["max_batch"] = max(self.stats["max_batch"], len(payloads))
+            handler = self._handlers.get(channel)
+            if handler:
+                try:
+                    handler(payloads)
+                except Exception as e:
+                    logger.error(f"[CoalescingDispatcher] '{channel}' 핸들러 오류: {e}", exc_info=True)
+            self.flushed.emit(channel, payloads)
+
+    def pending_count(self) -> int:
+        """아직 전달되지 않은 이벤트 수"""
+        with self._lock:
+            return sum(len(items) for items in self._buffers.values())
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 정보 반환"""
+        return {**self.stats, "pending": self.pending_count()}
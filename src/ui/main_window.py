@@ -61,29 +61,24 @@ sys.path.insert(0, str(project_root))
 from main import SmartAssistant, DEFAULT_DATASET_ROOT
 from .todo_panel import TodoPanel   # ✅ TodoPanel 사용
 from .time_range_selector import TimeRangeSelector  # ✅ TimeRangeSelector 추가
-from .message_summary_panel import MessageSummaryPanel  # ✅ MessageSummaryPanel 추가
-from .message_detail_dialog import MessageDetailDialog  # ✅ MessageDetailDialog 추가
-from .email_panel import EmailPanel  # ✅ EmailPanel 추가
-from .analysis_result_panel import AnalysisResultPanel  # ✅ AnalysisResultPanel 추가
+# 메시지/이메일/분석 탭 패널과 다이얼로그는 처음 필요할 때 임포트 (시작 시간 단축)
 from .styles import Colors, Fonts, FontSizes, FontWeights, Spacing, BorderRadius
 from utils.datetime_utils import parse_iso_datetime  # ✅ 날짜 파싱 유틸리티
 from .main_window_components import (
     VirtualOfficeConnectionController,
     DataRefreshController,
     AnalysisCacheController,
+    StartupBootstrapper,
+    PersonaPrefetchController,
 )
 
 # 분리된 패널 import
 from .panels import LeftControlPanel, VirtualOfficePanel
 
-# 분리된 다이얼로그 import
-from .dialogs.summary_dialog import SummaryDialog
-
 # 분리된 위젯 및 헬퍼 import
 from .widgets import WorkerThread
-
-# 서비스 import
-from src.services import WeatherService
+from .helpers import CoalescingDispatcher
+from src.utils.sampling_profiler import profiled
 
 # VirtualOffice 연동 관련 import
 from src.integrations.virtualoffice_client import VirtualOfficeClient
@@ -93,7 +88,6 @@ from src.integrations.simulation_monitor import SimulationMonitor
 
 # 시각적 알림 관련 import
 from .visual_notification import NotificationManager, VisualNotification
-from .tick_history_dialog import TickHistoryDialog
 
 def _init_todo_schema(conn: sqlite3.Connection):
     cur = conn.cursor()
@@ -288,10 +282,12 @@ class SmartAssistantGUI(QMainWindow):
         self._message_summary_cache: Dict[tuple, List[Dict]] = {}
     
     def _init_services(self):
-        """서비스 초기화"""
-        # 날씨 서비스
-        kma_api_key = os.environ.get("KMA_API_KEY")
-        self.weather_service = WeatherService(kma_api_key=kma_api_key)
+        """서비스 초기화
+
+        첫 화면에 필요 없는 서비스(날씨 등)는 처음 사용할 때 생성합니다.
+        """
+        # 날씨 서비스 (lazy: weather_service 프로퍼티)
+        self._weather_service = None
         
         # VDOS 통합 서비스
         self.vdos_service = VDOSIntegrationService()
@@ -311,6 +307,14 @@ class SmartAssistantGUI(QMainWindow):
             self.assistant, self.time_filter_service
         )
     
+    @property
+    def weather_service(self):
+        """WeatherService (처음 접근 시 생성)"""
+        if self._weather_service is None:
+            from src.services.weather_service import WeatherService
+            self._weather_service = WeatherService(kma_api_key=os.environ.get("KMA_API_KEY"))
+        return self._weather_service
+    
     def _init_virtualoffice_attributes(self):
         """VirtualOffice 관련 속성 초기화"""
         self.vo_client: Optional[VirtualOfficeClient] = None
@@ -337,13 +341,24 @@ class SmartAssistantGUI(QMainWindow):
         self._cache_valid_until: Dict[str, float] = {}
         self._persona_first_load: Dict[str, bool] = {}  # 페르소나별 첫 로드 추적
         
-        # 새로운 캐시 서비스
+        # 새로운 캐시 서비스 (디스크 스냅샷으로 재시작 후에도 유지)
+        from src.config.settings import PERSONA_TODO_CACHE_CONFIG
         from src.services.persona_todo_cache_service import PersonaTodoCacheService
-        self._cache_service = PersonaTodoCacheService(max_cache_size=10)
+        cache_config = PERSONA_TODO_CACHE_CONFIG
+        self._cache_service = PersonaTodoCacheService(
+            max_cache_size=cache_config["max_entries"],
+            max_memory_bytes=cache_config["max_memory_mb"] * 1024 * 1024,
+            db_path=cache_config["db_path"] if cache_config["persistent"] else None,
+            max_disk_bytes=cache_config["max_disk_mb"] * 1024 * 1024,
+        )
         
         # 캐시 관련 상태 변수
         self._current_persona_id: Optional[str] = None
-        self._current_data_version: str = "0"  # 틱 번호 또는 타임스탬프
+        # 틱 번호 또는 타임스탬프 (마지막 실행 시 틱을 복원해 같은 틱이면 디스크 캐시 재사용)
+        self._current_data_version: str = self._cache_service.last_data_version() or "0"
+        
+        # 최근 전환 페르소나 백그라운드 선분석 (유휴 시간에 캐시 채움)
+        self.prefetch_controller = PersonaPrefetchController(self)
         
         logger.info("✅ 캐시 시스템 초기화 완료")
     
@@ -355,14 +370,24 @@ class SmartAssistantGUI(QMainWindow):
         self._progress_bar = None
         self._progress_label = None
         self._widgets_registered = False  # 위젯 등록 여부 추적
+        
+        # 워커 이벤트 병합 전달기 (폴링 결과를 100ms 단위로 묶어 한 번에 처리)
+        self.event_dispatcher = CoalescingDispatcher(interval_ms=100, parent=self)
+        self.event_dispatcher.register("new_data", self._on_coalesced_new_data)
     
     def _finalize_initialization(self):
-        """초기화 완료"""
+        """초기화 완료
+
+        셸 UI만 동기적으로 구성하고, 저장된 TODO 로드 → VirtualOffice 상태 조회 →
+        분석 시작은 StartupBootstrapper가 창 표시 이후 단계별로 진행합니다.
+        """
         self.init_ui()
         self.setup_timers()
         self.initialize_online_state()
         self._load_vo_config()
         QTimer.singleShot(1000, self._update_connection_status)
+        self.bootstrapper = StartupBootstrapper(self)
+        self.bootstrapper.start()
 
     
     def init_ui(self):
@@ -480,6 +505,7 @@ class SmartAssistantGUI(QMainWindow):
     
     def _show_summary_popup(self, title: str, text: str) -> None:
         """요약 다이얼로그 표시"""
+        from .dialogs.summary_dialog import SummaryDialog
         dialog = SummaryDialog(title, text, self)
         dialog.exec()
 
@@ -675,7 +701,8 @@ class SmartAssistantGUI(QMainWindow):
         # ✅ TODO 탭: TodoPanel 그대로 붙이기
         self.todo_tab = QWidget()
         todo_layout = QVBoxLayout(self.todo_tab)
-        self.todo_panel = TodoPanel(db_path=TODO_DB_PATH, parent=self)
+        # 오래된 TODO 정리는 시작 단계 워커에서 수행
+        self.todo_panel = TodoPanel(db_path=TODO_DB_PATH, parent=self, cleanup_on_start=False)
         # Top3 서비스 전달 (VDOS 연동됨)
         if hasattr(self.todo_panel, "set_top3_service_instance"):
             self.todo_panel.set_top3_service_instance(self.top3_service)
@@ -685,13 +712,101 @@ class SmartAssistantGUI(QMainWindow):
         todo_layout.addWidget(self.todo_panel)
         self.tab_widget.addTab(self.todo_tab, "📋 TODO 리스트")
 
-        # ✅ 메시지/이메일/분석 탭
+        # ✅ 메시지/이메일/분석 탭 (빈 탭만 만들고 패널은 처음 열거나 접근할 때 생성)
+        self._lazy_tabs: Dict[str, tuple] = {}
+        self._lazy_panels: Dict[str, QWidget] = {}
         self.message_tab = self.create_message_tab(); self.tab_widget.addTab(self.message_tab, "📨 메시지")
         self.email_tab = self.create_email_tab(); self.tab_widget.addTab(self.email_tab, "📧 이메일")
         self.analysis_tab = self.create_analysis_tab(); self.tab_widget.addTab(self.analysis_tab, "📊 분석 결과")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(self.tab_widget)
         return panel
+
+    def _register_lazy_tab(self, attr: str, factory, margins: bool = True) -> QWidget:
+        """패널 생성을 미루는 탭 컨테이너 등록
+
+        Args:
+            attr: 패널 속성 이름 (예: "email_panel")
+            factory: 패널을 생성해 반환하는 함수
+            margins: False면 탭 레이아웃 여백 제거
+        """
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        if not margins:
+            layout.setContentsMargins(0, 0, 0, 0)
+        self._lazy_tabs[attr] = (tab, factory)
+        return tab
+
+    def _materialize_panel(self, attr: str) -> QWidget:
+        """지연 탭 패널을 (필요하면 생성하여) 반환"""
+        panel = self._lazy_panels.get(attr)
+        if panel is None:
+            tab, factory = self._lazy_tabs[attr]
+            started = time.perf_counter()
+            panel = factory()
+            tab.layout().addWidget(panel)
+            self._lazy_panels[attr] = panel
+            logger.debug(f"[MainWindow] {attr} 생성 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+            self._populate_lazy_panel(attr, panel)
+        return panel
+
+    def is_panel_created(self, attr: str) -> bool:
+        """지연 탭 패널이 이미 생성되었는지 확인 (hasattr와 달리 패널을 생성하지 않음)"""
+        return attr in self.__dict__.get("_lazy_panels", {})
+
+    def _populate_lazy_panel(self, attr: str, panel: QWidget) -> None:
+        """처음 생성된 패널에 현재 데이터 채우기
+
+        패널이 없는 동안에는 업데이트를 건너뛰므로, 생성 시점에 최신 상태를 한 번 반영합니다.
+        """
+        try:
+            messages = list(getattr(self, "collected_messages", None) or [])
+            if self._widgets_registered and attr in ("message_summary_panel", "email_panel"):
+                self.notification_manager.register_widget(panel, "visual")
+
+            if attr == "email_panel":
+                if not messages:
+                    return
+                todo_items = []
+                if hasattr(self, 'todo_panel') and hasattr(self.todo_panel, 'repository'):
+                    try:
+                        todo_items = self.todo_panel.repository.fetch_active()
+                    except Exception as e:
+                        logger.warning(f"TODO 아이템 가져오기 실패: {e}")
+                panel.update_emails([m for m in messages if m.get("type") == "email"], todo_items)
+            elif attr == "message_summary_panel":
+                if messages:
+                    self._update_message_summaries("day")
+            elif attr == "analysis_result_panel":
+                if getattr(self, "analysis_results", None):
+                    panel.update_analysis(
+                        self.analysis_results,
+                        messages,
+                        getattr(self, '_current_persona_ids', []),
+                    )
+        except Exception as e:
+            logger.warning(f"⚠️ {attr} 초기 데이터 반영 실패: {e}")
+
+    def _on_tab_changed(self, index: int) -> None:
+        """탭을 처음 열 때 해당 패널 생성"""
+        tab = self.tab_widget.widget(index)
+        for attr, (lazy_tab, _factory) in self._lazy_tabs.items():
+            if lazy_tab is tab:
+                self._materialize_panel(attr)
+                break
+
+    @property
+    def message_summary_panel(self):
+        return self._materialize_panel("message_summary_panel")
+
+    @property
+    def email_panel(self):
+        return self._materialize_panel("email_panel")
+
+    @property
+    def analysis_result_panel(self):
+        return self._materialize_panel("analysis_result_panel")
     
     def create_todo_tab(self):
         tab = QWidget()
@@ -880,41 +995,32 @@ class SmartAssistantGUI(QMainWindow):
         self.weather_tip_label.setText(result.get("tip", "날씨 팁을 불러오지 못했습니다."))
     
     def create_message_tab(self):
-        """메시지 탭 생성 - MessageSummaryPanel 사용"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # ✅ MessageSummaryPanel 사용
-        self.message_summary_panel = MessageSummaryPanel()
-        self.message_summary_panel.summary_unit_changed.connect(self._on_summary_unit_changed)
-        self.message_summary_panel.summary_card_clicked.connect(self._on_summary_card_clicked)
-        self.message_summary_panel.sender_badge_clicked.connect(self._on_summary_sender_clicked)
-        layout.addWidget(self.message_summary_panel)
+        """메시지 탭 생성 - MessageSummaryPanel 사용 (지연 생성)"""
+        def factory():
+            from .message_summary_panel import MessageSummaryPanel
+            panel = MessageSummaryPanel()
+            panel.summary_unit_changed.connect(self._on_summary_unit_changed)
+            panel.summary_card_clicked.connect(self._on_summary_card_clicked)
+            panel.sender_badge_clicked.connect(self._on_summary_sender_clicked)
+            return panel
         
-        return tab
+        return self._register_lazy_tab("message_summary_panel", factory)
     
     def create_email_tab(self):
-        """이메일 탭 생성 - EmailPanel 사용"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        """이메일 탭 생성 - EmailPanel 사용 (지연 생성)"""
+        def factory():
+            from .email_panel import EmailPanel
+            return EmailPanel()
         
-        # ✅ EmailPanel 사용
-        self.email_panel = EmailPanel()
-        layout.addWidget(self.email_panel)
-        
-        return tab
+        return self._register_lazy_tab("email_panel", factory)
     
     def create_analysis_tab(self):
-        """분석 결과 탭 생성 - AnalysisResultPanel 사용"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # ✅ AnalysisResultPanel 사용
-        self.analysis_result_panel = AnalysisResultPanel()
-        layout.addWidget(self.analysis_result_panel)
+        """분석 결과 탭 생성 - AnalysisResultPanel 사용 (지연 생성)"""
+        def factory():
+            from .analysis_result_panel import AnalysisResultPanel
+            return AnalysisResultPanel()
         
-        return tab
+        return self._register_lazy_tab("analysis_result_panel", factory, margins=False)
 
     def _apply_status_style(self):
         """상태 스타일 적용 (LeftControlPanel에 위임)"""
@@ -949,6 +1055,12 @@ class SmartAssistantGUI(QMainWindow):
         exit_action = file_menu.addAction("종료")
         exit_action.triggered.connect(self.close)
         
+        # 도구 메뉴
+        tools_menu = menubar.addMenu("도구")
+        
+        performance_action = tools_menu.addAction("성능...")
+        performance_action.triggered.connect(self.show_performance_dialog)
+        
         # 도움말 메뉴
         help_menu = menubar.addMenu("도움말")
         
@@ -1089,7 +1201,7 @@ class SmartAssistantGUI(QMainWindow):
         """
         try:
             # 이메일 패널 업데이트 (TODO 아이템 포함)
-            if hasattr(self, 'email_panel'):
+            if self.is_panel_created('email_panel'):
                 email_messages = [m for m in filtered_messages if m.get("type") == "email"]
                 # repository를 통해 TODO 아이템 가져오기
                 todo_items = []
@@ -1101,11 +1213,11 @@ class SmartAssistantGUI(QMainWindow):
                 self.email_panel.update_emails(email_messages, todo_items)
             
             # 메시지 요약 패널 업데이트
-            if hasattr(self, 'message_summary_panel'):
+            if self.is_panel_created('message_summary_panel'):
                 self._update_message_summaries("day")
             
             # 분석 결과 패널 업데이트
-            if hasattr(self, 'analysis_result_panel') and hasattr(self, 'analysis_results'):
+            if self.is_panel_created('analysis_result_panel') and hasattr(self, 'analysis_results'):
                 # 현재 페르소나의 sender IDs 전달 (이메일과 채팅 핸들 모두)
                 current_persona_ids = getattr(self, '_current_persona_ids', [])
                 self.analysis_result_panel.update_analysis(
@@ -1204,6 +1316,7 @@ class SmartAssistantGUI(QMainWindow):
             summary_with_label["period_label"] = self._format_summary_period_label(summary)
             summary_with_label["statistics_summary"] = self._compose_statistics_text(messages, filter_sender)
 
+            from .message_detail_dialog import MessageDetailDialog
             dialog = MessageDetailDialog(summary_with_label, messages, self)
             dialog.exec()
 
@@ -1326,7 +1439,7 @@ class SmartAssistantGUI(QMainWindow):
 
         if not messenger_messages:
             logger.info("ℹ️ 메신저 메시지가 없어 요약을 생성하지 않습니다. (이메일 %d건)", email_count)
-            if hasattr(self, "message_summary_panel"):
+            if self.is_panel_created("message_summary_panel"):
                 self.message_summary_panel.show_message_count(0, email_count)
             return
 
@@ -1348,7 +1461,7 @@ class SmartAssistantGUI(QMainWindow):
         cached_summaries = self._message_summary_cache.get(cache_key)
         if cached_summaries:
             logger.info("🗂️ 메시지 요약 캐시 히트: unit=%s, entries=%d", unit, len(cached_summaries))
-            if hasattr(self, "message_summary_panel"):
+            if self.is_panel_created("message_summary_panel"):
                 self.message_summary_panel.display_summaries(cached_summaries)
             return
 
@@ -1380,9 +1493,45 @@ class SmartAssistantGUI(QMainWindow):
             except Exception:
                 continue
         
+        # 영구 캐시: 구성 메시지/우선순위 지문이 그대로인 그룹(지난 기간)은 저장된 요약 사용
+        persona_key = self._current_persona_id or "unknown"
+        fingerprints: Dict[str, str] = {}
+        cached_groups: Dict[str, Dict] = {}
+        group_cache = None
+        try:
+            from ..services.group_summary_cache_service import (
+                get_group_summary_cache_service,
+                group_fingerprint,
+            )
+            group_cache = get_group_summary_cache_service()
+            for period, messages in groups.items():
+                priorities = ",".join(sorted(
+                    f"{msg.get('msg_id')}={priority_lookup[msg.get('msg_id')]}"
+                    for msg in messages
+                    if msg.get("msg_id") in priority_lookup
+                ))
+                fingerprints[str(period)] = group_fingerprint(
+                    messages, extra=f"{virtual_dates_mtime}|{priorities}"
+                )
+            cached_groups = group_cache.get_many(persona_key, "panel", unit, fingerprints)
+        except Exception as e:
+            logger.warning(f"그룹 요약 캐시 사용 불가: {e}")
+            group_cache = None
+        if cached_groups:
+            logger.info(
+                "🗂️ 그룹 요약 영구 캐시: %d/%d개 재사용 (unit=%s)",
+                len(cached_groups), len(groups), unit,
+            )
+        new_groups: Dict[str, tuple] = {}
+        
         # 그룹별 요약 생성
         summaries = []
         for period, messages in groups.items():
+            cached_group = cached_groups.get(str(period))
+            if cached_group is not None:
+                summaries.append(cached_group)
+                continue
+            
             # 간단한 요약 생성
             key_points = self._extract_key_points(messages)
             brief_summary = self._generate_brief_summary(messages, key_points)
@@ -1435,11 +1584,16 @@ class SmartAssistantGUI(QMainWindow):
             summary_dict["sender_highlights"] = self._build_sender_highlights(messages, sender_priority_map, sender_message_map)
 
             summaries.append(summary_dict)
+            if str(period) in fingerprints:
+                new_groups[str(period)] = (fingerprints[str(period)], summary_dict)
+        
+        if group_cache is not None and new_groups:
+            group_cache.save_many(persona_key, "panel", unit, new_groups)
         
         self._message_summary_cache[cache_key] = summaries
 
         # MessageSummaryPanel에 표시
-        if hasattr(self, "message_summary_panel"):
+        if self.is_panel_created("message_summary_panel"):
             self.message_summary_panel.display_summaries(summaries)
     
     def _generate_brief_summary(self, messages: list, key_points: Optional[List[str]] = None) -> str:
@@ -1760,6 +1914,7 @@ class SmartAssistantGUI(QMainWindow):
         """수집 중지"""
         self.data_controller.stop_collection()
     
+    @profiled("gui_handle_result", all_threads=False)
     def handle_result(self, result):
         self.data_controller.handle_result(result)
 
@@ -1794,6 +1949,22 @@ class SmartAssistantGUI(QMainWindow):
         """결과 불러오기"""
         QMessageBox.information(self, "불러오기", "결과 불러오기 기능은 향후 구현될 예정입니다.")
     
+    def show_performance_dialog(self):
+        """성능 다이얼로그 표시 (모달리스, 열려 있으면 앞으로 가져옴)"""
+        from .dialogs import PerformanceDialog
+        
+        dialog = getattr(self, "_performance_dialog", None)
+        if dialog is None or not dialog.isVisible():
+            dialog = PerformanceDialog(
+                top3_service=getattr(self, "top3_service", None),
+                persona_cache_service=getattr(self, "_cache_service", None),
+                parent=self,
+            )
+            self._performance_dialog = dialog
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+    
     def show_about(self):
         """정보 표시"""
         QMessageBox.about(self, "Smart Assistant 정보",
@@ -1829,6 +2000,8 @@ class SmartAssistantGUI(QMainWindow):
             self.selected_persona = persona
             persona_key = self._build_persona_key(persona)
             self._current_persona_id = persona_key
+            # 전경 작업 우선: 선분석 중지 후 전환 기록
+            self.prefetch_controller.on_persona_switch(persona, persona_key)
             logger.info(f"페르소나 변경: {persona.name} ({persona.email_address})")
 
             # 페르소나 변경 시 기존 메시지 상태 초기화
@@ -1917,6 +2090,35 @@ class SmartAssistantGUI(QMainWindow):
     
     # on_data_source_changed 메서드 제거 (VirtualOffice 전용으로 변경)
     
+    def _connect_polling_worker(self, worker: PollingWorker) -> None:
+        """PollingWorker 시그널 연결
+        
+        새 데이터는 워커 스레드에서 바로 병합 전달기에 쌓이고,
+        GUI 스레드에서는 주기당 한 번 `_on_coalesced_new_data`로 처리된다.
+        """
+        worker.new_data_received.connect(
+            self.event_dispatcher.poster("new_data"),
+            Qt.ConnectionType.DirectConnection,
+        )
+        worker.error_occurred.connect(self.on_polling_error)
+    
+    def _on_coalesced_new_data(self, payloads: List[dict]) -> None:
+        """병합 전달기에서 모인 폴링 결과를 하나로 합쳐 처리"""
+        if len(payloads) == 1:
+            self.on_new_data_received(payloads[0])
+            return
+        
+        merged = {"emails": [], "messages": [], "all_messages": [], "timestamp": ""}
+        for data in payloads:
+            emails = data.get("emails", [])
+            messages = data.get("messages", [])
+            merged["emails"].extend(emails)
+            merged["messages"].extend(messages)
+            merged["all_messages"].extend(data.get("all_messages", emails + messages))
+            merged["timestamp"] = data.get("timestamp") or merged["timestamp"]
+        logger.info(f"📬 폴링 결과 {len(payloads)}건 병합 처리")
+        self.on_new_data_received(merged)
+    
     def on_new_data_received(self, data: dict):
         """새 데이터 수신 핸들러 (점진적 UI 업데이트)"""
         try:
@@ -2121,21 +2323,21 @@ class SmartAssistantGUI(QMainWindow):
         
         # 위젯 등록 (최초 1회만)
         if not self._widgets_registered:
-            if hasattr(self, 'message_summary_panel'):
+            if self.is_panel_created('message_summary_panel'):
                 self.notification_manager.register_widget(self.message_summary_panel, "visual")
-            if hasattr(self, 'email_panel'):
+            if self.is_panel_created('email_panel'):
                 self.notification_manager.register_widget(self.email_panel, "visual")
             self._widgets_registered = True
         
         # 메시지 요약 패널 업데이트
-        if hasattr(self, 'message_summary_panel'):
+        if self.is_panel_created('message_summary_panel'):
             self.notification_manager.show_notification(self.message_summary_panel, duration_ms=300)
         
         if show_progress:
             self._update_progress_bar(70)
         
         # 이메일 패널 업데이트 (TODO 아이템 포함)
-        if hasattr(self, 'email_panel'):
+        if self.is_panel_created('email_panel'):
             email_messages = [m for m in self.collected_messages if m.get("type") == "email"]
             # repository를 통해 TODO 아이템 가져오기
             todo_items = []
@@ -2729,12 +2931,22 @@ class SmartAssistantGUI(QMainWindow):
         try:
             logger.info(f"⏰ Tick {tick} 진행됨")
             
-            # 데이터 버전 업데이트
-            self._current_data_version = str(tick)
+            # 틱 번호 + VDOS DB 식별자 (새 시뮬레이션의 같은 틱에서 이전 스냅샷을 쓰지 않도록)
+            from src.services.persona_todo_cache_service import dataset_identity, make_data_version
+            data_version = make_data_version(tick, dataset_identity(self.vdos_service.get_vdos_db_path()))
             
-            # 모든 캐시 무효화 (새 데이터 추가됨)
-            invalidated_count = self._cache_service.invalidate_all()
-            logger.info(f"🗑️ 틱 진행으로 전체 캐시 무효화: {invalidated_count}개")
+            if data_version == self._current_data_version:
+                # 재시작 후 첫 폴링: 마지막 실행과 같은 데이터셋의 같은 틱이면 캐시 유지
+                logger.info(f"♻️ 이전 실행과 같은 틱({tick}) - 캐시 유지")
+            else:
+                # 데이터 버전 업데이트
+                self._current_data_version = data_version
+                self._cache_service.set_data_version(self._current_data_version)
+                
+                # 메모리 캐시 무효화 (새 데이터 추가됨)
+                # 디스크 스냅샷은 틱이 키에 포함되어 있어 이전 틱 결과가 조회되지 않음
+                invalidated_count = self._cache_service.invalidate_all(keep_persisted=True)
+                logger.info(f"🗑️ 틱 진행으로 전체 캐시 무효화: {invalidated_count}개")
             
             # 상태바에 틱 진행 메시지 표시
             self.statusBar().showMessage(f"⏰ Tick {tick} 진행됨", 3000)
@@ -2786,6 +2998,7 @@ class SmartAssistantGUI(QMainWindow):
                 return
             
             # 다이얼로그 생성 및 표시
+            from .tick_history_dialog import TickHistoryDialog
             dialog = TickHistoryDialog(self)
             
             # 새로고침 버튼 동작 연결
@@ -2813,6 +3026,10 @@ class SmartAssistantGUI(QMainWindow):
     
     def closeEvent(self, event):
         """창 닫기 이벤트"""
+        # 진행 중인 시작 단계 취소
+        if getattr(self, "bootstrapper", None):
+            self.bootstrapper.cancel()
+        
         # WorkerThread 정리
         if self.worker_thread and self.worker_thread.isRunning():
             self.worker_thread.stop()
@@ -2835,6 +3052,14 @@ class SmartAssistantGUI(QMainWindow):
         if hasattr(self, 'todo_panel') and self.todo_panel:
             self.todo_panel.cleanup_async_services()
         
+        # 선분석 워커 정리
+        if getattr(self, "prefetch_controller", None):
+            self.prefetch_controller.close()
+        
+        # 페르소나 캐시 write-behind 저장 마무리
+        if getattr(self, "_cache_service", None):
+            self._cache_service.close()
+        
         event.accept()
     
     def _update_connection_status(self):
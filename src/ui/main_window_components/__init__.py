@@ -8,9 +8,13 @@
 from .connection_controller import VirtualOfficeConnectionController
 from .data_refresh_controller import DataRefreshController
 from .analysis_cache_controller import AnalysisCacheController
+from .startup_bootstrapper import StartupBootstrapper
+from .persona_prefetch_controller import PersonaPrefetchController
 
 __all__ = [
     "VirtualOfficeConnectionController",
     "DataRefreshController",
     "AnalysisCacheController",
+    "StartupBootstrapper",
+    "PersonaPrefetchController",
 ]
@@ -38,6 +38,10 @@ class AnalysisCacheController:
     # ------------------------------------------------------------------
     # 공개 API
     # ------------------------------------------------------------------
+    def is_busy(self) -> bool:
+        """메시지 수집/분석이 진행 중인지 여부"""
+        return self._collect_in_progress
+
     def start_quick_analysis(self, force: bool = False) -> None:
         """선택된 페르소나에 대해 빠른 분석을 시작한다.
 
@@ -238,7 +242,7 @@ class AnalysisCacheController:
                 analysis_results = result.get("analysis_results", [])
                 if analysis_results:
                     ui.analysis_results = analysis_results
-                    if hasattr(ui, "analysis_result_panel"):
+                    if ui.is_panel_created("analysis_result_panel"):
                         ui.analysis_result_panel.update_analysis(
                             analysis_results,
                             ui.collected_messages,
@@ -331,7 +335,7 @@ class AnalysisCacheController:
                 analysis_results = result.get("analysis_results") or []
                 if analysis_results:
                     ui.analysis_results = analysis_results
-                    if hasattr(ui, "analysis_result_panel"):
+                    if ui.is_panel_created("analysis_result_panel"):
                         ui.analysis_result_panel.update_analysis(
                             ui.analysis_results,
                             ui.collected_messages,
@@ -340,7 +344,7 @@ class AnalysisCacheController:
 
                 self._save_to_cache(items, ui.collected_messages, analysis_results)
                 self._update_cache_with_analysis_results(items, analysis_results)
-                if hasattr(ui, "message_summary_panel"):
+                if ui.is_panel_created("message_summary_panel"):
                     ui._update_message_summaries("day")
 
                 ui.status_message.setText(f"✅ 재분석 완료: TODO {len(items)}개")
@@ -410,7 +414,7 @@ class AnalysisCacheController:
 
             # 4. UI 패널 업데이트 (메시지 요약, 이메일, 분석 결과)
             # 메시지 요약 패널 업데이트 (collected_messages가 설정된 후)
-            if cached_result.messages and hasattr(ui, "message_summary_panel"):
+            if cached_result.messages and ui.is_panel_created("message_summary_panel"):
                 logger.info(f"📝 메시지 요약 패널 업데이트 시작 (메시지 {len(cached_result.messages)}개)")
                 # collected_messages가 설정되었는지 확인
                 if hasattr(ui, "collected_messages") and ui.collected_messages:
@@ -420,7 +424,7 @@ class AnalysisCacheController:
                     logger.warning("⚠️ collected_messages가 설정되지 않아 메시지 요약 패널 업데이트 건너뜀")
             
             # 이메일 패널 업데이트
-            if cached_result.messages and hasattr(ui, "email_panel"):
+            if cached_result.messages and ui.is_panel_created("email_panel"):
                 email_messages = [m for m in cached_result.messages if m.get("type") == "email"]
                 # TODO 아이템 가져오기 (필터링된 TODO)
                 todo_items = []
@@ -433,7 +437,7 @@ class AnalysisCacheController:
                 logger.info("📧 이메일 패널 업데이트 완료: %d개", len(email_messages))
             
             # 분석 결과 패널 업데이트
-            if hasattr(ui, "analysis_result_panel"):
+            if ui.is_panel_created("analysis_result_panel"):
                 # analysis_results가 설정되었는지 확인
                 analysis_results = getattr(ui, "analysis_results", None) or []
                 if analysis_results:
@@ -663,7 +667,7 @@ class AnalysisCacheController:
             analysis_results = cached_data.get("analysis_results", [])
             if analysis_results:
                 ui.analysis_results = analysis_results
-                if hasattr(ui, "analysis_result_panel"):
+                if ui.is_panel_created("analysis_result_panel"):
                     ui.analysis_result_panel.update_analysis(
                         ui.analysis_results,
                         messages,
@@ -907,8 +911,7 @@ class AnalysisCacheController:
                 current_tick, is_running = self._get_simulation_status()
                 polling_interval = 30 if is_running else 60
                 ui.polling_worker = PollingWorker(data_source, polling_interval=polling_interval)
-                ui.polling_worker.new_data_received.connect(ui.on_new_data_received)
-                ui.polling_worker.error_occurred.connect(ui.on_polling_error)
+                ui._connect_polling_worker(ui.polling_worker)
                 ui.polling_worker.start()
                 logger.info("✅ PollingWorker 시작됨 (폴링 간격: %d초)", polling_interval)
         except Exception as exc:  # pragma: no cover
@@ -927,12 +930,12 @@ class AnalysisCacheController:
         try:
             logger.info("🔄 UI 업데이트 시작: %d개 메시지", len(messages))
 
-            if hasattr(ui, "email_panel"):
+            if ui.is_panel_created("email_panel"):
                 email_messages = [m for m in messages if m.get("type") == "email"]
                 ui.email_panel.update_emails(email_messages)
                 logger.debug("이메일 패널 업데이트: %d개", len(email_messages))
 
-            if hasattr(ui, "message_summary_panel"):
+            if ui.is_panel_created("message_summary_panel"):
                 ui._update_message_summaries("day")
                 logger.debug("메시지 요약 패널 업데이트")
 
@@ -940,7 +943,7 @@ class AnalysisCacheController:
                 self._update_timeline_with_badges()
                 logger.debug("타임라인 업데이트")
 
-            if hasattr(ui, "analysis_result_panel") and hasattr(ui, "analysis_results"):
+            if ui.is_panel_created("analysis_result_panel") and hasattr(ui, "analysis_results"):
                 ui.analysis_result_panel.update_analysis(ui.analysis_results, messages)
                 logger.debug("분석 결과 패널 업데이트")
 
@@ -957,12 +960,12 @@ class AnalysisCacheController:
             except Exception as exc:  # pragma: no cover
                 logger.debug("TimeRangeSelector 데이터 범위 설정 오류: %s", exc)
 
-            if hasattr(ui, "email_panel"):
+            if ui.is_panel_created("email_panel"):
                 email_messages = [m for m in messages if m.get("type") == "email"]
                 ui.email_panel.update_emails(email_messages)
                 logger.debug("이메일 패널 업데이트: %d개", len(email_messages))
 
-            if hasattr(ui, "message_summary_panel"):
+            if ui.is_panel_created("message_summary_panel"):
                 ui._update_message_summaries("day")
                 logger.debug("메시지 요약 패널 업데이트")
 
@@ -970,7 +973,7 @@ class AnalysisCacheController:
                 self._update_timeline_with_badges()
                 logger.debug("타임라인 업데이트")
 
-            if hasattr(ui, "analysis_result_panel") and hasattr(ui, "analysis_results"):
+            if ui.is_panel_created("analysis_result_panel") and hasattr(ui, "analysis_results"):
                 ui.analysis_result_panel.update_analysis(ui.analysis_results, messages)
                 logger.debug("분석 결과 패널 업데이트")
 
@@ -1203,9 +1206,9 @@ class AnalysisCacheController:
         ui = self.ui
         try:
             targets = []
-            if hasattr(ui, "message_summary_panel"):
+            if ui.is_panel_created("message_summary_panel"):
                 targets.append(ui.message_summary_panel)
-            if hasattr(ui, "email_panel"):
+            if ui.is_panel_created("email_panel"):
                 targets.append(ui.email_panel)
             for widget in targets:
                 ui.notification_manager.register_widget(widget, "visual")
@@ -7,7 +7,7 @@ VirtualOffice 연결 및 시뮬레이션 제어 컨트롤러
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication, QMessageBox
@@ -62,6 +62,48 @@ class VirtualOfficeConnectionController:
         """연결 성공 다이얼로그 직접 요청 시 사용."""
         self._show_connection_success_dialog(personas, sim_status)
 
+    @staticmethod
+    def probe_connection(server_urls: Dict[str, str]) -> Tuple[VirtualOfficeClient, List["PersonaInfo"], Any]:
+        """서버 연결 확인 + 페르소나/시뮬레이션 상태 조회 (위젯 접근 없음, 워커 스레드용).
+
+        Raises:
+            ValueError, ConnectionError: URL 누락, 연결 실패, 페르소나 없음
+        """
+        vo_client = VirtualOfficeConnectionController._open_client(server_urls)
+        personas = vo_client.get_personas()
+        if not personas:
+            raise ValueError("페르소나 목록이 비어있습니다.")
+        sim_status = vo_client.get_simulation_status()
+        return vo_client, personas, sim_status
+
+    def apply_probed_connection(
+        self,
+        vo_client: VirtualOfficeClient,
+        personas: List["PersonaInfo"],
+        sim_status: Any,
+    ) -> None:
+        """`probe_connection` 결과를 UI에 반영 (GUI 스레드).
+
+        페르소나 선택 시 분석이 바로 시작되지 않도록 시그널을 막고 목록만 채웁니다.
+        분석은 호출자가 `ui.on_persona_changed()`로 이어서 시작합니다.
+        """
+        ui = self.ui
+        ui.vo_client = vo_client
+        ui.persona_combo.blockSignals(True)
+        try:
+            self._setup_personas(personas)
+        finally:
+            ui.persona_combo.blockSignals(False)
+
+        self._update_sim_status_display(sim_status)
+        ui.sim_monitor = SimulationMonitor(vo_client)
+        ui.sim_monitor.status_updated.connect(ui.on_sim_status_updated)
+        ui.sim_monitor.tick_advanced.connect(ui.on_tick_advanced)
+        ui.sim_monitor.start_monitoring()
+
+        self._update_connection_ui(personas)
+        logger.info("✅ 저장된 설정으로 VirtualOffice 자동 연결 (%d개 페르소나)", len(personas))
+
     # ------------------------------------------------------------------
     # 내부 구현
     # ------------------------------------------------------------------
@@ -72,8 +114,10 @@ class VirtualOfficeConnectionController:
         QApplication.processEvents()
 
     def _create_vo_client(self) -> VirtualOfficeClient:
-        ui = self.ui
-        server_urls = ui.vo_panel.get_server_urls()
+        return self._open_client(self.ui.vo_panel.get_server_urls())
+
+    @staticmethod
+    def _open_client(server_urls: Dict[str, str]) -> VirtualOfficeClient:
         if not all(server_urls.values()):
             raise ValueError("모든 서버 URL을 입력해주세요.")
 
@@ -132,8 +176,7 @@ class VirtualOfficeConnectionController:
             return
 
         ui.polling_worker = PollingWorker(data_source, polling_interval=30)
-        ui.polling_worker.new_data_received.connect(ui.on_new_data_received)
-        ui.polling_worker.error_occurred.connect(ui.on_polling_error)
+        ui._connect_polling_worker(ui.polling_worker)
         ui.polling_worker.start()
         logger.info("✅ PollingWorker 시작됨 (폴링 간격: 30초)")
 
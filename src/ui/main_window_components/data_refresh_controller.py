@@ -106,10 +106,10 @@ class DataRefreshController:
         analysis_results = result.get("analysis_results") or []
         ui.analysis_results = analysis_results
 
-        if hasattr(ui, "analysis_result_panel"):
+        if ui.is_panel_created("analysis_result_panel"):
             ui.analysis_result_panel.update_analysis(analysis_results, messages)
 
-        if hasattr(ui, "email_panel"):
+        if ui.is_panel_created("email_panel"):
             ui.email_panel.update_emails(messages, items)
 
         ui._save_to_cache(items, messages, analysis_results)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+페르소나 선분석 컨트롤러
+
+`PersonaPrefetchService`를 메인 윈도우 상태에 연결합니다.
+
+- 페르소나 전환 시 전환 기록을 남기고 선분석을 즉시 일시 중지
+- 1초마다 전경 작업(분석 워커, 수집) 여부를 확인해 작업 중이면 일시 중지
+- 전경이 `idle_delay_sec` 동안 유휴 상태면 최근 전환 페르소나를 대기열에 넣고 재개
+  (시간당 한도와 페르소나별 재분석 최소 간격은 `PersonaPrefetchService`가 적용)
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.config.settings import PERSONA_PREFETCH_CONFIG
+from src.services.persona_prefetch_service import PersonaPrefetchService, PrefetchTarget
+from src.services.persona_todo_cache_service import CacheKey
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.ui.main_window import SmartAssistantGUI
+
+logger = logging.getLogger(__name__)
+
+
+def _create_assistant():
+    from main import SmartAssistant
+
+    return SmartAssistant()
+
+
+class PersonaPrefetchController(QObject):
+    """유휴 시간에 최근 전환 페르소나를 미리 분석해 캐시에 채우는 컨트롤러."""
+
+    CHECK_INTERVAL_MS = 1000
+
+    def __init__(self, ui: "SmartAssistantGUI") -> None:
+        super().__init__(ui)
+        self.ui = ui
+        self.config = PERSONA_PREFETCH_CONFIG
+        self.service = PersonaPrefetchService(
+            cache_service=ui._cache_service,
+            assistant_factory=_create_assistant,
+            max_concurrency=self.config["max_concurrency"],
+            history_size=self.config["history_size"],
+            max_runs_per_hour=self.config["max_runs_per_hour"],
+            min_refresh_sec=self.config["min_refresh_sec"],
+        )
+        self._idle_since: Optional[float] = None
+        self._scheduled_signature: Optional[tuple] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_check)
+        if self.config["enabled"]:
+            self._timer.start()
+        else:
+            logger.info("[Prefetch] 페르소나 선분석 비활성화")
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def on_persona_switch(self, persona, persona_key: str) -> None:
+        """페르소나 전환 시작: 선분석 중지 후 전환 기록"""
+        self.service.pause()
+        self._idle_since = None
+        self._scheduled_signature = None
+        if persona_key:
+            self.service.record_switch(persona_key, persona)
+
+    def close(self) -> None:
+        """타이머와 선분석 워커 종료"""
+        self._timer.stop()
+        self.service.stop()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _foreground_busy(self) -> bool:
+        ui = self.ui
+        worker = getattr(ui, "worker_thread", None)
+        if worker is not None and worker.isRunning():
+            return True
+        controller = getattr(ui, "analysis_controller", None)
+        return bool(controller and controller.is_busy())
+
+    def _collect_options(self) -> dict:
+        ui = self.ui
+        options = {
+            "email_limit": getattr(ui, "quick_collect_email_limit", None),
+            "messenger_limit": getattr(ui, "quick_collect_messenger_limit", None),
+            "overall_limit": getattr(ui, "quick_collect_overall_limit", None),
+            "force_reload": True,
+        }
+        time_filter = getattr(ui, "time_filter_service", None)
+        if time_filter is not None and time_filter.is_enabled:
+            start, end = time_filter.current_range
+            options["time_range"] = {"start": start, "end": end}
+        return options
+
+    def _build_targets(self) -> List[PrefetchTarget]:
+        ui = self.ui
+        data_version = ui._current_data_version
+        collect_options = self._collect_options()
+        recent = self.service.recent_personas(exclude=ui._current_persona_id)
+        return [
+            PrefetchTarget(
+                persona_key=persona_key,
+                persona=persona,
+                cache_key=CacheKey(
+                    persona_id=persona_key,
+                    time_range_start=None,
+                    time_range_end=None,
+                    data_version=data_version,
+                ),
+                collect_options=dict(collect_options),
+            )
+            for persona_key, persona in recent[: self.config["max_personas"]]
+        ]
+
+    def _on_check(self) -> None:
+        ui = self.ui
+        if not getattr(ui, "vo_client", None) or getattr(ui, "data_source_type", None) != "virtualoffice":
+            return
+
+        if self._foreground_busy():
+            self.service.pause()
+            self._idle_since = None
+            return
+
+        now = time.monotonic()
+        if self._idle_since is None:
+            self._idle_since = now
+        if now - self._idle_since < self.config["idle_delay_sec"]:
+            return
+
+        targets = self._build_targets()
+        signature = (ui._current_data_version, tuple(t.persona_key for t in targets))
+        if signature == self._scheduled_signature and not self.service.is_paused:
+            return
+
+        self.service.set_client(ui.vo_client)
+        self._scheduled_signature = signature
+        self.service.schedule(targets)
+        self.service.resume()
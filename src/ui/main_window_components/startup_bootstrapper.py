@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 시작 부트스트랩
+
+창(셸)을 먼저 그린 뒤 아래 단계를 순서대로 진행합니다.
+각 단계의 I/O는 워커 스레드에서 실행하고, 결과 반영만 GUI 스레드에서 수행합니다.
+진행 상황은 상태바에 표시됩니다.
+
+1. 캐시된 TODO 로드 (SQLite)
+2. VirtualOffice 페르소나/시뮬레이션 상태 조회 (저장된 설정이 있을 때)
+3. 선택된 페르소나 분석 시작
+"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QProgressBar
+
+from src.ui.todo.repository import TodoRepository
+
+from .connection_controller import VirtualOfficeConnectionController
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.ui.main_window import SmartAssistantGUI
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BootstrapStage:
+    """시작 단계 정의
+
+    Attributes:
+        name: 단계 식별자 (타이밍 기록용)
+        label: 상태바에 표시할 설명
+        prepare: GUI 스레드에서 호출되어 작업 입력을 반환. None을 반환하면 단계를 건너뜀
+        work: 워커 스레드에서 `work(prepared)`로 실행 (None이면 워커 없이 바로 apply)
+        apply: GUI 스레드에서 결과를 반영
+    """
+    name: str
+    label: str
+    prepare: Callable[[], Any]
+    apply: Callable[[Any], None]
+    work: Optional[Callable[[Any], Any]] = None
+
+
+class _StageWorker(QThread):
+    """단일 단계 작업을 실행하는 워커 스레드"""
+
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, work: Callable[[Any], Any], arg: Any, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._work = work
+        self._arg = arg
+
+    def run(self):
+        try:
+            result = self._work(self._arg)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(result)
+
+
+class StartupBootstrapper(QObject):
+    """시작 단계를 순서대로 실행하고 상태바에 진행 상황을 표시
+
+    Signals:
+        stage_started: (단계 이름, 순번(1부터), 전체 단계 수)
+        finished: {단계 이름: 소요 시간(ms)}
+    """
+
+    stage_started = pyqtSignal(str, int, int)
+    finished = pyqtSignal(dict)
+
+    TODO_CLEANUP_DAYS = 14
+
+    def __init__(self, ui: "SmartAssistantGUI") -> None:
+        super().__init__(ui)
+        self.ui = ui
+        self._stages: List[BootstrapStage] = self._build_stages()
+        self._index = -1
+        self._worker: Optional[_StageWorker] = None
+        self._stage_started_at = 0.0
+        self._cancelled = False
+        self._progress: Optional[QProgressBar] = None
+        self.timings: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # 단계 정의
+    # ------------------------------------------------------------------
+    def _build_stages(self) -> List[BootstrapStage]:
+        ui = self.ui
+        return [
+            BootstrapStage(
+                name="cached_todos",
+                label="저장된 TODO 불러오는 중",
+                prepare=lambda: ui.todo_panel.db_path if getattr(ui, "todo_panel", None) else None,
+                work=lambda db_path: TodoRepository.read_active_snapshot(
+                    db_path, cleanup_days=self.TODO_CLEANUP_DAYS
+                ),
+                apply=lambda rows: ui.todo_panel.show_cached_rows(rows),
+            ),
+            BootstrapStage(
+                name="virtualoffice",
+                label="VirtualOffice 페르소나/시뮬레이션 상태 확인 중",
+                prepare=self._prepare_connection,
+                work=VirtualOfficeConnectionController.probe_connection,
+                apply=lambda result: ui.connection_controller.apply_probed_connection(*result),
+            ),
+            BootstrapStage(
+                name="analysis",
+                label="분석 시작",
+                prepare=self._prepare_analysis,
+                apply=ui.on_persona_changed,
+            ),
+        ]
+
+    def _prepare_connection(self) -> Optional[Dict[str, str]]:
+        """저장된 설정이 있고 아직 연결되지 않았을 때만 서버 URL 반환"""
+        ui = self.ui
+        if ui.vo_config is None or ui.vo_client is not None:
+            return None
+        server_urls = ui.vo_panel.get_server_urls()
+        return server_urls if all(server_urls.values()) else None
+
+    def _prepare_analysis(self) -> Optional[int]:
+        """연결된 상태에서 선택된 페르소나 인덱스 반환"""
+        ui = self.ui
+        if ui.vo_client is None or ui.selected_persona is not None:
+            return None
+        index = ui.persona_combo.currentIndex()
+        return index if index >= 0 else None
+
+    # ------------------------------------------------------------------
+    # 실행 제어
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """이벤트 루프 진입 후(첫 페인트 이후) 첫 단계 시작"""
+        status_bar = getattr(self.ui, "status_bar", None)
+        if status_bar is not None:
+            self._progress = QProgressBar()
+            self._progress.setRange(0, len(self._stages))
+            self._progress.setMaximumWidth(160)
+            self._progress.setTextVisible(False)
+            status_bar.addPermanentWidget(self._progress)
+        QTimer.singleShot(0, self._advance)
+
+    def cancel(self) -> None:
+        """남은 단계 취소 (창 닫기 시)"""
+        self._cancelled = True
+        if self._worker and self._worker.isRunning():
+            self._worker.wait(3000)
+
+    def _advance(self) -> None:
+        if self._cancelled:
+            return
+
+        self._index += 1
+        if self._index >= len(self._stages):
+            self._finish()
+            return
+
+        stage = self._stages[self._index]
+        try:
+            prepared = stage.prepare()
+        except Exception as e:
+            logger.warning(f"[Bootstrap] '{stage.name}' 준비 실패: {e}")
+            prepared = None
+
+        if prepared is None:
+            logger.info(f"[Bootstrap] '{stage.name}' 단계 건너뜀")
+            self._advance()
+            return
+
+        total = len(self._stages)
+        self._stage_started_at = time.perf_counter()
+        self._report(f"⏳ 시작 준비 ({self._index + 1}/{total}): {stage.label}...")
+        self.stage_started.emit(stage.name, self._index + 1, total)
+
+        if stage.work is None:
+            self._on_stage_result(prepared)
+            return
+
+        # 시그널은 이 객체(GUI 스레드)의 메서드에 연결되므로 큐 연결로 전달됨
+        self._worker = _StageWorker(stage.work, prepared, parent=self)
+        self._worker.succeeded.connect(self._on_stage_result)
+        self._worker.failed.connect(self._on_stage_failed)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._worker.start()
+
+    def _on_stage_result(self, result: Any) -> None:
+        if self._cancelled:
+            return
+        stage = self._stages[self._index]
+        try:
+            stage.apply(result)
+        except Exception as e:
+            logger.error(f"[Bootstrap] '{stage.name}' 결과 반영 실패: {e}", exc_info=True)
+        self._complete_stage(stage)
+
+    def _on_stage_failed(self, error: str) -> None:
+        if self._cancelled:
+            return
+        stage = self._stages[self._index]
+        logger.warning(f"[Bootstrap] '{stage.name}' 단계 실패: {error}")
+        self._complete_stage(stage)
+
+    def _complete_stage(self, stage: BootstrapStage) -> None:
+        elapsed_ms = (time.perf_counter() - self._stage_started_at) * 1000
+        self.timings[stage.name] = elapsed_ms
+        logger.info(f"[Bootstrap] '{stage.name}' 완료 ({elapsed_ms:.0f}ms)")
+        if self._progress is not None:
+            self._progress.setValue(self._index + 1)
+        self._worker = None
+        # 반영 직후 화면이 갱신될 수 있도록 다음 단계는 이벤트 루프를 한 번 거친 뒤 시작
+        QTimer.singleShot(0, self._advance)
+
+    def _finish(self) -> None:
+        if self._progress is not None:
+            self.ui.status_bar.removeWidget(self._progress)
+            self._progress.deleteLater()
+            self._progress = None
+        total_ms = sum(self.timings.values())
+        self._report("Smart Assistant 준비됨", timeout_ms=5000)
+        logger.info(f"[Bootstrap] 시작 단계 완료 (총 {total_ms:.0f}ms): {self.timings}")
+        self.finished.emit(dict(self.timings))
+
+    def _report(self, message: str, timeout_ms: int = 0) -> None:
+        status_bar = getattr(self.ui, "status_bar", None)
+        if status_bar is not None:
+            status_bar.showMessage(message, timeout_ms)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+TODO 변경 알림 → Qt 시그널 브리지
+
+`TodoChangeFeed` 구독 콜백은 발행한 스레드(예: 프로젝트 태그 워커)에서 호출되므로,
+`CoalescingDispatcher`로 모아서 GUI 스레드에서 주기당 한 번 시그널로 전달합니다.
+"""
+from __future__ import annotations
+
+import logging
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.services.todo_change_feed import TodoChangeEvent, TodoChangeFeed, get_todo_change_feed
+
+from ..helpers.coalescing_dispatcher import CoalescingDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class TodoChangeBridge(QObject):
+    """TodoChangeFeed 이벤트를 `changes_received` 시그널로 전달."""
+
+    changes_received = pyqtSignal(list)  # List[TodoChangeEvent]
+
+    CHANNEL = "todo_changes"
+
+    def __init__(
+        self,
+        feed: Optional[TodoChangeFeed] = None,
+        parent: Optional[QObject] = None,
+        interval_ms: int = 100,
+    ) -> None:
+        super().__init__(parent)
+        self._feed = feed or get_todo_change_feed()
+        self._dispatcher = CoalescingDispatcher(interval_ms=interval_ms, parent=self)
+        self._dispatcher.register(self.CHANNEL, self._emit_batch)
+        self._token: Optional[int] = self._feed.subscribe(self._dispatcher.poster(self.CHANNEL))
+
+    def _emit_batch(self, batches: List[List[TodoChangeEvent]]) -> None:
+        # 주기 동안 발행된 모든 이벤트를 한 번의 시그널로 전달
+        events = [event for batch in batches for event in batch]
+        if events:
+            self.changes_received.emit(events)
+
+    def close(self) -> None:
+        """구독 해제"""
+        if self._token is not None:
+            self._feed.unsubscribe(self._token)
+            self._token = None
+            logger.debug("[TodoChangeBridge] 구독 해제")
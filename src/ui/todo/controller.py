@@ -169,8 +169,9 @@ class TodoPanelController:
 
         try:
             top_ids = set(self.top3_service.pick_top3(rows, simulation_time=simulation_time))
+            scores = self._calculate_scores(rows)
             updates: List[Tuple[int, str]] = []
-            for row in rows:
+            for row, score in zip(rows, scores):
                 row_id = row.get("id")
                 if not row_id:
                     continue
@@ -178,10 +179,7 @@ class TodoPanelController:
                 if row.get("is_top3") != mark:
                     updates.append((mark, row_id))
                 row["is_top3"] = mark
-                try:
-                    row["_top3_score"] = self.top3_service.calculate_score(row)
-                except Exception:
-                    row["_top3_score"] = 0.0
+                row["_top3_score"] = score
 
             if updates:
                 self.repository.update_top3_flags(updates)
@@ -199,6 +197,21 @@ class TodoPanelController:
                 row["_top3_score"] = 0.0
             return set()
 
+    def _calculate_scores(self, rows: List[dict]) -> List[float]:
+        """행 점수를 배치로 계산 (실패 시 행 단위로 계산, 오류 행은 0.0)"""
+        try:
+            return list(self.top3_service.calculate_scores(rows))
+        except Exception as exc:
+            logger.debug("Top-3 배치 점수 계산 실패, 행 단위로 계산: %s", exc)
+
+        scores: List[float] = []
+        for row in rows:
+            try:
+                scores.append(self.top3_service.calculate_score(row))
+            except Exception:
+                scores.append(0.0)
+        return scores
+
     # ------------------------------------------------------------------ #
     # 프로젝트 태그
     # ------------------------------------------------------------------ #
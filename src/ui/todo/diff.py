@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+TODO 리스트 증분 diff 엔진
+
+이전에 렌더링한 행 목록과 새 행 목록을 `(key, version)` 기준으로 비교하여
+최소한의 insert/update/move/remove 연산을 계산합니다.
+Qt 의존성이 없으므로 TodoPanel 외의 곳에서도 재사용할 수 있습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Set, Tuple
+
+# BasicTodoItem 렌더링 결과에 영향을 주는 필드들
+VERSION_FIELDS: Tuple[str, ...] = (
+    "title",
+    "description",
+    "priority",
+    "deadline",
+    "deadline_ts",
+    "requester",
+    "type",
+    "status",
+    "project",
+    "recipient_type",
+    "source_type",
+    "is_top3",
+    "evidence",
+    "created_at",
+    "updated_at",
+)
+
+
+def todo_version(todo: dict) -> str:
+    """렌더링 관련 필드로 TODO 버전 문자열 생성."""
+    payload = [todo.get(name) for name in VERSION_FIELDS]
+    source = todo.get("source_message")
+    if isinstance(source, (dict, list)):
+        source = json.dumps(source, ensure_ascii=False, sort_keys=True)
+    payload.append(source)
+    raw = json.dumps(payload, ensure_ascii=False, default=str)
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class TodoDiff:
+    """두 행 목록 사이의 최소 변경 연산 집합.
+
+    적용 순서:
+        1. `removed`와 `moved`의 키를 현재 뷰에서 제거
+        2. `inserts_in_order()` 순서대로 목표 인덱스에 삽입
+        3. `updated` 키를 제자리에서 갱신
+    """
+    removed: List[str] = field(default_factory=list)
+    inserted: List[Tuple[str, int]] = field(default_factory=list)
+    moved: List[Tuple[str, int]] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.removed or self.inserted or self.moved or self.updated)
+
+    def inserts_in_order(self) -> List[Tuple[str, int, bool]]:
+        """삽입/이동 대상을 목표 인덱스 오름차순으로 반환 (key, index, is_move)."""
+        merged = [(key, idx, False) for key, idx in self.inserted]
+        merged.extend((key, idx, True) for key, idx in self.moved)
+        merged.sort(key=lambda entry: entry[1])
+        return merged
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "inserted": len(self.inserted),
+            "updated": len(self.updated),
+            "moved": len(self.moved),
+            "removed": len(self.removed),
+        }
+
+
+def _stable_positions(old_positions: Sequence[int]) -> Set[int]:
+    """최장 증가 부분 수열(LIS)에 속하는 인덱스(new 기준)를 반환.
+
+    LIS에 포함된 행은 상대 순서가 유지되므로 이동하지 않아도 됩니다.
+    """
+    tails: List[int] = []
+    tails_idx: List[int] = []
+    parents: List[int] = [-1] * len(old_positions)
+
+    for i, pos in enumerate(old_positions):
+        j = bisect_left(tails, pos)
+        if j == len(tails):
+            tails.append(pos)
+            tails_idx.append(i)
+        else:
+            tails[j] = pos
+            tails_idx[j] = i
+        parents[i] = tails_idx[j - 1] if j > 0 else -1
+
+    stable: Set[int] = set()
+    cursor = tails_idx[-1] if tails_idx else -1
+    while cursor != -1:
+        stable.add(cursor)
+        cursor = parents[cursor]
+    return stable
+
+
+def compute_todo_diff(
+    old_rows: Sequence[Tuple[str, str]],
+    new_rows: Sequence[Tuple[str, str]],
+) -> TodoDiff:
+    """이전/새 행 목록을 비교하여 최소 변경 연산을 계산.
+
+    Args:
+        old_rows: 현재 뷰에 표시된 `(key, version)` 목록 (표시 순서)
+        new_rows: 새로 표시할 `(key, version)` 목록 (표시 순서)
+
+    Returns:
+        TodoDiff: 제거/삽입/이동/갱신 연산
+    """
+    diff = TodoDiff()
+    old_index: Dict[str, int] = {}
+    old_versions: Dict[str, str] = {}
+    for idx, (key, version) in enumerate(old_rows):
+        old_index[key] = idx
+        old_versions[key] = version
+
+    new_keys = {key for key, _ in new_rows}
+    diff.removed = [key for key, _ in old_rows if key not in new_keys]
+
+    # 양쪽에 모두 있는 행의 이전 위치 (새 순서 기준)
+    common: List[Tuple[int, str]] = []
+    for new_idx, (key, _) in enumerate(new_rows):
+        if key in old_index:
+            common.append((new_idx, key))
+    stable = _stable_positions([old_index[key] for _, key in common])
+    stable_keys = {common[i][1] for i in stable}
+
+    for new_idx, (key, version) in enumerate(new_rows):
+        if key not in old_index:
+            diff.inserted.append((key, new_idx))
+        elif key not in stable_keys:
+            diff.moved.append((key, new_idx))
+        elif old_versions[key] != version:
+            diff.updated.append(key)
+
+    return diff
@@ -15,6 +15,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Generator, Iterable, List, Optional
 
+from src.services.todo_change_feed import (
+    CHANGE_DELETED,
+    CHANGE_PROJECT,
+    CHANGE_RESET,
+    CHANGE_STATUS,
+    CHANGE_TOP3,
+    CHANGE_UPSERTED,
+    TodoChangeEvent,
+    get_todo_change_feed,
+)
+
 # offline_agent/src 기준에서 virtualoffice/todos_cache.db로 맞춤
 OFFLINE_AGENT_ROOT = Path(__file__).resolve().parents[3]
 DEFAULT_DB_PATH = (
@@ -26,12 +37,22 @@ VDOS_DB_PATH = (
 
 logger = logging.getLogger(__name__)
 
+# 생성 후 `days`일 지난 TODO 삭제 (파라미터: "-{days} days")
+_CLEANUP_SQL = """
+    DELETE FROM todos
+    WHERE created_at IS NOT NULL
+      AND created_at <> ''
+      AND datetime(replace(substr(created_at,1,19),'T',' '))
+            < datetime('now', ? , 'localtime')
+"""
+
 
 class TodoRepository:
     """SQLite 기반 TODO 저장소."""
 
     def __init__(self, db_path: Optional[str] = None) -> None:
         self.db_path = Path(db_path or DEFAULT_DB_PATH)
+        self._change_feed = get_todo_change_feed()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self.db_path))
         self._conn.row_factory = sqlite3.Row
@@ -254,21 +275,19 @@ class TodoRepository:
             self._conn.rollback()
             raise
 
+    def _publish(self, kind: str, todo_id: Optional[str] = None, **fields) -> None:
+        """변경 알림 채널에 이벤트 발행 (커밋 이후 호출)."""
+        self._change_feed.publish(kind, todo_id, source="repository", **fields)
+
     # ------------------------------------------------------------------ #
     # 공개 API
     # ------------------------------------------------------------------ #
     def cleanup_old_rows(self, days: int) -> None:
         with self._transaction() as cur:
-            cur.execute(
-                """
-                DELETE FROM todos
-                WHERE created_at IS NOT NULL
-                  AND created_at <> ''
-                  AND datetime(replace(substr(created_at,1,19),'T',' '))
-                        < datetime('now', ? , 'localtime')
-                """,
-                (f"-{days} days",),
-            )
+            cur.execute(_CLEANUP_SQL, (f"-{days} days",))
+            removed = cur.rowcount
+        if removed > 0:
+            self._publish(CHANGE_RESET, reason="cleanup")
 
     def release_snoozed(self) -> None:
         now = datetime.now().isoformat()
@@ -283,10 +302,14 @@ class TodoRepository:
                 """,
                 (now, now),
             )
+            released = cur.rowcount
+        if released > 0:
+            self._publish(CHANGE_RESET, reason="snooze_released")
 
     def delete_all(self) -> None:
         with self._transaction() as cur:
             cur.execute("DELETE FROM todos")
+        self._publish(CHANGE_RESET, reason="delete_all")
 
     def save_all(self, rows: Iterable[dict]) -> None:
         rows = list(rows)
@@ -339,6 +362,7 @@ class TodoRepository:
                         project_fullname,
                     ),
                 )
+        self._publish(CHANGE_RESET, reason="save_all", count=len(rows))
 
     def upsert_todos(self, rows: Iterable[dict]) -> dict:
         """TODO를 증분 업데이트 (기존 TODO 유지, 새로운 TODO만 추가/업데이트)
@@ -351,6 +375,7 @@ class TodoRepository:
         """
         rows = list(rows)
         stats = {'added': 0, 'updated': 0, 'unchanged': 0}
+        changed_ids: List[str] = []
         
         with self._transaction() as cur:
             # 기존 TODO ID 목록 조회
@@ -411,6 +436,7 @@ class TodoRepository:
                         ),
                     )
                     stats['added'] += 1
+                    changed_ids.append(todo_id)
                 elif existing_todos[todo_id] != updated_at:
                     # 프로젝트 풀네임 가져오기
                     from src.utils.project_fullname_mapper import get_project_fullname
@@ -453,10 +479,16 @@ class TodoRepository:
                         ),
                     )
                     stats['updated'] += 1
+                    changed_ids.append(todo_id)
                 else:
                     # 변경 없음
                     stats['unchanged'] += 1
-        
+
+        if changed_ids:
+            self._change_feed.publish_many(
+                TodoChangeEvent(kind=CHANGE_UPSERTED, todo_id=todo_id, source="repository")
+                for todo_id in changed_ids
+            )
         return stats
 
     def fetch_active(self, persona_name: Optional[str] = None, persona_email: Optional[str] = None, persona_handle: Optional[str] = None) -> List[dict]:
@@ -474,7 +506,16 @@ class TodoRepository:
             중요: DB의 persona_name 컬럼에는 한글 이름만 저장되어 있으므로,
             persona_name만 비교합니다.
         """
-        cur = self._conn.cursor()
+        return self._select_active(self._conn, persona_name, persona_email, persona_handle)
+
+    @staticmethod
+    def _select_active(
+        conn: sqlite3.Connection,
+        persona_name: Optional[str] = None,
+        persona_email: Optional[str] = None,
+        persona_handle: Optional[str] = None,
+    ) -> List[dict]:
+        cur = conn.cursor()
         
         # persona_name 필터만 사용 (DB 컬럼에 한글 이름만 저장됨)
         if persona_name:
@@ -514,12 +555,52 @@ class TodoRepository:
         
         return [dict(row) for row in cur.fetchall()]
 
+    @classmethod
+    def read_active_snapshot(
+        cls,
+        db_path: Optional[str] = None,
+        cleanup_days: Optional[int] = None,
+    ) -> List[dict]:
+        """전용 연결로 활성 TODO를 읽어 반환 (시작 단계 백그라운드 스레드용).
+
+        스키마 초기화/백필은 하지 않으며, DB나 테이블이 아직 없으면 빈 목록을 반환합니다.
+
+        Args:
+            db_path: TODO DB 경로 (None이면 기본 경로)
+            cleanup_days: 지정하면 읽기 전에 오래된 TODO를 정리
+        """
+        path = Path(db_path or DEFAULT_DB_PATH)
+        if not path.exists():
+            return []
+
+        conn = sqlite3.connect(str(path))
+        conn.row_factory = sqlite3.Row
+        try:
+            removed = 0
+            if cleanup_days is not None:
+                with conn:
+                    removed = conn.execute(_CLEANUP_SQL, (f"-{cleanup_days} days",)).rowcount
+            if removed > 0:
+                get_todo_change_feed().publish(CHANGE_RESET, source="repository", reason="cleanup")
+                logger.info(f"[TodoRepository] 오래된 TODO {removed}개 정리")
+            return cls._select_active(conn)
+        except sqlite3.OperationalError as e:
+            # 최초 실행 등으로 todos 테이블이 아직 없는 경우
+            logger.debug(f"[TodoRepository] 스냅샷 조회 건너뜀: {e}")
+            return []
+        finally:
+            conn.close()
+
     def update_top3_flags(self, updates: Iterable[tuple[int, str]]) -> None:
         updates = list(updates)
         if not updates:
             return
         with self._transaction() as cur:
             cur.executemany("UPDATE todos SET is_top3=? WHERE id=?", updates)
+        self._change_feed.publish_many(
+            TodoChangeEvent(kind=CHANGE_TOP3, todo_id=todo_id, fields={"is_top3": mark}, source="repository")
+            for mark, todo_id in updates
+        )
 
     def mark_done(self, todo_id: str, now_iso: str) -> bool:
         with self._transaction() as cur:
@@ -527,7 +608,10 @@ class TodoRepository:
                 "UPDATE todos SET status='done', updated_at=? WHERE id=?",
                 (now_iso, todo_id),
             )
-            return cur.rowcount > 0
+            updated = cur.rowcount > 0
+        if updated:
+            self._publish(CHANGE_STATUS, todo_id, status="done")
+        return updated
 
     def snooze_until(self, todo_id: str, until_iso: str, updated_iso: str) -> None:
         with self._transaction() as cur:
@@ -535,6 +619,7 @@ class TodoRepository:
                 "UPDATE todos SET status='snoozed', snooze_until=?, updated_at=? WHERE id=?",
                 (until_iso, updated_iso, todo_id),
             )
+        self._publish(CHANGE_STATUS, todo_id, status="snoozed", snooze_until=until_iso)
 
     def get_project(self, todo_id: str) -> Optional[str]:
         cur = self._conn.cursor()
@@ -550,6 +635,7 @@ class TodoRepository:
                 "UPDATE todos SET project_tag = ?, project_full_name = ? WHERE id = ?", 
                 (project, project_fullname, todo_id)
             )
+        self._publish(CHANGE_PROJECT, todo_id, project=project, project_full_name=project_fullname)
 
     def available_projects(self) -> List[str]:
         cur = self._conn.cursor()
@@ -618,7 +704,10 @@ class TodoRepository:
         """
         with self._transaction() as cur:
             cur.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
-            return cur.rowcount > 0
+            deleted = cur.rowcount > 0
+        if deleted:
+            self._publish(CHANGE_DELETED, todo_id)
+        return deleted
     
     def create_indexes(self):
         """중복 제거를 위한 인덱스 생성"""
@@ -695,6 +784,9 @@ class TodoRepository:
                     stats["skipped"] += 1
                     logger.debug(f"   스킵: {current_requester} (매핑 없음)")
         
+        if stats["updated"]:
+            self._publish(CHANGE_RESET, reason="migrate_requester", count=stats["updated"])
+        
         logger.info(
             f"✅ requester 필드 마이그레이션 완료: "
             f"업데이트={stats['updated']}, 스킵={stats['skipped']}, 오류={stats['errors']}"
@@ -27,6 +27,12 @@ from .dialogs import Top3RuleDialog, Top3NaturalRuleDialog
 from src.services import Top3Service, TOP3_RULE_DEFAULT, LLMClient
 from .todo import TodoRepository
 from .todo.controller import TodoPanelController
+from .todo.diff import compute_todo_diff, todo_version, VERSION_FIELDS
+from .todo.change_bridge import TodoChangeBridge
+from src.services.todo_change_feed import CHANGE_DELETED, CHANGE_PROJECT, TodoChangeEvent
+from src.services.todo_deduplication_service import get_todo_deduplication_service
+from src.config.settings import SEMANTIC_INDEX_CONFIG
+from src.utils.sampling_profiler import profiled
 
 logger = logging.getLogger(__name__)
 
@@ -424,7 +430,7 @@ class BasicTodoItem(QWidget):
         todo_id = todo.get("id", "unknown")
         if not unread:
             # 읽음 상태로 초기화
-            logger.info(f"[BasicTodoItem.__init__] ✅ TODO {todo_id}: unread=False로 초기화 (회색)")
+            logger.debug("[BasicTodoItem.__init__] ✅ TODO %s: unread=False로 초기화 (회색)", todo_id)
             self.new_badge.hide()
             self.setStyleSheet(self._read_style)
             self._unread = False
@@ -498,7 +504,7 @@ class BasicTodoItem(QWidget):
             stack = ''.join(traceback.format_stack()[-5:-1])  # 최근 4개 호출 스택
             logger.warning(f"[BasicTodoItem.set_unread] ⚠️⚠️⚠️ TODO {todo_id}를 unread=TRUE로 설정! 호출 스택:\n{stack}")
         else:
-            logger.info(f"[BasicTodoItem.set_unread] ✅ TODO {todo_id}를 unread=False로 설정 (회색)")
+            logger.debug("[BasicTodoItem.set_unread] ✅ TODO %s를 unread=False로 설정 (회색)", todo_id)
         
         self._unread = unread
         if unread:
@@ -565,7 +571,7 @@ class BasicTodoItem(QWidget):
                     self.project_tag_widget = project_tag
                     # status 위젯 다음에 삽입 (인덱스 3)
                     self.top_layout.insertWidget(3, project_tag, 0)
-                    logger.info(f"[프로젝트 태그] ✅ TODO {self.todo.get('id')}: {project_code} 태그 업데이트 완료")
+                    logger.debug("[프로젝트 태그] ✅ TODO %s: %s 태그 업데이트 완료", self.todo.get('id'), project_code)
         except Exception as e:
             logger.error(f"[프로젝트 태그] 업데이트 오류: {e}")
     
@@ -574,7 +580,17 @@ class BasicTodoItem(QWidget):
 # 2) TodoPanel 본체
 # ─────────────────────────────────────────────────────────────────────────────
 class TodoPanel(QWidget):
-    def __init__(self, db_path=None, parent=None, top3_callback: Optional[Callable[[List[dict]], None]] = None):
+    def __init__(
+        self,
+        db_path=None,
+        parent=None,
+        top3_callback: Optional[Callable[[List[dict]], None]] = None,
+        cleanup_on_start: bool = True,
+    ):
+        """
+        Args:
+            cleanup_on_start: False면 오래된 TODO 정리를 호출자(시작 단계 워커)에 맡김
+        """
         super().__init__(parent)
 
         self._repo = TodoRepository(db_path)
@@ -588,8 +604,9 @@ class TodoPanel(QWidget):
         self.llm_client: LLMClient = LLMClient()
 
         # 애플리케이션 시작 시 오래된 TODO만 정리 (14일 이상)
-        logger.info("애플리케이션 시작: 오래된 TODO 데이터 정리")
-        self.controller.cleanup_old_rows(days=14)
+        if cleanup_on_start:
+            logger.info("애플리케이션 시작: 오래된 TODO 데이터 정리")
+            self.controller.cleanup_old_rows(days=14)
         
         # 기존 TODO 유지 (삭제하지 않음)
         # 사용자가 원하면 수동으로 "모두 삭제" 버튼 사용 가능
@@ -600,6 +617,11 @@ class TodoPanel(QWidget):
         self._current_top3: List[dict] = []
         self._viewed_ids: set[str] = set()
         self._item_widgets: Dict[str, Tuple[QListWidgetItem | None, BasicTodoItem | None]] = {}
+        # 증분 렌더링 상태: 현재 표시 중인 (key, version) 목록과 key → 리스트 아이템
+        self._rendered_rows: List[Tuple[str, str]] = []
+        self._row_items: Dict[str, QListWidgetItem] = {}
+        # 의미 검색 결과 캐시: (검색어, 매칭 TODO ID)
+        self._semantic_search: Tuple[str, set[str]] = ("", set())
         self._top3_updated_cb: Optional[Callable[[List[dict]], None]] = top3_callback
         self._simulation_time: Optional[datetime] = None  # VDOS 시뮬레이션 시간
         
@@ -643,12 +665,9 @@ class TodoPanel(QWidget):
         self.snooze_timer.timeout.connect(self.on_snooze_timer)
         self.snooze_timer.start()
 
-        # 프로젝트 태그 업데이트 타이머 (3초마다 - 빠른 UI 반영)
-        self.project_update_timer = QTimer(self)
-        self.project_update_timer.setInterval(3 * 1000)
-        self.project_update_timer.timeout.connect(self.on_project_update_timer)
-        self.project_update_timer.start()
-        logger.info("[프로젝트 업데이트] 타이머 시작됨 (3초 간격)")
+        # TODO 변경 알림 구독 (프로젝트 태그 분석 완료 등을 즉시 해당 행에만 반영)
+        self.change_bridge = TodoChangeBridge(parent=self)
+        self.change_bridge.changes_received.connect(self._on_todo_changes)
 
     def set_top3_service_instance(self, service: Optional[Top3Service]) -> None:
         self.top3_service = service
@@ -869,66 +888,69 @@ class TodoPanel(QWidget):
         self.controller.release_snoozed()
         self.refresh_todo_list()
 
-    def on_project_update_timer(self) -> None:
-        """프로젝트 태그 업데이트 타이머 콜백: 새로 분석된 프로젝트 태그를 UI에 반영"""
+    def _on_todo_changes(self, events: List[TodoChangeEvent]) -> None:
+        """TODO 변경 알림 처리: 영향 받은 행만 갱신한다.
+
+        패널 자신의 쓰기(저장/완료/스누즈/Top-3)는 호출 직후 렌더링되므로
+        여기서는 외부(백그라운드 스레드 포함)에서 발생한 변경만 반영한다.
+        """
         try:
-            logger.info("[프로젝트 업데이트] 타이머 실행")
-            
-            # TODO 리스트를 다시 로드해서 프로젝트 태그 업데이트
-            rows = self.controller.load_active_items()
-            if not rows:
-                logger.info("[프로젝트 업데이트] rows 없음 - 스킵")
-                return
-            
-            logger.info(f"[프로젝트 업데이트] DB에서 {len(rows)}개 TODO 로드")
-            
-            # 프로젝트 태그가 실제로 변경되었는지 확인
-            has_changes = False
-            changes_detail = []
-            for row in rows:
-                todo_id = row.get('id')
-                # DB 컬럼명은 'project_tag'
-                new_project = row.get('project_tag') or row.get('project')
-                
-                # 현재 UI에 표시된 TODO와 비교
-                if todo_id in self._item_widgets:
-                    item, widget = self._item_widgets[todo_id]
-                    if widget and hasattr(widget, 'todo_data'):
-                        old_project = widget.todo_data.get('project')
-                        if old_project != new_project:
-                            has_changes = True
-                            changes_detail.append(f"{todo_id}: {old_project} → {new_project}")
-                            if len(changes_detail) < 5:  # 최대 5개만 로그
-                                logger.info(f"[프로젝트 업데이트] 변경 감지: {todo_id}: '{old_project}' → '{new_project}'")
-            
-            # 변경사항이 없으면 프로젝트 태그 바만 업데이트 (초기 로드 대응)
-            if not has_changes:
-                logger.debug("[프로젝트 업데이트] 변경사항 없음 - 프로젝트 태그 바만 업데이트")
-                self._update_project_tag_bar_from_todos(rows)
-                return
-            
-            logger.info(f"[프로젝트 업데이트] 프로젝트 태그 변경 감지 - UI 업데이트")
-            
-            # 프로젝트 태그 바만 업데이트 (전체 새로고침 없이)
-            self._update_project_tag_bar_from_todos(rows)
-            
-            # 각 TODO 위젯의 프로젝트 태그도 업데이트
-            for i in range(self.todo_list.count()):
-                item = self.todo_list.item(i)
-                widget = self.todo_list.itemWidget(item)
-                if widget and hasattr(widget, 'todo_data'):
-                    todo_id = widget.todo_data.get('id')
-                    # DB에서 최신 프로젝트 태그 가져오기
-                    for row in rows:
-                        if row.get('id') == todo_id:
-                            # DB 컬럼명은 'project_tag'
-                            new_project = row.get('project_tag') or row.get('project')
-                            widget.todo_data['project'] = new_project
-                            if hasattr(widget, 'update_project_tag'):
-                                widget.update_project_tag(new_project)
-                            break
+            project_updates: Dict[str, Optional[str]] = {}
+            deleted_ids: set[str] = set()
+            for event in events:
+                if not event.todo_id:
+                    continue
+                if event.kind == CHANGE_PROJECT:
+                    project_updates[event.todo_id] = event.fields.get("project")
+                elif event.kind == CHANGE_DELETED:
+                    deleted_ids.add(event.todo_id)
+
+            if deleted_ids and any(todo_id in self._item_widgets for todo_id in deleted_ids):
+                self._all_rows = [row for row in self._all_rows if row.get("id") not in deleted_ids]
+                self._top3_all = [row for row in self._top3_all if row.get("id") not in deleted_ids]
+                self._rest_all = [row for row in self._rest_all if row.get("id") not in deleted_ids]
+                self._re_render()
+
+            if project_updates:
+                changed = self._apply_project_updates(project_updates)
+                if changed:
+                    logger.info(f"[프로젝트 업데이트] {changed}개 TODO 프로젝트 태그 반영")
+                    # 프로젝트 필터가 걸려 있으면 표시 대상이 바뀔 수 있음 (diff 렌더링이라 저렴)
+                    self._re_render()
+                    self._update_project_tag_bar_from_todos(self._all_rows)
         except Exception as e:
-            logger.error(f"프로젝트 업데이트 타이머 오류: {e}")
+            logger.error(f"TODO 변경 알림 처리 오류: {e}")
+
+    def _apply_project_updates(self, projects: Dict[str, Optional[str]]) -> int:
+        """표시 중인 TODO 위젯의 프로젝트 태그만 제자리에서 갱신한다.
+
+        Args:
+            projects: {todo_id: project_code} 매핑
+
+        Returns:
+            int: 실제로 변경된 TODO 수
+        """
+        changed_keys: Dict[str, str] = {}
+        for todo_id, new_project in projects.items():
+            stored = self._item_widgets.get(todo_id)
+            if not stored:
+                continue
+            _, widget = stored
+            if not widget or not hasattr(widget, "todo_data"):
+                continue
+            if widget.todo_data.get("project") == new_project:
+                continue
+            # todo_data는 _all_rows의 행과 같은 dict이므로 목록 상태도 함께 갱신됨
+            widget.todo_data["project"] = new_project
+            if hasattr(widget, "update_project_tag"):
+                widget.update_project_tag(new_project)
+            changed_keys[f"todo:{todo_id}"] = todo_version(widget.todo_data)
+
+        if changed_keys:
+            self._rendered_rows = [
+                (key, changed_keys.get(key, version)) for key, version in self._rendered_rows
+            ]
+        return len(changed_keys)
 
     def populate_from_items(
         self,
@@ -995,13 +1017,13 @@ class TodoPanel(QWidget):
                 if todo_id:
                     self._viewed_ids.add(todo_id)
             logger.info(f"[TodoPanel] 전체 교체 모드: {len(self._viewed_ids)}개 TODO를 viewed로 처리")
-            logger.info(f"[TodoPanel] _viewed_ids 샘플 (처음 5개): {list(self._viewed_ids)[:5]}")
+            logger.debug("[TodoPanel] _viewed_ids 샘플 (처음 5개): %s", list(self._viewed_ids)[:5])
             
             self._rebuild_from_rows(prepared, show_reasoning=show_reasoning)
 
-    def _todo_identity(self, todo: dict) -> str:
-        """TODO 고유 식별자 생성 (source_message + title + description)."""
-        msg_id = None
+    @staticmethod
+    def _source_message_id(todo: dict) -> Optional[str]:
+        """TODO의 원본 메시지 ID (없으면 None)"""
         source_message = todo.get("source_message")
         if isinstance(source_message, str):
             try:
@@ -1009,11 +1031,16 @@ class TodoPanel(QWidget):
             except Exception:
                 source_message = None
         if isinstance(source_message, dict):
-            msg_id = (
+            return (
                 source_message.get("msg_id")
                 or source_message.get("id")
                 or source_message.get("message_id")
             )
+        return None
+
+    def _todo_identity(self, todo: dict) -> str:
+        """TODO 고유 식별자 생성 (source_message + title + description)."""
+        msg_id = self._source_message_id(todo)
         
         # 제목 정규화
         title = (todo.get("title") or "").strip().lower()
@@ -1073,18 +1100,32 @@ class TodoPanel(QWidget):
                 len(merged),
             )
             
-            # 중복된 TODO 상세 정보 출력 (처음 10개만)
-            logger.info("[TodoPanel] === 중복 제거된 TODO 샘플 (최대 10개) ===")
-            for idx, dup in enumerate(duplicates_info[:10], 1):
-                logger.info(f"  [{idx}] Identity: {dup['identity']}")
-                logger.info(f"      원본 제목: {dup['original_title']}")
-                logger.info(f"      중복 제목: {dup['duplicate_title']}")
-                logger.info(f"      원본 설명: {dup['original_desc']}...")
-                logger.info(f"      중복 설명: {dup['duplicate_desc']}...")
-                logger.info(f"      요청자: {dup['requester']}, 마감일: {dup['deadline']}")
-                logger.info("")
-        
-        return list(merged.values())
+            # 중복된 TODO 상세 정보 출력 (처음 10개만, DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TodoPanel] === 중복 제거된 TODO 샘플 (최대 10개) ===")
+                for idx, dup in enumerate(duplicates_info[:10], 1):
+                    logger.debug(
+                        "  [%d] Identity: %s\n      원본 제목: %s\n      중복 제목: %s\n"
+                        "      원본 설명: %s...\n      중복 설명: %s...\n      요청자: %s, 마감일: %s",
+                        idx, dup['identity'], dup['original_title'], dup['duplicate_title'],
+                        dup['original_desc'], dup['duplicate_desc'], dup['requester'], dup['deadline'],
+                    )
+        
+        # 내용이 거의 같은 TODO 병합 (다른 메시지에서 생성된 같은 요청자의 TODO 포함)
+        rows, near_count = get_todo_deduplication_service().deduplicate(
+            list(merged.values()),
+            text_of=lambda t: t.get("description") or t.get("title") or "",
+            type_of=lambda t: t.get("type") or "",
+            group_of=self._source_message_id,
+            owner_of=lambda t: (t.get("requester") or "").strip().lower(),
+            threshold=0.9,
+            cross_group_threshold=0.9,
+            merge=self._merge_todo_records,
+        )
+        if near_count:
+            logger.info(f"[TodoPanel] 유사 중복 TODO {near_count}개 병합 ({len(merged)}개 → {len(rows)}개)")
+        
+        return rows
 
     def _merge_todo_records(self, base: dict, candidate: dict) -> dict:
         """중복 TODO 간에 정보를 병합하고 더 풍부한 데이터를 유지한다."""
@@ -1119,6 +1160,7 @@ class TodoPanel(QWidget):
 
         return merged
     
+    @profiled("gui_refresh_todo_list", all_threads=False)
     def refresh_todo_list(self, show_reasoning: bool = False, preserve_existing_on_empty: bool = True) -> None:
         """TODO 리스트 새로고침
         
@@ -1180,6 +1222,21 @@ class TodoPanel(QWidget):
         self.update_project_tags(rows)
         self._rebuild_from_rows(rows, show_reasoning=show_reasoning)
     
+    def show_cached_rows(self, rows: List[dict]) -> None:
+        """시작 단계에서 백그라운드로 읽어 온 TODO를 즉시 표시
+
+        프로젝트 태그 분석 등 후속 작업 없이 마지막 상태만 그립니다.
+        이미 다른 경로로 목록이 채워졌다면 덮어쓰지 않습니다.
+        """
+        if self._all_rows or not rows:
+            return
+        for row in rows:
+            if row.get("id"):
+                self._viewed_ids.add(row["id"])
+        self._rebuild_from_rows(rows)
+        self._update_project_tag_bar_from_todos(self._all_rows)
+        logger.info(f"[TodoPanel] 캐시된 TODO {len(rows)}개 표시")
+
     def _get_current_persona_email(self) -> Optional[str]:
         """현재 선택된 페르소나의 이메일 주소 가져오기"""
         try:
@@ -1304,9 +1361,8 @@ class TodoPanel(QWidget):
 
     def _re_render(self) -> None:
         if not self._all_rows:
-            self.todo_list.clear()
+            self._clear_rendered_rows()
             self.todo_label.setVisible(False)
-            self._item_widgets.clear()
             self._top3_cache = []
             self._update_top3_header([])
             self.todo_list.addItem("등록된 TODO가 없습니다.")
@@ -1326,18 +1382,27 @@ class TodoPanel(QWidget):
         filtered_rest = [todo for todo in self._rest_all if self._match_filters(todo)]
 
         if not filtered_top3 and not filtered_rest:
-            self.todo_list.clear()
+            self._clear_rendered_rows()
             self.todo_label.setVisible(False)
-            self._item_widgets.clear()
             self.todo_list.addItem("검색 조건에 맞는 TODO가 없습니다.")
             return
 
         self._render_rest(filtered_top3, filtered_rest)
 
-    def _render_rest(self, top3_preview: List[dict], rest: List[dict]) -> None:
+    def _clear_rendered_rows(self) -> None:
+        """리스트와 증분 렌더링 상태를 모두 비운다."""
         self.todo_list.clear()
-        sections: List[tuple[str, str, List[dict]]] = []
         self._item_widgets.clear()
+        self._rendered_rows = []
+        self._row_items = {}
+
+    def _render_rest(self, top3_preview: List[dict], rest: List[dict]) -> None:
+        """섹션별 TODO 목록을 렌더링한다.
+
+        이전 렌더링 결과와 (key, version) 단위로 diff를 계산하여
+        변경된 행만 삽입/갱신/이동/제거하고, 변경 없는 행의 위젯은 유지한다.
+        """
+        sections: List[tuple[str, str, List[dict]]] = []
 
         if top3_preview:
             sections.append(("top3", "🔺 Top-3 미리보기", list(top3_preview)))
@@ -1355,56 +1420,129 @@ class TodoPanel(QWidget):
             ("low", "🧊 Low Priority", buckets["low"]),
         ])
 
-        any_items = False
-        for key, label, bucket in sections:
+        desired: List[Tuple[str, str, object]] = []
+        seen_keys: set[str] = set()
+        for section_key, label, bucket in sections:
             if not bucket:
                 continue
-            any_items = True
-            header = QLabel(label)
-            header.setStyleSheet("padding:6px 10px; font-weight:700; color:#1F2937; background:#E5E7EB; border-radius:6px;")
-            header_item = QListWidgetItem()
-            header_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            header_item.setSizeHint(header.sizeHint())
-            self.todo_list.addItem(header_item)
-            self.todo_list.setItemWidget(header_item, header)
-
-            unread_count = 0
+            desired.append((f"section:{section_key}", label, label))
             for idx, todo in enumerate(bucket):
-                todo_id = todo.get("id")
-                
                 # unread 기능 비활성화 - 항상 읽음 상태로 표시
-                is_new_todo = False
-                unread = False
-                
-                if unread:
-                    unread_count += 1
-                
-                # 디버깅: 처음 3개 TODO 또는 unread TODO만 로그 출력
-                if idx < 3 or unread:
-                    logger.info(f"[TodoPanel] 렌더링 TODO #{idx+1}: id={todo_id}, is_new={is_new_todo}, unread={unread}, in_viewed_ids={todo_id in self._viewed_ids if todo_id else 'N/A'}")
-                
-                # viewed 상태 업데이트
-                if not is_new_todo:
-                    todo["_viewed"] = True
-                
-                widget = BasicTodoItem(todo, parent=self, unread=unread)
-                widget.mark_done_clicked.connect(self._on_mark_done_clicked)
-                item = QListWidgetItem()
-                item.setSizeHint(widget.sizeHint())
-                item.setData(Qt.ItemDataRole.UserRole, todo)
-                self.todo_list.addItem(item)
-                self.todo_list.setItemWidget(item, widget)
-                if todo_id:
-                    self._item_widgets[todo_id] = (item, widget)
-            
-            if unread_count > 0:
-                logger.info(f"[TodoPanel] {label} 섹션: {unread_count}개 unread TODO 발견!")
-
-        if not any_items:
+                todo["_viewed"] = True
+                todo_id = todo.get("id")
+                row_key = f"todo:{todo_id}" if todo_id else f"todo:{section_key}:{idx}"
+                if row_key in seen_keys:
+                    row_key = f"{row_key}#{idx}"
+                seen_keys.add(row_key)
+                desired.append((row_key, todo_version(todo), todo))
+
+        if not desired:
+            self._clear_rendered_rows()
             self.todo_label.setVisible(False)
             self.todo_list.addItem("추가로 처리할 TODO가 없습니다.")
+            return
+
+        # 안내 문구 등 diff 대상이 아닌 아이템이 있으면 처음부터 다시 구성
+        if self.todo_list.count() != len(self._rendered_rows):
+            self._clear_rendered_rows()
+
+        new_rows = [(row_key, version) for row_key, version, _ in desired]
+        payloads = {row_key: payload for row_key, _, payload in desired}
+        diff = compute_todo_diff(self._rendered_rows, new_rows)
+
+        if not diff.is_empty:
+            for row_key in diff.removed + [row_key for row_key, _ in diff.moved]:
+                self._take_row(row_key)
+            for row_key, index, _ in diff.inserts_in_order():
+                self._insert_row(index, row_key, payloads[row_key])
+            for row_key in diff.updated:
+                self._update_row(row_key, payloads[row_key])
+            logger.info("[TodoPanel] 증분 렌더링: %s", diff.summary())
+
+        # 변경 없는 행은 위젯을 유지하되 최신 dict를 참조하도록 다시 연결
+        touched = set(diff.updated)
+        touched.update(row_key for row_key, _ in diff.inserted)
+        touched.update(row_key for row_key, _ in diff.moved)
+        for row_key, _, payload in desired:
+            if row_key not in touched and isinstance(payload, dict):
+                self._rebind_row(row_key, payload)
+
+        self._rendered_rows = new_rows
+        self.todo_label.setVisible(True)
+
+    def _take_row(self, row_key: str) -> None:
+        """리스트에서 행을 제거한다 (위젯은 Qt가 정리)."""
+        item = self._row_items.pop(row_key, None)
+        if row_key.startswith("todo:"):
+            self._item_widgets.pop(row_key[len("todo:"):], None)
+        if item is None:
+            return
+        row = self.todo_list.row(item)
+        if row >= 0:
+            self.todo_list.takeItem(row)
+
+    def _insert_row(self, index: int, row_key: str, payload: object) -> None:
+        """지정 위치에 섹션 헤더 또는 TODO 행을 삽입한다."""
+        item = QListWidgetItem()
+        if isinstance(payload, dict):
+            widget = BasicTodoItem(payload, parent=self, unread=False)
+            widget.mark_done_clicked.connect(self._on_mark_done_clicked)
+            item.setData(Qt.ItemDataRole.UserRole, payload)
+            todo_id = payload.get("id")
+            if todo_id:
+                self._item_widgets[todo_id] = (item, widget)
         else:
-            self.todo_label.setVisible(True)
+            widget = QLabel(str(payload))
+            widget.setStyleSheet("padding:6px 10px; font-weight:700; color:#1F2937; background:#E5E7EB; border-radius:6px;")
+            item.setFlags(Qt.ItemFlag.NoItemFlags)
+        item.setSizeHint(widget.sizeHint())
+        self.todo_list.insertItem(index, item)
+        self.todo_list.setItemWidget(item, widget)
+        self._row_items[row_key] = item
+
+    def _rebind_row(self, row_key: str, todo: dict) -> None:
+        """위젯을 다시 만들지 않고 행이 참조하는 TODO dict만 교체한다."""
+        item = self._row_items.get(row_key)
+        if item is None:
+            return
+        widget = self.todo_list.itemWidget(item)
+        if widget is not None and hasattr(widget, "todo_data"):
+            widget.todo = todo
+            widget.todo_data = todo
+        item.setData(Qt.ItemDataRole.UserRole, todo)
+
+    def _update_row(self, row_key: str, payload: object) -> None:
+        """기존 행을 제자리에서 갱신한다.
+
+        프로젝트 태그만 바뀐 경우 위젯을 유지한 채 태그만 교체하고,
+        그 외 변경은 해당 행의 위젯만 새로 만든다.
+        """
+        item = self._row_items.get(row_key)
+        if item is None or not isinstance(payload, dict):
+            return
+
+        old_widget = self.todo_list.itemWidget(item)
+        old_todo = getattr(old_widget, "todo_data", None)
+        if isinstance(old_todo, dict):
+            changed = {name for name in VERSION_FIELDS if old_todo.get(name) != payload.get(name)}
+            if changed == {"project"} and old_todo.get("source_message") == payload.get("source_message"):
+                old_widget.todo = payload
+                old_widget.todo_data = payload
+                old_widget.update_project_tag(payload.get("project"))
+                item.setData(Qt.ItemDataRole.UserRole, payload)
+                todo_id = payload.get("id")
+                if todo_id:
+                    self._item_widgets[todo_id] = (item, old_widget)
+                return
+
+        widget = BasicTodoItem(payload, parent=self, unread=False)
+        widget.mark_done_clicked.connect(self._on_mark_done_clicked)
+        item.setData(Qt.ItemDataRole.UserRole, payload)
+        item.setSizeHint(widget.sizeHint())
+        self.todo_list.setItemWidget(item, widget)
+        todo_id = payload.get("id")
+        if todo_id:
+            self._item_widgets[todo_id] = (item, widget)
 
     def _match_filters(self, todo: dict) -> bool:
         # 프로젝트 필터 확인
@@ -1430,7 +1568,33 @@ class TodoPanel(QWidget):
             todo.get("type", ""),
             todo.get("project", ""),  # 프로젝트도 검색 대상에 포함
         ]).lower()
-        return search in haystack
+        if search in haystack:
+            return True
+        return todo.get("id") in self._semantic_search_ids(search)
+
+    def _semantic_search_ids(self, search: str) -> set[str]:
+        """의미 인덱스에서 검색어와 가까운 TODO ID (SEMANTIC_INDEX 사용 시, 검색어별 1회 조회)"""
+        if not SEMANTIC_INDEX_CONFIG["enabled"]:
+            return set()
+        cached_search, cached_ids = self._semantic_search
+        if cached_search == search:
+            return cached_ids
+        try:
+            from src.services.semantic_index_service import get_semantic_index_service
+
+            ids = get_semantic_index_service().search_todo_ids(
+                search,
+                k=SEMANTIC_INDEX_CONFIG["search_top_k"],
+                min_similarity=SEMANTIC_INDEX_CONFIG["min_similarity"],
+            )
+        except Exception as e:
+            logger.debug("의미 검색 실패: %s", e)
+            ids = set()
+        if ids is None:
+            # 임베딩 모델 로드 중: 캐시하지 않고 다음 렌더링 때 다시 조회
+            return set()
+        self._semantic_search = (search, ids)
+        return ids
 
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         if not item:
@@ -1634,7 +1798,7 @@ class TodoPanel(QWidget):
                         self.todo_list.setItemWidget(list_item, new_widget)
                         self._item_widgets[todo_id] = (list_item, new_widget)
                         
-                        logger.info(f"TODO {todo_id} 위젯을 Completed 상태로 업데이트")
+                        logger.debug("TODO %s 위젯을 Completed 상태로 업데이트", todo_id)
                         break
     
     def _on_project_filter_changed(self, project_code: str) -> None:
@@ -1761,6 +1925,8 @@ class TodoPanel(QWidget):
     
     def cleanup_async_services(self):
         """비동기 서비스 정리"""
+        if hasattr(self, 'change_bridge') and self.change_bridge:
+            self.change_bridge.close()
         if hasattr(self, 'async_project_service') and self.async_project_service:
             self.async_project_service.stop()
             logger.info("🛑 비동기 프로젝트 태그 서비스 정리 완료")
@@ -5,6 +5,9 @@
 import asyncio
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from src.utils.sampling_profiler import get_sampling_profiler
+from src.utils.tracing import get_tracer
+
 
 class WorkerThread(QThread):
     """백그라운드 작업 스레드"""
@@ -23,6 +26,11 @@ class WorkerThread(QThread):
         self._should_stop = False
     
     def run(self):
+        # 분석 실행 전체를 루트 스팬으로 기록 (단계별 스팬은 SmartAssistant 메서드에서 생성)
+        run_span = get_tracer().start_span("analysis_run", category="run")
+        # 프로파일링 모드(PROFILE_SAMPLING=1 또는 성능 패널)에서만 스택 샘플링
+        profile = get_sampling_profiler().start("analysis_run")
+        error = None
         try:
             # 비동기 작업을 동기적으로 실행
             loop = asyncio.new_event_loop()
@@ -79,9 +87,12 @@ class WorkerThread(QThread):
             self.result_ready.emit(result)
             
         except Exception as e:
+            error = e
             self.error_occurred.emit(f"오류 발생: {str(e)}")
         finally:
             loop.close()
+            get_tracer().end_span(run_span, error=error)
+            get_sampling_profiler().stop(profile)
     
     def stop(self):
         self._should_stop = True
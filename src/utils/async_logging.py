@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 로깅 설정 (QueueHandler/QueueListener)
+
+분석/렌더링 루프에서 항목마다 찍히는 로그가 호출 스레드(GUI 스레드 포함)를 막지 않도록
+로거는 레코드를 큐에 넣기만 하고, 포맷과 출력(콘솔/파일)은 리스너 스레드가 처리합니다.
+
+- 지연 포맷: `logger.debug("처리 %s개", n)`처럼 %-스타일 인자를 쓰면 문자열 조합이
+  리스너 스레드에서 일어나고, 레벨에서 걸러지면 아예 일어나지 않습니다.
+  (인자가 가변 객체이면 큐에 넣기 전에 문자열로 고정)
+- 반복 억제: 같은 호출 위치(파일:줄)의 INFO 이하 로그를 창(window)마다 일정 개수까지만 출력하고,
+  다음 창의 첫 로그에 생략된 개수를 덧붙입니다. WARNING 이상은 항상 출력합니다.
+- 샘플링: 모듈별로 INFO 이하 로그를 N개 중 1개만 출력 (`LOG_PROFILES[...]["sample_rates"]`)
+- 프로필: `LOG_PROFILE=production`이면 억제/샘플링을 강화하고 JSON 한 줄 형식으로 출력
+
+사용 예:
+    from src.utils.async_logging import setup_logging
+    setup_logging()                       # LOG_PROFILE 환경 변수 기준
+    setup_logging(profile="production")   # 명시
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import LOG_PROFILE, LOG_PROFILES, LOGGING_CONFIG
+
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None), bytes)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서 포맷하지 않고 큐에 넣기만 하는 핸들러 (같은 프로세스 리스너 전용)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 QueueHandler.prepare는 호출 스레드에서 메시지를 포맷하므로 재정의
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in values):
+                # 가변 객체는 출력 시점에 내용이 바뀔 수 있으므로 지금 문자열로 고정
+                record.msg = record.getMessage()
+                record.args = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """호출 위치별 반복 억제 + 모듈별 샘플링 (INFO 이하에만 적용)"""
+
+    def __init__(
+        self,
+        per_window: int = 50,
+        window_seconds: float = 10.0,
+        sample_rates: Optional[Dict[str, float]] = None,
+        max_level: int = logging.INFO,
+    ):
+        super().__init__()
+        self.per_window = per_window
+        self.window_seconds = window_seconds
+        self.sample_rates = {_normalize_name(name): rate for name, rate in (sample_rates or {}).items()}
+        self.max_level = max_level
+        # (파일 경로, 줄 번호) → [창 시작 시각, 창 내 출력 수, 생략 수, 누적 호출 수]
+        self._sites: Dict[Tuple[str, int], List[float]] = {}
+        self._sample_every: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+
+        every = self._sample_every.get(record.name)
+        if every is None:
+            every = self._sample_every[record.name] = self._resolve_sample_every(record.name)
+
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = [record.created, 0, 0, 0]
+            site[3] += 1
+            if every > 1 and (site[3] - 1) % every:
+                return False
+            suppressed = 0
+            if record.created - site[0] >= self.window_seconds:
+                suppressed = int(site[2])
+                site[0], site[1], site[2] = record.created, 0, 0
+            if site[1] >= self.per_window:
+                site[2] += 1
+                return False
+            site[1] += 1
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+    def _resolve_sample_every(self, logger_name: str) -> int:
+        name = _normalize_name(logger_name)
+        for prefix, rate in self.sample_rates.items():
+            if (name == prefix or name.startswith(prefix + ".")) and 0 < rate < 1:
+                return max(1, round(1 / rate))
+        return 1
+
+
+def _normalize_name(name: str) -> str:
+    # main.py가 src/를 sys.path에 추가하므로 같은 모듈이 "src.x"와 "x" 두 이름으로 로깅될 수 있음
+    return name[len("src."):] if name.startswith("src.") else name
+
+
+class TextFormatter(logging.Formatter):
+    """기본 텍스트 형식 + 반복 억제로 생략된 개수 표시"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            text += f" (같은 위치 로그 {suppressed}건 생략)"
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 수집기용 JSON 한 줄 형식"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            "process": record.processName,
+        }
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            payload["suppressed"] = suppressed
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+# 전역 리스너 (프로세스당 하나)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[DeferredQueueHandler] = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(
+    profile: Optional[str] = None,
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    force: bool = False,
+) -> Optional[logging.handlers.QueueListener]:
+    """루트 로거에 비동기 큐 핸들러 설치
+
+    `logging.basicConfig`처럼 루트 로거에 이미 핸들러가 있으면(테스트 러너 등) 아무 것도 하지 않습니다.
+
+    Args:
+        profile: "development" | "production" (None이면 LOG_PROFILE)
+        level: 루트 로그 레벨 (None이면 프로필 값)
+        fmt: 텍스트 형식 문자열 (None이면 LOGGING_CONFIG 기본 형식)
+        force: 기존 설정을 지우고 다시 설치
+
+    Returns:
+        시작된 QueueListener (설치하지 않았으면 None)
+    """
+    global _listener, _queue_handler
+
+    with _setup_lock:
+        root = logging.getLogger()
+        if force:
+            _stop_listener()
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+        elif _listener is not None or root.handlers:
+            return _listener
+
+        profile_name = profile or LOG_PROFILE
+        config = LOG_PROFILES.get(profile_name) or LOG_PROFILES["development"]
+
+        default_format = LOGGING_CONFIG["formatters"]["default"]
+        if config.get("format") == "json":
+            formatter: logging.Formatter = JsonFormatter()
+        else:
+            formatter = TextFormatter(fmt or default_format["format"], default_format.get("datefmt"))
+
+        handlers: List[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+        if config.get("file"):
+            log_file = Path(config["file"])
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+            ))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = DeferredQueueHandler(log_queue)
+        rate_limit = config.get("rate_limit") or {}
+        _queue_handler.addFilter(RateLimitFilter(
+            per_window=rate_limit.get("per_window", 50),
+            window_seconds=rate_limit.get("window_seconds", 10.0),
+            sample_rates=config.get("sample_rates"),
+        ))
+        root.addHandler(_queue_handler)
+        root.setLevel((level or config.get("level") or "INFO").upper())
+        for name, module_level in (config.get("module_levels") or {}).items():
+            logging.getLogger(name).setLevel(module_level)
+        if profile_name == "production":
+            # 로깅 중 예외(포맷 오류 등)로 stderr에 스택이 쏟아지지 않도록
+            logging.raiseExceptions = False
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def flush_logging() -> None:
+    """큐에 쌓인 로그를 모두 출력할 때까지 대기 (atexit이 실행되지 않는 워커 프로세스용)"""
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+
+
+def shutdown_logging() -> None:
+    """리스너를 멈추고 큐에 남은 로그를 모두 출력"""
+    with _setup_lock:
+        _stop_listener()
+
+
+def _stop_listener() -> None:
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        try:
+            _listener.stop()
+        except Exception:
+            pass
+        for handler in _listener.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
@@ -189,7 +189,7 @@ def filter_by_recipient_type(messages: List[Dict[str, Any]]) -> Tuple[List[Dict[
     filtered_messages = []
     stats = {"to_kept": 0, "cc_kept": 0, "bcc_kept": 0, "removed": 0}
     
-    for (sender, subject), group in groups.items():
+    for group in groups.values():
         if len(group) == 1:
             # 그룹에 메시지가 하나만 있으면 그대로 유지
             filtered_messages.append(group[0])
@@ -104,6 +104,37 @@ class ProjectClassifier:
         # 3. 점수 통합 및 최종 분류
         return self._combine_scores(keyword_scores, sender_scores, full_text, sender)
     
+    def classify_by_keywords(self,
+                             message_content: str,
+                             subject: Optional[str] = None) -> ProjectClassification:
+        """
+        키워드만으로 분류 (발신자 점수 제외)
+        
+        발신자 신호를 따로 계산하는 쪽에서 같은 근거를 두 번 합산하지 않도록
+        발신자 가중치를 섞지 않습니다. 신뢰도는 `keyword_score * keyword_weight`이며,
+        최고 점수 프로젝트가 여러 개면 분류하지 않습니다.
+        
+        Args:
+            message_content: 메시지 내용
+            subject: 제목 (이메일의 경우)
+            
+        Returns:
+            ProjectClassification 객체 (sender_score는 항상 0)
+        """
+        self._load_mappings()
+        
+        full_text = message_content
+        if subject:
+            full_text = f"{subject} {message_content}"
+        
+        keyword_scores = self._classify_by_keywords(full_text)
+        top_scores = sorted((score for score, _ in keyword_scores.values()), reverse=True)
+        if len(top_scores) > 1 and top_scores[0] == top_scores[1]:
+            # 여러 프로젝트에 같은 강도로 걸리는 키워드는 근거가 되지 않음
+            keyword_scores = {}
+        
+        return self._combine_scores(keyword_scores, {}, full_text, "")
+    
     def _classify_by_keywords(self, text: str) -> Dict[int, Tuple[float, List[str]]]:
         """
         키워드 기반 분류
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+내장 샘플링 프로파일러 (사용자 PC에서 느려지는 원인 진단용)
+
+별도 데몬 스레드가 일정 간격(`interval_ms`)마다 `sys._current_frames()`로 각 스레드의
+호출 스택을 찍어 세션별로 집계합니다. 대상 코드에 계측을 넣지 않으므로 오버헤드가 작고
+(간격 10ms 기준 수 % 이하), 세션이 없으면 샘플링 스레드도 멈춥니다.
+
+세션이 끝나면 `data/profiles/`에 실행 단위로 파일을 씁니다.
+- `*.collapsed.txt`: Brendan Gregg collapsed stacks (`flamegraph.pl`, speedscope 가져오기)
+- `*.speedscope.json`: https://www.speedscope.app 에서 바로 열 수 있는 형식 (스레드별 프로파일)
+
+기본은 꺼져 있으며 `PROFILE_SAMPLING=1` 또는 성능 패널의 체크박스로 켭니다.
+
+사용 예:
+    from src.utils.sampling_profiler import profile_session, profiled
+
+    with profile_session("analysis_run"):          # 모든 스레드 샘플링
+        ...
+
+    @profiled("gui_refresh", all_threads=False)     # 호출한 스레드(GUI 스레드)만 샘플링
+    def refresh_todo_list(self): ...
+"""
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.config.settings import PROFILING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# (함수명, 파일 경로, 함수 시작 줄) - 줄 단위가 아닌 함수 단위로 집계해 스택 종류 수를 줄임
+Frame = Tuple[str, str, int]
+Stack = Tuple[Frame, ...]
+
+
+@dataclass
+class ProfileSession:
+    """프로파일 세션 (한 번의 분석 실행 또는 GUI 새로고침)"""
+    name: str
+    thread_ids: Optional[Set[int]]        # None이면 모든 스레드
+    interval_ms: float
+    started_at: datetime = field(default_factory=datetime.now)
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: Optional[int] = None
+    samples: int = 0
+    stacks: Dict[int, Counter] = field(default_factory=dict)       # 스레드 ID → Counter[Stack]
+    thread_names: Dict[int, str] = field(default_factory=dict)
+    files: List[Path] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def record(self, thread_id: int, stack: Stack) -> None:
+        counter = self.stacks.get(thread_id)
+        if counter is None:
+            counter = self.stacks[thread_id] = Counter()
+        counter[stack] += 1
+        self.samples += 1
+
+    def top_functions(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """스택 맨 위(self time) 기준 상위 함수"""
+        totals: Counter = Counter()
+        for counter in self.stacks.values():
+            for stack, count in counter.items():
+                if stack:
+                    func, filename, _ = stack[-1]
+                    totals[f"{func} ({Path(filename).name})"] += count
+        return totals.most_common(limit)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_ms": round(self.duration_ms, 1),
+            "samples": self.samples,
+            "threads": len(self.stacks),
+            "top_functions": self.top_functions(5),
+            "files": [str(p) for p in self.files],
+        }
+
+    def to_collapsed(self) -> str:
+        """collapsed stacks 텍스트 (`스레드;바깥;...;안쪽 샘플수`)"""
+        lines = []
+        for thread_id, counter in self.stacks.items():
+            thread_label = _sanitize(self.thread_names.get(thread_id, str(thread_id)))
+            for stack, count in counter.most_common():
+                frames = ";".join(_sanitize(_frame_label(frame)) for frame in stack)
+                lines.append(f"{thread_label};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """speedscope 파일 형식 (sampled 프로파일, 스레드마다 하나)"""
+        frame_index: Dict[Frame, int] = {}
+        frames: List[Dict[str, Any]] = []
+        profiles = []
+        for thread_id, counter in self.stacks.items():
+            samples: List[List[int]] = []
+            weights: List[float] = []
+            for stack, count in counter.items():
+                indices = []
+                for frame in stack:
+                    index = frame_index.get(frame)
+                    if index is None:
+                        index = frame_index[frame] = len(frames)
+                        frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                    indices.append(index)
+                samples.append(indices)
+                weights.append(count * self.interval_ms)
+            profiles.append({
+                "type": "sampled",
+                "name": self.thread_names.get(thread_id, str(thread_id)),
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": f"{self.name} {self.started_at.isoformat(timespec='seconds')}",
+            "exporter": "smart_assistant.sampling_profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+def _frame_label(frame: Frame) -> str:
+    func, filename, lineno = frame
+    return f"{func} ({Path(filename).name}:{lineno})"
+
+
+def _sanitize(text: str) -> str:
+    # collapsed 형식 구분자(;, 공백 뒤 숫자)와 충돌하지 않도록 치환
+    return text.replace(";", ":").replace("\n", " ")
+
+
+class SamplingProfiler:
+    """`sys._current_frames()` 기반 샘플링 프로파일러"""
+
+    def __init__(
+        self,
+        interval_ms: float = 10.0,
+        output_dir: Optional[Path] = None,
+        output_format: str = "both",
+        enabled: bool = False,
+        max_depth: int = 64,
+        max_files: int = 40,
+        min_duration_ms: float = 200.0,
+        history_size: int = 20,
+    ):
+        """
+        Args:
+            interval_ms: 샘플링 간격 (ms)
+            output_dir: 프로파일 파일 저장 디렉터리 (None이면 파일로 쓰지 않음)
+            output_format: "collapsed" | "speedscope" | "both"
+            enabled: 활성화 여부 (비활성이면 세션을 만들지 않음)
+            max_depth: 샘플당 최대 스택 깊이 (깊은 재귀에서 비용 제한)
+            max_files: 출력 디렉터리에 유지할 최대 파일 수
+            min_duration_ms: 이보다 짧은 세션은 파일로 쓰지 않음
+            history_size: 보관할 최근 세션 요약 수
+        """
+        self.interval_ms = max(1.0, float(interval_ms))
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.output_format = output_format
+        self.enabled = enabled
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.min_duration_ms = min_duration_ms
+        self._sessions: List[ProfileSession] = []
+        self._history: deque = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 세션
+    # ------------------------------------------------------------------
+    def start(self, name: str, all_threads: bool = True) -> Optional[ProfileSession]:
+        """세션 시작 (비활성 상태면 None)"""
+        if not self.enabled:
+            return None
+        session = ProfileSession(
+            name=name,
+            thread_ids=None if all_threads else {threading.get_ident()},
+            interval_ms=self.interval_ms,
+        )
+        with self._lock:
+            self._sessions.append(session)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+                self._thread.start()
+        return session
+
+    def stop(self, session: Optional[ProfileSession]) -> List[Path]:
+        """세션 종료 및 파일 저장"""
+        if session is None or session.end_ns is not None:
+            return []
+        session.end_ns = time.perf_counter_ns()
+        with self._lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        if session.samples and self.output_dir and session.duration_ms >= self.min_duration_ms:
+            session.files = self._write(session)
+        self._history.append(session.summary())
+        return session.files
+
+    @contextmanager
+    def session(self, name: str, all_threads: bool = True) -> Iterator[Optional[ProfileSession]]:
+        session = self.start(name, all_threads=all_threads)
+        try:
+            yield session
+        finally:
+            self.stop(session)
+
+    def recent_profiles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 세션 요약 (최신순)"""
+        history = list(self._history)
+        history.reverse()
+        return history[:limit] if limit is not None else history
+
+    # ------------------------------------------------------------------
+    # 샘플링 스레드
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        interval = self.interval_ms / 1000.0
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    # 활성 세션이 없으면 스레드 종료 (다음 start()에서 다시 시작)
+                    self._thread = None
+                    return
+                # 잠금 안에서 기록해야 stop() 이후 세션이 더 바뀌지 않음 (샘플 1회는 수십 µs)
+                try:
+                    self._sample(self._sessions, own_id)
+                except Exception as e:
+                    logger.debug(f"[Profiler] 샘플링 오류: {e}")
+            time.sleep(interval)
+
+    def _sample(self, sessions: List[ProfileSession], own_id: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            wanted = [s for s in sessions if s.thread_ids is None or thread_id in s.thread_ids]
+            if not wanted:
+                continue
+            stack = self._extract(frame)
+            thread_name = names.get(thread_id, str(thread_id))
+            for session in wanted:
+                session.thread_names.setdefault(thread_id, thread_name)
+                session.record(thread_id, stack)
+
+    def _extract(self, frame) -> Stack:
+        frames: List[Frame] = []
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            code = frame.f_code
+            frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+            depth += 1
+        frames.reverse()
+        return tuple(frames)
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+    def _write(self, session: ProfileSession) -> List[Path]:
+        stamp = session.started_at.strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        base = self.output_dir / f"{stamp}_{session.name}"
+        written: List[Path] = []
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if self.output_format in ("collapsed", "both"):
+                path = base.with_suffix(".collapsed.txt")
+                path.write_text(session.to_collapsed(), encoding="utf-8")
+                written.append(path)
+            if self.output_format in ("speedscope", "both"):
+                path = base.with_suffix(".speedscope.json")
+                with path.open("w", encoding="utf-8") as fp:
+                    json.dump(session.to_speedscope(), fp, ensure_ascii=False)
+                written.append(path)
+            self._prune()
+            logger.info(
+                f"🔬 [Profiler] {session.name}: {session.duration_ms:.0f}ms, 샘플 {session.samples}개 → "
+                + ", ".join(p.name for p in written)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ [Profiler] 프로파일 저장 실패: {e}")
+        return written
+
+    def _prune(self) -> None:
+        files = sorted(
+            (p for p in self.output_dir.iterdir() if p.name.endswith((".collapsed.txt", ".speedscope.json"))),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for old in files[: max(0, len(files) - self.max_files)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def profile_session(name: str, all_threads: bool = True):
+    """프로파일 세션 컨텍스트 매니저 (비활성 상태면 아무 것도 하지 않음)"""
+    return get_sampling_profiler().session(name, all_threads=all_threads)
+
+
+def profiled(name: Optional[str] = None, all_threads: bool = True):
+    """함수 실행 구간을 프로파일 세션으로 감싸는 데코레이터 (동기 함수용)"""
+
+    def decorator(func):
+        session_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_sampling_profiler()
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.session(session_name, all_threads=all_threads):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_sampling_profiler: Optional[SamplingProfiler] = None
+_sampling_profiler_lock = threading.Lock()
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """샘플링 프로파일러 싱글톤 인스턴스 반환"""
+    global _sampling_profiler
+
+    if _sampling_profiler is None:
+        with _sampling_profiler_lock:
+            if _sampling_profiler is None:
+                _sampling_profiler = SamplingProfiler(
+                    interval_ms=PROFILING_CONFIG["interval_ms"],
+                    output_dir=Path(PROFILING_CONFIG["output_dir"]),
+                    output_format=PROFILING_CONFIG["output_format"],
+                    enabled=PROFILING_CONFIG["enabled"],
+                    max_depth=PROFILING_CONFIG["max_depth"],
+                    max_files=PROFILING_CONFIG["max_files"],
+                    min_duration_ms=PROFILING_CONFIG["min_duration_ms"],
+                    history_size=PROFILING_CONFIG["history_size"],
+                )
+    return _sampling_profiler
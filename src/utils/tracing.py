@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+"""
+경량 트레이싱 (분석 단계별 소요 시간 계측)
+
+컨텍스트 매니저 스팬으로 수집 → 필터링 → 우선순위 → 요약 → 액션 추출 → TODO 생성 →
+태깅 → Top3 각 단계의 시간(monotonic), 메시지 수, LLM 토큰, 캐시 적중률을 기록합니다.
+수집기(collector) 없이 파일로 내보냅니다.
+
+- Chrome trace JSON: chrome://tracing, https://ui.perfetto.dev 에서 열기
+- OTLP/JSON: OpenTelemetry 파일 형식 (otel-cli, Jaeger/Tempo 가져오기 등)
+
+스팬은 contextvars로 부모를 추적하므로 async 태스크(`asyncio.gather`)와 `asyncio.to_thread`로
+넘어간 작업도 같은 트레이스에 붙습니다. 자식 스팬의 카운터(LLM 토큰, 캐시 히트 등)는
+종료 시 부모로 합산되어 루트 스팬에서 전체 합계를 볼 수 있습니다.
+
+사용 예:
+    from src.utils.tracing import get_tracer, trace_cache, trace_count, traced
+
+    tracer = get_tracer()
+    with tracer.span("analysis_run", category="run", persona="pm"):
+        with tracer.span("rank", messages=len(messages)) as span:
+            ranked = ...
+            span.set(ranked=len(ranked))
+        trace_count("llm.tokens", 120)
+        trace_cache("summary_prompt", hit=True)
+
+    @traced("todo_generation")
+    async def generate_todo_list(...): ...
+
+`TRACE_EXPORT=1`이면 루트 스팬(분석 실행)이 끝날 때마다 `data/traces/`에 파일을 씁니다.
+"""
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.config.settings import TRACING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "smart_assistant"
+LATENCY_WINDOW = 500
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "smart_assistant_current_span", default=None
+)
+# 스팬 카운터는 풀 워커 스레드에서도 증가하므로 증가/합산/조회를 한 락으로 묶음
+_counters_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """트레이스 스팬 (한 단계의 실행 구간)"""
+    name: str
+    category: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int                      # time.perf_counter_ns() (구간 계산용)
+    start_wall_ns: int                 # time.time_ns() (OTLP 타임스탬프용)
+    thread_id: int
+    thread_name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    counters: Dict[str, float] = field(default_factory=dict)
+    end_ns: Optional[int] = None
+    status: str = "ok"
+    children: List["Span"] = field(default_factory=list, repr=False)
+    _parent: Optional["Span"] = field(default=None, repr=False)
+    _token: Any = field(default=None, repr=False)
+
+    def set(self, **attributes: Any) -> "Span":
+        """속성 지정 (메시지 수 등)"""
+        self.attributes.update(attributes)
+        return self
+
+    def count(self, name: str, value: float = 1) -> None:
+        """카운터 증가 (종료 시 부모 스팬으로 합산)"""
+        with _counters_lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def counter_snapshot(self) -> Dict[str, float]:
+        """카운터 사본 (다른 스레드가 증가 중이어도 안전)"""
+        with _counters_lock:
+            return dict(self.counters)
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def cache_ratios(self) -> Dict[str, float]:
+        """`cache.<이름>.hit/miss` 카운터로 캐시별 적중률 계산"""
+        counters = self.counter_snapshot()
+        ratios: Dict[str, float] = {}
+        for key, hits in counters.items():
+            if not (key.startswith("cache.") and key.endswith(".hit")):
+                continue
+            name = key[len("cache."):-len(".hit")]
+            misses = counters.get(f"cache.{name}.miss", 0)
+            total = hits + misses
+            if total:
+                ratios[f"cache.{name}.hit_ratio"] = round(hits / total, 3)
+        for key, misses in counters.items():
+            if key.startswith("cache.") and key.endswith(".miss"):
+                name = key[len("cache."):-len(".miss")]
+                ratios.setdefault(f"cache.{name}.hit_ratio", 0.0 if misses else 1.0)
+        return ratios
+
+    def summary(self) -> Dict[str, Any]:
+        """직계 자식 단계별 소요 시간 요약 (성능 패널/로그용)"""
+        stages: Dict[str, float] = {}
+        for child in self.children:
+            stages[child.name] = round(stages.get(child.name, 0.0) + child.duration_ms, 1)
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "started_at": datetime.fromtimestamp(self.start_wall_ns / 1e9).isoformat(timespec="seconds"),
+            "duration_ms": round(self.duration_ms, 1),
+            "status": self.status,
+            "stages": stages,
+            "attributes": dict(self.attributes),
+            "counters": self.counter_snapshot(),
+            **self.cache_ratios(),
+        }
+
+
+class _NullSpan:
+    """활성 스팬이 없을 때 반환하는 빈 스팬"""
+
+    def set(self, **attributes: Any) -> "_NullSpan":
+        return self
+
+    def count(self, name: str, value: float = 1) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """스팬 기록/보관/내보내기"""
+
+    def __init__(
+        self,
+        buffer_size: int = 5000,
+        history_size: int = 20,
+        export_dir: Optional[Path] = None,
+        export_format: str = "chrome",
+        export_enabled: bool = False,
+        max_files: int = 50,
+    ):
+        """
+        Args:
+            buffer_size: 메모리에 보관할 최근 종료 스팬 수
+            history_size: 보관할 최근 루트 스팬(실행) 수
+            export_dir: 자동 내보내기 디렉터리
+            export_format: "chrome" | "otlp" | "both"
+            export_enabled: 루트 스팬 종료 시 파일 자동 내보내기 여부
+            max_files: 내보내기 디렉터리에 유지할 최대 파일 수 (오래된 것부터 삭제)
+        """
+        self._spans: deque = deque(maxlen=buffer_size)
+        self._runs: deque = deque(maxlen=history_size)
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.export_dir = Path(export_dir) if export_dir else None
+        self.export_format = export_format
+        self.export_enabled = export_enabled
+        self.max_files = max_files
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def start_span(self, name: str, category: str = "analysis", **attributes: Any) -> Span:
+        """스팬 시작 (긴 코드 블록용; 반드시 같은 태스크에서 `end_span`으로 종료)"""
+        parent = _current_span.get()
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            category=category,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.perf_counter_ns(),
+            start_wall_ns=time.time_ns(),
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+        span._parent = parent
+        span._token = _current_span.set(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """스팬 종료 및 기록"""
+        if span.end_ns is not None:
+            return
+        span.end_ns = time.perf_counter_ns()
+        if error is not None:
+            span.status = "error"
+            span.attributes["error"] = f"{type(error).__name__}: {error}"
+        try:
+            _current_span.reset(span._token)
+        except ValueError:
+            # 다른 컨텍스트에서 종료된 경우 (토큰 재사용 불가) → 부모로 되돌림
+            _current_span.set(span._parent)
+        self._finish(span, span._parent)
+
+    @contextmanager
+    def span(self, name: str, category: str = "analysis", **attributes: Any) -> Iterator[Span]:
+        """스팬 컨텍스트 매니저 (현재 스팬의 자식으로 기록, 없으면 새 트레이스의 루트)"""
+        span = self.start_span(name, category, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=e)
+            raise
+        self.end_span(span)
+
+    def _finish(self, span: Span, parent: Optional[Span]) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if parent is not None:
+                parent.children.append(span)
+                with _counters_lock:
+                    for key, value in span.counters.items():
+                        parent.counters[key] = parent.counters.get(key, 0) + value
+            elif span.category == "run":
+                self._runs.append(span)
+        if parent is None and span.category == "run":
+            logger.info(
+                f"⏱️ [Trace] {span.name} {span.duration_ms:.0f}ms - "
+                + ", ".join(f"{stage} {ms:.0f}ms" for stage, ms in span.summary()["stages"].items())
+            )
+            if self.export_enabled and self.export_dir:
+                self.export_run(span)
+
+    def record_latency(self, name: str, seconds: float) -> None:
+        """호출 지연 시간 기록 (예: "llm"; 최근 LATENCY_WINDOW개로 백분위 계산)"""
+        with self._lock:
+            window = self._latencies.get(name)
+            if window is None:
+                window = self._latencies[name] = deque(maxlen=LATENCY_WINDOW)
+            window.append(seconds * 1000.0)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def latency_percentiles(self, name: str) -> Dict[str, float]:
+        """최근 지연 시간 백분위 (ms) - {"count", "p50", "p90", "p99", "max"}"""
+        with self._lock:
+            values = sorted(self._latencies.get(name, ()))
+        if not values:
+            return {"count": 0}
+
+        def _pct(q: float) -> float:
+            return round(values[min(len(values) - 1, int(q * len(values)))], 1)
+
+        return {
+            "count": len(values),
+            "p50": _pct(0.50),
+            "p90": _pct(0.90),
+            "p99": _pct(0.99),
+            "max": round(values[-1], 1),
+        }
+
+    def recent_runs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 실행(루트 스팬) 요약 목록 (최신순)"""
+        with self._lock:
+            runs = list(self._runs)
+        runs.reverse()
+        if limit is not None:
+            runs = runs[:limit]
+        return [run.summary() for run in runs]
+
+    def recent_spans(self, since_ns: Optional[int] = None) -> List[Span]:
+        """보관 중인 종료 스팬 (since_ns 이후 시작한 것만)"""
+        with self._lock:
+            spans = list(self._spans)
+        if since_ns is not None:
+            spans = [span for span in spans if span.start_ns >= since_ns]
+        return spans
+
+    def trace_spans(self, trace_id: str) -> List[Span]:
+        """한 트레이스에 속한 스팬 목록"""
+        return [span for span in self.recent_spans() if span.trace_id == trace_id]
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+    def export_run(self, root: Span) -> List[Path]:
+        """실행 하나(루트 스팬과 같은 시간대의 백그라운드 스팬 포함)를 설정 형식으로 내보내기"""
+        spans = [
+            span for span in self.recent_spans(since_ns=root.start_ns)
+            if span.trace_id == root.trace_id or (span.end_ns or 0) <= (root.end_ns or 0)
+        ]
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = self.export_dir / f"{stamp}_{root.name}_{root.trace_id[:8]}"
+        written: List[Path] = []
+        try:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            if self.export_format in ("chrome", "both"):
+                written.append(self.export_chrome_trace(base.with_suffix(".trace.json"), spans))
+            if self.export_format in ("otlp", "both"):
+                written.append(self.export_otlp_json(base.with_suffix(".otlp.json"), spans))
+            self._prune_exports()
+            logger.info(f"💾 [Trace] 내보내기: {', '.join(p.name for p in written)}")
+        except Exception as e:
+            logger.warning(f"⚠️ [Trace] 내보내기 실패: {e}")
+        return written
+
+    def export_chrome_trace(self, path: Path, spans: Optional[Iterable[Span]] = None) -> Path:
+        """Chrome trace event 형식(JSON)으로 저장"""
+        spans = list(spans if spans is not None else self.recent_spans())
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000.0,
+                "dur": ((span.end_ns or span.start_ns) - span.start_ns) / 1000.0,
+                "pid": self._pid,
+                "tid": span.thread_id,
+                "args": {
+                    **_jsonable(span.attributes),
+                    **span.counter_snapshot(),
+                    **span.cache_ratios(),
+                    "status": span.status,
+                    "trace_id": span.trace_id,
+                },
+            })
+        for tid, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": thread_name}})
+        events.append({"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": SERVICE_NAME}})
+
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp, ensure_ascii=False)
+        return path
+
+    def export_otlp_json(self, path: Path, spans: Optional[Iterable[Span]] = None) -> Path:
+        """OpenTelemetry OTLP/JSON 파일 형식으로 저장 (ExportTraceServiceRequest)"""
+        spans = list(spans if spans is not None else self.recent_spans())
+        otlp_spans = []
+        for span in spans:
+            duration_ns = (span.end_ns or span.start_ns) - span.start_ns
+            attributes = {
+                **_jsonable(span.attributes),
+                **span.counter_snapshot(),
+                **span.cache_ratios(),
+                "smart_assistant.category": span.category,
+                "thread.id": span.thread_id,
+                "thread.name": span.thread_name,
+            }
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_wall_ns),
+                "endTimeUnixNano": str(span.start_wall_ns + duration_ns),
+                "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+                "status": {"code": 2 if span.status == "error" else 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _otlp_attribute("service.name", SERVICE_NAME),
+                    _otlp_attribute("process.pid", self._pid),
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "src.utils.tracing"},
+                    "spans": otlp_spans,
+                }],
+            }]
+        }
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump(payload, fp, ensure_ascii=False)
+        return path
+
+    def _prune_exports(self) -> None:
+        files = sorted(
+            (p for p in self.export_dir.glob("*.json") if p.name.endswith((".trace.json", ".otlp.json"))),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for old in files[: max(0, len(files) - self.max_files)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def _jsonable(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+        for key, value in attributes.items()
+    }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": "" if value is None else str(value)}
+    return {"key": key, "value": typed}
+
+
+# ----------------------------------------------------------------------
+# 현재 스팬 헬퍼 (활성 스팬이 없으면 아무 것도 하지 않음)
+# ----------------------------------------------------------------------
+def current_span():
+    """현재 활성 스팬 (없으면 빈 스팬)"""
+    return _current_span.get() or _NULL_SPAN
+
+
+def trace_count(name: str, value: float = 1) -> None:
+    """현재 스팬 카운터 증가 (예: "llm.calls", "llm.tokens")"""
+    span = _current_span.get()
+    if span is not None:
+        span.count(name, value)
+
+
+def trace_cache(name: str, hit: bool, count: int = 1) -> None:
+    """현재 스팬에 캐시 히트/미스 기록 (`cache.<name>.hit_ratio`로 내보내짐)"""
+    span = _current_span.get()
+    if span is not None:
+        span.count(f"cache.{name}.{'hit' if hit else 'miss'}", count)
+
+
+def traced(name: Optional[str] = None, category: str = "analysis"):
+    """함수 전체를 스팬으로 감싸는 데코레이터 (호출 시점에 트레이서 조회, 임포트 시점 안전)"""
+
+    def decorator(func):
+        span_name = name or func.__name__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_tracer().span(span_name, category=category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name, category=category):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """트레이서 싱글톤 인스턴스 반환"""
+    global _tracer
+
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer(
+                    buffer_size=TRACING_CONFIG["buffer_size"],
+                    history_size=TRACING_CONFIG["history_size"],
+                    export_dir=Path(TRACING_CONFIG["export_dir"]),
+                    export_format=TRACING_CONFIG["export_format"],
+                    export_enabled=TRACING_CONFIG["export_enabled"],
+                    max_files=TRACING_CONFIG["max_files"],
+                )
+    return _tracer
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+마감일 규칙 사전 판정 회귀 검사
+
+요청 표현 + "까지"가 있으면 과거형 수식어("작성한", "정리한")가 있어도 유효로 판정하고,
+요청 표현이 없는 과거 완료/질문 문장만 LLM 없이 무효로 판정하는지 확인합니다.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.deadline_validator_service import DeadlineValidatorService  # noqa: E402
+
+
+class _NoLLMClient:
+    """규칙으로 판정되지 않으면 실패시키는 LLM 클라이언트"""
+
+    def generate(self, *args, **kwargs):
+        raise AssertionError("규칙으로 판정되어야 하는 문장에서 LLM 호출")
+
+
+@pytest.fixture
+def validator():
+    return DeadlineValidatorService(llm_client=_NoLLMClient())
+
+
+@pytest.mark.parametrize("text, expected_time", [
+    ("어제 작성한 보고서 내일까지 검토 부탁드립니다.", (18, 0)),
+    ("회의에서 정리한 자료를 금요일까지 공유해 주세요.", (18, 0)),
+    ("디자인 시안 내일 오전까지 전달 부탁드립니다.", (12, 0)),
+])
+def test_request_with_deadline_is_valid_even_with_past_participle(validator, text, expected_time):
+    verdict = validator._rule_verdict(text)
+    assert verdict is not None and verdict.valid
+    assert verdict.time == expected_time
+
+
+@pytest.mark.parametrize("text", [
+    "오늘 리뷰한 문서는 공유 드라이브에 있습니다.",
+    "자료는 언제까지 공유해주실 수 있을까요?",
+])
+def test_past_completion_and_question_are_invalid(validator, text):
+    verdict = validator._rule_verdict(text)
+    assert verdict is not None and not verdict.valid
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+페르소나 TODO 영구 캐시 회귀 검사
+
+재시작 후 같은 데이터셋의 같은 틱이면 데이터 버전이 그대로라 디스크 스냅샷을 바로 쓰는지 확인합니다.
+"""
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.persona_todo_cache_service import (  # noqa: E402
+    CacheKey,
+    CachedAnalysisResult,
+    PersonaTodoCacheService,
+    dataset_identity,
+    make_data_version,
+)
+
+
+def _make_vdos_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE chat_messages (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.execute("INSERT INTO chat_messages (body) VALUES ('안녕하세요')")
+    conn.commit()
+    conn.close()
+
+
+def _result(persona_id: str, key: CacheKey) -> CachedAnalysisResult:
+    return CachedAnalysisResult(
+        cache_key=key.to_hash(),
+        persona_id=persona_id,
+        todo_list=[{"id": "t1", "title": "보고서 검토"}],
+        messages=[{"msg_id": "m1"}],
+        analysis_summary={"todo_count": 1},
+        analysis_data=[],
+        created_at=datetime.now(),
+        last_accessed_at=datetime.now(),
+    )
+
+
+def test_dataset_identity_survives_reads_and_writes(tmp_path):
+    vdos_db = tmp_path / "vdos.db"
+    _make_vdos_db(vdos_db)
+    before = dataset_identity(str(vdos_db))
+
+    # 읽기 전용 사용 후 연결 종료(체크포인트)와 추가 쓰기 모두 식별자를 바꾸지 않음
+    conn = sqlite3.connect(vdos_db)
+    conn.execute("SELECT * FROM chat_messages").fetchall()
+    conn.close()
+    conn = sqlite3.connect(vdos_db)
+    conn.execute("INSERT INTO chat_messages (body) VALUES ('추가 메시지')")
+    conn.commit()
+    conn.close()
+
+    assert before and dataset_identity(str(vdos_db)) == before
+    assert dataset_identity(str(tmp_path / "other.db")) == ""
+
+
+def test_warm_restart_on_same_tick_reuses_snapshot(tmp_path):
+    vdos_db = tmp_path / "vdos.db"
+    cache_db = tmp_path / "persona_cache.db"
+    _make_vdos_db(vdos_db)
+
+    version = make_data_version(42, dataset_identity(str(vdos_db)))
+    key = CacheKey("pm@example.com", None, None, version)
+    service = PersonaTodoCacheService(db_path=str(cache_db))
+    service.set_data_version(version)
+    service.put(key, _result("pm@example.com", key))
+    service.close()
+
+    # 재시작 사이에 VDOS DB를 읽기만 해도 (체크포인트로 mtime 변경) 같은 버전이어야 함
+    conn = sqlite3.connect(vdos_db)
+    conn.execute("SELECT COUNT(*) FROM chat_messages").fetchone()
+    conn.close()
+
+    restarted = PersonaTodoCacheService(db_path=str(cache_db))
+    try:
+        restored_version = restarted.last_data_version()
+        assert restored_version == make_data_version(42, dataset_identity(str(vdos_db)))
+        cached = restarted.get(CacheKey("pm@example.com", None, None, restored_version))
+        assert cached is not None
+        assert cached.todo_list == [{"id": "t1", "title": "보고서 검토"}]
+    finally:
+        restarted.close()
+
+
+def _key(persona_id: str, version: str = "1@abc") -> CacheKey:
+    return CacheKey(persona_id, None, None, version)
+
+
+def test_snapshot_round_trip_restores_all_fields(tmp_path):
+    cache_db = tmp_path / "persona_cache.db"
+    key = _key("pm@example.com")
+    original = _result("pm@example.com", key)
+    original.analysis_data = [{"msg_id": "m1", "actions": ["검토"]}]
+
+    service = PersonaTodoCacheService(db_path=str(cache_db))
+    service.put(key, original)
+    assert service.flush(timeout=5)
+    service.close()
+
+    restarted = PersonaTodoCacheService(db_path=str(cache_db))
+    try:
+        restored = restarted.get(key)
+        assert restored is not None
+        assert restored.cache_key == original.cache_key
+        assert restored.todo_list == original.todo_list
+        assert restored.messages == original.messages
+        assert restored.analysis_summary == original.analysis_summary
+        assert restored.analysis_data == original.analysis_data
+        assert restarted.get_stats()["disk_hits"] == 1
+    finally:
+        restarted.close()
+
+
+def test_lru_eviction_falls_back_to_disk(tmp_path):
+    keys = [_key(f"user{i}@example.com") for i in range(3)]
+    service = PersonaTodoCacheService(max_cache_size=2, db_path=str(tmp_path / "persona_cache.db"))
+    memory_only = PersonaTodoCacheService(max_cache_size=2)
+    try:
+        for key in keys:
+            service.put(key, _result(key.persona_id, key))
+            memory_only.put(key, _result(key.persona_id, key))
+        assert service.flush(timeout=5)
+
+        stats = service.get_stats()
+        assert stats["current_cache_size"] == 2
+        assert stats["evictions"] == 1
+
+        # 가장 오래된 항목은 메모리에서 빠졌지만 디스크에서 복원됨
+        assert memory_only.get(keys[0]) is None
+        restored = service.get(keys[0])
+        assert restored is not None and restored.persona_id == keys[0].persona_id
+        assert service.get_stats()["disk_hits"] == 1
+        # 복원된 항목이 최근 사용이 되어 다음 LRU 대상은 keys[1]
+        assert service.get_stats()["evictions"] == 2
+        assert memory_only.get(keys[1]) is not None
+    finally:
+        service.close()
+        memory_only.close()
+
+
+def test_invalidate_removes_persisted_snapshots(tmp_path):
+    cache_db = tmp_path / "persona_cache.db"
+    key_a, key_b = _key("a@example.com"), _key("b@example.com")
+    service = PersonaTodoCacheService(db_path=str(cache_db))
+    try:
+        service.put(key_a, _result("a@example.com", key_a))
+        service.put(key_b, _result("b@example.com", key_b))
+        assert service.flush(timeout=5)
+
+        assert service.invalidate("a@example.com") == 1
+        assert service.flush(timeout=5)
+        assert not service.contains(key_a)
+        assert service.get(key_a) is None
+        assert service.contains(key_b)
+
+        # 디스크 저장 전에 무효화해도 스냅샷이 남지 않음
+        key_c = _key("c@example.com")
+        service.put(key_c, _result("c@example.com", key_c))
+        service.invalidate("c@example.com")
+        assert service.flush(timeout=5)
+        assert not service.contains(key_c)
+
+        # 틱 진행(keep_persisted)은 메모리만 비우고, 전체 무효화는 디스크도 비움
+        service.invalidate_all(keep_persisted=True)
+        assert service.flush(timeout=5)
+        assert service.contains(key_b)
+        service.invalidate_all()
+        assert service.flush(timeout=5)
+        assert not service.contains(key_b)
+    finally:
+        service.close()
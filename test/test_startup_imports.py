@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+시작 경로 지연 임포트 회귀 검사
+
+`tools/importtime_report.py`로 새 인터프리터에서 시작 모듈을 임포트하고,
+첫 화면에 필요 없는 모듈(NLP 스택, 지연 생성 패널 등)이 로드되지 않았는지 확인합니다.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+
+from importtime_report import DEFAULT_FORBIDDEN, DEFAULT_MODULE, find_forbidden, run_importtime  # noqa: E402
+
+
+def _assert_no_deferred_imports(module: str) -> None:
+    returncode, rows, stderr = run_importtime(module)
+    assert returncode == 0, stderr[-2000:]
+    assert find_forbidden(rows, DEFAULT_FORBIDDEN) == []
+
+
+def test_main_module_defers_heavy_imports():
+    _assert_no_deferred_imports("main")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("PyQt6") is None, reason="PyQt6 미설치")
+def test_main_window_defers_heavy_imports():
+    _assert_no_deferred_imports(DEFAULT_MODULE)
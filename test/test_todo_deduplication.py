@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+MinHash-LSH 기반 TODO 중복 제거 회귀 검사
+
+기존 전수 비교와 같은 의미를 유지하는지 확인합니다.
+- 유사한 항목은 먼저 유지된 항목을 남기고, 유형 우선순위가 더 높으면 나중 항목으로 교체
+- 다른 그룹은 더 높은 기준, owner가 다르면 비교하지 않음
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.todo_deduplication_service import (  # noqa: E402
+    TodoDeduplicationService,
+    jaccard_similarity,
+    word_tokens,
+)
+
+
+@pytest.fixture
+def service():
+    return TodoDeduplicationService()
+
+
+def _dedup(service, items, **kwargs):
+    return service.deduplicate(
+        items,
+        text_of=lambda x: x["text"],
+        type_of=lambda x: x.get("type", ""),
+        group_of=lambda x: x.get("msg"),
+        owner_of=lambda x: x.get("owner"),
+        **kwargs,
+    )
+
+
+def test_first_kept_item_wins_for_same_priority(service):
+    items = [
+        {"id": "a", "text": "분기 보고서 초안 검토 후 회신 부탁드립니다", "type": "review", "msg": "m1"},
+        {"id": "b", "text": "분기 보고서 초안 검토 후 회신 부탁드립니다 감사합니다", "type": "review", "msg": "m1"},
+        {"id": "c", "text": "회의실 예약 확인", "type": "task", "msg": "m1"},
+    ]
+    kept, removed = _dedup(service, items)
+    assert [x["id"] for x in kept] == ["a", "c"]
+    assert removed == 1
+    assert service.get_deduplication_stats()["near_duplicates_removed"] == 1
+
+
+def test_higher_priority_type_replaces_and_takes_later_position(service):
+    items = [
+        {"id": "a", "text": "디자인 시안 금요일 까지 전달", "type": "task", "msg": "m1"},
+        {"id": "b", "text": "고객 미팅 자료 준비", "type": "task", "msg": "m1"},
+        {"id": "c", "text": "디자인 시안 금요일 까지 전달 요청", "type": "deadline", "msg": "m1"},
+    ]
+    merged_pairs = []
+
+    def merge(keep, drop):
+        merged_pairs.append((keep["id"], drop["id"]))
+        return keep
+
+    kept, removed = _dedup(service, items, merge=merge)
+    assert [x["id"] for x in kept] == ["b", "c"]
+    assert removed == 1
+    assert merged_pairs == [("c", "a")]
+
+
+def test_cross_group_uses_stricter_threshold_and_owner(service):
+    text = "주간 회의록 정리 해서 공유 부탁드립니다"
+    items = [
+        {"id": "a", "text": text, "msg": "m1", "owner": "kim"},
+        {"id": "b", "text": text + " 오늘", "msg": "m2", "owner": "kim"},
+        {"id": "c", "text": text, "msg": "m3", "owner": "park"},
+        {"id": "d", "text": text, "msg": "m4", "owner": "kim"},
+    ]
+    # a/b 유사도 6/7 < 0.9 → 다른 그룹이라 유지, c는 owner가 달라 비교 안 함, d는 a와 동일
+    assert jaccard_similarity(word_tokens(items[0]["text"]), word_tokens(items[1]["text"])) < 0.9
+    kept, removed = _dedup(service, items)
+    assert [x["id"] for x in kept] == ["a", "b", "c"]
+    assert removed == 1
+
+    kept, removed = _dedup(service, items, cross_group_threshold=None)
+    assert [x["id"] for x in kept] == ["a", "b", "c", "d"]
+    assert removed == 0
+
+
+def test_matches_pairwise_reference(service):
+    topics = ["보고서 검토", "예산 승인", "채용 면접 일정", "서버 점검 공지", "고객 피드백 정리"]
+    items = []
+    for i in range(40):
+        topic = topics[i % len(topics)]
+        suffix = "" if i % 3 else f"추가 메모 {i}"
+        items.append({"id": f"t{i}", "text": f"{topic} 요청 드립니다 {suffix}".strip(), "msg": "m1"})
+
+    # 기존 전수 비교 구현 (같은 그룹, threshold 0.7, 유형 우선순위 동일)
+    reference = []
+    for item in items:
+        tokens = word_tokens(item["text"])
+        if not any(jaccard_similarity(tokens, word_tokens(k["text"])) >= 0.7 for k in reference):
+            reference.append(item)
+
+    kept, removed = _dedup(service, items)
+    assert [x["id"] for x in kept] == [x["id"] for x in reference]
+    assert removed == len(items) - len(reference)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+TODO 리스트 증분 diff 회귀 검사
+
+`compute_todo_diff` 결과를 TodoDiff 문서의 적용 순서대로 이전 목록에 적용하면 새 목록과 같아지고,
+LIS에 속한 행은 이동 대상에서 빠져 연산 수가 최소로 유지되는지 확인합니다.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ui.todo.diff import compute_todo_diff, todo_version  # noqa: E402
+
+
+def _rows(keys, versions=None):
+    versions = versions or {}
+    return [(key, versions.get(key, "v1")) for key in keys]
+
+
+def _apply(old_rows, new_rows, diff):
+    """TodoPanel과 같은 순서로 diff를 적용한 뒤의 키 목록"""
+    dropped = set(diff.removed) | {key for key, _ in diff.moved}
+    keys = [key for key, _ in old_rows if key not in dropped]
+    for key, index, _ in diff.inserts_in_order():
+        keys.insert(index, key)
+    return keys
+
+
+@pytest.mark.parametrize("old_keys, new_keys", [
+    ([], ["a", "b", "c"]),
+    (["a", "b", "c"], []),
+    (["a", "b", "c", "d"], ["d", "a", "b", "c"]),
+    (["a", "b", "c", "d", "e"], ["e", "b", "x", "a", "d"]),
+    (["a", "b", "c"], ["c", "b", "a"]),
+])
+def test_applying_diff_reproduces_new_order(old_keys, new_keys):
+    old_rows, new_rows = _rows(old_keys), _rows(new_keys)
+    diff = compute_todo_diff(old_rows, new_rows)
+    assert _apply(old_rows, new_rows, diff) == new_keys
+
+
+def test_single_move_keeps_stable_rows_in_place():
+    old_rows = _rows(["a", "b", "c", "d"])
+    new_rows = _rows(["d", "a", "b", "c"])
+    diff = compute_todo_diff(old_rows, new_rows)
+    assert diff.moved == [("d", 0)]
+    assert not (diff.inserted or diff.removed or diff.updated)
+
+
+def test_version_change_is_update_without_move():
+    old_rows = _rows(["a", "b"])
+    new_rows = _rows(["a", "b"], versions={"b": "v2"})
+    diff = compute_todo_diff(old_rows, new_rows)
+    assert diff.updated == ["b"]
+    assert diff.summary() == {"inserted": 0, "updated": 1, "moved": 0, "removed": 0}
+    assert compute_todo_diff(new_rows, new_rows).is_empty
+
+
+def test_todo_version_ignores_non_render_fields():
+    todo = {"id": "t1", "title": "보고서 검토", "priority": "high"}
+    assert todo_version(todo) == todo_version({**todo, "_cache_hint": 3})
+    assert todo_version(todo) != todo_version({**todo, "priority": "low"})
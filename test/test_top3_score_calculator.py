@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Top3 점수 계산 배치 경로 회귀 검사
+
+`calculate_scores`(NumPy 배치)가 항목별 `calculate_score`와 비트 단위로 같은 점수를 내고,
+argpartition 기반 `select_top3`가 전체 정렬과 같은 Top3를 고르는지 확인합니다.
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services import top3_score_calculator  # noqa: E402
+from src.services.top3_score_calculator import Top3ScoreCalculator  # noqa: E402
+
+NOW = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+
+RULES = {
+    "priority_high": 3.0,
+    "priority_medium": 2.0,
+    "priority_low": 1.0,
+    "deadline_emphasis": 24.0,
+    "deadline_base": 1.0,
+    "evidence_per_item": 0.1,
+    "evidence_max_bonus": 0.5,
+    "recipient_type_cc_penalty": 0.7,
+}
+
+ENTITY_RULES = {
+    "requester": {"kim": 1.5, "임호규": 2.0},
+    "keyword": {"보고서": 1.0, "urgent": 0.5},
+    "type": {"review": 0.8},
+}
+
+
+def _todos():
+    todos = []
+    priorities = ["high", "medium", "low", None, "HIGH"]
+    requesters = ["kim@example.com", "임호규", "hongyu.lim@example.com", "park", ""]
+    recipients = ["to", "cc", "bcc", None]
+    for i in range(60):
+        deadline = None
+        if i % 4 == 0:
+            deadline = (NOW + timedelta(hours=i - 20)).isoformat()
+        elif i % 4 == 1:
+            deadline = (NOW + timedelta(days=i)).strftime("%Y-%m-%d %H:%M")
+        todos.append({
+            "id": f"t{i}",
+            "title": "주간 보고서 작성" if i % 3 == 0 else f"작업 {i}",
+            "description": "urgent" if i % 7 == 0 else "",
+            "type": "review" if i % 5 == 0 else "task",
+            "priority": priorities[i % len(priorities)],
+            "requester": requesters[i % len(requesters)],
+            "recipient_type": recipients[i % len(recipients)],
+            "deadline": deadline,
+            "evidence": ["근거"] * (i % 8),
+            "created_at": f"2026-03-01T{i % 24:02d}:00:00",
+        })
+    return todos
+
+
+@pytest.fixture
+def calculator():
+    return Top3ScoreCalculator(dict(RULES), {k: dict(v) for k, v in ENTITY_RULES.items()})
+
+
+@pytest.mark.skipif(top3_score_calculator.np is None, reason="NumPy 미설치")
+def test_batch_scores_match_scalar_bitwise(calculator):
+    todos = _todos()
+    batch = calculator.calculate_scores(todos, now=NOW)
+    scalar = [calculator.calculate_score(todo, now=NOW) for todo in todos]
+    assert batch == scalar
+
+
+def test_scalar_fallback_without_numpy(calculator, monkeypatch):
+    todos = _todos()
+    expected = [calculator.calculate_score(todo, now=NOW) for todo in todos]
+    monkeypatch.setattr(top3_score_calculator, "np", None)
+    assert calculator.calculate_scores(todos, now=NOW) == expected
+
+
+def test_select_top3_matches_full_sort(calculator):
+    todos = _todos()
+    todos[-1]["status"] = "done"
+    selected = calculator.select_top3(todos)
+
+    pending = [todo for todo in todos if todo.get("status") != "done"]
+    pending.sort(key=lambda x: (x["_top3_score"], x["created_at"]), reverse=True)
+    assert selected == {todo["id"] for todo in pending[:3]}
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Top3 증분 추적기 회귀 검사
+
+점수 힙의 지연 삭제(lazy deletion)로 제거/점수 변경된 TODO의 오래된 힙 항목이
+Top-k에 나오지 않고, 힙 압축과 변경 알림 처리 후에도 전체 재계산 결과와 같은지 확인합니다.
+"""
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.todo_change_feed import CHANGE_DELETED, CHANGE_STATUS, TodoChangeFeed  # noqa: E402
+from src.services.top3_score_calculator import Top3ScoreCalculator  # noqa: E402
+from src.services.top3_tracker import Top3Tracker  # noqa: E402
+
+NOW = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+
+RULES = {
+    "priority_high": 3.0,
+    "priority_medium": 2.0,
+    "priority_low": 1.0,
+    "deadline_emphasis": 24.0,
+    "deadline_base": 1.0,
+    "evidence_per_item": 0.1,
+    "evidence_max_bonus": 0.5,
+    "recipient_type_cc_penalty": 0.7,
+}
+
+
+def _todo(index: int, priority: str = "low", evidence: int = 0) -> dict:
+    return {
+        "id": f"t{index}",
+        "title": f"작업 {index}",
+        "priority": priority,
+        "evidence": ["근거"] * evidence,
+        "created_at": f"2026-03-01T{index % 24:02d}:00:00",
+    }
+
+
+def _expected_top(calculator, todos, k=3):
+    scored = sorted(
+        todos,
+        key=lambda t: (calculator.calculate_score(t, now=NOW), t["created_at"]),
+        reverse=True,
+    )
+    return [todo["id"] for todo in scored[:k]]
+
+
+@pytest.fixture
+def calculator():
+    return Top3ScoreCalculator(dict(RULES), {"requester": {}, "type": {}})
+
+
+def test_removed_and_rescored_entries_are_skipped(calculator):
+    tracker = Top3Tracker(calculator)
+    todos = [_todo(i, evidence=i % 5) for i in range(10)]
+    todos[2]["priority"] = "high"
+    tracker.sync(todos, now=NOW)
+    assert tracker.top_ids() == _expected_top(calculator, todos)
+
+    # 최고 점수 TODO를 제거하고, 다른 TODO는 점수를 낮춤 → 힙에는 오래된 항목이 남음
+    tracker.remove("t2")
+    lowered = dict(todos[4], evidence=[])
+    tracker.upsert(lowered)
+    remaining = [lowered if t["id"] == "t4" else t for t in todos if t["id"] != "t2"]
+
+    assert "t2" not in tracker.top_ids(k=10)
+    assert tracker.top_ids(k=len(remaining)) == _expected_top(calculator, remaining, k=len(remaining))
+    # 조회는 힙 항목을 되돌려 놓으므로 반복 조회해도 같은 결과
+    assert tracker.top_ids() == tracker.top_ids()
+
+
+def test_heap_is_compacted_after_many_stale_entries(calculator):
+    tracker = Top3Tracker(calculator)
+    todos = [_todo(i) for i in range(5)]
+    tracker.sync(todos, now=NOW)
+    for round_ in range(20):
+        for todo in todos:
+            tracker.upsert(dict(todo, evidence=["근거"] * (round_ % 6)))
+
+    stats = tracker.get_stats()
+    assert stats["tracked"] == 5
+    assert stats["heap_size"] <= 2 * stats["tracked"] + 16
+
+
+def test_feed_events_apply_lazy_removals(calculator):
+    feed = TodoChangeFeed()
+    tracker = Top3Tracker(calculator, feed=feed)
+    todos = [_todo(i, priority="high" if i < 3 else "low") for i in range(6)]
+    try:
+        assert tracker.sync(todos, now=NOW) == {"t0", "t1", "t2"}
+        feed.publish(CHANGE_DELETED, todo_id="t0")
+        feed.publish(CHANGE_STATUS, todo_id="t1", status="done")
+
+        remaining = [t for t in todos if t["id"] not in ("t0", "t1")]
+        assert tracker.top_ids() == _expected_top(calculator, remaining)
+        assert tracker.get_stats()["removals"] == 2
+        assert tracker.sync(remaining, now=NOW) == set(_expected_top(calculator, remaining))
+    finally:
+        tracker.close()
@@ -0,0 +1,120 @@
+# tools/importtime_report.py
+"""
+GUI 시작 경로 임포트 시간 리포트 (`python -X importtime` 하네스)
+
+새 프로세스에서 대상 모듈을 `-X importtime`으로 임포트하고,
+누적 시간이 큰 모듈 순으로 출력합니다. 다음 조건이면 종료 코드 1을 반환하므로
+시작 시간 회귀 검사로 사용할 수 있습니다.
+
+- 전체 임포트 시간이 예산(--budget-ms)을 넘은 경우
+- 첫 화면에 필요 없는 지연 임포트 대상 모듈(--forbid)이 로드된 경우
+
+사용 예:
+    python tools/importtime_report.py
+    python tools/importtime_report.py --module src.ui.main_window --budget-ms 800 --top 30
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULE = "src.ui.main_window"
+DEFAULT_BUDGET_MS = 800.0
+
+# 첫 화면 이전에 임포트되면 안 되는 모듈 (처음 사용할 때 임포트하도록 바꾼 것들)
+# `src.` 접두사 유무와 관계없이 모듈 이름 끝부분으로 비교합니다.
+DEFAULT_FORBIDDEN = (
+    "nlp.summarize",
+    "nlp.priority_ranker",
+    "nlp.action_extractor",
+    "services.analysis_pipeline_service",
+    "services.weather_service",
+    "ui.email_panel",
+    "ui.message_summary_panel",
+    "ui.analysis_result_panel",
+    "ui.message_detail_dialog",
+    "ui.tick_history_dialog",
+    "ui.dialogs.summary_dialog",
+)
+
+
+def run_importtime(module: str):
+    """새 인터프리터에서 모듈을 임포트하고 (모듈, self_us, cumulative_us) 목록 반환"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, payload = line.split(":", 1)
+            self_us, cumulative_us, name = payload.split("|", 2)
+            rows.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return proc.returncode, rows, proc.stderr
+
+
+def find_forbidden(rows, forbidden):
+    """로드된 모듈 중 금지 목록에 해당하는 이름 반환"""
+    hits = []
+    for name, _self_us, _cum_us in rows:
+        for suffix in forbidden:
+            if name == suffix or name.endswith("." + suffix):
+                hits.append(name)
+                break
+    return hits
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="GUI 시작 경로 임포트 시간 리포트")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="임포트할 모듈 (기본값: %(default)s)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="전체 임포트 시간 예산 (ms)")
+    parser.add_argument("--top", type=int, default=25, help="출력할 상위 모듈 수")
+    parser.add_argument("--forbid", action="append", default=None,
+                        help="로드되면 실패로 처리할 모듈 (여러 번 지정 가능, 기본 목록 대체)")
+    args = parser.parse_args(argv)
+
+    returncode, rows, stderr = run_importtime(args.module)
+    if returncode != 0:
+        print(f"❌ '{args.module}' 임포트 실패 (exit={returncode})")
+        print("\n".join(line for line in stderr.splitlines() if not line.startswith("import time:"))[-2000:])
+        return 2
+
+    target = next((r for r in rows if r[0] == args.module), None)
+    total_ms = (target[2] if target else sum(r[1] for r in rows)) / 1000.0
+
+    print(f"📦 {args.module}: 모듈 {len(rows)}개, 누적 {total_ms:.1f}ms (예산 {args.budget_ms:.0f}ms)")
+    print(f"{'cumulative(ms)':>15} {'self(ms)':>10}  module")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{cum_us / 1000.0:>15.1f} {self_us / 1000.0:>10.1f}  {name}")
+
+    failed = False
+    forbidden = tuple(args.forbid) if args.forbid else DEFAULT_FORBIDDEN
+    hits = find_forbidden(rows, forbidden)
+    if hits:
+        failed = True
+        print(f"❌ 지연 임포트 대상 모듈이 시작 시 로드됨: {', '.join(sorted(set(hits)))}")
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"❌ 임포트 시간 예산 초과: {total_ms:.1f}ms > {args.budget_ms:.0f}ms")
+
+    if not failed:
+        print("✅ 임포트 시간 검사 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
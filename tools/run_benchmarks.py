@@ -0,0 +1,82 @@
+# tools/run_benchmarks.py
+"""
+벤치마크 실행/비교 하네스 (pytest-benchmark)
+
+`benchmarks/` 스위트를 실행하고 결과를 `benchmarks/results/`에 자동 저장합니다.
+저장 파일 이름에 커밋 해시와 시각이 들어가므로 커밋 간 비교에 사용할 수 있습니다.
+`--compare`를 주면 직전(또는 지정한) 저장 결과와 비교하고, 평균 시간이
+`--fail-threshold`보다 느려진 벤치마크가 있으면 종료 코드 1을 반환합니다.
+
+사용 예:
+    python tools/run_benchmarks.py
+    python tools/run_benchmarks.py --scale 1k,10k --llm-latency-ms 200
+    python tools/run_benchmarks.py --compare                # 직전 저장 결과와 비교
+    python tools/run_benchmarks.py --compare 0003 -k top3   # 3번째 저장 결과와 top3만 비교
+    python tools/run_benchmarks.py --list                   # 저장된 결과 목록
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = PROJECT_ROOT / "benchmarks"
+RESULTS_DIR = BENCH_DIR / "results"
+
+DEFAULT_FAIL_THRESHOLD = "mean:15%"
+
+
+def list_results() -> int:
+    files = sorted(RESULTS_DIR.glob("*/*.json"))
+    if not files:
+        print(f"저장된 결과가 없습니다: {RESULTS_DIR}")
+        return 0
+    for path in files:
+        print(path.relative_to(RESULTS_DIR))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 실행 및 커밋 간 비교")
+    parser.add_argument("--scale", default="1k", help="실행할 규모 (쉼표 구분: 1k,10k,100k)")
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0, help="스텁 LLM 응답 지연 (ms)")
+    parser.add_argument("--llm-rate-limit-every", type=int, default=0, help="N번째 요청마다 429 반환")
+    parser.add_argument("--rounds", type=int, default=3, help="DB/파이프라인 벤치마크 반복 횟수")
+    parser.add_argument("-k", dest="keyword", default=None, help="pytest -k 표현식 (벤치마크 선택)")
+    parser.add_argument(
+        "--compare", nargs="?", const="", default=None,
+        help="저장된 결과와 비교 (번호 생략 시 직전 결과)",
+    )
+    parser.add_argument("--fail-threshold", default=DEFAULT_FAIL_THRESHOLD, help="비교 실패 기준 (예: mean:15%%)")
+    parser.add_argument("--no-save", action="store_true", help="이번 결과를 저장하지 않음")
+    parser.add_argument("--list", action="store_true", help="저장된 결과 목록 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        return list_results()
+
+    cmd = [
+        sys.executable, "-m", "pytest", str(BENCH_DIR),
+        "-p", "no:cacheprovider",
+        f"--benchmark-storage=file://{RESULTS_DIR.as_posix()}",
+        "--benchmark-columns=min,mean,median,stddev,rounds",
+        "--benchmark-sort=name",
+        f"--bench-scale={args.scale}",
+        f"--llm-latency-ms={args.llm_latency_ms}",
+        f"--llm-rate-limit-every={args.llm_rate_limit_every}",
+        f"--bench-rounds={args.rounds}",
+    ]
+    if args.keyword:
+        cmd += ["-k", args.keyword]
+    if not args.no_save:
+        cmd.append("--benchmark-autosave")
+    if args.compare is not None:
+        cmd.append(f"--benchmark-compare={args.compare}" if args.compare else "--benchmark-compare")
+        cmd.append(f"--benchmark-compare-fail={args.fail_threshold}")
+
+    print("▶ " + " ".join(cmd))
+    return subprocess.run(cmd, cwd=str(PROJECT_ROOT)).returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())